@@ -3,17 +3,21 @@
 # ?
 
 from PySide6 import QtCore
-from PySide6.QtCore import QTranslator, QLibraryInfo
+from PySide6.QtCore import QTranslator, QLibraryInfo, QItemSelection
+from PySide6.QtCore import QItemSelectionModel
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
-    QTableWidgetItem,
     QFileDialog,
     QAbstractItemView,
     QMessageBox,
+    QLineEdit,
+    QComboBox,
+    QProgressBar,
+    QLabel,
 )
 
-import pyqtgraph as pg
 import contextlib
 import sys
 import os
@@ -28,29 +32,39 @@ from app_tools.format_tools import *
 from app_tools.validation_tools import *
 from app_tools.message_boxes import *
 from app_tools.combo_lists import *
+from app_tools.cycle_time_tools import Cycle_time, tool_call_sides
+from app_tools.generator_cache import Generator_cache
+from app_tools.history_tools import Edit_command, Edit_history
+from app_tools.journal_tools import (
+    Edit_journal,
+    find_journals,
+    journal_path,
+    recoverable_commands,
+    replay_journal,
+)
+from app_tools.profiler_tools import Profiler
+from app_tools.project_tools import Project_file, project_extension, write_project
+from app_tools.record_tools import config_from_json, config_line, json_default
+from app_tools.regeneration_tools import (
+    Regeneration_signals,
+    Regeneration_worker,
+    regeneration_pool,
+)
+from app_tools.table_models import Config_model, Tape_model
+from app_tools.tape_tools import *
 
 
 # ?
 # ? Generación de líneas de tape -------------------------------------------- *
 # ?
 
-from generators.header_gen import header_gen
-from generators.free_gen import free_gen
-from generators.comment_gen import comment_gen
-from generators.subrutine_gen import subrutine_gen
-from generators.tool_call_gen import tool_call_gen
-from generators.tool_close_gen import tool_close_gen
-from generators.spindle_gen import spindle_gen
-from generators.spindle_index_gen import spindle_index_gen
-from generators.misc_gen import misc_gen
-from generators.end_gen import end_gen
+from app_tools.generator_registry import bind_machine
 
 # ?
 # ? Interfaces -------------------------------------------------------------- *
 # ?
 
 from interfaces.ui_MainWindow import Ui_MainWindow
-from interfaces.ui_graph import Ui_GraphWindow
 from interfaces.ui_helper import Ui_frm_helper
 from interfaces.ui_header import Ui_frm_header
 from interfaces.ui_comment import Ui_frm_comment
@@ -89,11 +103,22 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.load_main_data()
         self.load_machining_data()
         self.load_tape_conditions()
+        self.load_regeneration_data()
+        self.load_generator_cache()
+        self.load_regeneration_worker()
+        self.load_cycle_time()
+        self.load_edit_history()
+        self.load_dialog_pool()
+        self.load_profiler()
         self.load_task_list()
         self.load_menu_actions()
+        self.load_history_actions()
+        self.load_profiler_actions()
+        self.load_project_actions()
         self.load_buttons_list()
         self.load_buttons_connections()
         self.default_buttons_status()
+        self.load_table_models()
         self.load_widgets_events()
         self.load_main_title()
 
@@ -129,6 +154,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.current_folder = self.root_dir
         self.file_name = ""
         self.file_extension = ""
+        self.project = None
+        self.journal = None
         self.subwinpos_horiz = 0
         self.subwinpos_verti = 0
         self.current_config_line = 0
@@ -152,6 +179,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.current_tool = 0
         self.current_tool_diameter = 0
         self.swiss_back_machining = False
+        self.generators = bind_machine("")
 
     def load_tape_conditions(self) -> None:
         """Cargar condiciones del tape"""
@@ -159,6 +187,71 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.modified_task = False
         self.save_required = False
 
+    def load_regeneration_data(self) -> None:
+        """Cargar datos de regeneración incremental del tape"""
+
+        self.line_states = []
+        self.dirty_lines = None
+
+    def load_generator_cache(self) -> None:
+        """Cargar caché de líneas generadas"""
+
+        self.generator_cache = Generator_cache()
+
+    def load_regeneration_worker(self) -> None:
+        """Cargar regeneración del tape en segundo plano
+
+        Los programas con al menos background_lines líneas se regeneran
+        fuera del hilo de la interfaz.
+        """
+
+        self.regeneration_pool = regeneration_pool()
+        self.regeneration = None
+        self.background_lines = 5000
+
+        self.regeneration_signals = Regeneration_signals()
+        self.regeneration_signals.finished.connect(self.regeneration_finished)
+        self.regeneration_signals.failed.connect(self.regeneration_failed)
+
+        self.busy_indicator = QProgressBar()
+        self.busy_indicator.setRange(0, 0)
+        self.busy_indicator.setMaximumWidth(120)
+        self.busy_indicator.setTextVisible(False)
+        self.busy_indicator.hide()
+        self.statusbar.addPermanentWidget(self.busy_indicator)
+
+    def load_cycle_time(self) -> None:
+        """Cargar estimación del tiempo de ciclo
+
+        Usa el depósito de hilos de la regeneración para los programas con al
+        menos background_lines líneas.
+        """
+
+        self.cycle_time = None
+
+        self.cycle_time_signals = Regeneration_signals()
+        self.cycle_time_signals.finished.connect(self.cycle_time_finished)
+        self.cycle_time_signals.failed.connect(self.cycle_time_failed)
+
+        self.cycle_time_label = QLabel()
+        self.statusbar.addPermanentWidget(self.cycle_time_label)
+
+    def load_edit_history(self) -> None:
+        """Cargar historial de cambios para deshacer y rehacer"""
+
+        self.edit_history = Edit_history()
+
+    def load_dialog_pool(self) -> None:
+        """Cargar depósito de ventanas de tareas reutilizables"""
+
+        self.dialogs = {}
+
+    def load_profiler(self) -> None:
+        """Cargar medidor de rendimiento, activado con GCODE_EDITOR_PROFILE=1"""
+
+        enabled = os.environ.get("GCODE_EDITOR_PROFILE") == "1"
+        self.profiler = Profiler(enabled)
+
     def load_task_list(self) -> None:
         """Cargar lista de tareas"""
 
@@ -191,6 +284,52 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.actionGraph.triggered.connect(self.graph)
         self.actionVersion.triggered.connect(self.version)
 
+    def load_history_actions(self) -> None:
+        """Cargar acciones del menú para deshacer y rehacer"""
+
+        self.actionUndo = QAction("Deshacer", self)
+        self.actionUndo.setShortcut(QKeySequence.Undo)
+        self.actionUndo.triggered.connect(self.undo)
+
+        self.actionRedo = QAction("Rehacer", self)
+        self.actionRedo.setShortcut(QKeySequence.Redo)
+        self.actionRedo.triggered.connect(self.redo)
+
+        first_action = self.menuEdit.actions()[0]
+        self.menuEdit.insertActions(first_action, [self.actionUndo, self.actionRedo])
+        self.menuEdit.insertSeparator(first_action)
+
+    def load_profiler_actions(self) -> None:
+        """Cargar acciones del menú de medición de rendimiento"""
+
+        self.actionProfile = QAction("Medir rendimiento", self)
+        self.actionProfile.setCheckable(True)
+        self.actionProfile.setChecked(self.profiler.enabled)
+        self.actionProfile.toggled.connect(self.profiler_switch)
+
+        self.actionExport_trace = QAction("Exportar traza de rendimiento", self)
+        self.actionExport_trace.triggered.connect(self.export_trace)
+
+        self.menuView.addSeparator()
+        self.menuView.addAction(self.actionProfile)
+        self.menuView.addAction(self.actionExport_trace)
+
+    def load_project_actions(self) -> None:
+        """Cargar acciones del menú para el proyecto indexado"""
+
+        self.actionProject_format = QAction("Guardar como proyecto indexado", self)
+        self.actionProject_format.setCheckable(True)
+
+        self.actionExport_json = QAction("Exportar JSON", self)
+        self.actionExport_json.triggered.connect(self.export_json)
+
+        next_action = self.menuFile.actions()[
+            self.menuFile.actions().index(self.actionSave) + 1
+        ]
+        self.menuFile.insertActions(
+            next_action, [self.actionProject_format, self.actionExport_json]
+        )
+
     def load_buttons_list(self) -> None:
         """Cargar lista de botones"""
 
@@ -215,6 +354,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.plate_buttons = {}
 
+    def all_buttons(self) -> list:
+        """Obtiene todos los botones de tareas
+
+        Returns:
+            list: Lista de botones
+        """
+
+        return [
+            *self.main_buttons,
+            *self.turning_buttons,
+            *self.milling_buttons,
+            *self.drilling_buttons,
+            *self.plate_buttons,
+        ]
+
     def load_buttons_connections(self) -> None:
         """Cargar conexiones de botones a funciones"""
 
@@ -236,18 +390,37 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.btn_header.setEnabled(True)
 
+    def load_table_models(self) -> None:
+        """Cargar modelos de las tablas"""
+
+        self.config_model = Config_model("Esquema")
+        self.tape1_model = Tape_model("Programa principal")
+        self.tape2_model = Tape_model("Programa secundario")
+
+        self.config_widget.setModel(self.config_model)
+        self.tape1_widget.setModel(self.tape1_model)
+        self.tape2_widget.setModel(self.tape2_model)
+
+        self.config_changes = None
+        self.tape1_changes = None
+        self.tape2_changes = None
+
     def load_widgets_events(self) -> None:
         """Cargar eventos de los widgets"""
 
+        config_selection = self.config_widget.selectionModel()
+        tape1_selection = self.tape1_widget.selectionModel()
+        tape2_selection = self.tape2_widget.selectionModel()
+
         self.config_widget.clicked.connect(self.config_clicked)
         self.tape1_widget.clicked.connect(self.tape1_clicked)
         self.tape2_widget.clicked.connect(self.tape2_clicked)
-        self.config_widget.itemSelectionChanged.connect(self.config_selected)
-        self.config_widget.itemDoubleClicked.connect(self.config_modifier)
-        self.tape1_widget.itemSelectionChanged.connect(self.tape1_selected)
-        self.tape1_widget.itemDoubleClicked.connect(self.config_modifier)
-        self.tape2_widget.itemSelectionChanged.connect(self.tape2_selected)
-        self.tape2_widget.itemDoubleClicked.connect(self.config_modifier)
+        config_selection.selectionChanged.connect(self.config_selected)
+        self.config_widget.doubleClicked.connect(self.config_modifier)
+        tape1_selection.selectionChanged.connect(self.tape1_selected)
+        self.tape1_widget.doubleClicked.connect(self.config_modifier)
+        tape2_selection.selectionChanged.connect(self.tape2_selected)
+        self.tape2_widget.doubleClicked.connect(self.config_modifier)
 
     def load_main_title(self) -> None:
         """Actualiza el título de la ventana"""
@@ -271,25 +444,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def update_file_name(self) -> None:
         """Actualiza el nombre del archivo"""
 
-        back = "(H)" if self.swiss_back_machining else ""
-        machine = self.current_machine
-        file_extension = ""
-
-        if machine in ("B12", "A16", "K16", "E16"):
-            file_name = f"({self.current_machine}) {self.part_name} {back}"
-            file_extension = ".CNC"
-        elif machine == "OMNITURN":
-            file_name = self.main_tape_number
-        elif machine == "ROMI":
-            file_name = f"R{self.main_tape_number}"
-        elif machine == "HARDINGE":
-            file_name = f"H{self.main_tape_number}"
-        elif machine == "MAZAK":
-            file_name = f"O{self.main_tape_number}"
-            file_extension = ".CNC"
-
-        self.file_name = file_name
-        self.file_extension = file_extension
+        self.file_name, self.file_extension = tape_file_name(self)
 
     def update_file_dir(self) -> None:
         """Actualiza el forder de guardado"""
@@ -311,18 +466,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def create_new_tape(self):
         """Crea el nuevo tape"""
 
+        self.cancel_regeneration()
+        self.close_project()
+        self.close_journal(discard=True)
         self.load_main_data()
         self.load_machining_data()
         self.load_tape_conditions()
+        self.load_regeneration_data()
+        self.edit_history.clear()
         self.default_buttons_status()
         self.load_main_title()
 
-        self.config_widget.clearContents()
-        self.tape1_widget.clearContents()
-        self.tape2_widget.clearContents()
-        self.config_widget.setRowCount(0)
-        self.tape1_widget.setRowCount(0)
-        self.tape2_widget.setRowCount(0)
+        self.config_model.update_rows(self.config_list)
+        self.tape1_model.update_rows(self.tape1_list)
+        self.tape2_model.update_rows(self.tape2_list)
 
     def open_file(self) -> None:
         """Abrir un archivo de configuración"""
@@ -333,24 +490,176 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 self,
                 caption=("Abrir programa"),
                 dir=self.current_folder,
-                filter=("Archivos de configuración (*.json)"),
+                filter=("Archivos de configuración (*.gcp *.json)"),
             )
+        except OSError:
+            return
 
-            with open(file_name[0]) as file:
-                self.config_list = json.load(file)
+        self.load_file(file_name[0])
 
-            self.current_folder = os.path.dirname(file_name[0])
-            os.chdir(self.current_folder)
+    def load_file(self, file_name: str, ask: bool = True) -> None:
+        """Carga un archivo de configuración
 
-            self.update_data()
-            self.save_required = False
-            self.load_main_title()
+        Args:
+            file_name (str): Archivo de configuración (.gcp o .json)
+            ask (bool): Preguntar antes de recuperar los cambios sin guardar
+        """
+
+        try:
+            with self.profiler.span("open_file", "archivo"):
+                if file_name.lower().endswith(project_extension):
+                    self.open_project(file_name)
+                else:
+                    with self.profiler.span("json_load", "archivo"):
+                        with open(file_name) as file:
+                            self.config_list = config_from_json(json.load(file))
+                    self.close_project()
+                    self.actionProject_format.setChecked(False)
+                recovered = self.open_journal(os.path.abspath(file_name), ask)
+                self.load_regeneration_data()
+                self.edit_history.clear()
+
+                self.current_folder = os.path.dirname(file_name)
+                os.chdir(self.current_folder)
+
+                self.request_update()
+                self.save_required = recovered
+                self.load_main_title()
 
         except OSError:
             return
-        except KeyError:
+        except (KeyError, ValueError):
+            Messages.file_open_error(self)
+            self.close_journal()
+            self.create_new_tape()
+            return
+
+        self.show_profile()
+
+    def open_project(self, file: str) -> None:
+        """Abre un proyecto indexado mostrando primero la pantalla inicial
+
+        Las líneas visibles se decodifican y se muestran antes de leer el
+        resto, que se necesita completo para generar el tape.
+
+        Args:
+            file (str): Archivo del proyecto
+        """
+
+        with self.profiler.span("project_load", "archivo"):
+            project = Project_file(file)
+            self.close_project()
+            self.project = project
+            self.actionProject_format.setChecked(True)
+
+            row_height = max(1, self.config_widget.sizeHintForRow(0))
+            screen = self.config_widget.viewport().height() // row_height + 1
+            self.config_model.update_rows(project.read_lines(0, screen))
+            QApplication.processEvents()
+
+            self.config_list = project.read_lines()
+
+    def close_project(self) -> None:
+        """Cierra el proyecto indexado abierto"""
+
+        if self.project is not None:
+            self.project.close()
+            self.project = None
+
+    def open_journal(self, base: str, ask: bool = True) -> bool:
+        """Abre el diario de cambios del programa
+
+        Si el diario tiene cambios sin guardar sobre la versión actual del
+        archivo se ofrece aplicarlos a la configuración cargada.
+
+        Args:
+            base (str): Archivo del programa, None si no se ha guardado
+            ask (bool): Preguntar antes de recuperar los cambios
+
+        Raises:
+            ValueError: El diario no corresponde a la configuración
+
+        Returns:
+            bool: Se recuperaron cambios del diario
+        """
+
+        self.close_journal()
+        path = journal_path(base, self.root_dir)
+        if commands := recoverable_commands(path, base):
+            if not ask or self.recover_question(base) == QMessageBox.Yes:
+                replay_journal(self.config_list, commands)
+                self.journal = Edit_journal(path, base)
+                self.journal.resume()
+                return True
+
+        self.start_journal(base)
+        return False
+
+    def start_journal(self, base: str) -> None:
+        """Comienza un diario de cambios vacío para el programa
+
+        El diario anterior se borra si era de otro archivo: sus cambios ya
+        quedaron guardados en el archivo nuevo.
+
+        Args:
+            base (str): Archivo del programa, None si no se ha guardado
+        """
+
+        path = journal_path(base, self.root_dir)
+        if self.journal is not None:
+            self.close_journal(discard=self.journal.path != path)
+        self.journal = Edit_journal(path, base)
+        self.journal.start()
+
+    def close_journal(self, discard: bool = False) -> None:
+        """Cierra el diario de cambios
+
+        Args:
+            discard (bool): Borrar el diario, sus cambios ya no se necesitan
+        """
+
+        if self.journal is not None:
+            if discard:
+                self.journal.discard()
+            else:
+                self.journal.close()
+            self.journal = None
+
+    def recover_question(self, base: str) -> int:
+        """Pregunta si se recuperan los cambios sin guardar de un programa
+
+        Args:
+            base (str): Archivo del programa, None si no se ha guardado
+
+        Returns:
+            int: Botón elegido
+        """
+
+        return Messages.recover_changes_question(self, base or "el programa nuevo")
+
+    def recover_session(self) -> None:
+        """Ofrece recuperar los cambios sin guardar de la última sesión"""
+
+        journals = find_journals([self.root_dir, *self.default_dirs.values()])
+        if not journals:
+            return
+
+        path, base = journals[0]
+        if self.recover_question(base) != QMessageBox.Yes:
+            Edit_journal(path, base).discard()
+            return
+        if base is not None:
+            self.load_file(base, ask=False)
+            return
+
+        try:
+            self.open_journal(None, ask=False)
+        except ValueError:
             Messages.file_open_error(self)
             self.create_new_tape()
+            return
+        self.request_update()
+        self.load_main_title()
 
     def save_config(self) -> None:
         """Guardar el archivo de configuración"""
@@ -361,11 +670,59 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.update_data()
         self.update_file_dir()
 
-        file = f"{self.file_name}.json"
-        with open(file, "w") as file:
-            json.dump(self.config_list, file)
+        if self.actionProject_format.isChecked():
+            self.save_project()
+            self.start_journal(self.project.path)
+        else:
+            self.save_json(f"{self.file_name}.json")
+            self.start_journal(os.path.abspath(f"{self.file_name}.json"))
         self.save_tape()
 
+    def save_json(self, file: str) -> None:
+        """Guardar la configuración en JSON
+
+        Args:
+            file (str): Archivo de configuración
+        """
+
+        with self.profiler.span("save_json", "archivo"):
+            with open(file, "w") as file:
+                json.dump(self.config_list, file, default=json_default)
+
+    def save_project(self) -> None:
+        """Guardar la configuración en un proyecto indexado
+
+        Si el proyecto abierto es el mismo archivo solo se escriben las
+        líneas nuevas o modificadas.
+        """
+
+        file = os.path.abspath(f"{self.file_name}{project_extension}")
+        with self.profiler.span("save_project", "archivo"):
+            if self.project is not None and self.project.path == file:
+                self.project.save(self.config_list)
+                return
+
+            self.close_project()
+            write_project(file, self.config_list)
+            self.project = Project_file(file)
+            self.project.adopt(self.config_list)
+
+    def export_json(self) -> None:
+        """Exportar la configuración a un archivo JSON"""
+
+        if not self.tape1_list:
+            return
+
+        self.update_file_dir()
+        file_name = QFileDialog.getSaveFileName(
+            self,
+            caption=("Exportar JSON"),
+            dir=f"{self.current_folder}/{self.file_name}.json",
+            filter=("Archivos de configuración (*.json)"),
+        )
+        if file_name[0]:
+            self.save_json(file_name[0])
+
     def save_tape(self) -> None:
         """Guardar el archivo de configuración"""
 
@@ -376,33 +733,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         complete_tape = self.make_tape()
 
         file = f"{self.file_name}{self.file_extension}"
-        with open(file, "w") as tape:
-            for lines in complete_tape:
-                tape.write(lines + "\n")
+        with self.profiler.span("save_tape", "archivo"):
+            size, checksum = write_tape(file, complete_tape)
 
         self.save_required = False
         self.load_main_title()
+        self.statusbar.showMessage(
+            f"{file} guardado: {size} bytes, SHA-256 {checksum[:16]}"
+        )
+        self.show_profile()
 
-    def make_tape(self) -> list:
+    def make_tape(self) -> iter:
         """Crea las líneas del tape
 
         Returns:
-            list: Tape completo
+            iter: Líneas del tape completo
         """
 
-        tape = []
-        blank_space = fspace()
-
-        for line in self.tape1_list:
-            data = line[1]
-            if data != blank_space:
-                tape.append(data)
-        for line in self.tape2_list:
-            data = line[1]
-            if data != blank_space:
-                tape.append(data)
-
-        return tape
+        return tape_lines(self)
 
     def close_app(self) -> None:
         """Cerrar la aplicación"""
@@ -418,6 +766,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         event.ignore()
 
         if result == QMessageBox.Yes:
+            self.cancel_regeneration()
+            self.close_journal()
             if self.subtask1:
                 self.subtask1.close()
             if self.helper1:
@@ -442,8 +792,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if dialog == QMessageBox.Yes:
             start = self.current_selection[0]
             end = self.current_selection[-1] + 1
-            del self.config_list[start:end]
-            self.update_data()
+            self.replace_lines(start, end, [])
+            self.request_update()
 
     def duplicate_lines(self) -> None:
         """Duplica las líneas seleccionadas"""
@@ -453,17 +803,18 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             Messages.duplicate_header_information(self)
             return
 
-        duplicated_lines = [self.config_list[index] for index in index_list]
+        duplicated_lines = [
+            [self.config_list[index][0], self.config_list[index][1].copy()]
+            for index in index_list
+        ]
         insertion_index = index_list[-1] + 1
-        for line in duplicated_lines:
-            self.config_list.insert(insertion_index, line)
-            insertion_index += 1
-
         selection_len = len(index_list)
-        for n, index in enumerate(self.current_selection):
-            self.current_selection[n] = index + selection_len
+        selection = [index + selection_len for index in index_list]
 
-        self.update_data()
+        self.replace_lines(
+            insertion_index, insertion_index, duplicated_lines, selection
+        )
+        self.request_update()
 
     def movement(self, direction: str) -> None:
         """Valida el movimiento de las líneas seleccionadas
@@ -499,18 +850,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         moved_data = [self.config_list[index] for index in index_list]
         start, end = index_list[0], index_list[-1] + 1
-        del self.config_list[start:end]
 
         increment = 1 if direction == "down" else -1
-        index = start + increment
-        for line in moved_data:
-            self.config_list.insert(index, line)
-            index += 1
+        first = min(start, start + increment)
+        last = max(end, end + increment)
 
-        for n, index in enumerate(self.current_selection):
-            self.current_selection[n] = index + increment
+        lines = self.config_list[first:last]
+        del lines[start - first : end - first]
+        index = start + increment - first
+        lines[index:index] = moved_data
 
-        self.update_data()
+        selection = [index + increment for index in index_list]
+        self.replace_lines(first, last, lines, selection)
+        self.request_update()
 
     def home_position(self) -> None:
         """Obtiene la línea inicial del programa"""
@@ -524,7 +876,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def go_to_position(self, line):
         """Ir a la línea indicada"""
-        self.config_widget.setCurrentCell(line, 0)
+        self.config_widget.setCurrentIndex(self.config_model.index(line, 0))
         self.current_selection = [line]
         self.tape1_update_selection()
         self.tape2_update_selection()
@@ -537,11 +889,30 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Bloquea o desbloquea las líneas seleccionadas"""
 
         index_list = self.current_selection
+        first, last = index_list[0], index_list[-1] + 1
+
+        lines = self.config_list[first:last]
         for index in index_list:
-            with contextlib.suppress(KeyError):
-                block = self.config_list[index][1]["Blk"]
-                self.config_list[index][1]["Blk"] = not block
-        self.update_data()
+            task, data = lines[index - first]
+            if "Blk" in data:
+                lines[index - first] = [task, {**data, "Blk": not data["Blk"]}]
+
+        self.replace_lines(first, last, lines)
+        self.request_update()
+
+    def undo(self) -> None:
+        """Deshace el último cambio de la configuración"""
+
+        if command := self.edit_history.undo():
+            self.apply_command(command)
+            self.request_update()
+
+    def redo(self) -> None:
+        """Rehace el último cambio deshecho de la configuración"""
+
+        if command := self.edit_history.redo():
+            self.apply_command(command)
+            self.request_update()
 
     # *
     # * Menú Ayuda ---------------------------------------------------------- *
@@ -566,7 +937,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.insert_after(data_pack)
 
-        self.update_data()
+        self.request_update()
 
     def insert_after(self, data_pack: list):
         """Inserta los datos nuevos después de la línea seleccionada
@@ -575,12 +946,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             data_pack (list): Datos a insertar
         """
 
-        for pack in data_pack:
-            task = pack[0]
-            data = pack[1]
-            index = self.current_selection[0] + 1
-            self.config_list.insert(index, [task, data])
-            self.current_selection = [index]
+        first = self.current_selection[0] + 1
+        lines = [[task, data] for task, data in data_pack]
+        self.replace_lines(first, first, lines, [first + len(lines) - 1])
 
     def insert_end(self, data_pack):
         """Inserta los datos nuevos al final de la lista
@@ -589,11 +957,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             data_pack (list): Datos a insertar
         """
 
-        for pack in data_pack:
-            task = pack[0]
-            data = pack[1]
-            self.config_list.append([task, data])
-            self.current_selection = [len(self.config_list) - 1]
+        first = len(self.config_list)
+        lines = [[task, data] for task, data in data_pack]
+        self.replace_lines(first, first, lines, [first + len(lines) - 1])
 
     def change_modified(self, data_pack: list) -> None:
         """Modifica los datos de la línea seleccionada
@@ -602,37 +968,517 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             data_pack (list): Lista de datos modificados
         """
 
-        task = data_pack[0][0]
-        data = data_pack[0][1]
+        task, data = data_pack[0]
         index = self.current_selection[0]
-        self.config_list[index] = [task, data]
+        self.replace_lines(index, index + 1, [[task, data]])
+
+    def replace_lines(
+        self, first: int, end: int, lines: list, selection: list = None
+    ) -> None:
+        """Reemplaza un rango de líneas de configuración y registra el cambio
+
+        Args:
+            first (int): Primera línea del rango
+            end (int): Línea siguiente a la última del rango
+            lines (list): Líneas nuevas del rango
+            selection (list): Selección después del cambio, la actual si no
+                se indica
+        """
+
+        old_selection = tuple(self.current_selection)
+        if selection is None:
+            selection = old_selection
+
+        old_lines = tuple(self.config_list[first:end])
+        new_lines = tuple(config_line(task, data) for task, data in lines)
+        command = Edit_command(
+            first, old_lines, new_lines, old_selection, tuple(selection)
+        )
+        self.edit_history.record(command)
+        self.apply_command(command)
+
+    def apply_command(self, command: Edit_command) -> None:
+        """Aplica un cambio de líneas de configuración y lo anota en el diario
+
+        Args:
+            command (Edit_command): Cambio a aplicar
+        """
+
+        first = command.first
+        old_end = first + len(command.old_lines)
+        new_end = first + len(command.new_lines)
+
+        self.config_list[first:old_end] = command.new_lines
+        self.config_model.update_rows(self.config_list, (first, old_end, new_end))
+        self.set_dirty_lines(first, new_end, new_end - old_end)
+        self.current_selection = list(command.selection)
+
+        if self.journal is None:
+            self.start_journal(None)
+        self.journal.record(first, len(command.old_lines), command.new_lines)
 
     def update_data(self) -> None:
         """Actualiza pantalla después de abrir"""
 
-        self.tape_add()
-        self.update_config_widget()
-        self.update_tape_widgets()
-        self.config_update_selection()
-        self.tape1_update_selection()
-        self.tape2_update_selection()
+        self.cancel_regeneration()
+        span = self.profiler.span
+
+        with span("update_data"):
+            with span("tape_add"):
+                self.tape_add()
+            with span("update_config_widget", "tabla"):
+                self.update_config_widget()
+            with span("update_tape_widgets", "tabla"):
+                self.update_tape_widgets()
+            with span("config_update_selection", "selección"):
+                self.config_update_selection()
+            with span("tape1_update_selection", "selección"):
+                self.tape1_update_selection()
+            with span("tape2_update_selection", "selección"):
+                self.tape2_update_selection()
+            with span("update_cycle_time"):
+                self.update_cycle_time()
+            with span("update_graph"):
+                self.update_graph()
         self.modified_task = False
 
-    def tape_add(self) -> None:
-        """Genera líneas de tape a partir de la configuración"""
+        self.show_profile()
 
-        self.tape1_list = []
-        self.tape2_list = []
-        self.current_config_line = 0
+    def request_update(self) -> None:
+        """Actualiza pantalla después de un cambio de la configuración
+
+        Los programas grandes se regeneran en segundo plano, mientras tanto
+        las tablas de tape muestran el tape anterior.
+        """
+
+        if len(self.config_list) < self.background_lines:
+            self.update_data()
+            return
+
+        if self.dirty_lines is None:
+            self.config_model.update_rows(self.config_list)
+        self.start_regeneration()
+
+        self.save_required = True
+        self.modified_task = False
+        self.config_update_selection()
+        self.load_main_title()
+
+    def start_regeneration(self) -> None:
+        """Inicia la regeneración del tape en segundo plano
+
+        La regeneración en curso se cancela; la nueva parte del último tape
+        aplicado con todas las líneas modificadas desde entonces.
+        """
+
+        self.cancel_regeneration(wait=False)
+        self.cancel_cycle_time()
+        self.regeneration = Tape_regeneration(
+            tuple(self.config_list),
+            self.dirty_lines,
+            self.line_states,
+            self.tape1_list,
+            self.tape2_list,
+            self.generator_cache,
+        )
+        worker = Regeneration_worker(self.regeneration, self.regeneration_signals)
+        self.regeneration_pool.start(worker)
+
+        self.busy_indicator.show()
+        self.statusbar.showMessage("Generando tape...")
+
+    def cancel_regeneration(self, wait: bool = True) -> None:
+        """Cancela la regeneración en segundo plano
+
+        Args:
+            wait (bool): Esperar a que el hilo de regeneración se detenga
+        """
 
-        for line in self.config_list:
+        if self.regeneration is not None:
+            self.regeneration.cancel()
+            self.regeneration = None
+            self.busy_indicator.hide()
+            self.statusbar.clearMessage()
+
+        if wait:
+            self.regeneration_pool.waitForDone()
+
+    def regeneration_finished(self, regeneration: Tape_regeneration) -> None:
+        """Aplica el tape regenerado en segundo plano
+
+        Args:
+            regeneration (Tape_regeneration): Regeneración terminada
+        """
+
+        if regeneration is not self.regeneration:
+            return
+
+        self.regeneration = None
+        self.busy_indicator.hide()
+        self.statusbar.clearMessage()
+
+        span = self.profiler.span
+        with span("apply_regeneration"):
+            with span("load_regeneration"):
+                self.load_regeneration(regeneration)
+            with span("update_config_widget", "tabla"):
+                self.update_config_widget()
+            with span("update_tape_widgets", "tabla"):
+                self.update_tape_widgets()
+            with span("tape1_update_selection", "selección"):
+                self.tape1_update_selection()
+            with span("tape2_update_selection", "selección"):
+                self.tape2_update_selection()
+            with span("update_cycle_time"):
+                self.update_cycle_time()
+            with span("update_graph"):
+                self.update_graph()
+        self.load_main_title()
+
+        self.show_profile()
+
+    def regeneration_failed(
+        self, regeneration: Tape_regeneration, error: Exception
+    ) -> None:
+        """Repite en el hilo de la interfaz una regeneración que falló
+
+        Args:
+            regeneration (Tape_regeneration): Regeneración que falló
+            error (Exception): Error de la regeneración
+        """
+
+        if regeneration is self.regeneration:
+            self.update_data()
+
+    def load_regeneration(self, regeneration: Tape_regeneration) -> None:
+        """Toma el tape y el estado final de una regeneración terminada
+
+        Args:
+            regeneration (Tape_regeneration): Regeneración terminada
+        """
+
+        for index, data in regeneration.prepared.items():
+            self.config_list[index][1] = data
+
+        state = regeneration.state
+        self.tape1_list = state.tape1_list
+        self.tape2_list = state.tape2_list
+        self.line_states = regeneration.line_states
+        self.dirty_lines = None
+        self.config_changes = regeneration.config_changes
+        self.tape1_changes = regeneration.tape1_changes
+        self.tape2_changes = regeneration.tape2_changes
+
+        load_machining_state(self, machining_state(state))
+        self.current_config_line = state.current_config_line
+        if regeneration.first == 0 and self.config_list:
+            self.update_file_name()
+            self.update_file_dir()
+        self.restore_buttons()
+
+    def update_cycle_time(self) -> None:
+        """Estima el tiempo de ciclo del tape actual
+
+        Los programas grandes se estiman en segundo plano, mientras tanto se
+        muestra la estimación anterior.
+        """
+
+        self.cancel_cycle_time()
+        estimate = Cycle_time(
+            self.current_machine,
+            self.tape1_list,
+            self.tape2_list,
+            tool_call_sides(self.config_list),
+        )
+
+        if len(self.config_list) < self.background_lines:
+            estimate.run()
+            self.show_cycle_time(estimate)
+            return
+
+        self.cycle_time = estimate
+        worker = Regeneration_worker(estimate, self.cycle_time_signals)
+        self.regeneration_pool.start(worker)
+
+    def cancel_cycle_time(self) -> None:
+        """Cancela la estimación del tiempo de ciclo en segundo plano"""
+
+        if self.cycle_time is not None:
+            self.cycle_time.cancel()
+            self.cycle_time = None
+
+    def cycle_time_finished(self, estimate: Cycle_time) -> None:
+        """Muestra la estimación terminada en segundo plano
+
+        Args:
+            estimate (Cycle_time): Estimación terminada
+        """
+
+        if estimate is self.cycle_time:
+            self.cycle_time = None
+            self.show_cycle_time(estimate)
+
+    def cycle_time_failed(self, estimate: Cycle_time, error: Exception) -> None:
+        """Borra la estimación cuando falla en segundo plano
+
+        Args:
+            estimate (Cycle_time): Estimación que falló
+            error (Exception): Error de la estimación
+        """
+
+        if estimate is self.cycle_time:
+            self.cycle_time = None
+            self.cycle_time_label.clear()
+            self.cycle_time_label.setToolTip("")
+
+    def show_cycle_time(self, estimate: Cycle_time) -> None:
+        """Muestra el tiempo de ciclo en la barra de estado
+
+        El detalle por canal y por herramienta se muestra como ayuda.
+
+        Args:
+            estimate (Cycle_time): Estimación terminada
+        """
+
+        if not self.config_list:
+            self.cycle_time_label.clear()
+            self.cycle_time_label.setToolTip("")
+            return
+
+        lines = [f"Tiempo de ciclo: {ftime(estimate.total)}"]
+        lines += [
+            f"Canal {channel}: {ftime(seconds)}"
+            for channel, seconds in estimate.channels.items()
+            if seconds > 0
+        ]
+        lines += [
+            f"T{tool}: {ftime(seconds)}" for tool, seconds in estimate.tools.items()
+        ]
+        self.cycle_time_label.setText(f"Ciclo {ftime(estimate.total)}")
+        self.cycle_time_label.setToolTip("\n".join(lines))
+
+    def show_profile(self) -> None:
+        """Muestra el resumen de la última operación medida"""
+
+        if self.profiler.enabled and not self.profiler.depth:
+            self.statusbar.showMessage(self.profiler.summary())
+
+    def profiler_switch(self, enabled: bool) -> None:
+        """Activa o desactiva la medición de rendimiento
+
+        Args:
+            enabled (bool): Medición activada
+        """
+
+        self.profiler.set_enabled(enabled)
+        self.statusbar.showMessage(
+            "Medición de rendimiento activada" if enabled else ""
+        )
+
+    def export_trace(self) -> None:
+        """Exporta los tiempos medidos en formato de traza de Chrome"""
+
+        file_name = QFileDialog.getSaveFileName(
+            self,
+            caption=("Exportar traza de rendimiento"),
+            dir=f"{self.root_dir}/traza.json",
+            filter=("Traza de Chrome (*.json)"),
+        )
+        if not file_name[0]:
+            return
+
+        events = self.profiler.export_trace(file_name[0])
+        self.statusbar.showMessage(f"{events} intervalos guardados en {file_name[0]}")
+
+    def set_dirty_lines(self, first: int, last: int, shift: int = 0) -> None:
+        """Marca el rango de líneas de configuración modificadas
+
+        Args:
+            first (int): Primera línea modificada
+            last (int): Línea siguiente a la última modificada
+            shift (int): Diferencia de líneas respecto a la lista anterior
+        """
+
+        if self.dirty_lines is not None:
+            # Cambio sobre otro que aún no se regenera: el rango combinado
+            # cubre ambos, medido desde la última generación
+            old_first, old_last, old_shift = self.dirty_lines
+            if old_last > first:
+                old_last += shift
+            first = min(first, old_first)
+            last = max(last, old_last)
+            shift += old_shift
+
+        self.dirty_lines = (first, last, shift)
+
+    def tape_add(self) -> None:
+        """Genera líneas de tape a partir de la configuración
+
+        Solo se regeneran las líneas desde la primera línea modificada, la
+        generación se detiene cuando el estado vuelve a coincidir con el de
+        la generación anterior y el resto del tape se reutiliza.
+        """
+
+        old_states = self.line_states
+        old_tape1 = self.tape1_list
+        old_tape2 = self.tape2_list
+
+        first, last, shift = self.dirty_lines or (0, 0, 0)
+        self.dirty_lines = None
+        self.generator_cache.check_definitions()
+        if first <= 0 or first > len(old_states):
+            first, last = 0, len(self.config_list)
+
+        if first == 0:
+            self.load_machining_data()
+            self.tape1_list = []
+            self.tape2_list = []
+            self.line_states = []
+            self.current_config_line = 0
+            self.config_changes = None
+        else:
+            self.save_required = True
+            self.line_states = old_states[:first]
+            self.load_line_state(first - 1)
+            self.tape1_list = old_tape1[: self.line_states[-1][2]]
+            self.tape2_list = old_tape2[: self.line_states[-1][3]]
+            self.config_changes = (first, last - shift, last)
+        tape1_first = len(self.tape1_list)
+        tape2_first = len(self.tape2_list)
+
+        for index in range(first, len(self.config_list)):
+            old_index = index - shift
+            if index >= last and self.same_line_state(old_states, old_index):
+                _, _, old_end1, old_end2 = old_states[old_index - 1]
+                self.set_tape_changes(tape1_first, tape2_first, old_end1, old_end2)
+                self.reuse_tape_lines(old_states, old_tape1, old_tape2, shift)
+                self.restore_buttons()
+                return
+
+            line = self.config_list[index]
             task = line[0]
             if task != "Inicio de programa":
                 self.current_config_line += 1
 
-            self.tasks_list[task].processor(self, line[1])
-            self.tasks_list[task].button_switcher(self, line[1])
-            self.tasks_list[task].generator(self, line[1])
+            with self.profiler.span(task, "tarea"):
+                self.tasks_list[task].processor(self, line[1])
+                self.tasks_list[task].generator(self, line[1])
+                self.save_line_state()
+
+        self.set_tape_changes(tape1_first, tape2_first, len(old_tape1), len(old_tape2))
+        self.restore_buttons()
+
+    def set_tape_changes(
+        self, tape1_first: int, tape2_first: int, old_end1: int, old_end2: int
+    ) -> None:
+        """Guarda el rango de filas de tape modificadas
+
+        Args:
+            tape1_first (int): Primera fila modificada del tape 1
+            tape2_first (int): Primera fila modificada del tape 2
+            old_end1 (int): Final de las filas modificadas en el tape 1 anterior
+            old_end2 (int): Final de las filas modificadas en el tape 2 anterior
+        """
+
+        if self.config_changes is None:
+            self.tape1_changes = None
+            self.tape2_changes = None
+            return
+
+        self.tape1_changes = (tape1_first, old_end1, len(self.tape1_list))
+        self.tape2_changes = (tape2_first, old_end2, len(self.tape2_list))
+
+    def save_line_state(self) -> None:
+        """Guarda el estado de mecanizado después de procesar una línea"""
+
+        state = machining_state(self)
+        tape1_end = len(self.tape1_list)
+        tape2_end = len(self.tape2_list)
+
+        line_state = (state, self.current_config_line, tape1_end, tape2_end)
+        self.line_states.append(line_state)
+
+    def load_line_state(self, index: int) -> None:
+        """Recupera el estado de mecanizado guardado de una línea
+
+        Args:
+            index (int): Índice de la línea de configuración
+        """
+
+        state, config_line, _, _ = self.line_states[index]
+        load_machining_state(self, state)
+        self.current_config_line = config_line
+
+    def restore_buttons(self) -> None:
+        """Actualiza los botones según la configuración
+
+        Cada tarea fija siempre los mismos botones, basta aplicar una vez
+        cada tarea desde el último encabezado, en el orden de su última
+        aparición.
+        """
+
+        last_tasks = {}
+        for task, data in reversed(self.config_list):
+            last_tasks.setdefault(task, data)
+            if task == "Inicio de programa":
+                break
+        else:
+            self.default_buttons_status()
+
+        modified_task, save_required = self.modified_task, self.save_required
+        for task, data in reversed(last_tasks.items()):
+            self.tasks_list[task].button_switcher(self, data)
+        self.modified_task, self.save_required = modified_task, save_required
+
+    def same_line_state(self, old_states: list, old_index: int) -> bool:
+        """Compara el estado actual con el de la generación anterior
+
+        Args:
+            old_states (list): Estados de la generación anterior
+            old_index (int): Índice anterior de la línea a procesar
+
+        Returns:
+            bool: Condición de igualdad de los estados
+        """
+
+        if not 0 < old_index <= len(old_states):
+            return False
+
+        return old_states[old_index - 1][0] == self.line_states[-1][0]
+
+    def reuse_tape_lines(
+        self, old_states: list, old_tape1: list, old_tape2: list, shift: int
+    ) -> None:
+        """Reutiliza las líneas de tape de la generación anterior
+
+        Args:
+            old_states (list): Estados de la generación anterior
+            old_tape1 (list): Tape 1 de la generación anterior
+            old_tape2 (list): Tape 2 de la generación anterior
+            shift (int): Diferencia de líneas respecto a la lista anterior
+        """
+
+        old_index = len(self.line_states) - shift
+        _, _, old_end1, old_end2 = old_states[old_index - 1]
+        tape1_shift = len(self.tape1_list) - old_end1
+        tape2_shift = len(self.tape2_list) - old_end2
+
+        if shift:
+            self.tape1_list.extend(
+                (line[0] + shift, *line[1:]) for line in old_tape1[old_end1:]
+            )
+            self.tape2_list.extend(
+                (line[0] + shift, *line[1:]) for line in old_tape2[old_end2:]
+            )
+        else:
+            self.tape1_list.extend(old_tape1[old_end1:])
+            self.tape2_list.extend(old_tape2[old_end2:])
+
+        self.line_states.extend(
+            (state, config_line + shift, end1 + tape1_shift, end2 + tape2_shift)
+            for state, config_line, end1, end2 in old_states[old_index:]
+        )
+        self.load_line_state(len(self.line_states) - 1)
 
     def get_parameters(self) -> list:
         """Obtiene los parámetros de configuración para tape
@@ -655,14 +1501,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             param (list): Líneas de parámetros
         """
 
-        par1, par2, par3 = params
-
-        for line in lines[0]:
-            if line != "":
-                self.tape1_list.append((par1, line, par2, par3))
-        for line in lines[1]:
-            if line != "":
-                self.tape2_list.append((par1, line, par2, par3))
+        add_tape_lines(self, lines, params)
 
     def config_modifier(self) -> None:
         """Obtiene la línea de configuración a modificar"""
@@ -678,24 +1517,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     # *
 
     def update_config_widget(self) -> None:
-        """Actualiza ventana de configuración"""
+        """Actualiza ventana de configuración
+
+        Los cambios de líneas se muestran al aplicarlos, aquí solo se recarga
+        la tabla cuando se regenera el tape completo.
+        """
 
-        config = self.config_list
-        self.config_widget.setRowCount(len(config))
-        for num, line in enumerate(config):
-            operation = line[0]
-            self.config_widget.setItem(num, 0, QTableWidgetItem(operation))
+        if self.config_changes is None:
+            self.config_model.update_rows(self.config_list)
 
     def update_tape_widgets(self) -> None:
         """Actualiza ventanas de tape"""
 
-        self.tape1_widget.setRowCount(len(self.tape1_list))
-        for num, line in enumerate(self.tape1_list):
-            self.tape1_widget.setItem(num, 0, QTableWidgetItem(line[1]))
-
-        self.tape2_widget.setRowCount(len(self.tape2_list))
-        for num, line in enumerate(self.tape2_list):
-            self.tape2_widget.setItem(num, 0, QTableWidgetItem(line[1]))
+        self.tape1_model.update_rows(self.tape1_list, self.tape1_changes)
+        self.tape2_model.update_rows(self.tape2_list, self.tape2_changes)
 
     def config_clicked(self):
         """Ejecuta la selección de líneas de configuración"""
@@ -719,42 +1554,37 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Devuelve las líneas seleccionadas de la configuración"""
 
         if self.current_widget == "config_widget":
-            if selected_items := self.config_widget.selectedItems():
-                config_lines = []
-                config_lines.extend(
-                    item.row() for item in selected_items if item.column() == 0
-                )
+            if selected_rows := self.config_widget.selectionModel().selectedRows():
+                config_lines = [index.row() for index in selected_rows]
                 self.current_selection = sorted(list(set(config_lines)))
 
             self.tape1_update_selection()
             self.tape2_update_selection()
+            self.graph_update_selection()
 
     def tape1_selected(self) -> None:
         """Obtiene los items seleccionados en tape2"""
 
         if self.current_widget == "tape1_widget":
-            if selected_items := self.tape1_widget.selectedItems():
-                self.items_selection(selected_items)
+            if selected_rows := self.tape1_widget.selectionModel().selectedRows():
+                self.items_selection(selected_rows, 1)
 
     def tape2_selected(self) -> None:
         """Obtiene los items seleccionados en tape2"""
 
         if self.current_widget == "tape2_widget":
-            if selected_items := self.tape2_widget.selectedItems():
-                self.items_selection(selected_items)
+            if selected_rows := self.tape2_widget.selectionModel().selectedRows():
+                self.items_selection(selected_rows, 2)
 
-    def items_selection(self, selected_items):
+    def items_selection(self, selected_rows: list, tape: int) -> None:
         """Devuelve las líneas seleccionadas de la configuración
 
         Args:
-            selected_items (list): Lista de items seleccionados
+            selected_rows (list): Lista de índices de filas seleccionadas
+            tape (int): Número de tape seleccionado (1 o 2)
         """
-        selected_list = []
-        selected_list.extend(
-            item.row() for item in selected_items if item.column() == 0
-        )
 
-        config_lines = [self.tape1_list[line][0] for line in selected_list]
+        config_lines = [self.config_line(index.row(), tape) for index in selected_rows]
         self.current_selection = sorted(list(set(config_lines)))
 
         if self.current_widget == "tape1_widget":
@@ -763,71 +1593,103 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         elif self.current_widget == "tape2_widget":
             self.config_update_selection()
             self.tape1_update_selection()
+        self.graph_update_selection()
 
-    def config_update_selection(self) -> None:
-        """Actualiza líneas seleccionadas en config"""
+    def tape_rows(self, config_line: int, tape: int) -> tuple:
+        """Obtiene el rango de filas de tape generadas por una línea
 
-        all_items = [
-            self.config_widget.item(index_number, 0)
-            for index_number in range(len(self.config_list))
-        ]
+        Args:
+            config_line (int): Índice de la línea de configuración
+            tape (int): Número de tape (1 o 2)
 
-        indexes = self.current_selection
-        items = [self.config_widget.item(index, 0) for index in indexes]
+        Returns:
+            tuple: Primera fila y fila siguiente a la última
+        """
 
-        self.items_selector(all_items, items, self.config_widget)
+        column = tape + 1
+        start = self.line_states[config_line - 1][column] if config_line else 0
+        end = self.line_states[config_line][column]
 
-    def tape1_update_selection(self) -> None:
-        """Actualiza líneas seleccionadas en tape1"""
+        return start, end
 
-        all_items = [
-            self.tape1_widget.item(index_number, 0)
-            for index_number in range(len(self.tape1_list))
-        ]
+    def config_line(self, row: int, tape: int) -> int:
+        """Obtiene la línea de configuración que generó una fila de tape
 
-        config_indexes = self.current_selection
-        indexes = [
-            num
-            for num, index in enumerate(self.tape1_list)
-            if index[0] in config_indexes
-        ]
-        items = [self.tape1_widget.item(index, 0) for index in indexes]
+        Args:
+            row (int): Fila del tape
+            tape (int): Número de tape (1 o 2)
 
-        self.items_selector(all_items, items, self.tape1_widget)
+        Returns:
+            int: Índice de la línea de configuración
+        """
 
-    def tape2_update_selection(self) -> None:
+        tape_list = self.tape1_list if tape == 1 else self.tape2_list
+        return tape_list[row][0]
+
+    def selection_ranges(self, tape: int = 0) -> list:
+        """Obtiene los rangos de filas de la selección actual
+
+        Args:
+            tape (int): Número de tape (1 o 2), 0 para la configuración
+
+        Returns:
+            list: Lista de rangos de filas contiguos
+        """
+
+        ranges = []
+        if tape and self.regeneration is not None:
+            return ranges
+
+        for config_line in self.current_selection:
+            if config_line >= len(self.line_states):
+                break
+
+            if tape:
+                start, end = self.tape_rows(config_line, tape)
+            else:
+                start, end = config_line, config_line + 1
+
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            elif start < end:
+                ranges.append((start, end))
+
+        return ranges
+
+    def config_update_selection(self) -> None:
+        """Actualiza líneas seleccionadas en config"""
+
+        self.items_selector(self.selection_ranges(), self.config_widget)
+
+    def tape1_update_selection(self) -> None:
         """Actualiza líneas seleccionadas en tape1"""
 
-        all_items = [
-            self.tape2_widget.item(index_number, 0)
-            for index_number in range(len(self.tape2_list))
-        ]
+        self.items_selector(self.selection_ranges(1), self.tape1_widget)
 
-        config_indexes = self.current_selection
-        indexes = [
-            num
-            for num, index in enumerate(self.tape2_list)
-            if index[0] in config_indexes
-        ]
-        items = [self.tape2_widget.item(index, 0) for index in indexes]
+    def tape2_update_selection(self) -> None:
+        """Actualiza líneas seleccionadas en tape2"""
 
-        self.items_selector(all_items, items, self.tape2_widget)
+        self.items_selector(self.selection_ranges(2), self.tape2_widget)
 
-    def items_selector(self, all_items, items, widget):
-        """Selecciona los items en el widget
+    def items_selector(self, ranges: list, widget: QAbstractItemView) -> None:
+        """Selecciona los rangos de filas en el widget
 
         Args:
-            all_items (list): Lista total de items en el widget
-            items (list): Items a seleccionar
-            widget (QTableWidget): Widget a seleccionar
+            ranges (list): Rangos de filas a seleccionar
+            widget (QAbstractItemView): Widget a seleccionar
         """
-        with contextlib.suppress(AttributeError, IndexError):
-            for item in all_items:
-                item.setSelected(False)
-            for item in items:
-                item.setSelected(True)
+
+        model = widget.model()
+        selection = QItemSelection()
+        for start, end in ranges:
+            selection.select(model.index(start, 0), model.index(end - 1, 0))
+
+        flags = QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+        widget.selectionModel().select(selection, flags)
+        if ranges:
             view = QAbstractItemView
-            widget.scrollToItem(items[-1], view.PositionAtCenter)
+            last_row = model.index(ranges[-1][1] - 1, 0)
+            widget.scrollTo(last_row, view.PositionAtCenter)
 
     def keyPressEvent(self, qKeyEvent) -> None:
         """Configurar comportamento de teclas presionadas
@@ -857,15 +1719,59 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         image_load(self.helper1.lbl_image, image)
 
     def graph(self) -> None:
-        """Mostrar subventana"""
+        """Mostrar subventana
+
+        La ventana y pyqtgraph se importan la primera vez que se abre.
+        """
+        from app_tools.graph_tools import Graph
+
         if self.graph1:
             del self.graph1
-        self.graph1 = Graph()
+        self.graph1 = Graph([self.tape1_list, self.tape2_list])
+        self.graph1.highlight_lines(self.current_selection)
         self.graph1.show()
 
+    def update_graph(self) -> None:
+        """Actualiza la ventana de gráfico con los cambios del tape
+
+        Una ventana cerrada no se actualiza; al abrirla de nuevo se grafica
+        el tape completo.
+        """
+
+        if self.graph1 is None or not self.graph1.isVisible():
+            return
+
+        tapes = [self.tape1_list, self.tape2_list]
+        changes = [self.tape1_changes, self.tape2_changes]
+        self.graph1.update_tapes(tapes, changes, self.current_selection)
+
+    def graph_update_selection(self) -> None:
+        """Resalta en la ventana de gráfico las líneas seleccionadas"""
+
+        if self.graph1 is not None and self.graph1.isVisible():
+            self.graph1.highlight_lines(self.current_selection)
+
+    def task_dialog(self, task_class: type) -> object:
+        """Obtiene la ventana de una tarea, creándola solo la primera vez
+
+        Args:
+            task_class (type): Clase de la ventana de la tarea
+
+        Returns:
+            object: Ventana lista para mostrarse, con sus campos iniciales
+        """
+
+        dialog = self.dialogs.get(task_class)
+        if dialog is None:
+            dialog = task_class()
+            self.dialogs[task_class] = dialog
+
+        dialog.reset_fields()
+        return dialog
+
     def header(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Header()
+        self.subtask1 = self.task_dialog(Header)
         self.subtask1.show()
 
     def free(self) -> None:
@@ -874,17 +1780,17 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def comment(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Comment()
+        self.subtask1 = self.task_dialog(Comment)
         self.subtask1.show()
 
     def subrutine(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Subrutine()
+        self.subtask1 = self.task_dialog(Subrutine)
         self.subtask1.show()
 
     def tool_call(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Tool_call()
+        self.subtask1 = self.task_dialog(Tool_call)
         self.subtask1.show()
 
     def tool_close(self) -> None:
@@ -893,17 +1799,17 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def spindle(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Spindle()
+        self.subtask1 = self.task_dialog(Spindle)
         self.subtask1.show()
 
     def spindle_index(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Spindle_index()
+        self.subtask1 = self.task_dialog(Spindle_index)
         self.subtask1.show()
 
     def misc(self) -> None:
         """Mostrar subventana"""
-        self.subtask1 = Misc()
+        self.subtask1 = self.task_dialog(Misc)
         self.subtask1.show()
 
     def end(self) -> None:
@@ -932,10 +1838,41 @@ class Subtask_window(QMainWindow):
         """Inicializar la clase"""
 
         super().__init__()
+        load_help_resources()
         self.setupUi(self)
         self.move(window.subwinpos_horiz, window.subwinpos_verti)
         self.btn_save.clicked.connect(self.collector)
 
+        self.save_text = self.btn_save.text()
+        self.text_fields = [
+            field
+            for field in self.findChildren(QLineEdit)
+            if not isinstance(field.parent(), QComboBox)
+        ]
+        self.combo_fields = self.findChildren(QComboBox)
+
+    def reset_fields(self) -> None:
+        """Deja la ventana como recién creada para volver a usarla"""
+
+        for field in self.text_fields:
+            field.clear()
+        for field in self.combo_fields:
+            field.setCurrentIndex(0)
+
+        self.btn_save.setText(self.save_text)
+        self.move(window.subwinpos_horiz, window.subwinpos_verti)
+        self.load_defaults()
+
+        field = self.nextInFocusChain()
+        while field is not self and not field.focusPolicy() & QtCore.Qt.TabFocus:
+            field = field.nextInFocusChain()
+        field.setFocus()
+
+    def load_defaults(self) -> None:
+        """Valores iniciales de los campos al abrir la ventana"""
+
+        pass
+
     def keyPressEvent(self, qKeyEvent) -> None:
         """Configurar comportamento de teclas presionadas
 
@@ -1005,66 +1942,6 @@ class Version(QMainWindow, Ui_frm_version):
 # ? ---------------------------------------------------------------------------
 
 
-class Graph(QMainWindow, Ui_GraphWindow):
-    """Ventana de ayuda para la tarea
-
-    Args:
-        QMainWindow (_type_): Clase de la interfaz gráfica principal
-        Ui_GraphWindow (_type_): Interfaz gráfica de la ventana
-    """
-
-    def __init__(self) -> None:
-        """Inicializar la clase"""
-
-        super().__init__()
-        self.setupUi(self)
-
-        self.vertical_moves = [0, 0, 0.1, 0.1]
-        self.trasversal_moves = [0.05, 0.1, 0.15, 0.25]
-        self.horizontal_moves = [0, 0, 0.15, 0.25]
-        self.rapid_horizontal = [-0.05, 0]
-        self.rapid_vertical = [-0.05, 0]
-
-        self.construir_grafico()
-
-    def construir_grafico(self):
-
-        self.graph1_widget.setTitle("X - Z")
-        self.graph1_widget.plot(
-            self.horizontal_moves,
-            self.vertical_moves,
-            pen="blue",
-        )
-        self.graph1_widget.plot(
-            self.rapid_horizontal,
-            self.rapid_vertical,
-            pen="gray",
-        )
-        # self.graph1_widget.setAspectLocked()
-        self.graph1_widget.getPlotItem().hideAxis("bottom")
-        self.graph1_widget.getPlotItem().hideAxis("left")
-
-        self.graph2_widget.setTitle("Y - Z")
-        self.graph2_widget.plot(self.horizontal_moves, self.trasversal_moves)
-        # self.graph2_widget.setAspectLocked()
-        self.graph2_widget.getPlotItem().hideAxis("bottom")
-        self.graph2_widget.getPlotItem().hideAxis("left")
-
-        # self.graph1_widget.setXLink(self.graph2_widget)
-
-    def keyPressEvent(self, qKeyEvent) -> None:
-        """Configurar comportamento de teclas presionadas
-
-        Args:
-            qKeyEvent (any): Evento de tecla presionada
-        """
-
-        keyPressed(self, qKeyEvent)
-
-
-# ? ---------------------------------------------------------------------------
-
-
 class Header(Subtask_window, Ui_frm_header):
     """Encabezado del programa
 
@@ -1125,9 +2002,7 @@ class Header(Subtask_window, Ui_frm_header):
             data["Prt"] = ftext(data["Prt"]) if data["Prt"] != "" else ""
             data["Pgr"] = ftext(data["Pgr"]) if data["Pgr"] != "" else ""
             data["Dsc"] = ftext(data["Dsc"]) if data["Dsc"] != "" else ""
-            data["Dia"] = foper(data["Dia"])
-            data["Lgt"] = foper(data["Lgt"])
-            data["Chk"] = foper(data["Chk"])
+            foper_fields(data, ("Dia", "Lgt", "Chk"))
 
         except ValueError:
             Messages.data_type_error(self)
@@ -1157,8 +2032,8 @@ class Header(Subtask_window, Ui_frm_header):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = header_gen(machine, data)
+        generator = window.generators["Inicio de programa"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1171,7 +2046,7 @@ class Header(Subtask_window, Ui_frm_header):
         window.modified_task = True
         prt, pgr, dsc, mch, dia, lgt, chk, cch, wrk = data.values()
 
-        self.subtask1 = Header()
+        self.subtask1 = self.task_dialog(Header)
         self.subtask1.tbx_prt.setText(str(prt))
         self.subtask1.tbx_prt.setSelection(0, 100)
         self.subtask1.tbx_pgr.setText(str(pgr))
@@ -1193,15 +2068,7 @@ class Header(Subtask_window, Ui_frm_header):
         """
 
         window.save_required = True
-        window.current_side = "PRINCIPAL"
-        window.current_machine = data["Mch"]
-        window.part_name = data["Prt"]
-        window.main_tape_number = data["Pgr"]
-        window.tape_description = data["Dsc"]
-        window.current_bar_diameter = float(data["Dia"])
-        window.current_part_lenght = float(data["Lgt"])
-        window.current_work_offset = data["Wrk"]
-        window.swiss_back_machining = data["Chk"] > 0
+        header_processor(window, data)
 
         window.update_file_name()
         window.update_file_dir()
@@ -1302,8 +2169,8 @@ class Free(QMainWindow):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = free_gen(machine, data)
+        generator = window.generators[" "]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1354,6 +2221,10 @@ class Comment(Subtask_window, Ui_frm_comment):
         self.btn_help.clicked.connect(lambda: window.helper(image))
 
         self.cbx_sde.addItems(Combo_lists.tape_sides)
+
+    def load_defaults(self) -> None:
+        """Valores iniciales de los campos al abrir la ventana"""
+
         self.cbx_sde.setCurrentText(window.current_side)
 
     def collector(self) -> None:
@@ -1415,8 +2286,8 @@ class Comment(Subtask_window, Ui_frm_comment):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = comment_gen(machine, data)
+        generator = window.generators["        Comentario"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1429,7 +2300,7 @@ class Comment(Subtask_window, Ui_frm_comment):
         window.modified_task = True
         com, sde, blk = data.values()
 
-        self.subtask1 = Comment()
+        self.subtask1 = self.task_dialog(Comment)
         self.subtask1.tbx_com.setText(str(com))
         self.subtask1.tbx_com.setSelection(0, 100)
         self.subtask1.cbx_sde.setCurrentText(str(sde))
@@ -1444,8 +2315,7 @@ class Comment(Subtask_window, Ui_frm_comment):
         """
 
         window.save_required = True
-        window.current_comment = data["Com"]
-        window.current_side = data["Sde"]
+        comment_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -1536,8 +2406,8 @@ class Subrutine(Subtask_window, Ui_frm_subrutine):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = subrutine_gen(machine, data)
+        generator = window.generators["        -> Subrutina"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1550,7 +2420,7 @@ class Subrutine(Subtask_window, Ui_frm_subrutine):
         window.modified_task = True
         sub, rep, blk = data.values()
 
-        self.subtask1 = Subrutine()
+        self.subtask1 = self.task_dialog(Subrutine)
         self.subtask1.tbx_sub.setText(str(sub))
         self.subtask1.tbx_sub.setSelection(0, 100)
         self.subtask1.tbx_rep.setText(str(rep))
@@ -1565,7 +2435,7 @@ class Subrutine(Subtask_window, Ui_frm_subrutine):
         """
 
         window.save_required = True
-        window.current_side = "PRINCIPAL"
+        main_side_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -1599,6 +2469,10 @@ class Tool_call(Subtask_window, Ui_frm_tool_call):
 
         self.cbx_typ.addItems(Combo_lists.tool_list)
         self.cbx_sde.addItems(Combo_lists.tape_sides)
+
+    def load_defaults(self) -> None:
+        """Valores iniciales de los campos al abrir la ventana"""
+
         self.cbx_sde.setCurrentText(window.current_side)
 
     def collector(self) -> None:
@@ -1638,11 +2512,8 @@ class Tool_call(Subtask_window, Ui_frm_tool_call):
 
         try:
             data["Tol"] = int(data["Tol"])
-            data["Dia"] = foper(data["Dia"])
             data["Spc"] = ftext(data["Spc"]) if data["Spc"] != "" else ""
-            data["Xin"] = foper(data["Xin"])
-            data["Yin"] = foper(data["Yin"])
-            data["Zin"] = foper(data["Zin"])
+            foper_fields(data, ("Dia", "Xin", "Yin", "Zin"))
         except ValueError:
             Messages.data_type_error(self)
             return
@@ -1707,8 +2578,8 @@ class Tool_call(Subtask_window, Ui_frm_tool_call):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = tool_call_gen(machine, data)
+        generator = window.generators["    Llamar herramienta"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1721,7 +2592,7 @@ class Tool_call(Subtask_window, Ui_frm_tool_call):
         window.modified_task = True
         tol, typ, dia, spc, sde, xin, yin, zin, blk = data.values()
 
-        self.subtask1 = Tool_call()
+        self.subtask1 = self.task_dialog(Tool_call)
         self.subtask1.tbx_tol.setText(str(tol))
         self.subtask1.tbx_tol.setSelection(0, 100)
         self.subtask1.cbx_typ.setCurrentText(str(typ))
@@ -1742,8 +2613,7 @@ class Tool_call(Subtask_window, Ui_frm_tool_call):
         """
 
         window.save_required = True
-        window.current_tool = int(data["Tol"])
-        window.current_side = data["Sde"]
+        tool_call_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -1821,13 +2691,11 @@ class Tool_close(QMainWindow):
             data (dict): Diccionario de datos recopilados
         """
 
-        data["Tol"] = window.current_tool
-        data["Sde"] = window.current_side
-        data["Dia"] = window.current_bar_diameter
+        tool_close_data(window, data)
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = tool_close_gen(machine, data)
+        generator = window.generators["    Cerrar herramienta"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1879,6 +2747,10 @@ class Spindle(Subtask_window, Ui_frm_spindle):
 
         self.cbx_rot.addItems(Combo_lists.rotation_directions)
         self.cbx_sde.addItems(Combo_lists.tape_sides)
+
+    def load_defaults(self) -> None:
+        """Valores iniciales de los campos al abrir la ventana"""
+
         self.cbx_sde.setCurrentText(window.current_side)
 
     def collector(self) -> None:
@@ -1941,8 +2813,8 @@ class Spindle(Subtask_window, Ui_frm_spindle):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = spindle_gen(machine, data)
+        generator = window.generators["        Giro husillo"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -1955,7 +2827,7 @@ class Spindle(Subtask_window, Ui_frm_spindle):
         window.modified_task = True
         spd, rot, sde, blk = data.values()
 
-        self.subtask1 = Spindle()
+        self.subtask1 = self.task_dialog(Spindle)
         self.subtask1.tbx_spd.setText(str(spd))
         self.subtask1.tbx_spd.setSelection(0, 100)
         self.subtask1.cbx_rot.setCurrentText(str(rot))
@@ -1971,7 +2843,7 @@ class Spindle(Subtask_window, Ui_frm_spindle):
         """
 
         window.save_required = True
-        window.current_side = data["Sde"]
+        side_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -2063,8 +2935,8 @@ class Spindle_index(Subtask_window, Ui_frm_spindle_index):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = spindle_index_gen(machine, data)
+        generator = window.generators["        Orientar husillo"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -2077,7 +2949,7 @@ class Spindle_index(Subtask_window, Ui_frm_spindle_index):
         window.modified_task = True
         grd, rot, blk = data.values()
 
-        self.subtask1 = Spindle_index()
+        self.subtask1 = self.task_dialog(Spindle_index)
         self.subtask1.tbx_grd.setText(str(grd))
         self.subtask1.tbx_grd.setSelection(0, 100)
         self.subtask1.cbx_rot.setCurrentText(str(rot))
@@ -2092,7 +2964,7 @@ class Spindle_index(Subtask_window, Ui_frm_spindle_index):
         """
 
         window.save_required = True
-        window.current_side = "PRINCIPAL"
+        main_side_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -2127,6 +2999,10 @@ class Misc(Subtask_window, Ui_frm_misc):
         self.cbx_chk.addItems(Combo_lists.collet_operations)
         self.cbx_col.addItems(Combo_lists.coolant_operations)
         self.cbx_sde.addItems(Combo_lists.tape_sides)
+
+    def load_defaults(self) -> None:
+        """Valores iniciales de los campos al abrir la ventana"""
+
         self.cbx_sde.setCurrentText(window.current_side)
 
     def collector(self) -> None:
@@ -2191,8 +3067,8 @@ class Misc(Subtask_window, Ui_frm_misc):
         """
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = misc_gen(machine, data)
+        generator = window.generators["        Funciones M"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -2205,7 +3081,7 @@ class Misc(Subtask_window, Ui_frm_misc):
         window.modified_task = True
         com, stp, chk, col, sde, blk = data.values()
 
-        self.subtask1 = Misc()
+        self.subtask1 = self.task_dialog(Misc)
         self.subtask1.tbx_com.setText(str(com))
         self.subtask1.tbx_com.setSelection(0, 100)
         self.subtask1.cbx_stp.setCurrentText(str(stp))
@@ -2223,7 +3099,7 @@ class Misc(Subtask_window, Ui_frm_misc):
         """
 
         window.save_required = True
-        window.current_side = data["Sde"]
+        side_processor(window, data)
 
     def button_switcher(self, data: dict) -> None:
         """Actualiza las condiciones de los botones
@@ -2280,11 +3156,11 @@ class End(QMainWindow):
             data (dict): Diccionario de datos recopilados
         """
 
-        data["Mch"] = window.current_machine
+        end_data(window, data)
 
         parameters = window.get_parameters()
-        machine = window.current_machine
-        lines = end_gen(machine, data)
+        generator = window.generators["Fin de programa"]
+        lines = window.generator_cache.generate(generator, data)
         window.tape_generator(lines, parameters)
 
     def modifier(self, data: dict) -> None:
@@ -2320,6 +3196,7 @@ class End(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    load_theme(app)
 
     translator = QTranslator(app)
     translations = QLibraryInfo.location(QLibraryInfo.TranslationsPath)
@@ -2329,4 +3206,5 @@ if __name__ == "__main__":
     window = MainWindow()
     window.show()
     window.setWindowState(QtCore.Qt.WindowMaximized)
+    window.recover_session()
     sys.exit(app.exec())
@@ -0,0 +1,504 @@
+import numpy as np
+
+# Pirámide de diezmado de un trazo de la trayectoria:
+#   nivel 0: cada segmento del trazo (punto i al i + 1)
+#   nivel k: grupos de branching ** k segmentos seguidos
+# Cada grupo guarda su rectángulo (mínimo y máximo horizontal y vertical) y
+# los puntos donde se alcanzan esos extremos. Al dibujar se baja desde el
+# nivel más alto solo por los grupos que tocan la vista. Un grupo que cabe
+# en una franja de un pixel de ancho o de alto se dibuja con sus puntos
+# extremos unidos, en vez de todos sus segmentos, y cubre toda la franja
+# entre ellos. Los segmentos que no se unen no forman parte de ningún grupo.
+#
+# Lo que se dibuja se junta además por celdas de la pantalla: un tramo por
+# fila o columna de pixeles cubiertos y una diagonal por par de celdas, así
+# la cantidad de puntos depende del tamaño de la vista y no del trazo. Para
+# no recorrer todo el trazo en cada cuadro se guardan grillas del trazo ya
+# juntado con celdas de 2 ** -k del rectángulo completo; la vista usa la de
+# celdas más parecidas a un pixel y solo baja por la pirámide cuando la
+# vista es más fina que todas. Los segmentos horizontales y verticales que
+# se traslapan se juntan antes de armar la pirámide.
+
+branching = 4
+extreme_kinds = 4
+pixel_tolerance = 1.0
+finest_grid = 14
+
+
+def straight_runs(lines: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> tuple:
+    """Junta los segmentos de una misma recta que se tocan
+
+    Args:
+        lines (np.ndarray): Posición de la recta de cada segmento
+        starts (np.ndarray): Posición de un extremo sobre la recta
+        ends (np.ndarray): Posición del otro extremo sobre la recta
+
+    Returns:
+        tuple: Recta, inicio y final de cada tramo juntado
+    """
+
+    low, high = np.minimum(starts, ends), np.maximum(starts, ends)
+    origin = low.min()
+    order = np.lexsort((low, lines))
+    lines, low, high = lines[order], low[order] - origin, high[order] - origin
+
+    # Cada recta ocupa su propio rango de una escala común, así el máximo
+    # acumulado no pasa de una recta a la siguiente
+    scale = 2 * high.max() + 1
+    offset = np.cumsum(np.diff(lines, prepend=lines[0]) != 0) * scale
+    reach = np.maximum.accumulate(high + offset)
+    first = np.ones(len(lines), bool)
+    first[1:] = low[1:] + offset[1:] > reach[:-1]
+    firsts = np.flatnonzero(first)
+    lasts = np.append(firsts[1:], len(lines)) - 1
+    return lines[firsts], low[firsts] + origin, reach[lasts] - offset[lasts] + origin
+
+
+def merge_straight(
+    horizontal: np.ndarray, vertical: np.ndarray, connect: np.ndarray
+) -> tuple:
+    """Junta los segmentos horizontales y verticales que se traslapan
+
+    Cada segmento paralelo a un eje sale del trazo y pasa al final, dentro
+    de un tramo suelto con los demás segmentos de su recta que lo tocan. En
+    un taladrado los movimientos repetidos quedan en pocos tramos. Los
+    puntos que ya no forman parte de ningún segmento se quitan.
+
+    Args:
+        horizontal (np.ndarray): Coordenadas horizontales
+        vertical (np.ndarray): Coordenadas verticales
+        connect (np.ndarray): Indica si cada punto se une con el siguiente
+
+    Returns:
+        tuple: Coordenadas horizontales, verticales y arreglo de conexión
+    """
+
+    segments = np.flatnonzero(connect[:-1])
+    start_h, end_h = horizontal[segments], horizontal[segments + 1]
+    start_v, end_v = vertical[segments], vertical[segments + 1]
+    flat = start_v == end_v
+    upright = (start_h == end_h) & ~flat
+    extra_h, extra_v = [], []
+    if flat.any():
+        line, low, high = straight_runs(start_v[flat], start_h[flat], end_h[flat])
+        extra_h.append(np.column_stack((low, high)).ravel())
+        extra_v.append(np.repeat(line, 2))
+    if upright.any():
+        line, low, high = straight_runs(
+            start_h[upright], start_v[upright], end_v[upright]
+        )
+        extra_h.append(np.repeat(line, 2))
+        extra_v.append(np.column_stack((low, high)).ravel())
+    if not extra_h:
+        return horizontal, vertical, connect
+
+    # Del trazo quedan solo los puntos de los segmentos que siguen unidos
+    connect = connect.copy()
+    connect[segments[flat | upright]] = False
+    connect[-1] = False
+    kept = connect.copy()
+    kept[1:] |= connect[:-1]
+    extra_connect = np.zeros(sum(map(len, extra_h)), bool)
+    extra_connect[0::2] = True
+    return (
+        np.concatenate((horizontal[kept], *extra_h)),
+        np.concatenate((vertical[kept], *extra_v)),
+        np.concatenate((connect[kept], extra_connect)),
+    )
+
+
+def cell_runs(
+    lines: np.ndarray, starts: np.ndarray, ends: np.ndarray, count: int
+) -> tuple:
+    """Junta en tramos las celdas cubiertas de cada fila o columna
+
+    Args:
+        lines (np.ndarray): Fila o columna de cada tramo
+        starts (np.ndarray): Primera celda de cada tramo
+        ends (np.ndarray): Última celda de cada tramo
+        count (int): Cantidad de celdas de una fila o columna
+
+    Returns:
+        tuple: Fila o columna, primera celda y celda siguiente a la última
+            de cada tramo juntado
+    """
+
+    # Cada fila ocupa su propio rango de claves, así un tramo no pasa de
+    # una fila a la siguiente
+    offset = lines * (count + 1)
+    low = np.minimum(starts, ends) + offset
+    high = np.maximum(starts, ends) + offset
+    order = np.argsort(low)
+    low, high = low[order], np.maximum.accumulate(high[order])
+    first = np.ones(len(low), bool)
+    first[1:] = low[1:] > high[:-1] + 1
+    starts = np.flatnonzero(first)
+    ends = np.append(starts[1:], len(low))[: len(starts)] - 1
+    lines, low = np.divmod(low[starts], count + 1)
+    return lines, low, high[ends] - lines * (count + 1) + 1
+
+
+def screen_segments(
+    horizontal: np.ndarray,
+    vertical: np.ndarray,
+    connect: np.ndarray,
+    view_range: tuple,
+    cell: tuple,
+) -> tuple:
+    """Junta por celdas de la pantalla los segmentos a dibujar
+
+    Los segmentos dentro de una fila de celdas se juntan en tramos por fila
+    y los de una columna en tramos por columna. Un segmento entre celdas
+    vecinas en diagonal marca sus dos celdas en su fila. Las demás
+    diagonales se dibujan una vez por par de celdas, entre sus centros, o
+    igual que vienen si tienen un extremo fuera de la vista. Los tramos
+    empiezan y terminan un cuarto de celda adentro de sus celdas, así al
+    juntarlos otra vez en celdas del doble de tamaño no crecen.
+
+    Args:
+        horizontal (np.ndarray): Coordenadas horizontales
+        vertical (np.ndarray): Coordenadas verticales
+        connect (np.ndarray): Indica si cada punto se une con el siguiente
+        view_range (tuple): Mínimo y máximo horizontal, mínimo y máximo
+            vertical de la vista
+        cell (tuple): Ancho y alto de una celda
+
+    Returns:
+        tuple: Coordenadas horizontales, verticales y arreglo de conexión,
+            de a dos puntos por segmento
+    """
+
+    left, right, bottom, top = view_range
+    width, height = cell
+    columns = max(int(np.ceil((right - left) / width)), 1)
+    rows = max(int(np.ceil((top - bottom) / height)), 1)
+    segments = np.flatnonzero(connect[:-1])
+    column_0, column_1, row_0, row_1 = (
+        np.clip(np.floor((values - origin) / size), -1, count).astype(np.int64)
+        for values, origin, size, count in (
+            (horizontal[segments], left, width, columns),
+            (horizontal[segments + 1], left, width, columns),
+            (vertical[segments], bottom, height, rows),
+            (vertical[segments + 1], bottom, height, rows),
+        )
+    )
+
+    flat = row_0 == row_1
+    upright = (column_0 == column_1) & ~flat
+    near = (np.abs(column_1 - column_0) <= 1) & (np.abs(row_1 - row_0) <= 1)
+    near &= ~(flat | upright)
+    slanted = ~(flat | upright | near)
+    inside = np.ones(len(segments), bool)
+    for values, count in (
+        (column_0, columns),
+        (column_1, columns),
+        (row_0, rows),
+        (row_1, rows),
+    ):
+        inside &= (values >= 0) & (values < count)
+
+    clip_rows = lambda values: np.clip(values, 0, rows - 1)
+    clip_columns = lambda values: np.clip(values, 0, columns - 1)
+    row_runs = cell_runs(
+        clip_rows(np.concatenate((row_0[flat], row_0[near], row_1[near]))),
+        clip_columns(np.concatenate((column_0[flat], column_0[near], column_1[near]))),
+        clip_columns(np.concatenate((column_1[flat], column_0[near], column_1[near]))),
+        columns,
+    )
+    column_runs = cell_runs(
+        clip_columns(column_0[upright]),
+        clip_rows(row_0[upright]),
+        clip_rows(row_1[upright]),
+        rows,
+    )
+
+    # Diagonales entre celdas de la vista, una por par de celdas sin
+    # importar el sentido
+    chosen = slanted & inside
+    cells = rows * columns
+    first_cell = row_0[chosen] * columns + column_0[chosen]
+    last_cell = row_1[chosen] * columns + column_1[chosen]
+    pairs = np.unique(
+        np.minimum(first_cell, last_cell) * cells + np.maximum(first_cell, last_cell)
+    )
+    first_cell, last_cell = np.divmod(pairs, cells)
+    first_row, first_column = np.divmod(first_cell, columns)
+    last_row, last_column = np.divmod(last_cell, columns)
+
+    outside = segments[slanted & ~inside]
+    row, first, stop = row_runs
+    column, low, high = column_runs
+    horizontal = (
+        np.column_stack((left + (first + 0.25) * width, left + (stop - 0.25) * width)),
+        np.repeat(left + (column[:, None] + 0.5) * width, 2, axis=1),
+        left + (np.column_stack((first_column, last_column)) + 0.5) * width,
+        np.column_stack((horizontal[outside], horizontal[outside + 1])),
+    )
+    vertical = (
+        np.repeat(bottom + (row[:, None] + 0.5) * height, 2, axis=1),
+        np.column_stack(
+            (bottom + (low + 0.25) * height, bottom + (high - 0.25) * height)
+        ),
+        bottom + (np.column_stack((first_row, last_row)) + 0.5) * height,
+        np.column_stack((vertical[outside], vertical[outside + 1])),
+    )
+    horizontal = np.concatenate(horizontal).ravel()
+    vertical = np.concatenate(vertical).ravel()
+    connect = np.zeros(len(horizontal), bool)
+    connect[0::2] = True
+    return horizontal, vertical, connect
+
+
+class Backplot:
+    """Trazo de la trayectoria con nivel de detalle según la vista"""
+
+    def __init__(
+        self, horizontal: np.ndarray, vertical: np.ndarray, connect: np.ndarray
+    ) -> None:
+        """Construye la pirámide de diezmado del trazo
+
+        Args:
+            horizontal (np.ndarray): Coordenadas horizontales
+            vertical (np.ndarray): Coordenadas verticales
+            connect (np.ndarray): Indica si cada punto se une con el siguiente
+        """
+
+        self.horizontal, self.vertical, self.connect = merge_straight(
+            np.asarray(horizontal, float),
+            np.asarray(vertical, float),
+            np.asarray(connect, bool),
+        )
+        self.breaks = np.append(0, np.cumsum(~self.connect))
+        self.segments = max(len(self.horizontal) - 1, 0)
+        self.levels = []
+
+        bounds, extremes = self.segment_bounds(np.arange(self.segments))
+        while True:
+            self.levels.append((bounds, extremes))
+            if len(extremes) <= branching:
+                break
+            bounds, extremes = self.reduce_level(bounds, extremes)
+        self.grids = self.build_grids()
+
+    def build_grids(self) -> list:
+        """Junta el trazo por celdas de grillas cada vez más finas
+
+        La grilla k divide el rectángulo del trazo en 2 ** k celdas por lado.
+        La más fina se arma desde el trazo y cada una de las otras desde la
+        siguiente más fina.
+
+        Returns:
+            list: Segmentos sueltos de cada grilla, coordenadas horizontales
+                y verticales (n, 2)
+        """
+
+        extent = self.extent()
+        if extent is None:
+            return []
+
+        left, right, bottom, top = extent
+        width, height = (right - left) or 1.0, (top - bottom) or 1.0
+        horizontal, vertical, connect = self.horizontal, self.vertical, self.connect
+        grids = []
+        for depth in range(finest_grid, -1, -1):
+            cell = (width / 2**depth, height / 2**depth)
+            grid_range = (
+                left,
+                left + width + cell[0],
+                bottom,
+                bottom + height + cell[1],
+            )
+            horizontal, vertical, connect = screen_segments(
+                horizontal, vertical, connect, grid_range, cell
+            )
+            grids.append((horizontal.reshape(-1, 2), vertical.reshape(-1, 2)))
+        return grids[::-1]
+
+    def segment_bounds(self, segments: np.ndarray) -> tuple:
+        """Rectángulo y puntos extremos de segmentos del nivel 0
+
+        Args:
+            segments (np.ndarray): Segmentos a consultar
+
+        Returns:
+            tuple: Mínimos y máximos (4, n) y puntos extremos (n, 4)
+        """
+
+        first, last = segments, segments + 1
+        extremes = np.empty((len(segments), extreme_kinds), np.int64)
+        bounds = np.empty((extreme_kinds, len(segments)))
+        for kind, values in enumerate(
+            (self.horizontal, self.horizontal, self.vertical, self.vertical)
+        ):
+            start, end = values[first], values[last]
+            pick_first = start <= end if kind % 2 == 0 else start >= end
+            extremes[:, kind] = np.where(pick_first, first, last)
+            bounds[kind] = np.where(pick_first, start, end)
+
+        # Los segmentos que no se unen nunca quedan en la vista
+        joined = self.connect[first]
+        bounds[0::2, ~joined] = np.inf
+        bounds[1::2, ~joined] = -np.inf
+        return bounds, extremes
+
+    def reduce_level(self, bounds: np.ndarray, extremes: np.ndarray) -> tuple:
+        """Agrupa un nivel de la pirámide en el siguiente
+
+        Args:
+            bounds (np.ndarray): Mínimos y máximos (4, n) del nivel
+            extremes (np.ndarray): Puntos extremos (n, 4) del nivel
+
+        Returns:
+            tuple: Mínimos, máximos y puntos extremos del nivel siguiente
+        """
+
+        count = -(-len(extremes) // branching)
+        padding = count * branching - len(extremes)
+        fill = np.tile([[np.inf], [-np.inf]], (2, padding))
+        bounds = np.hstack((bounds, fill)).reshape(extreme_kinds, count, branching)
+        extremes = np.vstack((extremes, np.zeros((padding, extreme_kinds), np.int64)))
+        extremes = extremes.reshape(count, branching, extreme_kinds)
+
+        groups = np.arange(count)
+        new_bounds = np.empty((extreme_kinds, count))
+        new_extremes = np.empty((count, extreme_kinds), np.int64)
+        for kind in range(extreme_kinds):
+            pick = bounds[kind].argmin(1) if kind % 2 == 0 else bounds[kind].argmax(1)
+            new_bounds[kind] = bounds[kind, groups, pick]
+            new_extremes[:, kind] = extremes[groups, pick, kind]
+        return new_bounds, new_extremes
+
+    def level_bounds(self, level: int, groups: np.ndarray) -> tuple:
+        """Rectángulo y puntos extremos de grupos de un nivel
+
+        Args:
+            level (int): Nivel de la pirámide
+            groups (np.ndarray): Grupos a consultar
+
+        Returns:
+            tuple: Mínimos y máximos (4, n) y puntos extremos (n, 4)
+        """
+
+        bounds, extremes = self.levels[level]
+        return bounds[:, groups], extremes[groups]
+
+    def extent(self) -> tuple:
+        """Rectángulo de todo el trazo
+
+        Returns:
+            tuple: Mínimo y máximo horizontal, mínimo y máximo vertical
+        """
+
+        bounds, _ = self.levels[-1]
+        if not bounds.size or not np.isfinite(bounds).all(axis=0).any():
+            return None
+        return bounds[0].min(), bounds[1].max(), bounds[2].min(), bounds[3].max()
+
+    def grid_index(self, width: float, height: float) -> int:
+        """Grilla con celdas del tamaño más parecido a un pixel
+
+        Args:
+            width (float): Ancho de un pixel
+            height (float): Alto de un pixel
+
+        Returns:
+            int: Índice de la grilla, None si el pixel no tiene tamaño o si
+                todas las grillas tienen celdas más grandes
+        """
+
+        if width <= 0 or height <= 0 or not self.grids:
+            return None
+
+        left, right, bottom, top = self.extent()
+        depth = 0
+        for span, size in ((right - left, width), (top - bottom, height)):
+            if span > size:
+                depth = max(depth, int(np.rint(np.log2(span / size))))
+        return depth if depth <= finest_grid else None
+
+    def view(self, view_range: tuple, pixel: tuple) -> tuple:
+        """Obtiene los puntos a dibujar para una vista
+
+        Args:
+            view_range (tuple): Mínimo y máximo horizontal, mínimo y máximo
+                vertical de la vista
+            pixel (tuple): Ancho y alto de un pixel en unidades del trazo
+
+        Returns:
+            tuple: Coordenadas horizontales, verticales y arreglo de conexión
+        """
+
+        left, right, bottom, top = view_range
+        width, height = np.multiply(pixel, pixel_tolerance)
+        depth = self.grid_index(width, height)
+        if depth is not None:
+            horizontal, vertical = self.grids[depth]
+            visible = (
+                (horizontal.min(1) <= right)
+                & (horizontal.max(1) >= left)
+                & (vertical.min(1) <= top)
+                & (vertical.max(1) >= bottom)
+            )
+            horizontal, vertical = (
+                horizontal[visible].ravel(),
+                vertical[visible].ravel(),
+            )
+            connect = np.zeros(len(horizontal), bool)
+            connect[0::2] = True
+            return screen_segments(
+                horizontal, vertical, connect, view_range, (width, height)
+            )
+
+        top_level = len(self.levels) - 1
+        groups = np.arange(len(self.levels[-1][1]))
+        chosen, firsts, lasts = [], [], []
+
+        for level in range(top_level, -1, -1):
+            bounds, extremes = self.level_bounds(level, groups)
+            visible = (
+                (bounds[0] <= right)
+                & (bounds[1] >= left)
+                & (bounds[2] <= top)
+                & (bounds[3] >= bottom)
+            )
+            groups, extremes = groups[visible], extremes[visible]
+            bounds = bounds[:, visible]
+
+            span = branching**level
+            first = groups * span
+            last = np.minimum(first + span, self.segments)
+            done = (bounds[1] - bounds[0] <= width) | (bounds[3] - bounds[2] <= height)
+            done |= level == 0
+            chosen.append(extremes[done])
+            firsts.append(first[done])
+            lasts.append(last[done])
+
+            if done.all():
+                break
+            children = groups[~done, None] * branching + np.arange(branching)
+            groups = children[children < len(self.levels[level - 1][1])]
+
+        # Los grupos no se traslapan: ordenados por su primer segmento y
+        # cada uno con sus extremos en orden, los puntos siguen el trazo
+        chosen, firsts, lasts = map(np.concatenate, (chosen, firsts, lasts))
+        order = np.argsort(firsts)
+        points = np.sort(chosen[order], axis=1).ravel()
+        firsts = np.repeat(firsts[order], extreme_kinds)
+        lasts = np.repeat(lasts[order], extreme_kinds)
+        kept = np.diff(points, prepend=-1) != 0
+        points, firsts, lasts = points[kept], firsts[kept], lasts[kept]
+
+        # Dos puntos seguidos se unen si son del mismo grupo, o de grupos
+        # contiguos y el trazo no se corta entre ellos
+        joined = (lasts[:-1] == firsts[1:]) & (
+            self.breaks[points[1:]] == self.breaks[points[:-1]]
+        )
+        joined |= firsts[1:] == firsts[:-1]
+        connect = np.zeros(len(points), bool)
+        connect[:-1] = joined
+        horizontal, vertical = self.horizontal[points], self.vertical[points]
+        if width <= 0 or height <= 0:
+            return horizontal, vertical, connect
+        return screen_segments(
+            horizontal, vertical, connect, view_range, (width, height)
+        )
@@ -76,6 +76,30 @@ class Combo_lists:
         14: 0.394,
     }
 
+    rapid_rates = {
+        "B12": 1260,
+        "A16": 1260,
+        "K16": 1260,
+        "E16": 1260,
+        "OMNITURN": 400,
+        "ROMI": 945,
+        "HARDINGE": 945,
+        "MAZAK": 1650,
+    }
+
+    feed_modes = {
+        "B12": 99,
+        "A16": 99,
+        "K16": 99,
+        "E16": 99,
+        "OMNITURN": 94,
+        "ROMI": 95,
+        "HARDINGE": 95,
+        "MAZAK": 95,
+    }
+
+    diameter_machines = ("B12", "A16", "K16", "E16", "OMNITURN", "ROMI", "HARDINGE")
+
     rotation_directions = (
         "NORMAL",
         "REVERSA",
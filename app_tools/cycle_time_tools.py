@@ -0,0 +1,297 @@
+from operator import itemgetter
+
+import numpy as np
+
+from app_tools.combo_lists import Combo_lists
+from app_tools.gcode_tools import parse_tape
+from app_tools.toolpath_tools import block_positions, plane_axes
+
+# Estimación del tiempo de ciclo a partir del tape generado:
+#   rápidos (G00): el eje con el mayor recorrido a la velocidad rápida de
+#       la máquina
+#   avances (G01-G03): longitud de la trayectoria entre el avance por
+#       minuto (G94, G98: F) o por revolución (G95, G99: F por S)
+#   pausas (G04): segundos de X o U, o milisegundos de P
+# Las palabras F y S se mantienen hasta la siguiente; sin avance conocido el
+# movimiento no suma tiempo. La velocidad de corte constante (G96) no se
+# considera, S se toma como revoluciones por minuto.
+# Cada husillo guarda su velocidad: S<n>=<valor> (E16) indica el husillo, si
+# no lo indica la función de giro de la línea (M03, M23, M80, ...) o, sin
+# ella, el canal de la línea. Un avance por revolución usa el husillo de su
+# canal: $1 y $3 comparten el tape 1 pero no la velocidad. La S de la
+# orientación del husillo (M28S90) es un ángulo y no cuenta.
+
+tool_call_task = "    Llamar herramienta"
+per_minute_codes = (94, 98)
+per_revolution_codes = (95, 99)
+dwell_code = 4
+millimeters = 21
+inch = 25.4
+index_codes = (18, 28)
+rotation_spindles = np.zeros(100, np.int64)
+rotation_spindles[
+    [int(code[1:]) for code in Combo_lists.rotation_commands.values()]
+] = [int(name[-1]) for name in Combo_lists.rotation_commands]
+
+
+def last_value(values: np.ndarray) -> np.ndarray:
+    """Mantiene cada valor dado hasta el siguiente
+
+    Args:
+        values (np.ndarray): Valores, NaN donde no se dan
+
+    Returns:
+        np.ndarray: Último valor dado en cada posición, NaN antes del primero
+    """
+
+    indexes = np.arange(len(values))
+    last = np.maximum.accumulate(np.where(np.isnan(values), -1, indexes))
+    return np.where(last >= 0, values[last], np.nan)
+
+
+def arc_lengths(
+    starts: np.ndarray, ends: np.ndarray, blocks: np.ndarray, clockwise: np.ndarray
+) -> np.ndarray:
+    """Calcula la longitud de un grupo de arcos
+
+    Args:
+        starts (np.ndarray): Posiciones iniciales (n, 3)
+        ends (np.ndarray): Posiciones finales (n, 3)
+        blocks (np.ndarray): Líneas del tape de los arcos
+        clockwise (np.ndarray): Arcos en sentido horario (G02)
+
+    Returns:
+        np.ndarray: Longitud de cada arco sobre su plano
+    """
+
+    lengths = np.zeros(len(blocks))
+    for code, (a, b) in plane_axes.items():
+        selected = blocks["plane"] == code
+        if not selected.any():
+            continue
+
+        start, end = starts[selected], ends[selected]
+        chord = np.hypot(end[:, a] - start[:, a], end[:, b] - start[:, b])
+        radius = blocks["R"][selected]
+        given = ~np.isnan(radius)
+
+        # Arcos con R: ángulo por la cuerda, R negativo para el arco mayor
+        size = np.abs(radius)
+        ratio = np.minimum(chord / np.where(given & (size > 0), 2 * size, np.inf), 1)
+        angle = 2 * np.arcsin(ratio)
+        angle = np.where(radius < 0, 2 * np.pi - angle, angle)
+        lengths_r = size * angle
+
+        # Arcos con I, J, K: ángulo entre los radios inicial y final
+        offsets = np.column_stack([blocks[letter][selected] for letter in "IJK"])
+        offsets = np.nan_to_num(offsets)
+        center = start + offsets
+        sweep = np.arctan2(end[:, b] - center[:, b], end[:, a] - center[:, a])
+        sweep -= np.arctan2(-offsets[:, b], -offsets[:, a])
+        turn = clockwise[selected]
+        sweep = np.where(turn & (sweep >= 0), sweep - 2 * np.pi, sweep)
+        sweep = np.where(~turn & (sweep <= 0), sweep + 2 * np.pi, sweep)
+        lengths_ijk = np.hypot(offsets[:, a], offsets[:, b]) * np.abs(sweep)
+
+        lengths[selected] = np.where(given, lengths_r, lengths_ijk)
+
+    return np.nan_to_num(lengths)
+
+
+def spindle_speeds(blocks: np.ndarray, spindles: np.ndarray) -> np.ndarray:
+    """Obtiene la velocidad del husillo del canal de cada línea
+
+    Args:
+        blocks (np.ndarray): Líneas del tape leídas con parse_tape
+        spindles (np.ndarray): Husillo del canal de cada línea (1, 2, 3)
+
+    Returns:
+        np.ndarray: Revoluciones por minuto, NaN antes de la primera
+    """
+
+    m_codes = blocks["M"]
+    rotations = np.where(
+        (m_codes >= 0) & (m_codes < len(rotation_spindles)),
+        rotation_spindles[np.clip(m_codes, 0, len(rotation_spindles) - 1)],
+        0,
+    ).max(axis=1)
+    owners = np.where(blocks["spindle"] > 0, blocks["spindle"], rotations)
+    owners = np.where(owners > 0, owners, spindles)
+
+    given = ~np.isnan(blocks["S"]) & (blocks["code"] != 50)
+    given &= ~np.isin(m_codes, index_codes).any(axis=1)
+
+    speeds = np.full(len(blocks), np.nan)
+    for spindle in np.unique(spindles):
+        spindle_speed = last_value(
+            np.where(given & (owners == spindle), blocks["S"], np.nan)
+        )
+        channel = spindles == spindle
+        speeds[channel] = spindle_speed[channel]
+    return speeds
+
+
+def block_times(
+    blocks: np.ndarray,
+    rapid_rate: float,
+    feed_mode: int,
+    diameter: bool,
+    spindles: np.ndarray,
+) -> np.ndarray:
+    """Calcula el tiempo de cada línea del tape
+
+    Args:
+        blocks (np.ndarray): Líneas del tape leídas con parse_tape
+        rapid_rate (float): Velocidad rápida de la máquina (pulgadas por
+            minuto)
+        feed_mode (int): Modo de avance cuando el programa no lo indica
+        diameter (bool): X se programa en diámetro
+        spindles (np.ndarray): Husillo del canal de cada línea (1, 2, 3)
+
+    Returns:
+        np.ndarray: Segundos de cada línea
+    """
+
+    positions, moves = block_positions(blocks)
+    if diameter:
+        positions[:, 0] /= 2
+
+    starts = np.vstack(([np.nan] * 3, positions[:-1]))
+    steps = np.nan_to_num(np.abs(positions - starts))
+    motion = blocks["motion"]
+    minutes = np.zeros(len(blocks))
+
+    # Rápidos
+    scale = np.where(blocks["units"] == millimeters, 1 / inch, 1)
+    rapids = moves & (motion == 0)
+    minutes[rapids] = steps[rapids].max(axis=1) * scale[rapids] / rapid_rate
+
+    # Avances
+    feeds = moves & (motion > 0)
+    lengths = np.sqrt((steps**2).sum(axis=1))
+    arcs = np.flatnonzero(feeds & (motion >= 2))
+    lengths[arcs] = arc_lengths(
+        starts[arcs], positions[arcs], blocks[arcs], motion[arcs] == 2
+    )
+
+    mode = np.where(blocks["feed"] >= 0, blocks["feed"], feed_mode)
+    rates = last_value(blocks["F"])
+    rates = np.where(
+        np.isin(mode, per_revolution_codes),
+        rates * spindle_speeds(blocks, spindles),
+        rates,
+    )
+    known = feeds & np.isin(mode, per_minute_codes + per_revolution_codes) & (rates > 0)
+    minutes[known] = lengths[known] / rates[known]
+
+    # Pausas
+    seconds = minutes * 60
+    dwells = blocks["code"] == dwell_code
+    pause = blocks["X"][dwells]
+    pause = np.where(np.isnan(pause), blocks["U"][dwells], pause)
+    pause = np.where(np.isnan(pause), blocks["P"][dwells] / 1000, pause)
+    seconds[dwells] = np.nan_to_num(pause)
+    return seconds
+
+
+def tool_call_sides(config_list: list) -> tuple:
+    """Obtiene el lado del tape de cada llamado de herramienta
+
+    Args:
+        config_list (list): Líneas de configuración
+
+    Returns:
+        tuple: Línea de configuración y canal ($1, $2, $3) de cada llamado
+    """
+
+    calls = [
+        (index, Combo_lists.tape_sides[data["Sde"]])
+        for index, (task, data) in enumerate(config_list)
+        if task == tool_call_task
+    ]
+    lines = np.array([index for index, _ in calls], np.int64)
+    return lines, [side for _, side in calls]
+
+
+class Cycle_time:
+    """Estimación del tiempo de ciclo sin interfaz gráfica
+
+    Se ejecuta igual que Tape_regeneration: en el hilo de la interfaz para
+    programas chicos o con Regeneration_worker en segundo plano. El tape 1
+    lleva los canales $1 y $3; cada línea toma el canal del último llamado
+    de herramienta antes de ella.
+    """
+
+    def __init__(
+        self, machine: str, tape1_list: list, tape2_list: list, sides: tuple
+    ) -> None:
+        """Inicializa la estimación
+
+        Args:
+            machine (str): Máquina del programa
+            tape1_list (list): Tape 1 generado
+            tape2_list (list): Tape 2 generado
+            sides (tuple): Lados de los llamados de herramienta, de
+                tool_call_sides
+        """
+
+        self.machine = machine
+        self.tapes = (tape1_list, tape2_list)
+        self.sides = sides
+        self.total = 0.0
+        self.channels = {}
+        self.tools = {}
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancela la estimación, se detiene antes del siguiente tape"""
+
+        self.cancelled = True
+
+    def run(self) -> bool:
+        """Calcula el tiempo total, por canal y por herramienta
+
+        Returns:
+            bool: La estimación terminó sin cancelarse
+        """
+
+        machine = self.machine
+        rapid_rate = Combo_lists.rapid_rates.get(machine, 400)
+        feed_mode = Combo_lists.feed_modes.get(machine, 95)
+        diameter = machine in Combo_lists.diameter_machines
+
+        call_lines, call_sides = self.sides
+        # Las líneas antes del primer llamado toman el último valor, $1
+        lateral = np.array([side == "$3" for side in call_sides] + [False])
+
+        times, tools, lateral_lines = [], [], []
+        for tape_list, tape_spindle in zip(self.tapes, (1, 2)):
+            if self.cancelled:
+                return False
+            blocks = parse_tape(tape_list)
+            calls = np.searchsorted(call_lines, blocks["line"], "right") - 1
+            on_lateral = lateral[calls] & (tape_spindle == 1)
+            spindles = np.where(on_lateral, 3, tape_spindle)
+            times.append(block_times(blocks, rapid_rate, feed_mode, diameter, spindles))
+            tools.append(np.fromiter(map(itemgetter(2), tape_list), np.int64))
+            lateral_lines.append(on_lateral)
+
+        on_lateral = lateral_lines[0]
+
+        self.channels = {
+            "$1": times[0][~on_lateral].sum(),
+            "$2": times[1].sum(),
+            "$3": times[0][on_lateral].sum(),
+        }
+        self.total = max(times[0].sum(), times[1].sum())
+
+        all_tools = np.concatenate(tools)
+        all_times = np.concatenate(times)
+        numbers = np.unique(all_tools)
+        totals = np.bincount(np.searchsorted(numbers, all_tools), all_times)
+        self.tools = {
+            int(number): float(seconds)
+            for number, seconds in zip(numbers, totals)
+            if seconds > 0
+        }
+        return True
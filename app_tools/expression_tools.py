@@ -0,0 +1,102 @@
+from functools import lru_cache
+import ast
+import math
+
+expression_names = {
+    "pi": math.pi,
+    "sqrt": math.sqrt,
+    "sin": lambda angle: math.sin(math.radians(angle)),
+    "cos": lambda angle: math.cos(math.radians(angle)),
+    "tan": lambda angle: math.tan(math.radians(angle)),
+}
+
+allowed_nodes = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+def check_node(node: ast.AST) -> None:
+    """Verifica que el nodo sea parte de una operación aritmética
+
+    Args:
+        node (ast.AST): Nodo de la expresión
+
+    Raises:
+        ValueError: El nodo no es aritmético
+    """
+
+    if not isinstance(node, allowed_nodes):
+        raise ValueError(f"Operación no permitida: {type(node).__name__}")
+
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Valor no permitido: {value!r}")
+    elif isinstance(node, ast.Name) and node.id not in expression_names:
+        raise ValueError(f"Nombre no permitido: {node.id}")
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ValueError("Función no permitida")
+        if len(node.args) != 1:
+            raise ValueError(f"{node.func.id} requiere un argumento")
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> object:
+    """Convierte una expresión aritmética en código compilado
+
+    Solo se aceptan números, + - * /, paréntesis, signo negativo, pi y las
+    funciones sqrt, sin, cos y tan (ángulos en grados).
+
+    Args:
+        expression (str): Expresión a compilar
+
+    Raises:
+        ValueError: La expresión no es una operación aritmética válida
+
+    Returns:
+        object: Código compilado de la expresión
+    """
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Expresión no válida: {expression!r}") from error
+
+    for node in ast.walk(tree):
+        check_node(node)
+
+    return compile(tree, "<expresión>", "eval")
+
+
+def evaluate(expression: str) -> float:
+    """Evalúa una expresión aritmética
+
+    Args:
+        expression (str): Expresión a evaluar
+
+    Raises:
+        ValueError: La expresión no es válida o no se puede calcular
+
+    Returns:
+        float: Resultado de la expresión
+    """
+
+    code = compile_expression(expression)
+
+    try:
+        return float(eval(code, {"__builtins__": {}}, expression_names))
+    except (ArithmeticError, TypeError) as error:
+        raise ValueError(f"No se puede calcular {expression!r}") from error
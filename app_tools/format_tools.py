@@ -1,5 +1,7 @@
 from datetime import date
 
+from app_tools.expression_tools import evaluate
+
 
 def ftext(txt: str) -> str:
     """Formatear texto a mayúsculas
@@ -38,21 +40,34 @@ def ftape(machine: str, number: int) -> str:
 
 
 def foper(oper: str) -> float:
-    """Realiza y formatea operaciones matemáticas
+    """Realiza y redondea operaciones matemáticas a 4 decimales
 
     Args:
         oper (str): Operación a evaluar
 
+    Raises:
+        ValueError: La operación no es aritmética o no se puede calcular
+
     Returns:
         float: Resultado de la operación
     """
-    if oper != "":
-        try:
-            result = eval(oper)
-            result = float(fnum4(result))
-        except NameError:
-            result = 0
-    return result
+
+    return round(evaluate(oper), 4)
+
+
+def foper_fields(data: dict, fields: tuple) -> None:
+    """Realiza las operaciones matemáticas de varios campos
+
+    Args:
+        data (dict): Diccionario de datos recopilados
+        fields (tuple): Campos a evaluar
+
+    Raises:
+        ValueError: Alguna operación no es válida
+    """
+
+    for field in fields:
+        data[field] = round(evaluate(data[field]), 4)
 
 
 def fdia(num: str) -> str:
@@ -65,19 +80,12 @@ def fdia(num: str) -> str:
         str: Cadena formateada
     """
 
-    num = "{0:.3f}".format(float(num))
-
-    while True:
-        if num[0] == "-":
-            if num[1] != "0":
-                break
-            num = f"-{num[2:]}"
-        elif num[0] != "0":
-            break
-        else:
-            num = num[1:]
-    num = "0" if num == ".0" else num
+    num = f"{float(num):.3f}"
 
+    if num[0] == "0":
+        return num[1:]
+    if num[0] == "-" and num[1] == "0":
+        return f"-{num[2:]}"
     return num
 
 
@@ -90,22 +98,16 @@ def fnum3(num: str) -> str:
     Returns:
         str: Cadena formateada
     """
-    num = "{0:.3f}".format(float(num))
-
-    while num[-1] == "0" and num[-2] != ".":
-        num = num[:-1]
-
-    while True:
-        if num[0] == "-":
-            if num[1] != "0":
-                break
-            num = f"-{num[2:]}"
-        elif num[0] != "0":
-            break
-        else:
-            num = num[1:]
-    num = "0" if num == ".0" else num
 
+    num = f"{float(num):.3f}".rstrip("0")
+    if num[-1] == ".":
+        num = f"{num}0"
+
+    if num[0] == "0":
+        num = num[1:]
+        return "0" if num == ".0" else num
+    if num[0] == "-" and num[1] == "0":
+        return f"-{num[2:]}"
     return num
 
 
@@ -118,25 +120,124 @@ def fnum4(num: str) -> str:
     Returns:
         str: Cadena formateada
     """
-    num = "{0:.4f}".format(float(num))
-
-    while num[-1] == "0" and num[-2] != ".":
-        num = num[:-1]
-
-    while True:
-        if num[0] == "-":
-            if num[1] != "0":
-                break
-            num = f"-{num[2:]}"
-        elif num[0] != "0":
-            break
-        else:
-            num = num[1:]
-    num = "0" if num == ".0" else num
 
+    num = f"{float(num):.4f}".rstrip("0")
+    if num[-1] == ".":
+        num = f"{num}0"
+
+    if num[0] == "0":
+        num = num[1:]
+        return "0" if num == ".0" else num
+    if num[0] == "-" and num[1] == "0":
+        return f"-{num[2:]}"
     return num
 
 
+def fnum_array(values: object, decimals: int = 3, trim: bool = True) -> list:
+    """Formatea un arreglo de números en una sola pasada
+
+    Produce las mismas cadenas que fnum3, fnum4 o fdia. Los valores se
+    redondean como enteros escalados y sus dígitos se arman en una matriz
+    de bytes; los que quedan demasiado cerca de la mitad de un decimal, los
+    no finitos y los muy grandes se formatean uno a uno para respetar el
+    redondeo de format.
+
+    Args:
+        values (object): Arreglo de NumPy o secuencia de números
+        decimals (int): Cantidad de decimales (3 o 4)
+        trim (bool): Quitar los ceros finales dejando al menos un decimal
+
+    Returns:
+        list: Números formateados
+    """
+
+    # NumPy se importa aquí para no cargarlo al abrir el editor
+    import numpy as np
+
+    single = {3: fnum3 if trim else fdia, 4: fnum4}[decimals]
+    values = np.asarray(values, dtype=np.float64).ravel()
+    count = values.size
+    if count == 0:
+        return []
+
+    scaled = values * 10**decimals
+    with np.errstate(invalid="ignore"):
+        exact = np.isfinite(scaled) & (np.abs(scaled) < 2.0**50)
+        half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+        exact &= half > np.abs(scaled) * 2.0**-48 + 2.0**-40
+    integers = np.abs(np.rint(np.where(exact, scaled, 0))).astype(np.int64)
+
+    whole, fraction = np.divmod(integers, 10**decimals)
+    whole_width = len(str(whole.max()))
+    whole_powers = 10 ** np.arange(whole_width - 1, -1, -1, dtype=np.int64)
+    fraction_powers = 10 ** np.arange(decimals - 1, -1, -1, dtype=np.int64)
+
+    # Columnas: signo, parte entera, punto, decimales y salto de línea
+    chars = np.empty((count, whole_width + decimals + 3), dtype=np.uint8)
+    used = np.ones(chars.shape, dtype=bool)
+    dot = whole_width + 1
+
+    chars[:, 0] = ord("-")
+    used[:, 0] = np.signbit(values)
+    chars[:, 1:dot] = whole[:, None] // whole_powers % 10 + ord("0")
+    used[:, 1:dot] = whole[:, None] >= whole_powers
+    chars[:, dot] = ord(".")
+    chars[:, dot + 1 : -1] = fraction[:, None] // fraction_powers % 10 + ord("0")
+    if trim:
+        used[:, dot + 2 : -1] = fraction[:, None] % (fraction_powers[1:] * 10) != 0
+        zero = ~used[:, 0] & (integers == 0)
+        used[:, dot] = ~zero
+    chars[:, -1] = ord("\n")
+    chars *= used
+
+    text = chars.tobytes().replace(b"\0", b"").decode("ascii")
+    formatted = text.split("\n")[:-1]
+
+    for index in np.flatnonzero(~exact).tolist():
+        formatted[index] = single(values[index])
+
+    return formatted
+
+
+def fnum3_array(values: object) -> list:
+    """Formatear un arreglo de números a str 3 decimales
+
+    Args:
+        values (object): Números a formatear
+
+    Returns:
+        list: Cadenas formateadas
+    """
+
+    return fnum_array(values, 3, True)
+
+
+def fnum4_array(values: object) -> list:
+    """Formatear un arreglo de números a str 4 decimales
+
+    Args:
+        values (object): Números a formatear
+
+    Returns:
+        list: Cadenas formateadas
+    """
+
+    return fnum_array(values, 4, True)
+
+
+def fdia_array(values: object) -> list:
+    """Formatear un arreglo de dimensiones a 3 decimales
+
+    Args:
+        values (object): Dimensiones a formatear
+
+    Returns:
+        list: Cadenas formateadas
+    """
+
+    return fnum_array(values, 3, False)
+
+
 def fversion() -> str:
     """Obtiene la versión del tape según la fecha
 
@@ -158,3 +259,21 @@ def fspace() -> str:
 
 def fcom(tool: int, compensations: list) -> float:
     return compensations[tool] if tool in compensations else False
+
+
+def ftime(seconds: float) -> str:
+    """Formatear segundos como tiempo de ciclo
+
+    Args:
+        seconds (float): Segundos a formatear
+
+    Returns:
+        str: Tiempo en horas, minutos y segundos (h:mm:ss.s) o en minutos y
+            segundos (m:ss.s)
+    """
+
+    minutes, seconds = divmod(round(seconds, 1), 60)
+    hours, minutes = divmod(int(minutes), 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:04.1f}"
+    return f"{minutes}:{seconds:04.1f}"
@@ -0,0 +1,259 @@
+from operator import itemgetter
+
+import numpy as np
+
+# Lectura del tape generado a un arreglo estructurado, un registro por línea:
+#   line: línea de configuración que generó la línea del tape
+#   motion, plane, distance, feed, units: grupos modales G vigentes en la
+#       línea (G00-G03, G17-G19, G90/G91, G94/G95/G98/G99, G20/G21); -1
+#       si el programa aún no lo indica y no tiene valor inicial
+#   code: último código G no modal de la línea (G04, G50, ...), -1 sin él
+#   N, M: número de bloque y hasta tres funciones M, -1 sin ellos
+#   X, Y, Z, ...: valor de cada palabra en la línea, NaN sin ella
+#   spindle: husillo de la palabra S cuando se escribe S<husillo>=<valor>
+#       (E16), -1 sin él
+# El texto de todas las líneas se une en un solo buffer de bytes y se lee
+# con operaciones de NumPy sobre el buffer completo, sin recorrer las
+# palabras en Python. Solo las letras mayúsculas fuera de paréntesis
+# seguidas de un número forman palabras; en la forma <letra><índice>=<valor>
+# la palabra toma el valor después del signo igual.
+
+modal_groups = {
+    "motion": (0, 1, 2, 3),
+    "plane": (17, 18, 19),
+    "distance": (90, 91),
+    "feed": (94, 95, 98, 99),
+    "units": (20, 21),
+}
+modal_defaults = {"motion": 0, "plane": 18, "distance": 90, "feed": -1, "units": -1}
+value_words = tuple("XYZCUVWIJKRFSTP")
+m_words = 3
+block_dtype = np.dtype(
+    [("line", np.int32)]
+    + [(name, np.int8) for name in modal_groups]
+    + [("code", np.int16), ("N", np.int32), ("M", np.int16, (m_words,))]
+    + [(letter, np.float64) for letter in value_words]
+    + [("spindle", np.int8)]
+)
+modal_codes = np.array([code for codes in modal_groups.values() for code in codes])
+empty_block = np.array(
+    (
+        0,
+        *modal_defaults.values(),
+        -1,
+        -1,
+        (-1,) * m_words,
+        *[np.nan] * len(value_words),
+        -1,
+    ),
+    block_dtype,
+)
+max_power = 308
+powers = 10.0 ** np.arange(max_power + 1)
+value_columns = np.full(256, -1, np.int64)
+value_columns[[ord(letter) for letter in value_words]] = np.arange(len(value_words))
+modal_columns = np.full(modal_codes.max() + 1, -1, np.int64)
+modal_columns[modal_codes] = np.repeat(
+    np.arange(len(modal_groups)), [len(codes) for codes in modal_groups.values()]
+)
+
+
+def field_view(blocks: np.ndarray, first: str, count: int) -> np.ndarray:
+    """Vista (líneas, campos) de campos contiguos del mismo tipo
+
+    Permite llenar varios campos de todos los registros con una sola
+    asignación.
+
+    Args:
+        blocks (np.ndarray): Arreglo block_dtype
+        first (str): Primer campo
+        count (int): Cantidad de campos
+
+    Returns:
+        np.ndarray: Vista de los campos, escribir en ella cambia blocks
+    """
+
+    field = blocks[first]
+    return np.lib.stride_tricks.as_strided(
+        field, (len(blocks), count), (block_dtype.itemsize, field.itemsize)
+    )
+
+
+def number_values(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> tuple:
+    """Lee el valor de tramos de caracteres de número
+
+    Los tramos se ordenan por largo, de mayor a menor; así los que aún
+    tienen el carácter j son los primeros del orden y cada paso lee una
+    columna de caracteres sobre arreglos contiguos, sin máscaras.
+
+    Args:
+        data (np.ndarray): Buffer de texto
+        starts (np.ndarray): Inicio de cada tramo
+        ends (np.ndarray): Final de cada tramo
+
+    Returns:
+        tuple: Valor y cantidad de dígitos de cada tramo
+    """
+
+    lengths = ends - starts
+    longest = int(lengths.max(initial=0))
+    # El ordenamiento estable de enteros de 16 bits es por conteo
+    key = ~lengths.astype(np.uint16) if longest <= 0xFFFF else -lengths
+    order = np.argsort(key, kind="stable")
+    sorted_starts = starts[order]
+    remaining = np.cumsum(np.bincount(lengths, minlength=longest + 1)[::-1])[::-1]
+
+    # Dígitos por su potencia de diez, divididos por los decimales después
+    # del punto
+    mantissa = np.zeros(len(starts))
+    digits = np.zeros(len(starts), np.int32)
+    decimals = np.zeros(len(starts), np.int32)
+    dot = np.zeros(len(starts), bool)
+    for column in range(longest):
+        count = remaining[column + 1]
+        chars = data[sorted_starts[:count] + column]
+        digit = chars >= ord("0")
+        column_mantissa = mantissa[:count]
+        column_mantissa *= np.where(digit, 10.0, 1.0)
+        column_mantissa += np.where(digit, chars - ord("0"), 0)
+        digits[:count] += digit
+        decimals[:count] += digit & dot[:count]
+        dot[:count] |= chars == ord(".")
+
+    values = np.empty(len(starts))
+    values[order] = mantissa / powers[np.minimum(decimals, max_power)]
+    counts = np.empty(len(starts), np.int32)
+    counts[order] = digits
+
+    signs = data[starts] == ord("-")
+    values[signs] = -values[signs]
+    return values, counts
+
+
+def tokenize(buffer: bytes) -> tuple:
+    """Separa las palabras de un buffer de texto G-code
+
+    Una palabra con índice, como S1=3000, toma el valor después del signo
+    igual y guarda el número antes de él como índice.
+
+    Args:
+        buffer (bytes): Líneas del tape unidas con saltos de línea
+
+    Returns:
+        tuple: Línea, letra (código ASCII), valor e índice (NaN sin él) de
+            cada palabra, en orden
+    """
+
+    data = np.frombuffer(buffer, np.uint8)
+    number = (data >= ord("-")) & (data <= ord("9")) & (data != ord("/"))
+    number |= data == ord("+")
+
+    # Cada tramo de caracteres de número es una palabra si lo precede una
+    # letra mayúscula fuera de comentario, o el valor de la palabra
+    # anterior si lo precede un signo igual pegado a ella
+    edges = np.flatnonzero(number[1:] != number[:-1]) + 1
+    if len(data) and number[0]:
+        edges = np.append(0, edges)
+    if len(data) and number[-1]:
+        edges = np.append(edges, len(data))
+    starts, ends = edges[0::2], edges[1::2]
+    marks = starts - 1
+    before = np.where(starts > 0, data[marks], 0)
+    words = (before >= ord("A")) & (before <= ord("Z"))
+    assigned = before == ord("=")
+    assigned[1:] &= words[:-1] & (ends[:-1] == marks[1:])
+    assigned[:1] = False
+    keep = words | assigned
+
+    # Un comentario va del paréntesis que abre al primero que cierra o al
+    # final de la línea
+    opens = np.flatnonzero(data == ord("("))
+    if len(opens):
+        closers = np.flatnonzero((data == ord(")")) | (data == ord("\n")))
+        closes = np.append(closers, len(data))[np.searchsorted(closers, opens)]
+        first = np.append(True, closes[1:] != closes[:-1])
+        bounds = np.column_stack((opens[first], closes[first])).ravel()
+        keep &= np.searchsorted(bounds, marks, "right") % 2 == 0
+
+    starts, ends, marks = starts[keep], ends[keep], marks[keep]
+    assigned = assigned[keep]
+    values, counts = number_values(data, starts, ends)
+    valid = counts > 0
+
+    # La palabra antes de un valor asignado siempre se conserva
+    targets = np.flatnonzero(assigned & valid) - 1
+    indexes = np.full(len(values), np.nan)
+    indexes[targets] = values[targets]
+    values[targets] = values[targets + 1]
+
+    valid &= ~assigned
+    marks = marks[valid]
+    newlines = np.flatnonzero(data == ord("\n"))
+    line_words = np.diff(np.searchsorted(marks, newlines), prepend=0, append=len(marks))
+    lines = np.repeat(np.arange(len(line_words)), line_words)
+    return lines, data[marks], values[valid], indexes[valid]
+
+
+def parse_tape(tape_list: list, previous: np.void = None) -> np.ndarray:
+    """Lee las líneas del tape a un arreglo estructurado
+
+    Args:
+        tape_list (list): Líneas del tape (línea de configuración, texto,
+            herramienta, comentario)
+        previous (np.void): Línea leída antes de tape_list, da los grupos
+            modales iniciales (opcional)
+
+    Returns:
+        np.ndarray: Un registro block_dtype por línea del tape
+    """
+
+    blocks = np.repeat(empty_block, len(tape_list))
+    blocks["line"] = np.fromiter(map(itemgetter(0), tape_list), np.int32, len(blocks))
+    buffer = "\n".join(map(itemgetter(1), tape_list)).encode()
+    lines, letters, values, word_indexes = tokenize(buffer)
+
+    # Cada línea toma el último código de cada grupo hasta ella; las líneas
+    # antes del primero apuntan a la línea 0, que sin código da el inicial
+    g_words = letters == ord("G")
+    g_lines, g_values = lines[g_words], values[g_words]
+    codes = g_values.astype(np.int64)
+    modal = (codes == g_values) & (codes >= 0) & (codes < len(modal_columns))
+    columns = np.where(modal, modal_columns[np.where(modal, codes, 0)], -1)
+    selected = columns >= 0
+
+    groups = np.full((len(blocks), len(modal_groups)), -1, np.int8)
+    groups[g_lines[selected], columns[selected]] = codes[selected]
+    indexes = np.arange(len(blocks), dtype=np.int32)[:, None]
+    last = np.maximum.accumulate(np.where(groups >= 0, indexes, 0))
+    groups = np.take_along_axis(groups, last, 0)
+    if previous is None:
+        defaults = np.array(list(modal_defaults.values()), np.int8)
+    else:
+        defaults = np.array([previous[name] for name in modal_groups], np.int8)
+    field_view(blocks, next(iter(modal_groups)), len(modal_groups))[:] = np.where(
+        groups >= 0, groups, defaults
+    )
+
+    blocks["code"][g_lines[~selected]] = g_values[~selected]
+
+    selected = letters == ord("N")
+    blocks["N"][lines[selected]] = values[selected]
+
+    selected = letters == ord("M")
+    m_lines, m_values = lines[selected], values[selected]
+    first = np.append(True, m_lines[1:] != m_lines[:-1])
+    position = np.arange(len(m_lines))
+    order = position - np.maximum.accumulate(np.where(first, position, 0))
+    kept = order < m_words
+    blocks["M"][m_lines[kept], order[kept]] = m_values[kept]
+
+    # Los campos de las palabras con valor son contiguos en cada registro
+    columns = value_columns[letters]
+    selected = columns >= 0
+    words = field_view(blocks, value_words[0], len(value_words))
+    words[lines[selected], columns[selected]] = values[selected]
+
+    selected = (letters == ord("S")) & ~np.isnan(word_indexes)
+    blocks["spindle"][lines[selected]] = word_indexes[selected]
+
+    return blocks
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from app_tools.format_tools import fversion
+from app_tools.cnc_codes import *
+from app_tools.combo_lists import *
+from app_tools.compensations_tools import *
+from app_tools.record_tools import Config_record
+
+machine_definitions = (
+    Swiss_lathe,
+    Swiss_k_lathe,
+    Omni_lathe,
+    Romi_lathe,
+    Hardinge_lathe,
+    Mazak_mill,
+    Compensations,
+    Combo_lists,
+)
+
+
+def freeze_data(data: object) -> object:
+    """Convierte los datos a una forma inmutable y comparable
+
+    Se conserva el orden de las llaves porque los generadores desempaquetan
+    los valores en orden, y el tipo de cada valor porque 1, 1.0 y True
+    generan líneas distintas.
+
+    Args:
+        data (object): Datos a convertir
+
+    Returns:
+        object: Datos inmutables
+    """
+
+    if isinstance(data, (dict, Config_record)):
+        return tuple((key, freeze_data(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze_data(value) for value in data)
+    return (data.__class__, data)
+
+
+def definitions_version() -> tuple:
+    """Obtiene la versión actual de las definiciones de máquinas
+
+    Returns:
+        tuple: Tablas de códigos y compensaciones
+    """
+
+    tables = tuple(
+        (name, freeze_data(value))
+        for definition in machine_definitions
+        for name, value in vars(definition).items()
+        if isinstance(value, (dict, tuple))
+    )
+
+    return fversion(), tables
+
+
+class Generator_cache:
+    """Caché LRU de líneas generadas por generador y datos"""
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """Inicializa el caché
+
+        Args:
+            max_size (int): Cantidad máxima de resultados guardados
+        """
+
+        self.max_size = max_size
+        self.lines = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.version = definitions_version()
+
+    def generate(self, generator: object, data: dict) -> list:
+        """Obtiene las líneas del caché o las genera
+
+        Los cambios que el generador hace en los datos también se guardan,
+        para repetirlos cuando el resultado se toma del caché.
+
+        Args:
+            generator (object): Generador de la tarea para la máquina actual
+            data (dict): Diccionario de datos de la línea
+
+        Returns:
+            list: Lista de líneas de tape
+        """
+
+        key = (generator, freeze_data(data))
+
+        if key in self.lines:
+            self.hits += 1
+            self.lines.move_to_end(key)
+            lines, changes = self.lines[key]
+            data.update(changes)
+            return lines
+
+        self.misses += 1
+        original = dict(data)
+        lines = generator(data)
+        changes = {
+            name: value
+            for name, value in data.items()
+            if name not in original or original[name] != value
+        }
+
+        self.lines[key] = (lines, changes)
+        if len(self.lines) > self.max_size:
+            self.lines.popitem(last=False)
+
+        return lines
+
+    def check_definitions(self) -> None:
+        """Vacía el caché si cambiaron las definiciones de máquinas"""
+
+        version = definitions_version()
+        if version != self.version:
+            self.version = version
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Vacía el caché"""
+
+        self.lines.clear()
+
+    def stats(self) -> dict:
+        """Obtiene las estadísticas de uso del caché
+
+        Returns:
+            dict: Aciertos, fallos y tamaño del caché
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.lines),
+        }
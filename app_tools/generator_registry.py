@@ -0,0 +1,79 @@
+from functools import lru_cache, partial
+
+from generators.header_gen import header_generators
+from generators.free_gen import free_gen
+from generators.comment_gen import comment_generators
+from generators.subrutine_gen import subrutine_gen
+from generators.tool_call_gen import tool_call_generators
+from generators.tool_close_gen import tool_close_generators
+from generators.spindle_gen import spindle_generators
+from generators.spindle_index_gen import spindle_index_generators
+from generators.misc_gen import misc_generators
+from generators.end_gen import end_gen
+
+machine_generators = {
+    "Inicio de programa": header_generators,
+    "        Comentario": comment_generators,
+    "    Llamar herramienta": tool_call_generators,
+    "    Cerrar herramienta": tool_close_generators,
+    "        Giro husillo": spindle_generators,
+    "        Orientar husillo": spindle_index_generators,
+    "        Funciones M": misc_generators,
+}
+
+common_generators = {
+    " ": free_gen,
+    "        -> Subrutina": subrutine_gen,
+    "Fin de programa": end_gen,
+}
+
+
+@lru_cache(maxsize=None)
+def bind_machine(machine: str) -> dict:
+    """Asocia cada tarea con el generador de la máquina
+
+    Se llama una sola vez por máquina, cuando el encabezado define la
+    máquina actual; al generar cada línea basta con buscar la tarea.
+
+    Args:
+        machine (str): Tipo de máquina utilizada
+
+    Returns:
+        dict: Generador de cada tarea, recibe solo los datos de la línea
+    """
+
+    generators = {
+        task: generators[machine]
+        for task, generators in machine_generators.items()
+        if machine in generators
+    }
+    for task, generator in common_generators.items():
+        generators[task] = partial(generator, machine)
+
+    return generators
+
+
+def register_generator(task: str, machine: str, generator: object) -> None:
+    """Registra el generador de una tarea para una máquina
+
+    Args:
+        task (str): Nombre de la tarea
+        machine (str): Tipo de máquina
+        generator (object): Función que recibe los datos de la línea
+    """
+
+    machine_generators[task][machine] = generator
+    bind_machine.cache_clear()
+
+
+def register_machine(machine: str, base: str) -> None:
+    """Registra una máquina que usa los mismos generadores que otra
+
+    Args:
+        machine (str): Tipo de máquina nueva
+        base (str): Máquina cuyos generadores se reutilizan
+    """
+
+    for generators in machine_generators.values():
+        generators[machine] = generators[base]
+    bind_machine.cache_clear()
@@ -0,0 +1,197 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QMainWindow
+import numpy as np
+
+from app_tools.backplot_tools import Backplot
+from app_tools.subwindow_tools import keyPressed
+from app_tools.toolpath_tools import Tape_toolpath, no_motion, view_curves
+from interfaces.ui_graph import Ui_GraphWindow
+
+# Rápidos, avances, rápidos resaltados y avances resaltados
+highlight_pen = {"color": "red", "width": 2}
+trace_pens = ("gray", "blue", highlight_pen, highlight_pen)
+
+
+class Graph(QMainWindow, Ui_GraphWindow):
+    """Ventana de ayuda para la tarea
+
+    Args:
+        QMainWindow (_type_): Clase de la interfaz gráfica principal
+        Ui_GraphWindow (_type_): Interfaz gráfica de la ventana
+    """
+
+    def __init__(self, tapes: list) -> None:
+        """Inicializar la clase
+
+        Args:
+            tapes (list): Tapes de cada canal a graficar
+        """
+
+        super().__init__()
+        self.setupUi(self)
+
+        self.toolpaths = [Tape_toolpath(tape_list) for tape_list in tapes]
+        self.selection = []
+        self.views = []
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(0)
+        self.refresh_timer.timeout.connect(self.refresh_views)
+
+        self.construir_grafico()
+
+    def construir_grafico(self) -> None:
+        """Grafica la trayectoria de la herramienta de los tapes
+
+        Cada vista usa un trazo para los rápidos y otro para los avances, y
+        otros dos para resaltar los movimientos de las líneas seleccionadas;
+        los arreglos de conexión indican qué puntos seguidos se unen. Los
+        trazos se dibujan con el nivel de detalle de la vista y se vuelven a
+        calcular cuando la vista cambia.
+        """
+
+        self.graph1_widget.setTitle("X - Z")
+        self.graph2_widget.setTitle("Y - Z")
+        self.views = []
+        for widget, axes in (
+            (self.graph1_widget, (2, 0)),
+            (self.graph2_widget, (2, 1)),
+        ):
+            widget.clear()
+            items = [widget.plot(pen=pen) for pen in trace_pens]
+            # widget.setAspectLocked()
+            widget.getPlotItem().hideAxis("bottom")
+            widget.getPlotItem().hideAxis("left")
+
+            view_box = widget.getViewBox()
+            view_box.sigRangeChanged.connect(self.schedule_refresh)
+            view_box.sigResized.connect(self.schedule_refresh)
+            self.views.append((view_box, axes, items, [None] * len(items)))
+
+        # self.graph1_widget.setXLink(self.graph2_widget)
+        self.load_paths()
+        self.load_highlight()
+        self.refresh_views()
+
+    def program_path(self) -> tuple:
+        """Une la trayectoria de todos los canales
+
+        Returns:
+            tuple: Puntos (n, 3) y movimiento de cada punto, cada canal
+                comienza un trazo nuevo
+        """
+
+        points = np.concatenate([toolpath.points for toolpath in self.toolpaths])
+        motions = np.concatenate([toolpath.motions for toolpath in self.toolpaths])
+        return points, motions
+
+    def load_paths(self) -> None:
+        """Prepara los trazos de la trayectoria de cada vista"""
+
+        points, motions = self.program_path()
+        for _, axes, _, backplots in self.views:
+            rapids, feeds = view_curves(points, motions, axes)
+            backplots[:2] = Backplot(*rapids), Backplot(*feeds)
+
+    def load_highlight(self) -> None:
+        """Prepara los trazos de los movimientos de las líneas seleccionadas
+
+        Los puntos de cada línea de configuración se toman de su tramo en la
+        trayectoria de cada canal, sin recorrer el resto.
+        """
+
+        lines = np.asarray(self.selection, np.int64)
+        run_firsts = lines[np.diff(lines, prepend=-2) != 1]
+        run_lasts = lines[np.diff(lines, append=-2) != 1]
+
+        points, motions = [], []
+        for toolpath in self.toolpaths:
+            indexes, firsts = toolpath.line_indexes(run_firsts, run_lasts)
+            points.append(toolpath.points[indexes])
+            motions.append(np.where(firsts, no_motion, toolpath.motions[indexes]))
+        points, motions = np.concatenate(points), np.concatenate(motions)
+
+        for _, axes, _, backplots in self.views:
+            rapids, feeds = view_curves(points, motions, axes)
+            backplots[2:] = Backplot(*rapids), Backplot(*feeds)
+
+    def update_tapes(self, tapes: list, changes: list, config_lines: list) -> None:
+        """Actualiza la trayectoria después de un cambio de los tapes
+
+        Solo se vuelven a leer las filas modificadas de cada tape y las que
+        dependen de ellas.
+
+        Args:
+            tapes (list): Tapes de cada canal
+            changes (list): Filas modificadas de cada tape (primera fila,
+                final anterior y final nuevo), None si cambió completo
+            config_lines (list): Líneas de configuración seleccionadas, en
+                orden
+        """
+
+        for toolpath, tape_list, tape_changes in zip(self.toolpaths, tapes, changes):
+            toolpath.update(tape_list, tape_changes)
+
+        self.selection = list(config_lines)
+        self.load_paths()
+        self.load_highlight()
+        self.refresh_views()
+
+    def highlight_lines(self, config_lines: list) -> None:
+        """Resalta los movimientos de líneas de configuración
+
+        Args:
+            config_lines (list): Líneas de configuración seleccionadas, en
+                orden
+        """
+
+        self.selection = list(config_lines)
+        self.load_highlight()
+        self.refresh_views()
+
+    def schedule_refresh(self, *args) -> None:
+        """Agrupa los cambios de vista seguidos en un solo redibujo"""
+
+        self.refresh_timer.start()
+
+    def refresh_views(self) -> None:
+        """Dibuja en cada vista solo la parte visible de la trayectoria
+
+        Con el rango automático activo se dibuja la trayectoria completa, así
+        la vista la abarca toda.
+        """
+
+        for view_box, _, items, backplots in self.views:
+            extents = [backplot.extent() for backplot in backplots]
+            extents = [extent for extent in extents if extent is not None]
+            if not extents:
+                for item in items:
+                    item.setData([], [])
+                continue
+
+            if any(view_box.autoRangeEnabled()):
+                left = min(extent[0] for extent in extents)
+                right = max(extent[1] for extent in extents)
+                bottom = min(extent[2] for extent in extents)
+                top = max(extent[3] for extent in extents)
+            else:
+                (left, right), (bottom, top) = view_box.viewRange()
+
+            pixel = (
+                (right - left) / max(view_box.width(), 1),
+                (top - bottom) / max(view_box.height(), 1),
+            )
+            for backplot, item in zip(backplots, items):
+                horizontal, vertical, connect = backplot.view(
+                    (left, right, bottom, top), pixel
+                )
+                item.setData(horizontal, vertical, connect=connect)
+
+    def keyPressEvent(self, qKeyEvent) -> None:
+        """Configurar comportamento de teclas presionadas
+
+        Args:
+            qKeyEvent (any): Evento de tecla presionada
+        """
+
+        keyPressed(self, qKeyEvent)
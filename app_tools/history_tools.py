@@ -0,0 +1,152 @@
+from collections import deque
+import sys
+
+
+def lines_size(lines: tuple) -> int:
+    """Estima la memoria ocupada por líneas de configuración
+
+    Args:
+        lines (tuple): Líneas de configuración
+
+    Returns:
+        int: Bytes aproximados
+    """
+
+    size = sys.getsizeof(lines)
+    for task, data in lines:
+        size += sys.getsizeof(data)
+        size += sum(sys.getsizeof(value) for value in data.values())
+
+    return size
+
+
+class Edit_command:
+    """Cambio de un rango de líneas de configuración
+
+    Las líneas se guardan por referencia: el comando comparte los objetos
+    con la lista de configuración, nunca los copia.
+    """
+
+    __slots__ = ("first", "old_lines", "new_lines", "old_selection", "selection")
+
+    def __init__(
+        self,
+        first: int,
+        old_lines: tuple,
+        new_lines: tuple,
+        old_selection: tuple,
+        selection: tuple,
+    ) -> None:
+        """Inicializa el comando
+
+        Args:
+            first (int): Primera línea del rango
+            old_lines (tuple): Líneas del rango antes del cambio
+            new_lines (tuple): Líneas del rango después del cambio
+            old_selection (tuple): Selección antes del cambio
+            selection (tuple): Selección después del cambio
+        """
+
+        self.first = first
+        self.old_lines = old_lines
+        self.new_lines = new_lines
+        self.old_selection = old_selection
+        self.selection = selection
+
+    def size(self) -> int:
+        """Estima la memoria ocupada por el comando
+
+        Returns:
+            int: Bytes aproximados
+        """
+
+        lines = lines_size(self.old_lines) + lines_size(self.new_lines)
+        return sys.getsizeof(self) + lines
+
+    def inverse(self) -> object:
+        """Obtiene el comando que deshace este cambio
+
+        Returns:
+            object: Comando inverso
+        """
+
+        return Edit_command(
+            self.first,
+            self.new_lines,
+            self.old_lines,
+            self.selection,
+            self.old_selection,
+        )
+
+
+class Edit_history:
+    """Historial de cambios para deshacer y rehacer
+
+    Los comandos más antiguos se descartan cuando el historial supera el
+    presupuesto de memoria.
+    """
+
+    def __init__(self, budget: int = 64 << 20) -> None:
+        """Inicializa el historial
+
+        Args:
+            budget (int): Memoria máxima del historial en bytes
+        """
+
+        self.budget = budget
+        self.undo_commands = deque()
+        self.redo_commands = []
+        self.size = 0
+
+    def record(self, command: Edit_command) -> None:
+        """Agrega un cambio al historial y descarta los cambios deshechos
+
+        Args:
+            command (Edit_command): Cambio realizado
+        """
+
+        self.size -= sum(size for _, size in self.redo_commands)
+        self.redo_commands.clear()
+
+        size = command.size()
+        self.undo_commands.append((command, size))
+        self.size += size
+
+        while self.size > self.budget and len(self.undo_commands) > 1:
+            _, size = self.undo_commands.popleft()
+            self.size -= size
+
+    def undo(self) -> Edit_command:
+        """Obtiene el comando que deshace el último cambio
+
+        Returns:
+            Edit_command: Comando a aplicar, None si no hay cambios
+        """
+
+        if not self.undo_commands:
+            return None
+
+        command, size = self.undo_commands.pop()
+        self.redo_commands.append((command, size))
+        return command.inverse()
+
+    def redo(self) -> Edit_command:
+        """Obtiene el comando que rehace el último cambio deshecho
+
+        Returns:
+            Edit_command: Comando a aplicar, None si no hay cambios
+        """
+
+        if not self.redo_commands:
+            return None
+
+        command, size = self.redo_commands.pop()
+        self.undo_commands.append((command, size))
+        return command
+
+    def clear(self) -> None:
+        """Vacía el historial"""
+
+        self.undo_commands.clear()
+        self.redo_commands.clear()
+        self.size = 0
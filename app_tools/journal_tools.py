@@ -0,0 +1,258 @@
+from pathlib import Path
+import contextlib
+import json
+import os
+
+from app_tools.project_tools import line_encoder
+from app_tools.record_tools import config_line
+
+# Diario de cambios (.journal), un registro JSON por línea:
+#   encabezado: versión, archivo base y su tamaño y fecha de modificación
+#   cambios: primera línea, cantidad de líneas reemplazadas y líneas nuevas
+# Cada cambio se agrega al final y se vacía al sistema operativo, un corte
+# a mitad de un registro solo pierde ese registro. Al guardar el programa
+# el diario vuelve a empezar con el archivo guardado como base.
+
+journal_extension = ".journal"
+journal_version = 1
+new_program_journal = f"nuevo_programa{journal_extension}"
+
+
+def journal_path(base: str, folder: str) -> str:
+    """Obtiene el archivo de diario de un programa
+
+    Args:
+        base (str): Archivo del programa, None si no se ha guardado
+        folder (str): Folder del diario de un programa sin guardar
+
+    Returns:
+        str: Archivo de diario junto al programa
+    """
+
+    if base is None:
+        return os.path.join(folder, new_program_journal)
+    return f"{base}{journal_extension}"
+
+
+def base_signature(base: str) -> list:
+    """Identifica la versión guardada del archivo base
+
+    Args:
+        base (str): Archivo del programa, None si no se ha guardado
+
+    Returns:
+        list: Tamaño y fecha de modificación, None sin archivo
+    """
+
+    if base is None:
+        return None
+    stat = os.stat(base)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class Edit_journal:
+    """Diario de cambios de la configuración abierto para agregar registros
+
+    Si el diario no se puede escribir queda desactivado: la edición sigue
+    sin él, igual que antes de existir el diario.
+    """
+
+    def __init__(self, path: str, base: str = None) -> None:
+        """Inicializa el diario
+
+        Args:
+            path (str): Archivo de diario
+            base (str): Archivo del programa, None si no se ha guardado
+        """
+
+        self.path = path
+        self.base = base
+        self.file = None
+
+    def start(self) -> None:
+        """Comienza el diario vacío sobre la versión actual del archivo base"""
+
+        self.close()
+        try:
+            header = {
+                "journal": journal_version,
+                "base": self.base,
+                "signature": base_signature(self.base),
+            }
+            self.file = open(self.path, "wb")
+        except OSError:
+            return
+        self.write(header)
+
+    def resume(self) -> None:
+        """Continúa un diario recuperado agregando los cambios nuevos"""
+
+        self.close()
+        with contextlib.suppress(OSError):
+            self.file = open(self.path, "ab")
+
+    def record(self, first: int, old_count: int, new_lines: tuple) -> None:
+        """Agrega un cambio al diario
+
+        Args:
+            first (int): Primera línea del rango
+            old_count (int): Cantidad de líneas reemplazadas
+            new_lines (tuple): Líneas nuevas del rango
+        """
+
+        self.write([first, old_count, new_lines])
+
+    def write(self, entry: object) -> None:
+        """Escribe un registro y lo vacía al sistema operativo
+
+        Args:
+            entry (object): Registro a escribir
+        """
+
+        if self.file is None:
+            return
+
+        try:
+            self.file.write(line_encoder.encode(entry).encode() + b"\n")
+            self.file.flush()
+        except OSError:
+            self.close()
+
+    def close(self) -> None:
+        """Cierra el archivo de diario"""
+
+        if self.file is not None:
+            with contextlib.suppress(OSError):
+                self.file.close()
+            self.file = None
+
+    def discard(self) -> None:
+        """Cierra y borra el diario"""
+
+        self.close()
+        with contextlib.suppress(OSError):
+            Path(self.path).unlink(missing_ok=True)
+
+
+def read_journal(path: str) -> tuple:
+    """Lee un diario de cambios
+
+    Un registro incompleto al final, de un corte durante la escritura, se
+    descarta junto con lo que le sigue.
+
+    Args:
+        path (str): Archivo de diario
+
+    Raises:
+        ValueError: El archivo no es un diario válido
+
+    Returns:
+        tuple: Encabezado y lista de cambios (primera línea, cantidad de
+            líneas reemplazadas y líneas nuevas)
+    """
+
+    with open(path, "rb") as file:
+        entries = file.read().split(b"\n")
+
+    header = json.loads(entries[0]) if len(entries) > 1 else None
+    if not isinstance(header, dict) or header.get("journal") != journal_version:
+        raise ValueError(f"{path} no es un diario de cambios")
+    if "base" not in header or "signature" not in header:
+        raise ValueError(f"Encabezado incompleto en {path}")
+
+    commands = []
+    for entry in entries[1:-1]:
+        try:
+            first, old_count, new_lines = json.loads(entry)
+        except ValueError:
+            break
+        lines = tuple(config_line(task, data) for task, data in new_lines)
+        commands.append((first, old_count, lines))
+
+    return header, commands
+
+
+def journal_applies(header: dict, base: str) -> bool:
+    """Indica si un diario se comenzó sobre la versión actual del archivo base
+
+    Args:
+        header (dict): Encabezado del diario
+        base (str): Archivo del programa, None si no se ha guardado
+
+    Returns:
+        bool: El archivo base no cambió después de comenzar el diario
+    """
+
+    try:
+        signature = base_signature(base)
+    except OSError:
+        return False
+
+    return header["base"] == base and header["signature"] == signature
+
+
+def recoverable_commands(path: str, base: str) -> list:
+    """Obtiene los cambios de un diario que se pueden aplicar al archivo base
+
+    Args:
+        path (str): Archivo de diario
+        base (str): Archivo del programa, None si no se ha guardado
+
+    Returns:
+        list: Cambios del diario, vacía si no hay diario o si el archivo base
+            cambió después de comenzarlo
+    """
+
+    try:
+        header, commands = read_journal(path)
+    except (OSError, ValueError):
+        return []
+
+    return commands if journal_applies(header, base) else []
+
+
+def find_journals(folders: list) -> list:
+    """Busca los diarios con cambios recuperables
+
+    Args:
+        folders (list): Folders donde buscar
+
+    Returns:
+        list: Archivos de diario y su archivo base, el más reciente primero
+    """
+
+    journals = []
+    for folder in folders:
+        for path in Path(folder).glob(f"*{journal_extension}"):
+            try:
+                header, commands = read_journal(path)
+                modified = path.stat().st_mtime_ns
+            except (OSError, ValueError):
+                continue
+            if commands and journal_applies(header, header["base"]):
+                journals.append((modified, str(path), header["base"]))
+
+    journals.sort(reverse=True)
+    return [(path, base) for _, path, base in journals]
+
+
+def replay_journal(config_list: list, commands: list) -> list:
+    """Aplica los cambios de un diario a la configuración
+
+    Args:
+        config_list (list): Líneas de configuración del archivo base
+        commands (list): Cambios leídos del diario
+
+    Raises:
+        ValueError: Un cambio no corresponde a la configuración
+
+    Returns:
+        list: La misma lista con los cambios aplicados
+    """
+
+    for first, old_count, new_lines in commands:
+        if not 0 <= first <= first + old_count <= len(config_list):
+            raise ValueError("El diario no corresponde al programa")
+        config_list[first : first + old_count] = new_lines
+
+    return config_list
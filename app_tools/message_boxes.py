@@ -68,3 +68,12 @@ class Messages:
             "Error al abrir archivo",
             "No se puede cargar el programa seleccionado",
         )
+
+    def recover_changes_question(self, file):
+        return QMessageBox.question(
+            self,
+            "Recuperar cambios",
+            f"Hay cambios sin guardar en {file}\n¿Desea recuperarlos?",
+            buttons=QMessageBox.Yes | QMessageBox.No,
+            defaultButton=QMessageBox.Yes,
+        )
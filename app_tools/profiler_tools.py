@@ -0,0 +1,178 @@
+from collections import deque
+import json
+import os
+import threading
+import time
+
+
+class Null_span:
+    """Intervalo que no mide nada, usado con la medición desactivada"""
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+null_span = Null_span()
+
+
+class Span:
+    """Intervalo medido de una etapa"""
+
+    __slots__ = ("profiler", "name", "category", "start")
+
+    def __init__(self, profiler: object, name: str, category: str) -> None:
+        """Inicializa el intervalo
+
+        Args:
+            profiler (object): Medidor que registra el intervalo
+            name (str): Nombre de la etapa
+            category (str): Categoría de la etapa
+        """
+
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self) -> None:
+        self.profiler.depth += 1
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter_ns()
+        self.profiler.record(self.name, self.category, self.start, end)
+
+
+class Profiler:
+    """Medidor opcional del tiempo de cada etapa del editor
+
+    Guarda los intervalos en formato de traza de Chrome y acumula el tiempo
+    de cada etapa por operación principal (la que no está anidada en otra)
+    para mostrar un resumen de las últimas operaciones.
+    """
+
+    def __init__(
+        self, enabled: bool = False, max_events: int = 200000, history: int = 20
+    ) -> None:
+        """Inicializa el medidor
+
+        Args:
+            enabled (bool): Medición activada
+            max_events (int): Cantidad máxima de intervalos guardados
+            history (int): Cantidad de operaciones del resumen
+        """
+
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self.history = deque(maxlen=history)
+        self.stages = {}
+        self.depth = 0
+        self.origin = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "etapa") -> object:
+        """Crea el intervalo de una etapa
+
+        Args:
+            name (str): Nombre de la etapa
+            category (str): Categoría de la etapa
+
+        Returns:
+            object: Administrador de contexto que mide la etapa
+        """
+
+        return Span(self, name, category) if self.enabled else null_span
+
+    def record(self, name: str, category: str, start: int, end: int) -> None:
+        """Registra un intervalo terminado
+
+        Args:
+            name (str): Nombre de la etapa
+            category (str): Categoría de la etapa
+            start (int): Inicio en nanosegundos
+            end (int): Fin en nanosegundos
+        """
+
+        thread = threading.get_ident()
+        self.events.append((name, category, start, end - start, thread))
+        self.stages[name] = self.stages.get(name, 0) + end - start
+
+        self.depth -= 1
+        if self.depth == 0:
+            self.history.append((name, self.stages))
+            self.stages = {}
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Activa o desactiva la medición
+
+        Args:
+            enabled (bool): Medición activada
+        """
+
+        self.enabled = enabled
+        self.stages = {}
+        self.depth = 0
+
+    def summary(self, stages: int = 5) -> str:
+        """Resume la última operación medida
+
+        Args:
+            stages (int): Cantidad de etapas más lentas a mostrar
+
+        Returns:
+            str: Tiempo de la operación, promedio reciente y etapas más lentas
+        """
+
+        if not self.history:
+            return ""
+
+        name, last = self.history[-1]
+        runs = [times[name] for operation, times in self.history if operation == name]
+        average = sum(runs) / len(runs)
+
+        slowest = sorted(
+            (item for item in last.items() if item[0] != name),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:stages]
+        parts = [
+            f"{name} {last[name] / 1e6:.1f} ms "
+            f"(promedio {average / 1e6:.1f} ms en {len(runs)})"
+        ]
+        parts.extend(
+            f"{stage.strip()} {time_ns / 1e6:.1f}" for stage, time_ns in slowest
+        )
+
+        return " | ".join(parts)
+
+    def export_trace(self, file: str) -> int:
+        """Guarda los intervalos en formato de traza de Chrome
+
+        El archivo se puede abrir en chrome://tracing o en Perfetto.
+
+        Args:
+            file (str): Archivo de traza
+
+        Returns:
+            int: Cantidad de intervalos guardados
+        """
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": name.strip(),
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": thread,
+            }
+            for name, category, start, duration, thread in self.events
+        ]
+
+        with open(file, "w") as trace:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace)
+
+        return len(events)
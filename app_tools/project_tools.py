@@ -0,0 +1,448 @@
+from array import array
+from pathlib import Path
+import gc
+import json
+import mmap
+import os
+import struct
+import sys
+
+from app_tools.record_tools import config_from_json, config_line, json_default
+
+# Formato del proyecto indexado (.gcp), enteros en little-endian:
+#   encabezado: firma, versión, reservado, líneas, inicio del índice y bytes
+#       de registros vigentes
+#   registros: largo (uint32) y línea [tarea, datos] en JSON compacto
+#   índice: inicio de cada registro (uint64), alineado a 8 bytes
+# Al guardar solo se agregan los registros nuevos y un índice nuevo al final;
+# el encabezado se escribe al último para que un corte deje el archivo
+# anterior intacto.
+
+project_extension = ".gcp"
+project_magic = b"GCEP"
+project_version = 1
+header_struct = struct.Struct("<4sHHIQQ")
+record_struct = struct.Struct("<I")
+index_item_size = 8
+line_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=json_default
+)
+
+
+def encode_line(line: list) -> bytes:
+    """Codifica una línea de configuración como registro
+
+    Args:
+        line (list): Línea [tarea, datos]
+
+    Returns:
+        bytes: Largo y JSON compacto de la línea
+    """
+
+    payload = line_encoder.encode(line).encode()
+    return record_struct.pack(len(payload)) + payload
+
+
+def line_values(data: object) -> tuple:
+    """Valores de los datos de una línea con su tipo
+
+    Sirve para saber si los datos cambiaron desde que se guardaron; el tipo
+    distingue valores iguales que se escriben distinto, como 1 y 1.0.
+
+    Args:
+        data (object): Registro o diccionario de datos de la línea
+
+    Returns:
+        tuple: Valores y tipos de los valores
+    """
+
+    values = tuple(data.values())
+    return values, tuple(map(type, values))
+
+
+def index_bytes(offsets: array) -> bytes:
+    """Convierte el índice de registros a bytes little-endian
+
+    Args:
+        offsets (array): Inicio de cada registro
+
+    Returns:
+        bytes: Índice del archivo
+    """
+
+    if sys.byteorder == "big":
+        offsets = array("Q", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def padding(position: int) -> bytes:
+    """Relleno para alinear el índice a 8 bytes
+
+    Args:
+        position (int): Posición actual del archivo
+
+    Returns:
+        bytes: Bytes de relleno
+    """
+
+    return bytes(-position % index_item_size)
+
+
+def write_project(path: str, config_list: list) -> None:
+    """Guarda la configuración completa en un proyecto indexado
+
+    Se escribe a un archivo temporal que reemplaza al anterior, así un
+    corte nunca deja el proyecto a medias.
+
+    Args:
+        path (str): Archivo del proyecto
+        config_list (list): Líneas de configuración
+    """
+
+    temporary = f"{path}.tmp"
+    offsets = array("Q")
+    records_size = 0
+
+    with open(temporary, "wb") as file:
+        file.write(bytes(header_struct.size))
+        position = header_struct.size
+        for line in config_list:
+            record = encode_line(line)
+            offsets.append(position)
+            file.write(record)
+            position += len(record)
+            records_size += len(record)
+
+        file.write(padding(position))
+        index_offset = position + len(padding(position))
+        file.write(index_bytes(offsets))
+
+        file.seek(0)
+        file.write(
+            header_struct.pack(
+                project_magic,
+                project_version,
+                0,
+                len(offsets),
+                index_offset,
+                records_size,
+            )
+        )
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary, path)
+
+
+class Project_file:
+    """Proyecto indexado abierto con mmap
+
+    Las líneas se decodifican solo cuando se piden y se guardan en caché.
+    El proyecto recuerda el registro de cada objeto de datos leído o
+    guardado junto con sus valores en ese momento. La regeneración cambia
+    los datos de algunas líneas en el mismo lugar, así que al guardar se
+    escriben los datos que no tienen registro y los que ya no tienen los
+    valores guardados.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Abre el proyecto
+
+        Args:
+            path (str): Archivo del proyecto
+
+        Raises:
+            ValueError: El archivo no es un proyecto válido
+        """
+
+        self.path = os.path.abspath(path)
+        self.file = None
+        self.map = None
+        self.lines = {}
+        self.records = {}
+        self.open()
+
+    def open(self) -> None:
+        """Lee el encabezado y el índice del proyecto
+
+        Raises:
+            ValueError: El archivo no es un proyecto válido
+        """
+
+        self.file = open(self.path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self.map) < header_struct.size:
+                raise ValueError(f"{self.path} no es un proyecto")
+
+            magic, version, _, count, index_offset, records_size = (
+                header_struct.unpack_from(self.map)
+            )
+            if magic != project_magic:
+                raise ValueError(f"{self.path} no es un proyecto")
+            if version != project_version:
+                raise ValueError(f"Versión de proyecto {version} no soportada")
+
+            index_end = index_offset + count * index_item_size
+            if index_end > len(self.map):
+                raise ValueError(f"Índice incompleto en {self.path}")
+
+            self.index = array("Q", self.map[index_offset:index_end])
+            if sys.byteorder == "big":
+                self.index.byteswap()
+
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+        self.index_offset = index_offset
+        self.records_size = records_size
+        self.file_size = len(self.map)
+
+    def close(self) -> None:
+        """Cierra el mapa del archivo"""
+
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, index: int) -> list:
+        """Obtiene una línea, decodificándola la primera vez
+
+        Args:
+            index (int): Número de línea
+
+        Returns:
+            list: Línea [tarea, datos]
+        """
+
+        line = self.lines.get(index)
+        if line is None:
+            self.decode_lines([index])
+            line = self.lines[index]
+        return line
+
+    def __iter__(self) -> iter:
+        return (self[index] for index in range(len(self)))
+
+    def decode_lines(self, indexes: list) -> None:
+        """Decodifica los registros de varias líneas en una sola lectura JSON
+
+        Args:
+            indexes (list): Números de línea
+
+        Raises:
+            ValueError: Registro dañado
+        """
+
+        index, data_map, unpack = self.index, self.map, record_struct.unpack_from
+        prefix, file_size = record_struct.size, self.file_size
+
+        offsets = [index[number] for number in indexes]
+        if offsets and max(offsets) + prefix > file_size:
+            raise ValueError(f"Registro fuera del archivo {self.path}")
+
+        sizes = [prefix + unpack(data_map, offset)[0] for offset in offsets]
+        if any(offset + size > file_size for offset, size in zip(offsets, sizes)):
+            raise ValueError(f"Registro incompleto en {self.path}")
+
+        payloads = b",".join(
+            [
+                data_map[offset + prefix : offset + size]
+                for offset, size in zip(offsets, sizes)
+            ]
+        )
+
+        # Las líneas no forman ciclos; sin el recolector la decodificación de
+        # un programa grande no recorre una y otra vez los objetos ya creados
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            lines = json.loads(b"[" + payloads + b"]")
+            for number, offset, size, (task, data) in zip(
+                indexes, offsets, sizes, lines
+            ):
+                line = config_line(task, data)
+                self.lines[number] = line
+                data = line[1]
+                self.records[id(data)] = (data, line_values(data), offset, size)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def read_lines(self, first: int = 0, last: int = None) -> list:
+        """Obtiene un rango de líneas
+
+        Args:
+            first (int): Primera línea
+            last (int): Línea siguiente a la última, todas si no se indica
+
+        Returns:
+            list: Líneas [tarea, datos]
+        """
+
+        last = len(self) if last is None else min(last, len(self))
+        missing = [index for index in range(first, last) if index not in self.lines]
+        if missing:
+            self.decode_lines(missing)
+
+        return [self.lines[index] for index in range(first, last)]
+
+    def garbage_size(self) -> int:
+        """Bytes de registros e índices que ya no se usan
+
+        Returns:
+            int: Bytes desperdiciados
+        """
+
+        live = header_struct.size + self.records_size + len(self) * index_item_size
+        return self.file_size - live
+
+    def save(self, config_list: list) -> int:
+        """Guarda la configuración escribiendo solo las líneas nuevas o cambiadas
+
+        Los registros nuevos y el índice se agregan al final del archivo y
+        luego se actualiza el encabezado. Si el espacio desperdiciado supera
+        al vigente, el proyecto se escribe completo de nuevo.
+
+        Args:
+            config_list (list): Líneas de configuración
+
+        Returns:
+            int: Cantidad de registros escritos
+        """
+
+        records = {}
+        offsets = array("Q")
+        new_lines = []
+        records_size = 0
+
+        for line in config_list:
+            data = line[1]
+            record = self.records.get(id(data))
+            if (
+                record is None
+                or record[0] is not data
+                or record[1] != line_values(data)
+            ):
+                new_lines.append((len(offsets), line))
+                offsets.append(0)
+            else:
+                records[id(data)] = record
+                offsets.append(record[2])
+                records_size += record[3]
+
+        if not new_lines and offsets == self.index:
+            return 0
+
+        self.close()
+        with open(self.path, "r+b") as file:
+            position = file.seek(0, os.SEEK_END)
+            for number, line in new_lines:
+                record = encode_line(line)
+                offsets[number] = position
+                file.write(record)
+                data = line[1]
+                records[id(data)] = (data, line_values(data), position, len(record))
+                records_size += len(record)
+                position += len(record)
+
+            file.write(padding(position))
+            index_offset = position + len(padding(position))
+            file.write(index_bytes(offsets))
+            file.flush()
+            os.fsync(file.fileno())
+
+            file.seek(0)
+            file.write(
+                header_struct.pack(
+                    project_magic,
+                    project_version,
+                    0,
+                    len(offsets),
+                    index_offset,
+                    records_size,
+                )
+            )
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.records = records
+        self.lines = dict(enumerate(config_list))
+        self.open()
+
+        if self.garbage_size() > header_struct.size + self.records_size:
+            self.compact(config_list)
+
+        return len(new_lines)
+
+    def compact(self, config_list: list) -> None:
+        """Escribe el proyecto completo para descartar el espacio desperdiciado
+
+        Args:
+            config_list (list): Líneas de configuración
+        """
+
+        self.close()
+        write_project(self.path, config_list)
+        self.open()
+        self.adopt(config_list)
+
+    def adopt(self, config_list: list) -> None:
+        """Asocia las líneas recién guardadas con sus registros
+
+        Args:
+            config_list (list): Líneas guardadas en el proyecto
+        """
+
+        self.lines = dict(enumerate(config_list))
+        self.records = {
+            id(data): (
+                data,
+                line_values(data),
+                self.index[index],
+                self.record_size(index),
+            )
+            for index, (task, data) in enumerate(config_list)
+        }
+
+    def record_size(self, index: int) -> int:
+        """Bytes que ocupa el registro de una línea
+
+        Args:
+            index (int): Número de línea
+
+        Returns:
+            int: Largo del registro con su prefijo
+        """
+
+        (length,) = record_struct.unpack_from(self.map, self.index[index])
+        return record_struct.size + length
+
+
+def read_config(path: str) -> list:
+    """Lee una configuración de un proyecto indexado o de un archivo JSON
+
+    Args:
+        path (str): Archivo de configuración
+
+    Returns:
+        list: Líneas de configuración
+    """
+
+    if Path(path).suffix.lower() == project_extension:
+        project = Project_file(path)
+        try:
+            return project.read_lines()
+        finally:
+            project.close()
+
+    with open(path) as file:
+        return config_from_json(json.load(file))
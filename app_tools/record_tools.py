@@ -0,0 +1,212 @@
+from collections.abc import MutableMapping
+from operator import attrgetter
+import sys
+
+
+class Config_record(MutableMapping):
+    """Datos de una línea de configuración con campos fijos
+
+    Cada tarea define sus campos en __slots__, en el mismo orden en que los
+    generadores desempaquetan data.values(). Se comporta como el diccionario
+    de datos de siempre pero sin guardar las llaves en cada línea.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls) -> None:
+        """Prepara la creación y lectura rápida de los valores de la tarea
+
+        El __init__ de cada tarea se genera con sus campos, como lo hace
+        dataclasses, para evitar recorrer los campos en cada línea.
+        """
+
+        super().__init_subclass__()
+        fields = ", ".join(cls.__slots__)
+        body = "".join(f"\n    self.{name} = {name}" for name in cls.__slots__)
+        namespace = {}
+        exec(f"def __init__(self, {fields}):{body}", namespace)
+        cls.__init__ = namespace["__init__"]
+
+        getter = attrgetter(*cls.__slots__)
+        if len(cls.__slots__) == 1:
+            cls.values_getter = staticmethod(lambda record: (getter(record),))
+        else:
+            cls.values_getter = staticmethod(getter)
+
+    def __init__(self, *values) -> None:
+        """Inicializa el registro
+
+        Args:
+            values: Valores de los campos en orden
+        """
+
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key: str) -> object:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: object) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Los campos de la línea de configuración son fijos")
+
+    def __iter__(self) -> iter:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())})"
+
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    def values(self) -> tuple:
+        return self.values_getter(self)
+
+    def items(self) -> tuple:
+        return tuple(zip(self.__slots__, self.values_getter(self)))
+
+    def copy(self) -> object:
+        """Copia el registro
+
+        Returns:
+            object: Registro nuevo con los mismos valores
+        """
+
+        return type(self)(*self.values())
+
+    def to_dict(self) -> dict:
+        """Convierte el registro al diccionario de datos
+
+        Returns:
+            dict: Diccionario con los campos en orden
+        """
+
+        return dict(zip(self.__slots__, self.values_getter(self)))
+
+
+class Header_record(Config_record):
+    __slots__ = ("Prt", "Pgr", "Dsc", "Mch", "Dia", "Lgt", "Chk", "Cch", "Wrk")
+
+
+class Free_record(Config_record):
+    __slots__ = ("Fre",)
+
+
+class Comment_record(Config_record):
+    __slots__ = ("Com", "Sde", "Blk")
+
+
+class Subrutine_record(Config_record):
+    __slots__ = ("Sub", "Rep", "Blk")
+
+
+class Tool_call_record(Config_record):
+    __slots__ = ("Tol", "Typ", "Dia", "Spc", "Sde", "Xin", "Yin", "Zin", "Blk")
+
+
+class Tool_close_record(Config_record):
+    __slots__ = ("Tol", "Sde", "Dia", "Blk")
+
+
+class Spindle_record(Config_record):
+    __slots__ = ("Spd", "Rot", "Sde", "Blk")
+
+
+class Spindle_index_record(Config_record):
+    __slots__ = ("Grd", "Rot", "Blk")
+
+
+class Misc_record(Config_record):
+    __slots__ = ("Com", "Stp", "Chk", "Col", "Sde", "Blk")
+
+
+class End_record(Config_record):
+    __slots__ = ("Mch", "Num", "Blk")
+
+
+task_records = {
+    "Inicio de programa": Header_record,
+    "        Comentario": Comment_record,
+    " ": Free_record,
+    "        -> Subrutina": Subrutine_record,
+    "    Llamar herramienta": Tool_call_record,
+    "    Cerrar herramienta": Tool_close_record,
+    "        Giro husillo": Spindle_record,
+    "        Orientar husillo": Spindle_index_record,
+    "        Funciones M": Misc_record,
+    "Fin de programa": End_record,
+}
+
+
+def config_line(task: str, data: object) -> list:
+    """Crea una línea de configuración compacta
+
+    Los textos se internan para compartir una sola copia de los valores
+    repetidos. Si la tarea no tiene registro o las llaves no coinciden con
+    sus campos se conserva el diccionario, para no perder datos.
+
+    Args:
+        task (str): Nombre de la tarea
+        data (object): Diccionario o registro de datos de la línea
+
+    Returns:
+        list: Nombre de tarea internado y datos de la línea
+    """
+
+    task = sys.intern(task)
+    if type(data) is not dict:
+        return [task, data]
+
+    record_type = task_records.get(task)
+    if record_type is None or tuple(data) != record_type.__slots__:
+        return [task, data]
+
+    intern = sys.intern
+    values = [intern(value) if type(value) is str else value for value in data.values()]
+    return [task, record_type(*values)]
+
+
+def config_from_json(config_list: list) -> list:
+    """Convierte la configuración leída de JSON a líneas compactas
+
+    La lista se convierte en el mismo lugar para liberar cada diccionario
+    en cuanto se reemplaza por su registro.
+
+    Args:
+        config_list (list): Líneas [tarea, diccionario] del archivo
+
+    Returns:
+        list: La misma lista con líneas [tarea, registro]
+    """
+
+    for index, (task, data) in enumerate(config_list):
+        config_list[index] = config_line(task, data)
+
+    return config_list
+
+
+def json_default(data: object) -> dict:
+    """Convierte los registros al guardar la configuración en JSON
+
+    Args:
+        data (object): Objeto que json no sabe guardar
+
+    Raises:
+        TypeError: El objeto no es un registro de configuración
+
+    Returns:
+        dict: Diccionario de datos de la línea
+    """
+
+    if isinstance(data, Config_record):
+        return data.to_dict()
+    raise TypeError(f"{type(data).__name__} no se puede guardar en JSON")
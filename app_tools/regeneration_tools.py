@@ -0,0 +1,60 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class Regeneration_signals(QObject):
+    """Señales de la regeneración en segundo plano
+
+    Pertenecen al hilo de la ventana: se emiten desde el trabajador y Qt
+    las entrega en el hilo de la interfaz, donde se aplica el resultado.
+    """
+
+    finished = Signal(object)
+    failed = Signal(object, object)
+
+
+class Regeneration_worker(QRunnable):
+    """Trabajador que regenera el tape fuera del hilo de la interfaz
+
+    Args:
+        QRunnable (_type_): Tarea del depósito de hilos de Qt
+    """
+
+    def __init__(self, regeneration: object, signals: Regeneration_signals) -> None:
+        """Inicializa el trabajador
+
+        Args:
+            regeneration (object): Regeneración a ejecutar (Tape_regeneration)
+            signals (Regeneration_signals): Señales para entregar el resultado
+        """
+
+        super().__init__()
+        self.regeneration = regeneration
+        self.signals = signals
+
+    def run(self) -> None:
+        """Ejecuta la regeneración y entrega el resultado si no se canceló"""
+
+        regeneration = self.regeneration
+        try:
+            finished = not regeneration.cancelled and regeneration.run()
+        except Exception as error:
+            self.signals.failed.emit(regeneration, error)
+            return
+
+        if finished:
+            self.signals.finished.emit(regeneration)
+
+
+def regeneration_pool() -> QThreadPool:
+    """Crea el depósito de hilos de regeneración
+
+    Usa un solo hilo: una regeneración nueva espera a que la cancelada
+    termine, así nunca comparten la caché de líneas generadas.
+
+    Returns:
+        QThreadPool: Depósito de un hilo
+    """
+
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    return pool
@@ -1,5 +1,7 @@
 from PySide6 import QtCore
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QResource
+from PySide6.QtGui import QPixmap, QPixmapCache
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -57,6 +59,56 @@ def absPath(file: str) -> str:
     return str(Path(__file__).parent.absolute() / file)
 
 
+def load_theme(app: object) -> None:
+    """Aplica el estilo de todas las ventanas una sola vez en la aplicación
+
+    Args:
+        app (object): Aplicación de Qt
+    """
+
+    with open(absPath("../resources/theme.qss"), encoding="utf-8") as theme:
+        app.setStyleSheet(theme.read())
+
+
+@lru_cache(maxsize=None)
+def load_help_resources() -> bool:
+    """Registra los íconos de las ventanas de tareas y las imágenes de ayuda
+
+    Están en resources/help.rcc y se registran la primera vez que se crea
+    una ventana de tarea o se muestra una ayuda; al abrir el editor solo
+    se carga resources_rc con los íconos de la ventana principal.
+
+    Returns:
+        bool: Recurso registrado
+    """
+
+    return QResource.registerResource(absPath("../resources/help.rcc"))
+
+
+def help_pixmap(image: str) -> QPixmap:
+    """Obtiene una imagen de ayuda, leyéndola solo la primera vez
+
+    Args:
+        image (str): Nombre de la imagen
+
+    Returns:
+        QPixmap: Imagen, nula si no existe
+    """
+
+    pixmap = QPixmapCache.find(image)
+    if pixmap is not None:
+        return pixmap
+
+    load_help_resources()
+    pixmap = QPixmap(f":/help/{image}")
+    if pixmap.isNull():
+        pixmap = QPixmap(absPath(f"../resources/{image}"))
+    if not pixmap.isNull():
+        QPixmapCache.insert(image, pixmap)
+
+    return pixmap
+
+
 def image_load(label: str, image: str) -> None:
     """Carga una imagen en una etiqueta
 
@@ -65,6 +117,5 @@ def image_load(label: str, image: str) -> None:
         image (str): Imagen a cargar
     """
 
-    image = QPixmap(absPath(f"../resources/{image}"))
-    label.setPixmap(image)
+    label.setPixmap(help_pixmap(image))
     label.setScaledContents(True)
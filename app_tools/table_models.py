@@ -0,0 +1,109 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class Lines_model(QAbstractTableModel):
+    """Modelo de tabla que lee las líneas directamente de una lista
+
+    Args:
+        QAbstractTableModel (_type_): Clase de modelo de tabla
+    """
+
+    column = 0
+
+    def __init__(self, title: str) -> None:
+        """Inicializa el modelo
+
+        Args:
+            title (str): Título de la columna
+        """
+
+        super().__init__()
+        self.title = title
+        self.lines = []
+        self.row_count = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de filas del modelo"""
+
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de columnas del modelo"""
+
+        return 0 if parent.isValid() else 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """Texto de la fila solicitada"""
+
+        if role == Qt.DisplayRole and index.isValid():
+            return self.lines[index.row()][self.column]
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> object:
+        """Título de la columna y número de las filas"""
+
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.title
+        return super().headerData(section, orientation, role)
+
+    def update_rows(self, lines: list, changes: tuple = None) -> None:
+        """Actualiza las filas modificadas del modelo
+
+        Args:
+            lines (list): Lista actual de líneas
+            changes (tuple): Primera fila modificada y final de las filas
+                modificadas antes y después del cambio, None para recargar
+                todas las filas
+        """
+
+        if changes is None:
+            self.reset_rows(lines)
+            return
+
+        first, old_last, new_last = changes
+        self.lines = lines
+
+        if new_last > old_last:
+            self.beginInsertRows(QModelIndex(), old_last, new_last - 1)
+            self.row_count += new_last - old_last
+            self.endInsertRows()
+        elif new_last < old_last:
+            self.beginRemoveRows(QModelIndex(), new_last, old_last - 1)
+            self.row_count -= old_last - new_last
+            self.endRemoveRows()
+
+        if self.row_count != len(lines):
+            self.reset_rows(lines)
+            return
+
+        last = min(old_last, new_last)
+        if first < last:
+            top = self.index(first, 0)
+            bottom = self.index(last - 1, 0)
+            self.dataChanged.emit(top, bottom, [Qt.DisplayRole])
+
+    def reset_rows(self, lines: list) -> None:
+        """Recarga todas las filas del modelo
+
+        Args:
+            lines (list): Lista actual de líneas
+        """
+
+        self.beginResetModel()
+        self.lines = lines
+        self.row_count = len(lines)
+        self.endResetModel()
+
+
+class Config_model(Lines_model):
+    """Modelo de la ventana de configuración, muestra el nombre de la tarea"""
+
+    column = 0
+
+
+class Tape_model(Lines_model):
+    """Modelo de las ventanas de tape, muestra la línea de código"""
+
+    column = 1
@@ -0,0 +1,578 @@
+from itertools import islice
+from operator import attrgetter
+import contextlib
+import hashlib
+import locale
+import os
+
+from app_tools.combo_lists import Combo_lists
+from app_tools.compensations_tools import Compensations
+from app_tools.format_tools import *
+
+from app_tools.generator_registry import bind_machine
+
+
+class Tape_state:
+    """Estado de mecanizado para generar tapes sin interfaz gráfica"""
+
+    def __init__(self) -> None:
+        """Inicializa el estado"""
+
+        self.current_machine = ""
+        self.current_comment = ""
+        self.current_side = ""
+        self.current_work_offset = ""
+        self.part_name = ""
+        self.main_tape_number = ""
+        self.tape_description = ""
+        self.current_bar_diameter = 0
+        self.current_part_lenght = 0
+        self.current_tool = 0
+        self.current_tool_diameter = 0
+        self.swiss_back_machining = False
+        self.generators = bind_machine("")
+        self.current_config_line = 0
+        self.tape1_list = []
+        self.tape2_list = []
+
+
+# Estado de mecanizado que se guarda después de cada línea de configuración
+machining_fields = (
+    "current_machine",
+    "current_comment",
+    "current_side",
+    "current_work_offset",
+    "part_name",
+    "main_tape_number",
+    "tape_description",
+    "current_bar_diameter",
+    "current_part_lenght",
+    "current_tool",
+    "current_tool_diameter",
+    "swiss_back_machining",
+)
+machining_state = attrgetter(*machining_fields)
+
+
+def load_machining_state(state: object, values: tuple) -> None:
+    """Recupera un estado de mecanizado guardado
+
+    Args:
+        state (object): Estado de mecanizado a actualizar
+        values (tuple): Valores guardados con machining_state
+    """
+
+    for name, value in zip(machining_fields, values):
+        setattr(state, name, value)
+    state.generators = bind_machine(state.current_machine)
+
+
+# ?
+# ? Procesadores de tareas -------------------------------------------------- *
+# ?
+
+
+def header_processor(state: object, data: dict) -> None:
+    """Procesa el encabezado del programa
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    state.current_side = "PRINCIPAL"
+    state.current_machine = data["Mch"]
+    state.part_name = data["Prt"]
+    state.main_tape_number = data["Pgr"]
+    state.tape_description = data["Dsc"]
+    state.current_bar_diameter = float(data["Dia"])
+    state.current_part_lenght = float(data["Lgt"])
+    state.current_work_offset = data["Wrk"]
+    state.swiss_back_machining = data["Chk"] > 0
+    state.generators = bind_machine(state.current_machine)
+
+
+def comment_processor(state: object, data: dict) -> None:
+    """Procesa un comentario
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    state.current_comment = data["Com"]
+    state.current_side = data["Sde"]
+
+
+def machine_tool(machine: str, tool: int, side: str) -> int:
+    """Convierte el número de herramienta a la numeración de la máquina
+
+    Hace la misma conversión que el generador del llamado de herramienta
+    de cada torno suizo; aplicarla otra vez no cambia el número.
+
+    Args:
+        machine (str): Máquina del programa
+        tool (int): Número de herramienta
+        side (str): Lado del tape (PRINCIPAL, SECUNDARIO, LATERAL)
+
+    Returns:
+        int: Número de herramienta convertido
+    """
+
+    if machine in ("B12", "A16"):
+        side = Combo_lists.tape_sides[side]
+        if machine == "A16" or side == "$1":
+            tool = Compensations.kswiss_to_swiss(None, tool, side)
+    elif machine in ("K16", "E16"):
+        side = Combo_lists.tape_sides[side]
+        tool = Compensations.swiss_to_kswiss(None, tool, side)
+
+    return tool
+
+
+def tool_call_processor(state: object, data: dict) -> None:
+    """Procesa el llamado de herramienta
+
+    El número se convierte antes de tomarlo como herramienta actual, así
+    el estado no cambia cuando el generador lo vuelve a convertir y una
+    sola generación da el tape final.
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    data["Tol"] = machine_tool(state.current_machine, data["Tol"], data["Sde"])
+    state.current_tool = int(data["Tol"])
+    state.current_side = data["Sde"]
+
+
+def side_processor(state: object, data: dict) -> None:
+    """Procesa una tarea que define el lado del tape
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    state.current_side = data["Sde"]
+
+
+def main_side_processor(state: object, data: dict) -> None:
+    """Procesa una tarea que regresa al lado principal del tape
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    state.current_side = "PRINCIPAL"
+
+
+def empty_processor(state: object, data: dict) -> None:
+    """Procesa una tarea que no modifica el estado
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    pass
+
+
+# ?
+# ? Datos dependientes del estado ------------------------------------------- *
+# ?
+
+
+def tool_close_data(state: object, data: dict) -> None:
+    """Completa los datos del cierre de herramienta
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    data["Tol"] = state.current_tool
+    data["Sde"] = state.current_side
+    data["Dia"] = state.current_bar_diameter
+
+
+def end_data(state: object, data: dict) -> None:
+    """Completa los datos del fin de programa
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    data["Mch"] = state.current_machine
+
+
+def same_data(state: object, data: dict) -> None:
+    """Tareas cuyos datos no dependen del estado
+
+    Args:
+        state (object): Estado de mecanizado
+        data (dict): Diccionario de datos de la línea
+    """
+
+    pass
+
+
+task_functions = {
+    "Inicio de programa": (header_processor, same_data),
+    "        Comentario": (comment_processor, same_data),
+    " ": (empty_processor, same_data),
+    "        -> Subrutina": (main_side_processor, same_data),
+    "    Llamar herramienta": (tool_call_processor, same_data),
+    "    Cerrar herramienta": (empty_processor, tool_close_data),
+    "        Giro husillo": (side_processor, same_data),
+    "        Orientar husillo": (main_side_processor, same_data),
+    "        Funciones M": (side_processor, same_data),
+    "Fin de programa": (empty_processor, end_data),
+}
+
+
+# ?
+# ? Generación del tape ----------------------------------------------------- *
+# ?
+
+
+def tape_file_name(state: object) -> tuple:
+    """Obtiene el nombre y la extensión del archivo de tape
+
+    Args:
+        state (object): Estado de mecanizado
+
+    Returns:
+        tuple: Nombre y extensión del archivo
+    """
+
+    back = "(H)" if state.swiss_back_machining else ""
+    machine = state.current_machine
+    file_name = ""
+    file_extension = ""
+
+    if machine in ("B12", "A16", "K16", "E16"):
+        file_name = f"({machine}) {state.part_name} {back}"
+        file_extension = ".CNC"
+    elif machine == "OMNITURN":
+        file_name = state.main_tape_number
+    elif machine == "ROMI":
+        file_name = f"R{state.main_tape_number}"
+    elif machine == "HARDINGE":
+        file_name = f"H{state.main_tape_number}"
+    elif machine == "MAZAK":
+        file_name = f"O{state.main_tape_number}"
+        file_extension = ".CNC"
+
+    return file_name, file_extension
+
+
+def add_tape_lines(state: object, lines: list, params: tuple) -> None:
+    """Agrega las líneas generadas a las listas de tape
+
+    Args:
+        state (object): Estado con las listas de tape
+        lines (list): Líneas de tape
+        params (tuple): Línea de configuración, herramienta y comentario
+    """
+
+    par1, par2, par3 = params
+
+    for line in lines[0]:
+        if line != "":
+            state.tape1_list.append((par1, line, par2, par3))
+    for line in lines[1]:
+        if line != "":
+            state.tape2_list.append((par1, line, par2, par3))
+
+
+def build_tape(config_list: list, cache: object = None) -> Tape_state:
+    """Genera el tape completo de una configuración sin interfaz gráfica
+
+    Args:
+        config_list (list): Lista de líneas de configuración
+        cache (object): Caché de líneas generadas (opcional)
+
+    Returns:
+        Tape_state: Estado final con las listas de tape
+    """
+
+    state = Tape_state()
+
+    for task, data in config_list:
+        if task != "Inicio de programa":
+            state.current_config_line += 1
+
+        processor, prepare = task_functions[task]
+        processor(state, data)
+        prepare(state, data)
+
+        generator = state.generators[task]
+        if cache is not None:
+            lines = cache.generate(generator, data)
+        else:
+            lines = generator(data)
+
+        params = (
+            state.current_config_line,
+            state.current_tool,
+            state.current_comment,
+        )
+        add_tape_lines(state, lines, params)
+
+    return state
+
+
+class Tape_regeneration:
+    """Regeneración incremental del tape sin interfaz gráfica
+
+    Sigue los mismos pasos que MainWindow.tape_add sobre una copia de la
+    configuración, por lo que puede ejecutarse fuera del hilo de la
+    interfaz. Cada línea se procesa sobre una copia de sus datos; las
+    copias que la preparación o el generador modificaron se guardan en
+    prepared para aplicarlas después en la configuración.
+    """
+
+    def __init__(
+        self,
+        config_lines: tuple,
+        dirty_lines: tuple,
+        line_states: list,
+        tape1_list: list,
+        tape2_list: list,
+        cache: object = None,
+    ) -> None:
+        """Inicializa la regeneración
+
+        Args:
+            config_lines (tuple): Copia de las líneas de configuración
+            dirty_lines (tuple): Rango modificado desde la generación
+                anterior, None para regenerar todo
+            line_states (list): Estados de la generación anterior
+            tape1_list (list): Tape 1 de la generación anterior
+            tape2_list (list): Tape 2 de la generación anterior
+            cache (object): Caché de líneas generadas (opcional)
+        """
+
+        self.config_lines = config_lines
+        self.dirty_lines = dirty_lines
+        self.old_states = line_states
+        self.old_tape1 = tape1_list
+        self.old_tape2 = tape2_list
+        self.cache = cache
+        self.state = Tape_state()
+        self.line_states = []
+        self.prepared = {}
+        self.first = 0
+        self.config_changes = None
+        self.tape1_changes = None
+        self.tape2_changes = None
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancela la regeneración, se detiene antes de la siguiente línea"""
+
+        self.cancelled = True
+
+    def run(self) -> bool:
+        """Regenera el tape desde la primera línea modificada
+
+        Returns:
+            bool: La regeneración terminó sin cancelarse
+        """
+
+        if self.cache is not None:
+            self.cache.check_definitions()
+
+        state = self.state
+        old_states = self.old_states
+        config_lines = self.config_lines
+
+        first, last, shift = self.dirty_lines or (0, 0, 0)
+        if first <= 0 or first > len(old_states):
+            first, last = 0, len(config_lines)
+        self.first = first
+
+        if first > 0:
+            self.line_states = old_states[:first]
+            values, config_line, tape1_end, tape2_end = self.line_states[-1]
+            load_machining_state(state, values)
+            state.current_config_line = config_line
+            state.tape1_list = self.old_tape1[:tape1_end]
+            state.tape2_list = self.old_tape2[:tape2_end]
+            self.config_changes = (first, last - shift, last)
+        tape1_first = len(state.tape1_list)
+        tape2_first = len(state.tape2_list)
+
+        for index in range(first, len(config_lines)):
+            if self.cancelled:
+                return False
+
+            old_index = index - shift
+            if index >= last and self.same_line_state(old_index):
+                _, _, old_end1, old_end2 = old_states[old_index - 1]
+                self.set_tape_changes(tape1_first, tape2_first, old_end1, old_end2)
+                self.reuse_tape_lines(old_index, shift)
+                return True
+
+            task, line_data = config_lines[index]
+            if task != "Inicio de programa":
+                state.current_config_line += 1
+
+            data = line_data.copy()
+            processor, prepare = task_functions[task]
+            processor(state, data)
+            prepare(state, data)
+
+            generator = state.generators[task]
+            if self.cache is not None:
+                lines = self.cache.generate(generator, data)
+            else:
+                lines = generator(data)
+
+            if tuple(data.values()) != tuple(line_data.values()):
+                self.prepared[index] = data
+
+            params = (
+                state.current_config_line,
+                state.current_tool,
+                state.current_comment,
+            )
+            add_tape_lines(state, lines, params)
+            self.line_states.append(
+                (
+                    machining_state(state),
+                    state.current_config_line,
+                    len(state.tape1_list),
+                    len(state.tape2_list),
+                )
+            )
+
+        old_end1, old_end2 = len(self.old_tape1), len(self.old_tape2)
+        self.set_tape_changes(tape1_first, tape2_first, old_end1, old_end2)
+        return True
+
+    def same_line_state(self, old_index: int) -> bool:
+        """Compara el estado actual con el de la generación anterior
+
+        Args:
+            old_index (int): Índice anterior de la línea a procesar
+
+        Returns:
+            bool: Condición de igualdad de los estados
+        """
+
+        if not 0 < old_index <= len(self.old_states):
+            return False
+
+        return self.old_states[old_index - 1][0] == self.line_states[-1][0]
+
+    def set_tape_changes(
+        self, tape1_first: int, tape2_first: int, old_end1: int, old_end2: int
+    ) -> None:
+        """Guarda el rango de filas de tape modificadas
+
+        Args:
+            tape1_first (int): Primera fila modificada del tape 1
+            tape2_first (int): Primera fila modificada del tape 2
+            old_end1 (int): Final de las filas modificadas en el tape 1 anterior
+            old_end2 (int): Final de las filas modificadas en el tape 2 anterior
+        """
+
+        if self.config_changes is None:
+            return
+
+        self.tape1_changes = (tape1_first, old_end1, len(self.state.tape1_list))
+        self.tape2_changes = (tape2_first, old_end2, len(self.state.tape2_list))
+
+    def reuse_tape_lines(self, old_index: int, shift: int) -> None:
+        """Reutiliza las líneas de tape de la generación anterior
+
+        Args:
+            old_index (int): Índice anterior de la primera línea reutilizada
+            shift (int): Diferencia de líneas respecto a la lista anterior
+        """
+
+        state = self.state
+        _, _, old_end1, old_end2 = self.old_states[old_index - 1]
+        tape1_shift = len(state.tape1_list) - old_end1
+        tape2_shift = len(state.tape2_list) - old_end2
+
+        if shift:
+            state.tape1_list.extend(
+                (line[0] + shift, *line[1:]) for line in self.old_tape1[old_end1:]
+            )
+            state.tape2_list.extend(
+                (line[0] + shift, *line[1:]) for line in self.old_tape2[old_end2:]
+            )
+        else:
+            state.tape1_list.extend(self.old_tape1[old_end1:])
+            state.tape2_list.extend(self.old_tape2[old_end2:])
+
+        self.line_states.extend(
+            (values, config_line + shift, end1 + tape1_shift, end2 + tape2_shift)
+            for values, config_line, end1, end2 in self.old_states[old_index:]
+        )
+        values, state.current_config_line, _, _ = self.line_states[-1]
+        load_machining_state(state, values)
+
+
+def tape_lines(state: object) -> iter:
+    """Obtiene las líneas de tape a guardar sin copiar las listas
+
+    Args:
+        state (object): Estado con las listas de tape
+
+    Yields:
+        str: Líneas del tape completo
+    """
+
+    blank_space = fspace()
+
+    for tape_list in (state.tape1_list, state.tape2_list):
+        for line in tape_list:
+            if line[1] != blank_space:
+                yield line[1]
+
+
+def write_tape(file: str, lines: iter, chunk_lines: int = 4096) -> tuple:
+    """Guarda el tape en un archivo temporal y lo renombra al terminar
+
+    Las líneas se escriben por bloques a través de un búfer grande, el
+    archivo se sincroniza a disco antes de reemplazar al anterior, por lo
+    que un fallo durante el guardado nunca deja un tape incompleto.
+
+    Args:
+        file (str): Archivo de tape
+        lines (iter): Líneas del tape
+        chunk_lines (int): Cantidad de líneas por bloque
+
+    Returns:
+        tuple: Cantidad de bytes escritos y suma SHA-256 del tape
+    """
+
+    lines = iter(lines)
+    temp_file = f"{file}.{os.getpid()}.tmp"
+    encoding = locale.getpreferredencoding(False)
+    line_end = os.linesep
+    checksum = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(temp_file, "wb", buffering=1 << 20) as tape:
+            while chunk := list(islice(lines, chunk_lines)):
+                data = line_end.join(chunk).encode(encoding) + line_end.encode()
+                checksum.update(data)
+                size += tape.write(data)
+            tape.flush()
+            os.fsync(tape.fileno())
+        os.replace(temp_file, file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_file)
+        raise
+
+    return size, checksum.hexdigest()
@@ -0,0 +1,442 @@
+import math
+
+import numpy as np
+
+from app_tools.gcode_tools import modal_groups, parse_tape
+
+# Trayectoria de la herramienta a partir del tape generado:
+#   points: posición X, Y, Z al final de cada movimiento
+#   motion: G00 a G03 del movimiento que llega a cada punto, o no_motion si
+#       el punto comienza un trazo nuevo (primer punto de cada canal)
+# X y Z no se conocen hasta que el programa los da; los puntos anteriores
+# quedan como NaN y no se dibujan. Y comienza en el centro (0).
+
+rapid, linear, clockwise, counterclockwise = range(4)
+no_motion = -1
+start_position = (np.nan, 0.0, np.nan)
+axis_words = (("X", "U"), ("Y", "V"), ("Z", "W"))
+center_words = ("I", "J", "K")
+plane_axes = {17: (0, 1), 18: (2, 0), 19: (1, 2)}
+no_move_codes = (4, 10, 28, 50, 92)
+arc_step = math.radians(5)
+min_rows = 16
+
+
+def arc_points(
+    start: list, end: list, center: list, clockwise_arc: bool, plane: tuple
+) -> np.ndarray:
+    """Interpola un arco con segmentos rectos
+
+    Args:
+        start (list): Posición inicial X, Y, Z
+        end (list): Posición final X, Y, Z
+        center (list): Centro del arco X, Y, Z
+        clockwise_arc (bool): Arco en sentido horario (G02)
+        plane (tuple): Ejes del plano del arco (abscisa, ordenada)
+
+    Returns:
+        np.ndarray: Puntos del arco sin el inicial, el último es el final
+    """
+
+    a, b = plane
+    a0, b0 = start[a] - center[a], start[b] - center[b]
+    a1, b1 = end[a] - center[a], end[b] - center[b]
+    angle = math.atan2(b0, a0)
+    sweep = math.atan2(b1, a1) - angle
+    if clockwise_arc and sweep >= 0:
+        sweep -= 2 * math.pi
+    elif not clockwise_arc and sweep <= 0:
+        sweep += 2 * math.pi
+    if not math.isfinite(sweep):
+        return np.array([end], float)
+
+    count = max(1, math.ceil(abs(sweep) / arc_step))
+    steps = np.arange(1, count + 1) / count
+    angles = angle + sweep * steps
+    radius0, radius1 = math.hypot(a0, b0), math.hypot(a1, b1)
+    radii = radius0 + (radius1 - radius0) * steps
+
+    points = np.asarray(start) + np.outer(steps, np.subtract(end, start))
+    points[:, a] = center[a] + radii * np.cos(angles)
+    points[:, b] = center[b] + radii * np.sin(angles)
+    points[-1] = end
+    return points
+
+
+def radius_center(
+    start: list, end: list, radius: float, clockwise_arc: bool, plane: tuple
+) -> list:
+    """Calcula el centro de un arco programado con R
+
+    Args:
+        start (list): Posición inicial X, Y, Z
+        end (list): Posición final X, Y, Z
+        radius (float): Radio, negativo para el arco mayor de 180 grados
+        clockwise_arc (bool): Arco en sentido horario (G02)
+        plane (tuple): Ejes del plano del arco (abscisa, ordenada)
+
+    Returns:
+        list: Centro del arco X, Y, Z
+    """
+
+    a, b = plane
+    chord_a, chord_b = end[a] - start[a], end[b] - start[b]
+    chord = math.hypot(chord_a, chord_b)
+    center = list(start)
+    if chord == 0:
+        return center
+
+    height = math.sqrt(max(radius * radius - chord * chord / 4, 0))
+    side = (-1 if clockwise_arc else 1) * (1 if radius > 0 else -1)
+    center[a] = start[a] + chord_a / 2 - side * height * chord_b / chord
+    center[b] = start[b] + chord_b / 2 + side * height * chord_a / chord
+    return center
+
+
+def block_positions(blocks: np.ndarray, start: tuple = start_position) -> tuple:
+    """Calcula la posición de la herramienta al final de cada línea del tape
+
+    Las palabras X, Y, Z son absolutas con G90 e incrementales con G91; U, V,
+    W siempre son incrementales. Las líneas con G04, G10, G28, G50 o G92 no
+    mueven la herramienta.
+
+    Args:
+        blocks (np.ndarray): Líneas del tape leídas con parse_tape
+        start (tuple): Posición antes de la primera línea
+
+    Returns:
+        tuple: Posiciones (n, 3) e indicador de las líneas con movimiento
+    """
+
+    indexes = np.arange(len(blocks))
+    moving = ~np.isin(blocks["code"], no_move_codes)
+    incremental = blocks["distance"] == 91
+    positions = np.empty((len(blocks), 3))
+    moves = np.zeros(len(blocks), bool)
+
+    for axis, (letter, step_letter) in enumerate(axis_words):
+        value, step = blocks[letter], blocks[step_letter]
+        given = ~np.isnan(value) & moving
+        stepped = ~np.isnan(step) & moving
+        absolute = given & ~incremental
+        steps = np.where(given & incremental, value, 0) + np.where(stepped, step, 0)
+        total = np.cumsum(steps)
+
+        # Cada valor absoluto fija la base a la que se suman los incrementos
+        # que le siguen
+        last = np.maximum.accumulate(np.where(absolute, indexes, -1))
+        since = total - np.where(last >= 0, total[last], 0)
+        positions[:, axis] = np.where(last >= 0, value[last], start[axis]) + since
+        moves |= given | stepped
+
+    return positions, moves
+
+
+def path_points(
+    blocks: np.ndarray, positions: np.ndarray, moves: np.ndarray, start: tuple
+) -> tuple:
+    """Obtiene los puntos de la trayectoria de líneas del tape seguidas
+
+    Args:
+        blocks (np.ndarray): Líneas del tape leídas con parse_tape
+        positions (np.ndarray): Posiciones de las líneas (block_positions)
+        moves (np.ndarray): Indicador de las líneas con movimiento
+        start (tuple): Posición antes de la primera línea
+
+    Returns:
+        tuple: Puntos (n, 3), movimiento y fila del tape de cada punto; el
+            primero es start, con no_motion y fila -1
+    """
+
+    rows = np.append(-1, np.flatnonzero(moves))
+    points = np.vstack((start, positions[moves]))
+    motions = np.append(no_motion, blocks["motion"][moves]).astype(np.int8)
+
+    # Los arcos se reemplazan por sus segmentos; son pocos y se recorren
+    arcs = np.flatnonzero(motions >= clockwise)
+    if not len(arcs):
+        return points, motions, rows
+
+    arc_blocks = blocks[rows[arcs]]
+    point_parts, motion_parts, row_parts, previous = [], [], [], 0
+    for index, block in zip(arcs, arc_blocks):
+        start, end = points[index - 1], points[index]
+        clockwise_arc = block["motion"] == clockwise
+        plane = plane_axes[block["plane"]]
+        if not np.isnan(block["R"]):
+            center = radius_center(start, end, block["R"], clockwise_arc, plane)
+        else:
+            offsets = [block[letter] for letter in center_words]
+            center = start + np.nan_to_num(offsets)
+        arc = arc_points(start, end, center, clockwise_arc, plane)
+
+        point_parts += [points[previous:index], arc]
+        motion_parts += [motions[previous:index], np.full(len(arc), block["motion"])]
+        row_parts += [rows[previous:index], np.full(len(arc), rows[index])]
+        previous = index + 1
+
+    point_parts.append(points[previous:])
+    motion_parts.append(motions[previous:])
+    row_parts.append(rows[previous:])
+    return (
+        np.concatenate(point_parts),
+        np.concatenate(motion_parts).astype(np.int8),
+        np.concatenate(row_parts),
+    )
+
+
+def tape_toolpath(tape_list: list) -> tuple:
+    """Obtiene la trayectoria de un canal del tape
+
+    Args:
+        tape_list (list): Líneas del tape (línea de configuración, texto,
+            herramienta, comentario)
+
+    Returns:
+        tuple: Puntos (n, 3) y movimiento de cada punto (n)
+    """
+
+    blocks = parse_tape(tape_list)
+    positions, moves = block_positions(blocks)
+    points, motions, _ = path_points(blocks, positions, moves, start_position)
+    return points, motions
+
+
+def program_toolpath(tapes: list) -> tuple:
+    """Obtiene la trayectoria de todos los canales
+
+    Args:
+        tapes (list): Tapes de cada canal
+
+    Returns:
+        tuple: Puntos (n, 3) y movimiento de cada punto (n), cada canal
+            comienza un trazo nuevo
+    """
+
+    paths = [tape_toolpath(tape_list) for tape_list in tapes]
+    points = np.concatenate([points for points, _ in paths])
+    motions = np.concatenate([motions for _, motions in paths])
+    return points, motions
+
+
+class Tape_toolpath:
+    """Trayectoria de un canal que se actualiza por tramos del tape
+
+    Cada punto guarda la fila del tape y la línea de configuración que lo
+    generó. El tape sigue el orden de la configuración, así los puntos de
+    una línea de configuración son un tramo seguido que se encuentra con
+    searchsorted. Un cambio del tape solo vuelve a leer sus filas y las que
+    siguen hasta que los grupos modales y la posición coinciden otra vez con
+    los de la lectura anterior; el resto se reutiliza.
+    """
+
+    def __init__(self, tape_list: list) -> None:
+        """Lee la trayectoria de todo el tape
+
+        Args:
+            tape_list (list): Líneas del tape (línea de configuración, texto,
+                herramienta, comentario)
+        """
+
+        self.load(tape_list)
+
+    def load(self, tape_list: list) -> None:
+        """Vuelve a leer la trayectoria de todo el tape
+
+        Args:
+            tape_list (list): Líneas del tape
+        """
+
+        self.blocks = parse_tape(tape_list)
+        self.positions, moves = block_positions(self.blocks)
+        self.points, self.motions, self.rows = path_points(
+            self.blocks, self.positions, moves, start_position
+        )
+        self.load_lines()
+
+    def load_lines(self) -> None:
+        """Obtiene la línea de configuración de cada punto"""
+
+        self.lines = np.append(-1, self.blocks["line"][self.rows[1:]])
+
+    def row_state(self, row: int) -> tuple:
+        """Estado de la lectura anterior antes de una fila del tape
+
+        Args:
+            row (int): Fila del tape
+
+        Returns:
+            tuple: Línea leída antes de la fila (None al inicio) y posición
+        """
+
+        if row <= 0:
+            return None, start_position
+        return self.blocks[row - 1], self.positions[row - 1]
+
+    def update(self, tape_list: list, changes: tuple) -> None:
+        """Actualiza la trayectoria después de un cambio del tape
+
+        Args:
+            tape_list (list): Líneas del tape con el cambio
+            changes (tuple): Primera fila modificada, final de las filas
+                modificadas en el tape anterior y en el nuevo; None si el
+                tape cambió completo
+        """
+
+        if changes is None:
+            self.load(tape_list)
+            return
+
+        first, old_end, new_end = changes
+        shift = new_end - old_end
+        valid = 0 <= first <= old_end <= len(self.blocks)
+        if not valid or len(tape_list) != len(self.blocks) + shift:
+            self.load(tape_list)
+            return
+
+        # Se leen las filas nuevas y luego tramos que crecen al doble hasta
+        # que el estado al final del tramo es el de la lectura anterior
+        previous, start = self.row_state(first)
+        parts, begin, end = [], first, new_end
+        while True:
+            blocks = parse_tape(tape_list[begin:end], previous)
+            positions, moves = block_positions(blocks, start)
+            parts.append((blocks, positions, moves))
+            if len(blocks):
+                previous, start = blocks[-1], positions[-1]
+            if end >= len(tape_list) or self.same_state(end - shift, previous, start):
+                break
+            begin, end = end, min(end + max(end - first, min_rows), len(tape_list))
+
+        blocks, positions, moves = (np.concatenate(part) for part in zip(*parts))
+        old_stop = end - shift
+
+        # Puntos de las filas leídas, entre los de antes y los reutilizados
+        first_point = np.searchsorted(self.rows, first)
+        last_point = np.searchsorted(self.rows, old_stop)
+        points, motions, rows = path_points(
+            blocks, positions, moves, self.points[first_point - 1]
+        )
+
+        tail = self.blocks[old_stop:].copy()
+        if len(tail):
+            tail["line"] += tape_list[end][0] - tail["line"][0]
+        self.blocks = np.concatenate((self.blocks[:first], blocks, tail))
+        self.positions = np.concatenate(
+            (self.positions[:first], positions, self.positions[old_stop:])
+        )
+        self.points = np.concatenate(
+            (self.points[:first_point], points[1:], self.points[last_point:])
+        )
+        self.motions = np.concatenate(
+            (self.motions[:first_point], motions[1:], self.motions[last_point:])
+        )
+        self.rows = np.concatenate(
+            (
+                self.rows[:first_point],
+                rows[1:] + first,
+                self.rows[last_point:] + shift,
+            )
+        )
+        self.load_lines()
+
+    def same_state(self, row: int, previous: np.void, position: np.ndarray) -> bool:
+        """Compara un estado con el de la lectura anterior antes de una fila
+
+        Args:
+            row (int): Fila del tape anterior
+            previous (np.void): Última línea leída, None si no hay
+            position (np.ndarray): Posición después de la última línea
+
+        Returns:
+            bool: Los grupos modales y la posición son iguales
+        """
+
+        old_previous, old_position = self.row_state(row)
+        if previous is None or old_previous is None:
+            same = previous is old_previous
+        else:
+            same = all(previous[name] == old_previous[name] for name in modal_groups)
+        return same and np.array_equal(position, old_position, equal_nan=True)
+
+    def line_points(self, first_lines: np.ndarray, last_lines: np.ndarray) -> tuple:
+        """Obtiene los tramos de puntos de rangos de líneas de configuración
+
+        Args:
+            first_lines (np.ndarray): Primera línea de cada rango
+            last_lines (np.ndarray): Última línea de cada rango
+
+        Returns:
+            tuple: Primer punto y punto siguiente al último de cada rango
+        """
+
+        starts = np.searchsorted(self.lines, first_lines)
+        ends = np.searchsorted(self.lines, np.add(last_lines, 1))
+        return starts, ends
+
+    def line_indexes(self, first_lines: np.ndarray, last_lines: np.ndarray) -> tuple:
+        """Obtiene los puntos de los movimientos de rangos de líneas
+
+        Cada tramo incluye el punto anterior, donde comienza su primer
+        movimiento.
+
+        Args:
+            first_lines (np.ndarray): Primera línea de cada rango
+            last_lines (np.ndarray): Última línea de cada rango
+
+        Returns:
+            tuple: Índices de los puntos e indicador del primero de cada tramo
+        """
+
+        starts, ends = self.line_points(first_lines, last_lines)
+        used = starts < ends
+        starts, ends = np.maximum(starts[used] - 1, 0), ends[used]
+        lengths = ends - starts
+        offsets = np.repeat(np.cumsum(lengths) - lengths - starts, lengths)
+        indexes = np.arange(lengths.sum()) - offsets
+        firsts = np.zeros(len(indexes), bool)
+        firsts[np.cumsum(lengths) - lengths] = True
+        return indexes, firsts
+
+
+def curve(horizontal: np.ndarray, vertical: np.ndarray, connect: np.ndarray) -> tuple:
+    """Deja en un trazo solo los puntos de sus segmentos
+
+    Args:
+        horizontal (np.ndarray): Coordenadas horizontales
+        vertical (np.ndarray): Coordenadas verticales
+        connect (np.ndarray): Indica si cada punto se une con el siguiente
+
+    Returns:
+        tuple: Coordenadas y arreglo de conexión del trazo
+    """
+
+    used = connect | np.append(False, connect[:-1])
+    return horizontal[used], vertical[used], connect[used]
+
+
+def view_curves(points: np.ndarray, motions: np.ndarray, axes: tuple) -> tuple:
+    """Prepara los trazos de una vista de la trayectoria
+
+    Los puntos con una coordenada desconocida no se dibujan y cortan el
+    trazo.
+
+    Args:
+        points (np.ndarray): Puntos de la trayectoria
+        motions (np.ndarray): Movimiento de cada punto
+        axes (tuple): Ejes horizontal y vertical de la vista
+
+    Returns:
+        tuple: Trazo de los rápidos y trazo de los avances (coordenadas
+            horizontales, verticales y arreglo de conexión)
+    """
+
+    horizontal, vertical = points[:, axes[0]], points[:, axes[1]]
+    visible = np.flatnonzero(np.isfinite(horizontal) & np.isfinite(vertical))
+    horizontal, vertical = horizontal[visible], vertical[visible]
+    following = np.diff(visible, append=-1) == 1
+    next_motion = np.roll(motions[visible], -1)
+
+    rapids = curve(horizontal, vertical, following & (next_motion == rapid))
+    feeds = curve(horizontal, vertical, following & (next_motion > rapid))
+    return rapids, feeds
@@ -0,0 +1,158 @@
+# ?
+# ? Imports ----------------------------------------------------------------- *
+# ?
+
+from multiprocessing import Pool
+from pathlib import Path
+import argparse
+import sys
+import time
+
+# ?
+# ? Módulos personales ------------------------------------------------------ *
+# ?
+
+from app_tools.combo_lists import *
+from app_tools.generator_cache import Generator_cache
+from app_tools.project_tools import project_extension, read_config
+from app_tools.tape_tools import *
+
+# ?
+# ? Generación de tapes sin interfaz gráfica -------------------------------- *
+# ?
+
+root_dir = "C:/GCodeEditor"
+process_cache = None
+
+
+def find_configs(paths: list) -> list:
+    """Busca los archivos de configuración a procesar
+
+    Args:
+        paths (list): Archivos o carpetas indicados
+
+    Returns:
+        list: Lista de archivos de configuración
+    """
+
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.json")))
+            files.extend(sorted(path.rglob(f"*{project_extension}")))
+        else:
+            files.append(path)
+
+    return files
+
+
+def load_cache() -> None:
+    """Crea el caché de líneas generadas de cada proceso"""
+
+    global process_cache
+    process_cache = Generator_cache()
+
+
+def make_tape_file(file: Path, output: str = None) -> tuple:
+    """Genera y guarda el tape de un archivo de configuración
+
+    Si no se indica carpeta de salida el tape se guarda en la carpeta
+    superior a la del archivo, igual que lo hace el editor.
+
+    Args:
+        file (Path): Archivo de configuración
+        output (str): Carpeta de salida
+
+    Returns:
+        tuple: Archivo, tape guardado, bytes escritos, suma SHA-256 y error
+    """
+
+    try:
+        config_list = read_config(file)
+
+        state = build_tape(config_list, process_cache)
+        file_name, file_extension = tape_file_name(state)
+
+        folder = Path(output) if output else file.parent.parent
+        tape_file = folder / f"{file_name}{file_extension}"
+        size, checksum = write_tape(tape_file, tape_lines(state))
+
+    except Exception as error:
+        return str(file), "", 0, "", f"{type(error).__name__}: {error}"
+
+    return str(file), str(tape_file), size, checksum, ""
+
+
+def make_tape_star(arguments: tuple) -> tuple:
+    """Desempaqueta los argumentos para el pool de procesos"""
+
+    return make_tape_file(*arguments)
+
+
+def batch_tapes(files: list, output: str = None, jobs: int = None) -> list:
+    """Genera los tapes de varios archivos en un pool de procesos
+
+    Args:
+        files (list): Archivos de configuración
+        output (str): Carpeta de salida
+        jobs (int): Cantidad de procesos
+
+    Returns:
+        list: Resultados de cada archivo
+    """
+
+    arguments = [(file, output) for file in files]
+    chunk_size = max(1, len(arguments) // ((jobs or 4) * 4))
+
+    with Pool(jobs, initializer=load_cache) as pool:
+        return list(pool.imap_unordered(make_tape_star, arguments, chunk_size))
+
+
+def main(argv: list = None) -> int:
+    """Genera tapes desde la línea de comandos
+
+    Args:
+        argv (list): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+
+    default_dirs = [f"{root_dir}/{machine}" for machine in Combo_lists.machines]
+
+    parser = argparse.ArgumentParser(
+        description="Genera tapes .CNC desde archivos de configuración .json "
+        "o proyectos .gcp"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="archivos .json, .gcp o carpetas a procesar (por defecto las "
+        "carpetas de cada máquina)",
+    )
+    parser.add_argument("-o", "--output", help="carpeta de salida de los tapes")
+    parser.add_argument("-j", "--jobs", type=int, help="cantidad de procesos")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [path for path in default_dirs if Path(path).is_dir()]
+    files = find_configs(paths)
+    start = time.perf_counter()
+    results = batch_tapes(files, args.output, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    errors = [result for result in results if result[4]]
+    for file, _, _, _, error in sorted(errors):
+        print(f"ERROR {file}: {error}", file=sys.stderr)
+
+    size = sum(result[2] for result in results)
+    speed = len(results) / elapsed if elapsed else 0
+    print(
+        f"{len(results) - len(errors)} tapes generados, {len(errors)} errores, "
+        f"{size} bytes en {elapsed:.2f} s ({speed:.1f} archivos/s)"
+    )
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
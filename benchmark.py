@@ -0,0 +1,686 @@
+# ?
+# ? Imports ----------------------------------------------------------------- *
+# ?
+
+from pathlib import Path
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import __version__ as pyside_version
+from PySide6.QtCore import QItemSelection, QItemSelectionModel
+from PySide6.QtWidgets import QApplication
+
+# ?
+# ? Módulos personales ------------------------------------------------------ *
+# ?
+
+from app_tools.combo_lists import *
+from app_tools.cycle_time_tools import Cycle_time, tool_call_sides
+from app_tools.format_tools import *
+from app_tools.gcode_tools import parse_tape
+from app_tools.record_tools import config_from_json, json_default
+from app_tools.subwindow_tools import load_theme
+import Gcode_Editor
+
+# ?
+# ? Programas sintéticos ---------------------------------------------------- *
+# ?
+
+default_sizes = (1000, 10000, 100000)
+backplot_moves = 1_000_000
+backplot_size = (1200, 800)
+frame_budget = 0.1
+form_classes = (
+    "Header",
+    "Comment",
+    "Subrutine",
+    "Tool_call",
+    "Spindle",
+    "Spindle_index",
+    "Misc",
+)
+
+
+def header_line(machine: str) -> list:
+    """Línea de encabezado del programa sintético
+
+    Args:
+        machine (str): Tipo de máquina
+
+    Returns:
+        list: Línea de configuración
+    """
+
+    number = 1000 + Combo_lists.machines.index(machine)
+    data = {
+        "Prt": f"BENCH {machine}",
+        "Pgr": str(number),
+        "Dsc": "BENCHMARK",
+        "Mch": machine,
+        "Dia": 0.5,
+        "Lgt": 1.25,
+        "Chk": 0.0,
+        "Cch": "DERECHA",
+        "Wrk": Combo_lists.work_offset_list[1],
+    }
+
+    return ["Inicio de programa", data]
+
+
+def operation_lines(machine: str, rnd: random.Random, number: int) -> list:
+    """Bloque de líneas de una operación con una herramienta
+
+    Args:
+        machine (str): Tipo de máquina
+        rnd (random.Random): Generador de números aleatorios
+        number (int): Número de operación
+
+    Returns:
+        list: Líneas de configuración
+    """
+
+    side = rnd.choice(tuple(Combo_lists.tape_sides))
+    tool = rnd.choice((1, 2, 4, 11, 12, 14, 15, 16, 21))
+    rotation = rnd.choice(("NORMAL", "REVERSA", "DETENER"))
+
+    return [
+        [" ", {"Fre": " "}],
+        [
+            "    Llamar herramienta",
+            {
+                "Tol": tool,
+                "Typ": "BROCA",
+                "Dia": rnd.choice((0, 0.125)),
+                "Spc": "0",
+                "Sde": side,
+                "Xin": 0.1,
+                "Yin": -0.25,
+                "Zin": 0.05,
+                "Blk": rnd.random() < 0.1,
+            },
+        ],
+        [
+            "        Comentario",
+            {"Com": f"OPERACION {number}", "Sde": side, "Blk": False},
+        ],
+        [
+            "        Giro husillo",
+            {
+                "Spd": rnd.choice((0, 3000)),
+                "Rot": rotation,
+                "Sde": side,
+                "Blk": False,
+            },
+        ],
+        [
+            "        Funciones M",
+            {
+                "Com": "",
+                "Stp": rnd.choice(("PROGRAMADA", "OPCIONAL")),
+                "Chk": rnd.choice(("CERRAR", "ABRIR")),
+                "Col": "ACTIVAR",
+                "Sde": side,
+                "Blk": False,
+            },
+        ],
+        ["        Orientar husillo", {"Grd": 90, "Rot": "NORMAL", "Blk": False}],
+        ["        -> Subrutina", {"Sub": "9000", "Rep": 2.0, "Blk": False}],
+        [
+            "    Cerrar herramienta",
+            {"Tol": tool, "Sde": side, "Dia": 0.5, "Blk": False},
+        ],
+    ]
+
+
+def synthetic_program(machine: str, size: int, seed: int = 0) -> list:
+    """Crea un programa de configuración con la cantidad de líneas indicada
+
+    Args:
+        machine (str): Tipo de máquina
+        size (int): Cantidad aproximada de líneas de configuración
+        seed (int): Semilla para repetir el mismo programa
+
+    Returns:
+        list: Lista de líneas de configuración
+    """
+
+    rnd = random.Random(seed)
+    config_list = [header_line(machine)]
+    while len(config_list) < size - 1:
+        config_list.extend(operation_lines(machine, rnd, len(config_list)))
+
+    end = {"Mch": machine, "Num": len(config_list), "Blk": False}
+    config_list.append(["Fin de programa", end])
+
+    return config_list
+
+
+def drilling_tape(moves: int, scattered: bool, seed: int = 0) -> list:
+    """Crea un tape de taladrado en una grilla de agujeros
+
+    Cada agujero usa tres movimientos: rápido sobre el agujero, avance a una
+    profundidad al azar y rápido de salida.
+
+    Args:
+        moves (int): Cantidad aproximada de movimientos
+        scattered (bool): Recorre los agujeros en orden al azar en vez de
+            por filas
+        seed (int): Semilla para repetir el mismo tape
+
+    Returns:
+        list: Filas del tape (línea de configuración, texto, herramienta y
+            comentario)
+    """
+
+    rnd = random.Random(seed)
+    holes = max(moves // 3, 1)
+    columns = math.ceil(math.sqrt(holes))
+    order = list(range(holes))
+    if scattered:
+        rnd.shuffle(order)
+
+    tape_list = []
+    for hole in order:
+        x, y = hole % columns * 0.05, hole // columns * 0.05
+        depth = rnd.randint(1, 20) * 0.01
+        tape_list.append((0, f"G00X{x:.3f}Y{y:.3f}Z.1", 1, ""))
+        tape_list.append((0, f"G01Z-{depth:.3f}F5.", 1, ""))
+        tape_list.append((0, "G00Z.1", 1, ""))
+
+    return tape_list
+
+
+def surface_tape(moves: int) -> list:
+    """Crea un tape de acabado de una superficie en pasadas paralelas
+
+    Todas las pasadas siguen el mismo perfil en Z, así en la vista X - Z se
+    dibujan una encima de otra.
+
+    Args:
+        moves (int): Cantidad aproximada de movimientos
+
+    Returns:
+        list: Filas del tape (línea de configuración, texto, herramienta y
+            comentario)
+    """
+
+    passes = max(math.isqrt(moves), 1)
+    steps = max(moves // passes, 2)
+    tape_list = [(0, "G00X0.Y0.Z.5", 1, "")]
+    for number in range(passes):
+        y = number * 0.01
+        for step in range(steps):
+            x = step / (steps - 1) * 10
+            x = 10 - x if number % 2 else x
+            z = 0.3 * math.sin(x) + 0.1 * math.cos(3 * x)
+            tape_list.append((0, f"G01X{x:.4f}Y{y:.3f}Z{z:.4f}F20.", 1, ""))
+
+    return tape_list
+
+
+# ?
+# ? Ventana de medición ----------------------------------------------------- *
+# ?
+
+
+class Benchmark_window(Gcode_Editor.MainWindow):
+    """Ventana principal que guarda los archivos en una carpeta temporal"""
+
+    bench_dir = ""
+
+    def load_folders_locations(self) -> None:
+        """Ubicación de los folders de guardado"""
+
+        self.root_dir = self.bench_dir
+        self.default_dirs = {
+            machine: f"{self.root_dir}/{machine}" for machine in Combo_lists.machines
+        }
+
+
+def timed(function: object, repeat: int, setup: object = None) -> list:
+    """Mide el tiempo de una función varias veces
+
+    Args:
+        function (object): Función a medir
+        repeat (int): Cantidad de mediciones
+        setup (object): Función que prepara cada medición (opcional)
+
+    Returns:
+        list: Tiempos en segundos
+    """
+
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def summary(times: list) -> dict:
+    """Resume una serie de tiempos
+
+    Args:
+        times (list): Tiempos en segundos
+
+    Returns:
+        dict: Mínimo, mediana, promedio y tiempos medidos
+    """
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "runs": times,
+    }
+
+
+def select_rows(window: object, first: int, last: int) -> None:
+    """Selecciona líneas de configuración como lo haría el usuario
+
+    Args:
+        window (object): Ventana principal
+        first (int): Primera línea
+        last (int): Línea siguiente a la última
+    """
+
+    model = window.config_model
+    selection = QItemSelection(model.index(first, 0), model.index(last - 1, 0))
+    flags = QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+    window.current_widget = "config_widget"
+    window.config_widget.selectionModel().select(selection, flags)
+
+
+def benchmark_program(window: object, config_list: list, repeat: int) -> dict:
+    """Mide las operaciones del editor con un programa
+
+    Args:
+        window (object): Ventana principal
+        config_list (list): Lista de líneas de configuración
+        repeat (int): Cantidad de mediciones por operación
+
+    Returns:
+        dict: Resultados de cada operación
+    """
+
+    # config_from_json convierte la lista en el mismo lugar; cada medición
+    # parte de una copia nueva leída del texto JSON
+    config_text = json.dumps(config_list, default=json_default)
+
+    def full_rebuild() -> None:
+        window.create_new_tape()
+        window.config_list = config_from_json(json.loads(config_text))
+        window.generator_cache.invalidate()
+
+    def edit_line() -> None:
+        middle = len(window.config_list) // 2
+        task, data = window.config_list[middle]
+        window.config_list[middle] = [task, dict(data)]
+        window.set_dirty_lines(middle, middle + 1)
+
+    def background_update() -> None:
+        window.start_regeneration()
+        window.regeneration_pool.waitForDone()
+        QApplication.processEvents()
+
+    def load_json() -> None:
+        with open(config_file) as file:
+            config_from_json(json.load(file))
+
+    results = {}
+    results["tape_add"] = summary(timed(window.tape_add, repeat, full_rebuild))
+    results["update_data"] = summary(timed(window.update_data, repeat, full_rebuild))
+    results["tape_add_cached"] = summary(
+        timed(window.tape_add, repeat, window.load_regeneration_data)
+    )
+    window.update_data()
+    results["update_data_edit"] = summary(timed(window.update_data, repeat, edit_line))
+    results["background_update_edit"] = summary(
+        timed(background_update, repeat, edit_line)
+    )
+
+    results["make_tape"] = summary(
+        timed(lambda: sum(1 for _ in window.make_tape()), repeat)
+    )
+    results["save_tape"] = summary(timed(window.save_tape, repeat))
+    results["parse_tape"] = summary(
+        timed(lambda: parse_tape(window.tape1_list + window.tape2_list), repeat)
+    )
+
+    def cycle_time() -> None:
+        sides = tool_call_sides(window.config_list)
+        Cycle_time(
+            window.current_machine, window.tape1_list, window.tape2_list, sides
+        ).run()
+
+    results["cycle_time"] = summary(timed(cycle_time, repeat))
+
+    config_file = Path(window.root_dir) / "benchmark.json"
+    with open(config_file, "w") as file:
+        json.dump(window.config_list, file, default=json_default)
+    results["open_json"] = summary(timed(load_json, repeat))
+
+    lines = len(window.config_list)
+    first, last = lines // 4, lines // 4 + max(1, lines // 10)
+    select_block = lambda: select_rows(window, first, last)
+    select_line = lambda: select_rows(window, last, last + 1)
+    results["selection_sync"] = summary(timed(select_block, repeat, select_line))
+
+    return {
+        "config_lines": len(window.config_list),
+        "tape1_lines": len(window.tape1_list),
+        "tape2_lines": len(window.tape2_list),
+        "operations": results,
+    }
+
+
+def benchmark_forms(window: object, repeat: int) -> dict:
+    """Mide la apertura de cada ventana de tarea
+
+    Se mide la ventana creada desde cero y la reutilizada del depósito,
+    las dos mostradas hasta que Qt aplica el estilo a sus widgets.
+
+    Args:
+        window (object): Ventana principal
+        repeat (int): Cantidad de mediciones por ventana
+
+    Returns:
+        dict: Resultados de cada ventana
+    """
+
+    def open_form(create: object) -> None:
+        form = create()
+        form.show()
+        QApplication.processEvents()
+        form.hide()
+
+    results = {}
+    for name in form_classes:
+        task_class = getattr(Gcode_Editor, name)
+        build = lambda: open_form(task_class)
+        reuse = lambda: open_form(lambda: window.task_dialog(task_class))
+        results[name] = {
+            "build": summary(timed(build, repeat)),
+            "reuse": summary(timed(reuse, repeat)),
+        }
+
+    return results
+
+
+def benchmark_backplot(moves: int, repeat: int, budget: float) -> dict:
+    """Mide el dibujo de la trayectoria al mover la vista
+
+    Cada cuadro mueve el rango de las dos vistas y espera a que Qt las
+    dibuje, con la ventana de la trayectoria del tamaño backplot_size.
+
+    Args:
+        moves (int): Cantidad aproximada de movimientos de cada tape
+        repeat (int): Cantidad de cuadros por vista
+        budget (float): Tiempo máximo de un cuadro en segundos
+
+    Returns:
+        dict: Resultados de cada tape, con los puntos dibujados en cada vista
+            en el último cuadro y si algún cuadro pasó del tiempo máximo
+    """
+
+    from app_tools.graph_tools import Graph
+
+    tapes = {
+        "drilling_rows": lambda: drilling_tape(moves, False),
+        "drilling_scattered": lambda: drilling_tape(moves, True),
+        "surface": lambda: surface_tape(moves),
+    }
+
+    results = {}
+    for name, make_tape in tapes.items():
+        graph = Graph([make_tape(), []])
+        graph.resize(*backplot_size)
+        graph.show()
+        QApplication.processEvents()
+        widgets = (graph.graph1_widget, graph.graph2_widget)
+        ranges = [widget.getViewBox().viewRange() for widget in widgets]
+        frame = iter(range(1, 2 * repeat + 1))
+
+        def draw(zoom: float) -> None:
+            step = next(frame)
+            for widget, ((left, right), (bottom, top)) in zip(widgets, ranges):
+                width = (right - left) * zoom
+                center = (left + right) / 2 + width * step / 100
+                widget.getViewBox().setRange(
+                    xRange=(center - width / 2, center + width / 2),
+                    yRange=(bottom, top),
+                    padding=0,
+                )
+            QApplication.processEvents()
+            for widget in widgets:
+                widget.grab()
+
+        full = timed(lambda: draw(1.0), repeat)
+        zoom = timed(lambda: draw(0.25), repeat)
+        points = [
+            sum(len(item.xData) for item in items if item.xData is not None)
+            for _, _, items, _ in graph.views
+        ]
+        graph.close()
+        results[name] = {
+            "moves": len(graph.toolpaths[0].points),
+            "points": points,
+            "pan_full": summary(full),
+            "pan_zoom": summary(zoom),
+            "over_budget": max(full + zoom) > budget,
+        }
+        print(f"trayectoria {name}: listo", file=sys.stderr)
+
+    return {"budget": budget, "size": backplot_size, "results": results}
+
+
+def import_report(module: str = "Gcode_Editor", top: int = 20) -> dict:
+    """Mide el costo de importar un módulo en un proceso nuevo
+
+    Usa python -X importtime, así cada medición empieza sin módulos
+    cargados, como al abrir el editor.
+
+    Args:
+        module (str): Módulo a importar
+        top (int): Cantidad de módulos y paquetes más lentos a mostrar
+
+    Returns:
+        dict: Tiempo del proceso, tiempo de importación y costo propio de
+            los paquetes y módulos más lentos, en segundos
+    """
+
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    environment = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+    start = time.perf_counter()
+    process = subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent,
+        env=environment,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    modules = {}
+    packages = {}
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        modules[name] = int(self_time) / 1e6
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_time) / 1e6
+        if name == module:
+            total = int(cumulative) / 1e6
+
+    slowest = lambda times: dict(
+        sorted(times.items(), key=lambda item: item[1], reverse=True)[:top]
+    )
+
+    return {
+        "module": module,
+        "process": elapsed,
+        "import": total,
+        "packages": slowest(packages),
+        "modules": slowest(modules),
+    }
+
+
+def run_benchmarks(
+    machines: list, sizes: list, repeat: int, budget: float = frame_budget
+) -> dict:
+    """Mide todas las combinaciones de máquina y tamaño
+
+    Args:
+        machines (list): Máquinas a medir
+        sizes (list): Cantidades de líneas de configuración
+        repeat (int): Cantidad de mediciones por operación
+        budget (float): Tiempo máximo de un cuadro de la trayectoria
+
+    Returns:
+        dict: Entorno de ejecución y resultados
+    """
+
+    app = QApplication.instance() or QApplication([])
+    load_theme(app)
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as bench_dir:
+        Benchmark_window.bench_dir = bench_dir
+        window = Benchmark_window()
+        Gcode_Editor.window = window
+
+        forms = benchmark_forms(window, repeat)
+        print("ventanas: listo", file=sys.stderr)
+
+        results = []
+        for machine in machines:
+            for size in sizes:
+                config_list = synthetic_program(machine, size)
+                result = benchmark_program(window, config_list, repeat)
+                results.append({"machine": machine, "size": size, **result})
+                print(f"{machine} {size}: listo", file=sys.stderr)
+
+        os.chdir(cwd)
+
+    backplot = benchmark_backplot(backplot_moves, repeat, budget)
+
+    return {
+        "version": fversion(),
+        "python": platform.python_version(),
+        "pyside6": pyside_version,
+        "platform": platform.platform(),
+        "qt_platform": app.platformName(),
+        "repeat": repeat,
+        "imports": import_report(),
+        "forms": forms,
+        "results": results,
+        "backplot": backplot,
+    }
+
+
+def main(argv: list = None) -> int:
+    """Ejecuta las mediciones desde la línea de comandos
+
+    Args:
+        argv (list): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Mide la generación, visualización, guardado y apertura "
+        "de programas sintéticos y guarda los resultados en JSON"
+    )
+    parser.add_argument(
+        "-m",
+        "--machines",
+        nargs="+",
+        choices=Combo_lists.machines,
+        default=list(Combo_lists.machines),
+        help="máquinas a medir (por defecto todas)",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=list(default_sizes),
+        help="líneas de configuración de cada programa",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="mediciones por operación"
+    )
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    parser.add_argument(
+        "-i",
+        "--imports",
+        action="store_true",
+        help="solo mide el costo de importación del editor",
+    )
+    parser.add_argument(
+        "-b",
+        "--backplot",
+        action="store_true",
+        help="solo mide el dibujo de la trayectoria",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=frame_budget,
+        help="segundos máximos de un cuadro de la trayectoria; si algún "
+        "cuadro tarda más el código de salida es 1",
+    )
+    args = parser.parse_args(argv)
+
+    output = Path(args.output).resolve() if args.output else None
+    if args.imports:
+        report = import_report()
+    elif args.backplot:
+        app = QApplication.instance() or QApplication([])
+        load_theme(app)
+        report = benchmark_backplot(backplot_moves, args.repeat, args.budget)
+    else:
+        report = run_benchmarks(args.machines, args.sizes, args.repeat, args.budget)
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    backplot = report.get("backplot", report)
+    slow = [
+        name
+        for name, result in backplot.get("results", {}).items()
+        if result["over_budget"]
+    ]
+    if slow:
+        print(f"trayectoria fuera de tiempo: {', '.join(slow)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,19 +12,10 @@ def header_gen(machine, data) -> list:
         list: Lista de líneas de tape
     """
 
-    if machine in ("B12", "A16"):
-        return header_swiss(machine, data)
-    elif machine in ("K16", "E16"):
-        return header_kswiss(data)
-    elif machine in ("HARDINGE", "ROMI"):
-        return header_hard_rom(machine, data)
-    elif machine == "OMNITURN":
-        return header_omni(data)
-    elif machine == "MAZAK":
-        return header_mazak(data)
-
-
-def header_swiss(machine: str, data: list) -> list:
+    return header_generators[machine](data)
+
+
+def header_swiss(data: list) -> list:
     """Encabezado para torno suizo A16 y B12
 
     Args:
@@ -40,7 +31,7 @@ def header_swiss(machine: str, data: list) -> list:
     num = ftape(mch, prg)
     xin = f"X{fnum3(dia + 0.02)}"
     zin = "Z0" if cch == "DERECHA" else "Z.315"
-    chn = "M09" if machine == "A16" else ""
+    chn = "M09" if mch == "A16" else ""
     version = fversion()
 
     lines1 = [
@@ -148,11 +139,10 @@ def header_mazak(data: list) -> list:
     return [lines1, lines2]
 
 
-def header_hard_rom(machine: str, data: list) -> list:
+def header_hard_rom(data: list) -> list:
     """Encabezado para torno Hardinge
 
     Args:
-        machine (str): Tipo de máquina utilizada
         data (list): Lista de datos a procesar
 
     Returns:
@@ -169,6 +159,18 @@ def header_hard_rom(machine: str, data: list) -> list:
     romi = "G20G40G90G95G97"
     hardinge = "G65P9150H1.5G97"
 
-    lines1.append(romi) if machine == "ROMI" else lines1.append(hardinge)
+    lines1.append(romi) if mch == "ROMI" else lines1.append(hardinge)
     lines2 = [blank_space for _ in lines1]
     return [lines1, lines2]
+
+
+header_generators = {
+    "B12": header_swiss,
+    "A16": header_swiss,
+    "K16": header_kswiss,
+    "E16": header_kswiss,
+    "OMNITURN": header_omni,
+    "ROMI": header_hard_rom,
+    "HARDINGE": header_hard_rom,
+    "MAZAK": header_mazak,
+}
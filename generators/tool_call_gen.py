@@ -14,22 +14,7 @@ def tool_call_gen(machine, data) -> list:
         list: Lista de líneas de tape
     """
 
-    if machine == "B12":
-        return gen_b12(data)
-    elif machine == "A16":
-        return gen_a16(data)
-    elif machine == "K16":
-        return gen_k16(data)
-    elif machine == "E16":
-        return gen_e16(data)
-    elif machine == "OMNITURN":
-        return gen_omni(data)
-    elif machine == "ROMI":
-        return gen_romi(data)
-    elif machine == "HARDINGE":
-        return gen_hardinge(data)
-    elif machine == "MAZAK":
-        return gen_mazak(data)
+    return tool_call_generators[machine](data)
 
 
 def gen_b12(data: list) -> list:
@@ -307,3 +292,15 @@ def gen_mazak(data: list) -> list:
     lines2 = [blank_space for _ in lines1]
 
     return [lines1, lines2]
+
+
+tool_call_generators = {
+    "B12": gen_b12,
+    "A16": gen_a16,
+    "K16": gen_k16,
+    "E16": gen_e16,
+    "OMNITURN": gen_omni,
+    "ROMI": gen_romi,
+    "HARDINGE": gen_hardinge,
+    "MAZAK": gen_mazak,
+}
@@ -1,3245 +1,11 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.1.1
+# Created by: The Resource Compiler for Qt version 6.6.3
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x008\xab\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x0eH\x00\x00\x0eH\
-\x01ko\x0d\xff\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x008(ID\
-ATx\xda\xed\xdd\x0b\x94\x95\xd5}\xf7\xf1:\x22\x0b\
-#\x22Y\xba\x96t\x85\x98\x10\x17\x22\x1a\x051\x1a#\
-D\x01\xb51\x9a\x10\x8bR\x92\xfa\x82\x18i\xa3\xa9\xf7\
-\x1am\xab1`\x90\x98\xd6\xda\xc6\xa4\xa2hb\xa0*\
-)\xe5\x92J\xadsa\xb8\xcbpg`\xee\xf7\xfb\xfd\
-~9g\xce\xcc93\xfb\xdd\xfb\xf8\x18G\x18f\xce\
-9s\x9e\xe7\xec\xe7\xd9\xdf\xbd\xd6g\xadw\xf5\x8d\x0a\
-{\xefg\xff\x7f\xe7\xb9\xec\xfdgB\x88?\x03\xa0\xb7\
-\xa9\x1ff\x8d\x93\xbe ]-\xcd\x97\x16I\x0fJ\xcf\
-J\xafH\xeb\xa4M\xd26)E\xda%eHG\xa5\
-l\xa9H\xaa\x90\xea\xa56\xc9'\x85,>\xeb\xffV\
-o\xfdo\x8a\xac\x7f\xe6\xa8\xf5\xef\xd8e\xfd;\xb7Y\
-\xff\x8du\xd6\x7f\xf3Y\xeb\xcf\xb0\xc8\xfa3\xcd\x90&\
-K\xe72f\x80\xfe\xe8\x04 \xb1\x85\xfd\x1c\xe9+\xd2\
--\xd2\x03\xd2*\xe9\x1di\xbbt\x5c\xaa\xb4\x0a\xb4p\
-\x19\xbfT%eJ\xe9\xd2\xbb\xd2\x8b\xd2r\xe9V\xe9\
-Ri,s\x00 \x00\x00^-\xf0I\xd2\x97\xa4\x9b\
-\xa5e\xd2\x0a\xeb\x17\xf4n\xab\xb8\xf7\xbb\xb0\xb8\xc7K\
-\xbf\x15\x12\xf6H\xeb\xa5\x95\xd2\xfd\xd2\x5c\xe9\xcb\xaa\xef\
-\x98C\x00\x01\x00pC\xb1\x9f(\xdd$=,\xad\x95\
-\x0e\xba\xf4\xd7\xbbNw\x11\x0eIoI\x8fX!\xea\
-\xf3\xcc5\x80\x00\x00$\xaa\xd0\x9f-].-\xb6n\
-ko\xb3\x9e\x9dS\xb4\x9d\xa1\xee\x9c\xfc\xaf\xd5\xf7j\
-\x0c\xa6\xab1an\x02\x04\x00 \xde\x05\xff\x8bV\xa1\
-yU:,\xf5P\x84\xb5\xd3c\x8d\xcd\xab\xd6X}\
-\x91\xb9\x0b\x10\x00\x80h\x7f\xdd_c\xdd\xc6\xdf`\xfd\
-\xda\xa4\xc0\xba\xf7N\xc1\x06k,\xaf\xe1.\x01@\x00\
-\x00\x06\x17\xfc\x09\xd2_X/\xa0\xa97\xef\xbb(\x9c\
-\x9e\xd5e\x8d\xf1Jk\xcc'p\x0d\x80\x00\x00\x98\xf5\
-V\xfe\x0dV\x118h\xf8[\xf8\xa6\xeb\xb7\xe6\xc0J\
-kN\xf0\xd5\x01\x08\x00\x80\xc7\x8a\xfe$\xe9>\xebv\
-p\x0b\x85\x0fg\xd0b\xcd\x115W&q\xed\x80\x00\
-\x00\xb8\xaf\xe0\x8f\xb1>\xc7[-\x1d\x93\x06(n\x88\
-\xd2\x805wV[si\x0c\xd7\x16\x08\x00\x80\x9eE\
-\xff\x02\xeb\x97\xdbf\xa9\x83\x02\x868\xeb\xb0\xe6\x96\x9a\
-c\x17p\xcd\x81\x00\x00$\xb6\xe8\x9f/\xdd+\xbd/\
-\xf5R\xa4\xe0\x90^k\xce\xa9\xb9w>\xd7\x22\x08\x00\
-\x803E\xff<\xeb;\xef-|\x8f\x0fM\xf6\x1f\xd8\
-b\xcd\xc9\xf3\xb8FA\x00\x00\xe2[\xf4\xcf\x95\xee\x96\
-6\xb2\xb5.4\xe6\xb3\xe6\xe8\xdd\x9c\x88\x08\x02\x000\
-\xba\xcf\xf5n\x97\xde\xe3\xdb|\xb8t\xcf\x81\xf7\xac9\
-\xcc\xe7\x85 \x00\x00\x11\x14~u\x9e\xfc\xf3\xec\xad\x0f\
-\x0f\xa9\xb0\xe6\xf4d\xaeq\x10\x00\x80\xd3\xb7\xdf]`\
-\x1d\xaa\x13\xa2`\xc0\xa3B\xd6\x1c_\xc0\xb6\xc4 \x00\
-\xc0\xf4\xc2?EZ%\xd5P\x1c`\x98\x1ak\xeeO\
-a-\x00\x01\x00\xa6\x14\xfds\xa4{\xa4T6\xe8\x01\
-\xc2\xd7@\xaauM\x9c\xc3\x1a\x01\x02\x00\xbcX\xf8/\
-\xb2\x9e\x836\xb0\xe8\x03Cj\xb0\xae\x91\x8bX3@\
-\x00\x80\x17\x0a\xffTi\x8d\xe4g\x81\x07\x22\xe2\xb7\xae\
-\x99\xa9\xac! \x00\xc0\x8d\x85\x7f\x8e\xb4\x95\xd3\xf6\x80\
-Q\x9dV\xa8\xae\xa19\xac) \x00\xc0\x0do\xf3\xab\
-g\x99\x07X\xbc\x81\xb8:`][|=\x00\x02\x00\
-\xb4\xdb\x9e\xf7\x11\xa9\x84\x85\x1a\xb0U\xa9u\xad\xb1\xed\
-0\x08\x00Hh\xe1\x9f`\xbd\xb4\xd4\xca\xc2\x0c8\xaa\
-\xd5\xba\xf6&\xb0\x16\x81\x00\x00\xa7\x7f\xf1?#\xb5\xb0\
-\x10\x03\x09\xd5b]\x8b\xdc\x11\x00\x01\x00\xb6\x16\xfeq\
-\xd2\x13|\xca\x07h\xf9\x09\xa1\xba6\xc7\xb1V\x81\x00\
-\x80x\x16\xfe\xb1\xd2\x8f\xd9\xb1\x0fp\xc5\x0e\x83\xeaZ\
-\x1d\xcb\xda\x05\x02\x00FS\xf8\xc7H\xcb9\x98\x07p\
-\xe5\x01D\xea\xda\x1d\xc3Z\x06\x02\x00\xa2)\xfc\xea(\
-\xde%R1\x0b)\xe0j\xc5\xd6\xb5\xcc\x91\xc4 \x00\
-`\xc4\xe2?W\xcad\xe1\x04<E]\xd3sY\xe3\
-@\x00\xc0\x99N\xe6\xdb\xccB\x09x\xdafN \x04\
-\x01\x00\x9f\x14\xfe\xf1\xd2j)\xc0\xe2\x08\x18!`]\
-\xf3\xe3Y\x03\x09\x000\xb3\xf0\x9f%-\x93\xeaX\x10\
-\x01#\xd5Yk\xc0Y\xac\x89\x04\x00\x98S\xfcgK\
-\x87Y\x00\x01Xk\xc1l\xd6F\x02\x00\xbc]\xf8/\
-\x916\xb0\xe0\x01\x18\x82Z\x1b.a\xad$\x00\xc0{\
-\xa7\xf4=%\xf9X\xe4\x00\x0c\xc3g\xad\x15\x9c:H\
-\x00\x80\x07\x8a\xffL\xe9\x08\x0b\x1b\x80(\xa85c&\
-k(\x01\x00\xee\xdd\xb7\xff%)\xc8b\x06 \x06A\
-k\x0d\xe1|\x01\x02\x00\x5c\xb6\x99O!\x0b\x18\x808\
-(d\x13!\x02\x00\xf4/\xfc\x13\xa57\xa5\x01\x16-\
-\x00q4`\xad-\x13Yk\x09\x00\xd0\xaf\xf8/\x94\
-jY\xa8\x00\xd8H\xad1\x0bYs\x09\x00\xd0\xa3\xf0\
-O\x92\xb6\xb00\x01p\x90Zs&\xb1\x06\x13\x00\x90\
-\xb8\xe2\xbf@jb1\x02\x90\x00j\xedY\xc0ZL\
-\x00\x80\xb3\x85\xffs\xd2\xeb,@\x004\xa0\xd6\xa2\xcf\
-\xb16\x13\x00`\x7f\xf1\x9f%\xe5\xb3\xe8\x00\xd0\x88Z\
-\x93f\xb1F\x13\x00`O\xe1O\x92\x9e\x96\xfaXl\
-\x00h\xa8\xcfZ\xa3\x92X\xb3\x09\x00\x88_\xf1\x9f,\
-\xed`\x81\x01\xe0\x02j\xad\x9a\xcc\xdaM\x00\xc0\xe8\x8b\
-\xff\x22\xa9\x95E\x05\x80\x8b\xa85k\x11k8\x01\x00\
-\xb1\x15\xfe\xf1\xd2\xdb,$\x00\x5cL\xada\xe3Y\xd3\
-\x09\x00\x88\xbc\xf8O\x93rY<\x00x\x80Z\xcb\xa6\
-\xb1\xb6\x13\x000r\xf1\xbfK\xea`\xd1\x00\xe0!j\
-M\xbb\x8b5\x9e\x00\x803\xbf\xe5\xbf\x9a}\xfc\x01x\
-\xf8<\x81\xd5|%@\x00\xc0g\x8b\xff\x85R\x0a\x0b\
-\x04\x00\x03\xa8\xb5\xeeB\xd6~\x02\x00\xc5\xff\xe3\x8d}\
-\xcaY\x14\x00\x18\xa4\x9c\x8d\x83\x08\x00\xa6\x17\xffeR\
-\x0f\x8b\x01\x00\x03\xa9\xb5o\x19\xb5\x80\x00`Z\xe1\x1f\
-+\xbd\xc6\x02\x00\x00\xe1\xb5p,\xb5\x81\x00`B\xf1\
-\xbfX\xda\xcfE\x0f\x00\x7f\xa2\xd6\xc4\x8b\xa9\x11\x04\x00\
-/\x17\xff\xe9R\x19\x17;\x00\x9cF\xad\x8d\xd3\xa9\x15\
-\x04\x00/\x16\xffyR\x1b\x179\x00\x9c\x91Z#\xe7\
-Q3\x08\x00^*\xfeK\xa7r\x8a\x1f\x00DB\xad\
-\x95K\xa9\x1d\x04\x00/\x14\xff\x15\x5c\xd0\x00\x10\xb5\x15\
-\xd4\x10\x02\x80\x9b\xdf\xf4_\xcfE\x0c\x001[\xcf\x17\
-\x02\x04\x00\xb7\x15\xff\x89\xd2N.^\x00\x185\xb5\x96\
-N\xa4\xb6\x10\x00\xdcP\xfc\xa7L\xe5$?\x00\x88'\
-\xb5\xa6N\xa1\xc6\x10\x00t.\xfe\xd7J\x0d\x5c\xac\x00\
-\x10wjm\xbd\x96ZC\x00\xd0\xb1\xf8\xcf\x99\xca1\
-\xbe\x00`'\xb5\xc6\xce\xa1\xe6\x10\x00t*\xfe\xb7I\
->.N\x00\xb0\x9dZko\xa3\xf6\x10\x00t(\xfe\
-\xdf\x93\x02\x5c\x94\x00\xe0\x18\xb5\xe6~\x8f\x1aD\x00H\
-d\xf1\xff\x81\x14\xe4b\x04\x00\xc7\xa9\xb5\xf7\x07\xd4\x22\
-\x02@\x22\x8a\xffr\xa9\x9f\x8b\x10\x00\x12F\xad\xc1\xcb\
-\xa9I\x04\x00'\x8b\xff\xe3\xd2\x00\x17\x1f\x00$\x9cZ\
-\x8b\x1f\xa76\x11\x00\x9c(\xfe\xcfq\xc1\x01\x80v\x9e\
-\xa3F\x11\x00\xec,\xfe\xbf\xe4\x22\x03\x00m\xfd\x92Z\
-E\x00\xa0\xf8\x03\x00!\x00\x04\x00n\xfb\x03\x00\x8f\x03\
-@\x00\x88\xfe\x85?.(\x00p\x17^\x0c$\x00\x8c\
-\xfaS?\xde\xf6\x07\x00w~\x1d\xc0'\x82\x04\x80\x98\
-7\xf9\xe1;\x7f\x00p\xf7>\x01l\x16D\x00\x88z\
-{_v\xf8\x03\x00o\xec\x18\xc8\xb6\xc1\x04\x80\x88\x0f\
-\xf6ao\x7f\x00\xf0\x0e\xb5\xa6s\x80\x10\x01`\xc4#\
-}9\xd5\x0f\x00\xbcG\xad\xed\x1c%L\x00\x18\xb2\xf8\
-_;\xf5\xe3\xb3\xa6\xb9P\x00\xc0\x9b\xd4\x1a\x7f-5\
-\x8f\x000\xb8\xf8O\x91\x1a\xb88\xe0\x15\x97'g\x8b\
-k\xb7\xe7\x8a\x9bv\xe6\x8b;\xf6\x16\x8aE\x19%\xe2\
-\xfe\xc3e\xe2\xe1c\x15\xe2\x1fNV\x8b\x9f\xe7\xd6\x8a\
-\x7f+\xac\x17kK\x9b\xc4{\x95-\xe2\x7fj\xda\xc4\
-\xa6\xeaV\xb1\xae\xbcY\xac)i\x14/\x17\xd4\x8b\x95\
-9\xb5\xe2\xe9\x93U\xe1\x7fF\xfd\xb3\x8b\xe5\xbf\xe3\xce\
-}Eb\xee\xae\x02q}z\xae\xb82%\x9b\xbe\x86\
-\x1b\xa9\xb5~\x0a\xb5\x8f\x00\xa0\x8a\xffD)\x97\x8b\x02\
-n13-'\x5c\xd0\xff)\xabZ\xbc]\xd6,\xf6\
-6u\x89\xac\x0e\xbf(\xeb\x0e\x88\xc6@P\xf8C\xfd\
-\xc2\xa9\x16\x1a\x18\x10\xed}!Q\xd3\xd3'\x0e\xb6t\
-\x8b?\xc80\xb1:\xafN\xfc\xcd\x91rq\xeb\xee\x82\
-p\x10a\xcc\xa0!\xb5\xe6O$\x00\x98]\xfc\xc7J\
-;\xb9\x18\xa0\xa3\xaf\xca_\xd8\x0b>*\x12O\x9d\xa8\
-\x12o\xc8_\xe5;\x1b;E\xb5\xbfO\x0c\x08\xf7\xb4\
-\xbe\xfe\x01Q\xdc\x15\x10i\xf5\x1d\xe1\xbf\x83\xba\xfb\xa0\
-\xee$\x5c\xb7=\x971F\xa2\xa9\xb5\x7f,\x01\xc0\xdc\
-\x00\xb0\x9e\x8b\x00:\xdc\xae\xbf}o\xa1x\xf4x\xa5\
-x\xb5\xa8A$\xcbbY*\x7f\xcd\xab_\xd7^n\
-m}!q\xb4\xcd'6V\xb5\x8a\x9f\xc8\x90s\xe3\
-\x8e<\xe6\x03\x9c\xb6\x9e\x00`f\xf1_\xc1\xe4G\x22\
-\x5c&}g_Q\xf8V\xf9\xee\xa6.Go\xd9\xeb\
-\xde\x0a\xbaz\xc4\xef\xca\x9a\xc5\x03G\xca\xc5\xd5\xa99\
-\xcc\x178a\x05\x01\xc0\xac\xe2\xbf\x94I\x0f'}s\
-g\xbex\xe6d\xb5x\xbf\xb6M4\xf5\x06\xa9\xf4\x11\
->>8\xd0\xd2-\xfe\xb5\xa0^,\xdc_,\xa6%\
-3\x8f`\x9b\xa5\x04\x003\x8a\xff<\xa9\x8f\x09\x0f\xbb\
-\xcd\xdbU\x10~\x9b>\xb7\xa3\x87j\x1e\x87\xa6^6\
-\xfc\xb0\xaeC<\x97]\x13\xee[\xe6\x18\xe2H\xd5\x84\
-y\x04\x00o\x17\xff\xe9R\x1b\x93\x1dv\xfe\xd2W\xb7\
-\xf6O\xb4\xfb\xa9\xd86\xb7r_\xafx\xa5\xb0\x9ew\
-\x07\x10/\xaa6L'\x00x\xb3\xf8_,\x951\xc9\
-a\xc7gy?\xcb\xa9\x11G[}b\x80\xba\xecx\
-S/K\xaa;\x03\xf7\x1d*\x0b\xbf_\xc1\x9c\xc4(\
-\xa8\x1aq1\x01\xc0{\x9f\xfb\xedgr#\x9e\xbe\xbd\
-\xb7P\xbcS\xd1\x22\xba\x83\xbc\xc4\xa7K+\xf3\xf5\x8a\
-\x97\xf2\xeb\xf8\xcc\x10\xa3\xb1\xdf\x94\xcf\x03M\x09\x00\xaf\
-1\xa9\x11\xafO\xf6\xd4\xcex\x19-\xddT[\x8d[\
-o\xff@xw\xc3\xef\x1f(a\xde\x22\x16\xaf\x11\x00\
-\xbcQ\xfc\x971\x99\x11\x8f\xdb\xfc\xeam\xf4\xfa\x9e>\
-\xaa\xab\xcbZaW \xbc\xad\xf1\xac4\xee\x0a *\
-\xcb\x08\x00\xee.\xfe\xb3\xa4\x1e&2F[\xf8\xd5\x1b\
-\xe84w7\xb5\xdf\x82\xdath._\x10 2\xaa\
-v\xcc\x22\x00\xb8\xb3\xf8_(\x953\x89\x11\x8b\x19\xa9\
-9\xe1O\xf8\xda(\xfc\x9e|<\xf0ViS\xf8\xb0\
-$\xe6:F\xa0j\xc8\x85\x04\x00w\x15\xff$)\x85\
-\xc9\x8bh]M\xe17\xa6\xa91~!\xb7VL\xe7\
-\xc0\x22\x0cO\xd5\x92$\x02\x80{\x02\xc0j&-\xa2\
-\xf5\xd0\xd1\x0aQ\xcb3~#\xbf\x1cx\xe8X\x05\xd7\
-\x00\x86\xb3\x9a\x00\xe0\x8e\xe2\x7f\x974\xc0\x84E\xa4n\
-\xde\x99/\xb67tR\x09\x0do\x87[\xbb\xc3[\x0e\
-sM`\x08\xaa\xa6\xdcE\x00\xd0\xbb\xf8O\x93:\x98\
-\xac\x88\xf4\x93>\xf5\xcd8\x87\xf1\xd0>ij#'\
-u^\xc3\xdc]\xf9\x5c#8\x95\xaa-\xd3\x08\x00z\
-\x16\xff\xf1R.\x93\x14\x91\xf8\xab\x8c\x12\x91\xdf\xc9\x1e\
-\xfd\xb4\xa1[\xa0\x7f@\xbcQ\xd2(\xaeI\xe3DB\
-|\x86\xaa1\xe3\x09\x00\xfa\x05\x80\xb7\x99\x9c\x18\xc9\xd7\
-\xb6\xe7\x8a?T\xb6\xb0e/-\xa2\xd6\x18\x08\x86\xb7\
-\x18\xe6\xda\xc1 o\x13\x00\xf4*\xfe\x8b\x98\x94\x18\xc9\
-S'\xaaD3G\xf1\xd2\xa2l\xfd2-\xae)i\
-\x0c?2\xe2:\x82e\x11\x01@\x8f\xe2?Yje\
-B\xe2Ln\xdbS(2\x9a\xd9\xba\x976\xbav\xa4\
-\xd5'n\xda\xc9\xbb\x01\x08S5g2\x01 \xf1\xdf\
-\xfb\xef`2b(\xd3\x92\xb3\xc4\xaf\x8a\x1a\xc2\x1b\xbf\
-\xd0h\xf1hjG\xc8\x1f\x1d-\xe7\xfa\x82\xb0jO\
-\x12\x01 q\x01\xe0i&!\xce\xf4\xac\x7fOS\x17\
-\x15\x8bfK{\xbb\xacY\x5c\x91\xc2#\x01d=M\
-\x00H\xdc>\xff}L@\x9c\xea\xce}E\xa2\xd2\xd7\
-K\x95\xa2\xd9\xda\xb2:\xfc\xe2\x96\xdd\x9c+`\xb8>\
-7\x9f\x17\xe0\xd6\xe2\xff9)\x9f\xc9\x87S=v\xbc\
-\x92\xef\xfai\x8e\xb5\xae`\xbfx,\xb3\x92k\xcfl\
-\xaa\x16}\x8e\x00\xe0\x5c\x00x\x9dI\x87S7\xf5Y\
-[\xdaDE\xa2%\xa4\xfdWe\xab\xb8\x92G\x02&\
-{\x9d\x00\xe0L\xf1_\xc0d\xc3\xa9\xcf\xfb\xf7\xf2\xbc\
-\x9f\x96\xe0\xb6\xaf\xb9K\x5c\x95\xca\xc6A\x06[@\x00\
-\xb0\xb7\xf8O\x92\x9a\x98h\xf8\xc4w\xf6\x15\x89*?\
-\xcf\xfbiz\xb4\x03-\xdd\xe1\x13%\xb96\x8d\xa4j\
-\xd3$\x02\x80}\x01`\x0b\x93\x0c\x7fz\xde\x9f\xc9\xf3\
-~\x9a~M\xed\x170\x93-\x84M\xb5\x85\x00`O\
-\xf1_\xc8\xe4\xc2'\xcf\xfb\xdf\xe4y?M\xe3v\xbc\
-\xcd'f\xa5\xe5r\xbd\x9ai!\x01 \xbe\xc5\x7f\xa2\
-T\xcb\xc4\x82\xfa\xf6zg#G\xf7\xd2\xf4oY\xed\
-\xfe\xf0\xfb)\x5c\xb7\xc6Q\xb5j\x22\x01 ~\x01\xe0\
-M&\x15\xd4/\xff\xb4\x86\x0e*\x0b\xcd5-\xb7\xa3\
-G\x5c\x9fN\x080\xd0\x9b\x04\x80\xf8\x14\xff\xb9\xd2\x00\
-\x13\x8a\xe2\xff\x7fu\xedT\x14\x9a\xebZAW\x8f\xb8\
-!=\x8f\xeb\xd8,\xaaf\xcd%\x00\x8c\xae\xf8\x8f\x93\
-\x0a\x99L\xec\xe9\xff\xc7\x9a6*\x09\xcd\xb5\xad\xa4;\
- n\xdcA\x080\x8c\xaa]\xe3\x08\x00\xb1\x07\x80\x97\
-\x98Df\xbbL\xdaX\xd5J\x05\xa1\xb9\xbe\x95\xf9z\
-\xc57\xb8\x13`\x9a\x97\x08\x00\xb1\x15\xff\x99R\x90\x09\
-d\xb6w*Z\xa8\x1c4\xcf\xb4\x8c\x96\xee\xf0\xe3,\
-\xaemc\xa8\x1a6\x93\x00\x10]\xf1?[:\xc2\xe4\
-1\xdbo\xcb\xf8\xd4\x8f\xe6\xbd\xf6zI#\xd7\xb7Y\
-T-;\x9b\x00\x10y\x00x\x8aIc\xb6\xff(n\
-\xa4R\xd0<\xd9\x06\xa4\x1f\x1d-\xe7:7\xcbS\x04\
-\x80\xc8\x8a\xff%\x92\x8f\x09c\xaeW\x0a\xeb\xa9\x124\
-O\xb7\x8e\xbe\x90\x98\xb7\x8b\xa3\x84\x0d\xa2j\xda%\x04\
-\x80\x91\x03\xc0\x06&\x8b\xb9~\x91WGu\xa0\x19\xd1\
-\xb2;\xfc\xe2\xab\x9c h\x92\x0d\x04\x80\xe1\x8b\xffl\
-&\x89\xb9~x\xb8,|{\x94F3\xa5\xa9c\x84\
-\xb9\xf6\x8d2\x9b\x000t\xf1?K:\xcc\x041\x93\
-\xfa<\xaa\xa97HE\xa0\x19\xd7\x9e>Y\xc5\x1a`\
-\x0eU\xe3\xce\x22\x00\x9c\x1e\x00\x9619\xcc\xfd\xd6\x7f\
-OS\x17\x95\x80fd\xeb\x09\xf5\x87\x8f\xb5f-0\
-\xc62\x02\xc0g\x8b\xffx\xa9\x8e\x89\xc1s\x7f\x1a\xcd\
-\xc4\xa66\x09\xba\x86#\x84M\xa1j\xddx\x02\xc0\xa7\
-\x01`5\x93\xc2L\x7f\xf9Q\xb1\xe8\xeb\xe7\xc9?\x8d\
-\xb6\xad\xb6\x9d5\xc1\x1c\xab\x09\x00\x1f\x17\xff)R\x80\
-\x09a\x9e\x19\xa99\xe1_>4\x1a\xed\xe3\xf6\x83\x03\
-\xa5\xac\x0dfP5o\x0a\x01\xe0\xc3\xac\xcdL\x063\
-m\xa9\xe6\x80\x1f\x1amp\xcbj\xf7\x87\xdf\x89a}\
-0\xc2f\xa3\x03\x80u\xd4/\x13\xc1@OfV\xb1\
-\xda\xdb\xdcz\xfb\x07Dc (\x0a\xbb\x02\xe2pk\
-\xb7Hk\xe8\x10\x9b\xaa[\xc5\xef\xca\x9a\xc2\x9b-\xfd\
-,\xa7F<\x96Y)\x96\x1d*\x13\x0b\xf7\x17\x8b{\
-\x0f\x96\x8a\x87\x8fU\x88\xe7\xb2k\xc4\xbf\x16\xd4\xcb\xff\
-]\xb3\xd8*C\xda\xae\xc6NqB\x16\xa6\x0a_\xaf\
-\xe8\x0c\x86\xe8X\x9b\xdbS'\xf8*\xc0 s\x8d\x0c\
-\x00\xf2/\x9e$e2\x01\xcc3\x7fw\x81\xe8\x0a\xf6\
-\xb3\xd2\xc7\xb1\xa9\xb7(\x8ad\xa1\xffCe\x8b\xf8\x89\
-, v\xee27W\xfe\xbb\xff1\xab:|Ds\
-}O\x1f\x9d\x1f\xe7V'\xfb\xf4\xaaT^\x084\x84\
-\xaa\x81I&\x06\x80%\x0c\xbey\xa6'g\x87\x7fM\
-\xd2F\xd7\xd4\x8b\x93G\xdb|bmiSx_\xf9\
-\xeb\xb6\xe7&lLo\xdbS(~\x9a]#>\xa8\
-m\x17\xcd\xec\xe5\x10\x97\xf6\xef\x85\x0d\xac\x17\xe6Xb\
-T\x00\x90\x7f\xe11R1\x03o\x9e\xdf\x147\xb0\xba\
-\xc7\xd8\xd4\xed\xf7\xf5\xe5\xcd\xe1\x17\xc5t\xdeB\xf6\x8e\
-\xbd\x85bMI#\x8f\x0bF\xd1\xfc\xa1~q\xe3\x8e\
-<\xd6\x0c3\xa8Z8\xc6\xa4\x00\xb0\x9cA7\xcfM\
-;\xf3E\x80O\xfebz1\xec\x9f\xb2\xaa\xc5\xd5.\
-\xbb-\xac\xbek\x7f\xb9\xa0\x9e\xbb\x021\xb6\xff\xaeb\
-\x9b`\x83,7\x22\x00\xc8\xbf\xe8X\xa9\x82\x017\xcf\
-\xd6\x1a\xde\xfa\x8f\xa6\x1dm\xf5\x89\xc5\x07J\x5c?\xee\
-\xeay\xf6\x8a\x9c\x1aQ\xed\xe7}\x81h\x9a\xca\xca\x0b\
->b\x87@C\xa8\x9a8\xd6\x84\x00\xf0c\x06\xdb<\
-\xdf\x93\x0b\x19\xbf\xfd#k%\xdd\x01\xf1\xd0\xb1\x0a\xcf\
-\xcd\x81\xcb\x93\xb3\xc3\xfb\xde\x17w\x05\x18\xe4\x08[F\
-s7\xeb\x879~\xec\xe9\x00 \xff\x82\xe3\xa4\x1a\x06\
-\xda<\xfb\x9b\xd9\xeb\x7f\xa4\xa6>\xdb[\x9dW\x1b.\
-\x94^?\xfbA=\xd2P\xcf\xb9i#7\xf5\x92'\
-k\x88\x11Tm\x1c\xe7\xe5\x00\xf0\x04\x83l\x9e\x07\x8e\
-\x94\xb3\x8a\x8f\xd0\xd4\xb7\xfa\xa6\x1d\x08s\xe7\xde\x22\xee\
-\x06D\xf2\x0eH\x87\x9fu\xc4\x1cOx2\x00\xc8\xbf\
-\xd8yR\x03\x03l\x96i\xc9Y\xa2\xa0\xab\x87U|\
-\x98\xf6NE\x8b\xd6o\xf5\xdbI\xbd\xd8\xb8\x95\x1d!\
-Gl\xdf\xe5\xb4@S\xa8\x1ay\x9e\x17\x03\xc03\x0c\
-\xaey\xd4\xad^\xda\xd0M\xbd\x13\xf1\xf3\xdcZ\xe6\x89\
-\xf4\x0f'y$0\x5c[W\xde\xcc<1\xc73\x9e\
-\x0a\x00\xf2/4Aja`\xcd\xfbu\xd7\x10\xe0\x13\
-\xb0\xa1Zh`@<#\x8b\x1e\xf3\x84G\x02\x91\xb4\
-\xf6\xbe\x90\xb8\xd2\xd0\xbbD\x06R\xb5r\x82\x97\x02\xc0\
-\xf3\x0c\xaay\xd4nf\xb4\xa1\x8b\xff\xc3\x1e|\xcb?\
-^\xa1Q\xed(H;\xbd\xa9s\x1b\x98#\xc6x\xde\
-\x13\x01\xc0z\xf6\xdf\xca\x80\x9a\xe5\x1b\xe9y\xc2\xc7-\
-\xdd!\x9b\xfa&\x9e92\xfc\xe7\x82\xe9\x0d\x9dL\x94\
-S\xda\xde\xa6.\xe6\x879Z\x9dx\x17\xc0\x89\x00\xf0\
-\x08\x83i\x1e\xb5e-\xed\xf4\xb6\x91\xdd\xdd\x22\xbe\x13\
-p\xbc\xcd\xc7\x84\x19\xd4\xd4\xc6@7\xef\xccg~\x98\
-\xe3\x11W\x07\x00\xf9\x178[*e \xcd[\xbc9\
-\xed\xef\xf4vL\x16\xb4+x\x8e\x1b1u\xc0Qi\
-7\xef\x04\x0cn\xbf*\xe2\x90 \x83\xa8\xday\xb6\x9b\
-\x03\xc0=\x0c\xa2\x99ot\xd3>\xdb\xd4\xcb\x90\x1c\xee\
-\x12=u\xf4p#/\x92\xfe\xa9U\xfb{\xc3\x1b)\
-17\x8cq\x8f\x9b\x03\xc0\x01\x06\xd0<\xc7\xb8u\xfb\
-\x99\xa6v\xf8\xbb{\x7f1s#F\xea\x1bx\xee(\
-}\xda\x96\x1e*c^\x98\xe3\x80+\x03\x80\xfc\x83\xcf\
-a\xf0\xcc\xa3\x8e\x82\xa5}\xb6\xa9\xfd\xef\x99\x1b\xa3\xb3\
-\xe4P\xa9\xe8\xe3$\xc9p\xdbV\xdb\xce\x9c0\xcb\x1c\
-7\x06\x80\xad\x0c\x9cy~\xcf\xcb\x7f\x9fil\xe0\x12\
-?/\xe4\xd62\xa1d\xeb\x09\xf5\xf3.\x89Y\xb6\xba\
-*\x00\xc8?\xf0T\xa9\x9f\x813\x8b\xda\xa8DmX\
-B\xfb\xb8U\xf8z\x8d\xdd\xe2\xd7\xae\xcf\x03\xd9V\xfa\
-\xe3\xc6#%\xa3\xa8Z:\xd5M\x01`\x0d\x83f\x9e\
-'3\xabX\x99\x07\xb5\x1f\x1e\xe6Ym\xbc\xa9\xe7\xdf\
-4!V\xb1\x85\xb4i\xd6\xb8\x22\x00\xc8?\xe8E\x92\
-\x9f\x013\xcf\x81\x96nVf\xab}X\xd7\xc1\x9c\xb0\
-IZ}\x87\xf1\xf3\xeb\x03\xde\x030\x8d\xaa\xa9\x17\xb9\
-!\x00\xb0\xed\xaf\x81n\xdb]@\xd5\xb7\x9a\xda\x01q\
-\x0e\x1b\xb6\xd8\xe6\x169\xd7z\x0d\x7f!\xb0\xa6\xa7\x8f\
-\xb9\xc0\xf6\xc0z\x05\x00\xf9\x07<g*G\xfe\x1ai\
-mi\x13\x95\xdfj\xab\xf3\xb8=k\xb77J\x1a\x8d\
-\x9fg\xec+a\x1cU[\xcf\xd19\x00\xb0\xf1\x8f\xa1\
-\xd8\xac\xe5\xe3\x96\xdf\xd9\x13~Y\x8d9a\xaf\x99i\
-9\xc6\xcf\xb9\xbf\xe3@)6\x06\xd2,\x00\xa42@\
-\xe6\xf9\xd6\x1e\xbe\xfdWM\xdd\x94^\x9cQ\xc2\x9cp\
-\xc8O\xb3k\x8c\x9eoo\x9561\x0f\xcc\x93\xaae\
-\x00\x90\x7f\xb0)\xd2\x00\x03d\x9eg\xb3\xd9\xfaW5\
-\x0e\xfaq\xd6\xd7\xb6\xe7\x86\x8fV6\xb5\x1dm\xf51\
-\x0f\xcc\xa3j\xec\x14\x1d\x03\xc0*\x06\xc7L[k\xda\
-x\xf1/\xd4\x1f>\xbc\x86\xf9\xe0\xac\x8f\x9a\xbb\x8c\x9d\
-s\x81\xfe\x011\x9d\xc7M&Z\xa5U\x00\x98\xfa\xf1\
-\xa9\x7f5\x0c\x8c\x99\xd4\x01%\xa67n\xc7&\xc6\x8a\
-\x1c\xb3\x1f\x03,dC \x13\xa9Z{\xb6N\x01`\
-\x01\x83b\xa6o\xee\xcc7\xbe\xf8\xabO\xd2x#;\
-1f\xcb~7\xf9\x83\xc0\x17\xd8\x10\xc8T\x0bt\x0a\
-\x00\xdb\x18\x103=\x91Yi|\x00\xd8P\xd9\xc2\x5c\
-H\xa0\xcc6\xbf\xb1s\xef\xb7e\xdcy2\xd46-\
-\x02\x80\xfc\x83L\x96B\x0c\x88\x99\xde\xa9h1\xba\xf8\
-\xab\x97\xd0\xe6\xef.`.$\xd0\xbf\x14\xd4\x1b;\xff\
-6W\xf3\xe2\xa9\xa1T\xcd\x9d\xacC\x00`\xe7?\x83\
-\x15t\x9a}8\xcb\xff\xd4\xb41\x0f\x12\xbd\x0b\xa5\xc1\
-\x9f\xa1\xa67t2\x07\xd8\x1901\x01@\xfe\x01\x92\
-\xa4\x0a\x06\xc2\xdc\xcf\xb0L~\xfe\xaa\xfe\xeew\xee-\
-b.h\xa0\xccg\xe6\x8b\xa8|\x0ah4U{\x93\
-\x12\x19\x00ng\x10\xcc\xf5\xb7G\xca\x8d\xfe\xf5\xbf\x9d\
-__\xda\xd8\xd3d\xe6\xe7\x80%\xdd\x01\xc6\xdfl\xb7\
-'2\x00\xbc\xc7\x00\x98\xeb\xd5\xa2\x06\xa3\x03\xc0\x22v\
-\xfd\xd3\xc6\x96j3\xf7\xa2h\xe9\x0d2\xfef{/\
-!\x01@\xfe\x87\xcf\x95\xba\x18\x00s\xa9\xb7\xdfMm\
-\x19-\xdd\xcc\x01\x8d\xbcn\xe8\xe1@\xea%\xd4\xcb\x18\
-\x7f\x93\xa9\x1a|n\x22\x02\xc0\xddt\xbe\xd9\x92\x0d>\
-\x97}\xf9\x91r\xe6\x80F~\x9e[k\xec\x5c\x9c\x95\
-\xc6\x0e\x94\x86\xbb;\x11\x01`#\x1do\xb6C\xf2W\
-\xb0\x89\xad!\x10\xe4\xc4?\xcd<z\xdc\xdc\xfd(\xf8\
-\x0c\xd5x\x1b\x1d\x0d\x00\xf2?x\x9e\xe4\xa3\xe3\xcdV\
-\xdc\x150r\xc1]\xcb\xb6\xbf\xda\xf9\xfe\x81\x12c\x03\
-\xc0_\xb2\x1d\xb0\xe9T->\xcf\xc9\x00\xb0\x98NG\
-ko\xc8\xc8\x05\xf7\xf6\xbd\x85\x8c\xbffn\x95\xbf\x82\
-Mm?<\x5c\xc6\x1c\xc0b'\x03\xc0\x16:\xdcl\
-\xd3\x92\xb3D\xbf\x81\x9b\x00\x9ch\xf73\xfe\x1a\xba:\
-5\xc7\xd8\x00\xa0\xb6\xe3f\x0e\x18o\x8b#\x01@\xfe\
-\x87\xce\x97z\xe8p\xb3]\x9f\x9ek\xe4b\xfb\xb3\x9c\
-\x1a\xc6_S\xea\x8dx\x13\xdbc\xc7\x09\x00\x08\xd7\xe4\
-\xf3\x9d\x08\x00\xf7\xd2\xd9P\xb7\xc1Mk\xea\xd4\xbfk\
-\xb7\xf3\xc65w\x00\xf4j\x0f\xf0\x08\x00\x1f\xbb\xd7\x89\
-\x00\xf0>\x1d\x8d\xbf>Xj\xdcB\xfbA];c\
-\xaf\xa99\x06\x1fK\xbd\xf8\x00\x1bR!\xec}[\x03\
-\x80\xfc\x0f\x5c \xf5\xd2\xd1x\xf8X\x85y\xbf\xb4\xf8\
-\xf6_[\xdf\xdek\xee\x81@w\xee\xe3<\x0a\x84\xa9\
-\xda|\x81\x9d\x01\xe0>:\x19&~w\xcd\xb7\xffz\
-[\x9ca\xeeg\x80sw\xe53\x07\xf0\x89\xfb\xec\x0c\
-\x00\x9b\xe9`(\x7fe\xd8\x82\xcb\xb7\xffz{\xe6d\
-\xb5\xb1\x01\xe0k\xbc\x97\x82Om\xb6%\x00\xc8\x7f\xf1\
-\x18\xa9\x83\x0e\x86r\x93a\xcf\x5c\xf9\xf6_o\xeb\xca\
-\x9b\x8d\x0d\x00\xdc\x99\xc2 \xaaF\x8f\xb1#\x00\xdcD\
-\xe7\xe2\x13j\xd11e\x1f\x80,\xbe\xfd\xd7\xde\xe1V\
-3\xb7\xa5\xee\x09\xf53\xfe8\xd5Mv\x04\x80\xd5t\
-,\x06S\xcf\xc5Mh/\xe6\xd52\xde\x1aS\xa7\xe1\
-u\x05\xfb\x8d\x0c\x00M\x1c\x07\x8c\xd3\xad\xb6#\x00\x1c\
-\xa3c1\xd8\xde\xa6.\xcf/\xb0js\x99\x1bw\xe4\
-1\xde\x1aSo\xc1\x9b\xda\xf2:{\x98\x038\xd5\xb1\
-\xb8\x06\x00\xf9/\x9c$\x0d\xd0\xb1\x18\xec\xb9\xec\x1a\xcf\
-/\xb0*\xe40\xd6z{\xb5\xa8\xc1\xd8\x00\xb0\xad\x96\
-\xbd)p\x1aU\xab'\xc53\x00\xf0\xf9\x1fN\xf3\xf5\
-\xf4<\xcfo\xbf\xfa\x93\x13U\x8c\xb5\xe6\x0a\xbaz\x8c\
-\x0d\x00\xaf\x14\xd63\x07\x10\xf3\xe7\x80\x91\x06\x80\x0dt\
-(\x86\x92\xd1\xe2\xdd\x97\xaf\xfc\xa1~1#5\x87q\
-\xd6\xd8_\xec1w\x03 \xd5\x1e:V\xc1<\xc0P\
-6\xc4%\x00\xc8\x7fQ\x92\xd4B\x87b(\xeap\x1c\
-\xaf\xb6\xdf\x9773\xc6\xdc\xfe\xd7\xba\xdd\xb6\xbb\x80y\
-\x80\xa1\xa8\x9a\x9d\x14\x8f\x00p\x03\x9d\x893Q\x9b\x90\
-\xb4\xf7\x85<\xb7\xb0\xaa\x83\x7ff\xf3\xf2\x9f\xd6\xd4\x01\
-@\xad\xbd!c\x8b\x7f@\xceQu,7s\x01g\
-pC<\x02\xc0J:\x12\xc3Y\x95[\xeb\xb9\xc5\xf5\
-\x9d\x8a\x16\xc6Vs\xab\xf3j\x8d\xfe\xf5\x9f\xdb\xc1\x17\
-\x00\x18\xd6\xcax\x04\x80\x83t$\x863=9[\x94\
-v\x07<\xb3\xb0\xf6\xc9_V\xdf\xdc\xc9\xfe\xea:\xbb\
-2%\xdb\x98}(\xce\xd4\xfe\xa7\xa6\x8d\xb9\x80\xe1\x1c\
-\x1cU\x00\x90\xff\x82\x09R?\x1d\x89\x91,?R\xee\
-\x99\x85\xf5\xbdJ~\xfd\xeb\xee\x85\x5c\xb3\x7f\xfd\xab\xf6\
-r\x01_\x00`X\xaavO\x18M\x00\xf8\x16\x9d\x88\
-H\xed\xf6\xc0\xc6@m}!\xf1\x8dt\x9e\xfd\xebL\
-\xdd\x9d1u\xe7\xbf\xc1M\x9d\x80\xc8|\xc0\x08\xbe5\
-\x9a\x00\xf0\x02\x1d\x88H\xa9\x97\xe6\xdc~[V\x1ds\
-\xccX\xeamgc\xa7\xf1\xc5_\xbd\xfc\xc8\x0b\x80\x88\
-\xc0\x0b\xa3\x09\x00;\xe8@Dc\xe1\xfe\xe2\xf0\x01%\
-nl\xff\xcb\xaej\xda\xfb\xfb\x13U\x82&\xc4\xd6j\
-\x9e\xff#\x22;b\x0a\x00S?>\xfe\xd7G\x07\x22\
-Z\x8fgV\xbanAm\x0c\x049W\xdd\x05;O\
-\xb6\xf5\x85\xa8\xfe\xdc\xa9B\xe4T\x0d\x1f\x13K\x00\xb8\
-\x8e\xceC\xac\xfe\xa3\xb8\xd15\x8bip`@,;\
-T\xc6\xb8i\xee\x83\xdav*\xbf5_\xafIc\x87\
-JD\xec\xbaX\x02\xc0\xe3t\x1cb\xa5\x8eh\xfdc\
-M\x9b\xf6\x8b\xa9:\xcb\xe01~Mi\xef\xc1\xa3\xe5\
-T~\xab\xedo\xeebN \x1a\x8f\xc7\x12\x006\xd1\
-q\x18m\x08\xf8M\xb1\xbe[\xb5\xaac\x8c\x9e9Y\
-\xcdXinVZ\xae\xf1\xdf\xfc\x0fnj\xe3-\xe6\
-\x05\xa2\xb0)\x96\x00PG\xc7!\x1e\x9e\xcc\xac\x0ao\
-\xad\xab[[\x91S\xc3\xf8hN\xbd\xe9\x9e\xd6\xd0A\
-\xd5\x1f\xd4na\xff\x7fD\xa7.\xaa\x00 \xff\x81K\
-\xe94\xc4\x93\xfaf\xb9\xa5W\x8f_q\x1d}!^\
-\xa2r\x89u\xe5\xcdT\xfcA\xedh\x9b\x8fy\x81X\
-\x5c\x1aM\x00XJ\x87!\xde\xe6\xee*\x10\x1f5w\
-%|\x01\x9d\xbb\x8bm~\xdd\xe0\xc5<v\xfb;\xb5\
-q\xfc/b\xb44\x9a\x00\xb0\x96\x0e\x83]\x1e8\x5c\
-&\x0a:{\x1c\x7f\xd9O}\x99pyr6c\xe0\
-\x02\x7f'\x0b\x9d\x86O\x8d\x12\xda\xca|\xbdl\xfe\x83\
-X\xad\x8d&\x00d\xd1a\xb0\xfb\xd9\xee?eU\xdb\
-\xfer\x97?\xd4/\xd6\x977\xf3\xab\xdfE\x16e\x94\
-\xb8v3);\xdb\xf3\xd9\xbc\xb3\x82\x98eE\x14\x00\
-\xe4\xffp\xac\x14\xa4\xc3\xe0\x04u\xa6\xbbz\x13?\xb9\
-\xbe#\xae\xfb\xbb7\xf5\x06\xc5\xabE\x0d\xe2:6\xf7\
-q\x15\xf5\x82\x9b.\xef\x8a\xe8\xd4T\x9f\x5c\x95\xca\xb7\
-\xff\x88\x99\xaa\xe9c#\x09\x003\xe8,$\x82:V\
-x\xe9\xa12\xf1\xbb\xb2fQ\xd2\x1d\x08ox\x12\xcd\
-\x02\xa9B\xc4\xca\x9cZq\xe7\xde\xa2\xf0'\x88\xf4\xa9\
-\xbb\xa8\xb0\xa6ns\xd3No*\xcc2G0J3\
-\x22\x09\x00K\xe8(\xe8\xb2\x8f\x80\xda\x9e\xf7\xdb{\x0b\
-\xc5\x92C\xa5\xe2\x89\xcc\xca\xf0\x8ba?\xcb\xa9\x09\xbf\
-\xc5\xbf\xe4`i\xb8\xd8\xdf\xb8#\x8f\x82\xefr\xea \
-\xa9\x82\xae\x1e*\xfd\x10M=\x0e\xb9>\x9d;Y\x18\
-\xb5%\x91\x04\x80\x7f\xa6\xa3\x008\xe5\xb6=\x85\xa2\xda\
-\xdfG\xa5?C{\xa7\xa2\x85y\x82x\xf8\xe7H\x02\
-@2\x1d\x05\xc0\x09\x7f\xb9\xbf\x98g\xfe#\xecY\xa1\
-\x0eAb\xae \x0e\x92#\x09\x00\xb5t\x14\x00\xbb\xa9\
-\xf7=|\xbc\xed\xcf\xb6\xbfpJ\xed\xb0\x01@\xfe\x0f\
-.\xa4\x93\x00\xd8M\xbd\xc3\xd1\xc7\x87\xfe\xc3\xb6\xa2\xae\
-\x00\xfbV \xde.\x1c.\x00\xcc\xa3\x83\x00\xd8I\xbd\
-\xc4I\xed\x1f\xb9\xdd\xc7\x11\xd5\x88\xbfy\xc3\x05\x80G\
-\xe9 \x00vQ\x9f\xb3\xd1Fn\xa9\xf5\x1d\xcc\x17\xd8\
-\xe1\xd1\xe1\x02\xc0[t\x10\x80xS;?\xaa\xb7\xd9\
-i#\xb7@\xff@\xf8\xdc\x0c\xe6\x0dl\xf0\xd6p\x01\
-\xe0\x10\x1d\x04 \x9e\xaeH\xc9\x16\x1f\xd4\xb5S\xd9\xd9\
-\xf4\x07\x89wh\xc8\x00 \xff?\x92$\x1f\x1d\x04 \
-^f\xa4\xe6$\xfc\x04H7\xb5\xbc\xce\x9ep`b\
-\xee\xc0&\xaa\xc6'\x0d\x15\x00\xbeD\xe7\x00\x88\x17\xf5\
-\xfdzV\xbb\x9f\xaa\x1eaS_E|g_\x11s\
-\x07v\xfb\xd2P\x01\xe0f:\x06@<\xa8\xd3\x17\xcb\
-\xba\x03T\xf5(\xda\xcb\x05\xf5\xcc\x1d8\xe1\xe6\xa1\x02\
-\xc02:\x06\xc0h\xa9\xf3\x19\xea{\xd8\xda7\x9av\
-\xbc\xcd\xc77\xffp\xca\xb2\xa1\x02\xc0\x0a:\x06\xc0h\
-,\xce(\x11\xed}!*z\x14\xcd\x1f\xea\x0f\x9f\x87\
-\xc0\xfc\x81CV\x0c\x15\x00\xd6\xd11\x00b\xf57G\
-\xca\xc3'\xd7\xd1\xa2k/\xb0\xdd/\x9c\xb5n\xa8\x00\
-\xb0\x9b\x8e\x01\x10\x8b\x9f\x9c\xac\x12\xa1\x01\xb6\xf7\x8b\xb6\
-mo\xe8\xe4(k8m\xf7P\x01\xa0\x92\x8e\x01\x10\
-\xad_\xe4\xd5\x09J\x7f\xf4\xad\xa4; \xaeI\xcba\
-\x0e\xc1i\x95\x9f\x09\x00\xf2\xffp\x8e\xd4O\xc7\x00\x88\
-\xc6\xda\xd2&*y\x0c\xad3\x18\xe2\xb9?\x12E\xd5\
-\xfas\x06\x07\x80\xaf\xd0)\x00\x22\xa5\xdeX\xdfT\xdd\
-J%\x8f\xa1\xa9\x83\x90\xfe\xf6H9\xf3\x08\x89\xf4\x95\
-\xc1\x01\xe0\x16:\x04@$\xaeJ\xcd\x09?\xbb\xa6\xc5\
-\xd6\xfe\xad\x90\xef\xfd\x91p\xb7\x0c\x0e\x00\x0f\xd0!\x00\
-Fr\xed\xf6\x5cq\xa4\xd5G\x15\x8f\xb1\xa5\xd4w\xf0\
-\xd2\x1ft\xf0\xc0\xe0\x00\xb0\x8a\x0e\x010\x9c\xd9;\xf2\
-DAW\x0fU<\xc6\x96\xd9\xe6\x0f\x9f\x8d\xc0\x5c\x82\
-\x06V\x0d\x0e\x00\xef\xd0!\x00\xceD\xbd\xb0V\xedg\
-w\xbfX[~g\x8f\xf8\xda\xf6\x5c\xe6\x12t\xf1\xce\
-\xe0\x00\xb0\x9d\x0e\x010\x94\x85\xfb\x8bEk/\xbb\xfb\
-\xc5\xda\xca|\xbd\xe2\x1b\xe9y\xcc%\xe8d\xfb\xe0\x00\
-p\x9c\x0e\x01p\xaa\xfb\x0f\x97\x09\x1f\xbb\xfb\xc5\xdcj\
-{\xfa\xc4\xcd;\xf3\x99K\xd0\xcd\xf1\xc1\x01\x80M\x80\
-\x00|\xc6\x13\x99\x95\x22\xc8\xee~1\xb7\xa6\xde \xdf\
-\xfaC\xeb\xcd\x80>\x09\x00>:\x04\xc0'~\x9e[\
-\xcb\xee~\xa3hm}!\xf1\x9d}E\xcc%\xe8\xca\
-\x17\x0e\x00\xf2\xff1\x8e\xce\x00\xf0\x895%\x8dT\xf0\
-Q\xb4\xba\x9e>q\xfb^~\xf9C{\xe3T\x00\xf8\
-\x02\x1d\x01@\xed\xee\xb7\xb1\x8a\xdd\xfdF\xbb\xbf\xffM\
-<\xf3\x87;|A\x05\x80\xab\xe9\x08\xc0l_M\xc9\
-\x16i\x0d\x1dT\xf0Q\xb4\x93\xed~q}:\x9f\xfa\
-\xc15\xaeV\x01`>\x1d\x01\x98K\xed\xeew\xb8\xb5\
-\x9b\x0a>\x8a\xf6Qs\x17\x9b\xfc\xc0m\xe6\xab\x00\xb0\
-\x88\x8e\x00\xcct\xa3\xda\xdd\xaf\x93\xdd\xfdF\xd3\xfe\xaf\
-\xae]\x5c\x91\x92\xcd|\x82\xdb,R\x01\xe0A:\x02\
-0\xcf-\xbb\x0bD\xb5\xbf\x97\x0a>\x8a\xf6^e\x8b\
-\x98\x96\xcc\x5c\x82+=\xa8\x02\xc0\xb3t\x04`\x96\xf9\
-\xb2\xf8\xab\xb7\xd5i\xb1\xb7\xdf\x1470\x97\xe0f\xcf\
-\xaa\x00\xf0\x0a\x1d\x01\x98c\xde\xae\x82\xf0\x0eu\xb4\xd8\
-\x9a\xda\x1f\xe1\x85\xdcZ\xe6\x12\xdc\xee\x15\x15\x00\xd6\xd1\
-\x11\x80\x19\xe6\xca\xe2_C\xf1\x8f\xb9\xa9\x9d\x11\x9f\xcc\
-\xacb.\xc1\x0b\xd6\xa9\x00\xb0\x89\x8e\x00L(\xfe\xf9\
-\x9c\xe87\x8a\xe6\x0f\xf5\x8b\x07\x0e\x971\x97\xe0\x15\x9b\
-T\x00\xd8FG\x00\xde\xa6\x0e\xa4\xe1\x85\xbf\xd8[{\
-_H,\xca(a.\xc1K\xb6\xa9\x00\x90BG\x00\
-\xde\xa5v\xa6\xab\xa2\xf8\xc7\xdc\xea{\xfa\xc4\x1dl\xed\
-\x0b\xefIQ\x01`\x17\x1d\x01x\xd37e\xf1\xaf\xf0\
-Q\xfccme\xdd\x81\xf0\xa3\x13\xe6\x12<h\x97\x0a\
-\x00\x19t\x04\xe0=sd\xf1/\xa7\xf8\xc7\xdc\xb2:\
-\xfc\xe2\xeb\xe9y\xcc%xU\x86\x0a\x00G\xe9\x08\xc0\
-[f\xef\xc8\x13e\x14\xff\x98[Fs\xb7\x98\x99\xc6\
-\xd6\xbe\xf0\xb4\xa3*\x00d\xd3\x11\x80w\xa8\xed}\xd5\
-\xadkZl-\xb9\xbeC\x5c\xc9\xd6\xbe\xf0\xbel\x15\
-\x00\x8a\xe8\x08\xc0;\xc5\xbf\x94\xe2\x1fs\xfb\x03[\xfb\
-\xc2\x1cE*\x00T\xd0\x11\x80\xfb\xa9[\xd6\x1c\xec\x13\
-{[S\xd2\xc8<\x82I*T\x00\xa8\xa7#\x00w\
-S\xbfZw5vR\xc5c\xdc\xda\xf7\xc5<\xb6\xf6\
-\x85q\xeaU\x00h\xa3#\x00w{\xbb\xac\x99J\x1e\
-C\x0b\x0d\x0c\x88\xa7N\xb0\xb5/\x8c\xd4\xa6\x02\x80\x8f\
-\x8e\x00\xdc\xeb\xb9\xec\x1a*y\x0c\xad'\xd4/\x96\x1f\
-)g\x0e\xc1T>\x15\x00Bt\x04\xe0NK\x0e\x95\
-\x86\x7f\xc5\xd2\xa2\xdf\xdaw1[\xfb\xc2l!\x02\x00\
-\xe0R\xb7\xee.\x08\x172Zt\xad!\x10\x14w\xee\
--b\x0e\x81\x00\xc0#\x00\xc0}.O\xce\x16'\xda\
-\xfdT\xf3(\x9b\xda\x19Q\x1d\x89\xcc\x1c\x02>~\x04\
-\xc0K\x80\x80\xcb\xfc\xba\xa8\x81j\x1ee\xcb\xe9\xe8\x11\
-7\xb0\xb5/\xf0\x99\x97\x00\xf9\x0c\x10p\x91\xbf\xca(\
-\xe1\xb9\x7f\x94\xed@K\xb7\xb8\x86\xad}\x81\xd3>\x03\
-d# \xc0%f\xa4\xe6\x88J\xf6\xf8\x8f\xaa\xa5\xb1\
-\xb5/p\xc6\x8d\x80\xd8\x0a\x18p\x89M\xd5\xadT\xf4\
-(\xda\xc6\xaa\xd6\xf0\xfb\x12\xcc\x1d\xe04E\x1c\x06\x04\
-\xb8\xc4CG+\xa8\xe8Q\xb47\xd8\xda\x17\x18N6\
-\xc7\x01\x03.\xf0\xd5\x94lQ\xed\xe7\xd6\x7f\xa4[\xfb\
-\xfe\x22\xaf\x8ey\x03\x0c/|\x1cp\x06\x1d\x01\xe8\xed\
-W\xbc\xf5\x1f\xf1\xd6\xbeO\x9fdk_ \x02\x19*\
-\x00\xec\xa2#\x00}\xdd\xbc3_\xf8C\xfdT\xf7\x08\
-\xb6\xf6\xfd\xd1Q\xb6\xf6\x05\x22\xb4K\x05\x80\x14:\x02\
-\xd0\xd7\x07u\xedT\xf7\x11Zg0$~p\xa0\x94\
-\xf9\x02D.E\x05\x80mt\x04\xa0\xa7{\x0f\x96R\
-\xddGh\x8d\x81\xa0\xf8\xce>\xb6\xf6\x05\xa2\xb4M\x05\
-\x80Mt\x04\xa0\x9fi\xc9Y\x22\xbf\xb3\x87\x0a?L\
-\xab\xf0\xf5\x8a\xf9\xbb\xd9\xda\x17\x88\xc1&\x15\x00\xd6\xd1\
-\x11\x80~\x1e;^I\x85\x1f\xa6\x95t\x07\xc4\x8d;\
-\xd8\xda\x17\x88\xd1:\x15\x00^\xa1#\x00\xfd\xa8\xbd\xeb\
-i\x14\x7f\xc0&\xaf\xa8\x00\xf0,\x1d\x01\xe8\xe5\x87\x87\
-\xcb\xa8\xf2\x14\x7f\xc0N\xcf\xaa\x00\xf0 \x1d\x01\xe8E\
-\x1d^C\xa3\xf8\x036zP\x05\x80Et\x04\xa0\x8f\
-E\x19%Tz\x8a?`\xb7E*\x00\xcc\xa7#\x00\
-}\xa45tP\xed)\xfe\x80\xdd\xe6\xab\x000\x83\x8e\
-\x00\xf4\xf0\xad=\x85\xe1\xbd\xeci\x14\x7f\xc0f3T\
-\x00\x98LG\x00zx\xbd\xa4\x91\x8aO\xf1\x07\x9c0\
-Y\x05\x80s\xe9\x08 \xf1.\x938\xf1\x8f\xe2\x0f8\
-\xe4\xdc?\x93\xd7\x99\x0a\x01~:\x03H\xac\xc5\x07x\
-\xf9\x8f\xe2\x0f8\xc2\xafj\xff'\x01\xa0\x8a\x0e\x01\x12\
-\xeb\x9d\x8a\x16*?\xc5\x1fpB\xd5\xe0\x00\x90I\x87\
-\x00\x89syr\xb6h\xe9\x0dR\xfc)\xfe\x80\x132\
-\x07\x07\x80t:\x04H\x9c\x07\x8e\x94\x1b_\xfc\xab\xfc\
-\xbd\x14\x7f\xc0\x19\xe9\x83\x03\xc0\xbbt\x08\x908\x7f\xac\
-i3\xba\xf8\xfbC\xfd\xe2\xbb\x1c\xe9\x0b8\xe5\xdd\xc1\
-\x01\xe0E:\x04H\x1c\xd3o\xff?\x99Y\xc5<\x00\
-\x9c\xf3\xe2\xe0\x00\xb0\x9c\x0e\x01\x12\xe3\xb6=\x85F\x17\
-\xff\xb7\xcb\x9a\x99\x07\x80\xb3\x96\x0f\x0e\x00\xb7\xd2!@\
-b\xfccV\xb5\xb1\xc5_\x1dz\xa4^\x80d\x1e\x00\
-\x8e\xbaup\x00\xb8\x94\x0e\x01\x12\xe3\xbf\xabZ\x8d,\
-\xfe\x8d\x81\xa0\xb8!\x9d\x97\xfe\x80\x04\xb8tp\x00\x18\
-+\xf5\xd3)\x80\xf3\xca\xba\x03F\x06\x80\xc7\x8eW2\
-\xfe\x80\xf3T\xad\x1f\xfb\xa7\x00\xc0f@@b|]\
-\xfe\x026\xb1\xedi\xeab\xfc\x81\x04n\x02tj\x00\
-\xd8C\xc7\x00\xcez\xe8X\x85q\xc5?\xd0? n\
-\xd9]\xc0\xf8\x03\x89\xb1g\xa8\x00\xb0\x9e\x8e\x01\x9c\xf5\
-Vi\x93q\x01\xe0WE\x0d\x8c=\x908\xeb\x87\x0a\
-\x00+\xe9\x18\xc0Y\xbb\x1b;\x8d*\xfeM\xbdAq\
-e\x0ao\xfd\x03\x09\xb4r\xa8\x00p?\x1d\x038\xab\
-\xc4\xb0\x17\x00\xdf(id\xdc\x81\xc4\xba\x7f\xa8\x000\
-\x97\x8e\x01\x9cs\x99\xa4\x9e\x87\x9b\xd2\xd4\xdf\x94g\xff\
-@\xc2\xcd\x1d*\x00|\x99\x8e\x01\x9c3{\x87Y_\
-\x00|\xd4\xcc\x9b\xff\x80\x06\xbe<T\x00H\x92\xfct\
-\x0e\xe0\x8c\xef\x1f(1*\x00<\xcaw\xff@\xa2\xa9\
-\x1a\x9ftZ\x00\xb0B\xc0a:\x08p\xc6ONV\
-\x19S\xfc\x9b{\x83b:[\xfe\x02\x89vxp\xcd\
-?5\x00\xfc\x96\x0e\x02\x9c\xf1jQ\x831\x01`m\
-i\x13c\x0e$\xdeo\x87\x0b\x00\x8f\xd1A\x803\xb6\
-V\xb7\x19\xf3\xf2\xdf\xad\xbc\xfc\x07\xe8\xe0\xb1\xe1\x02\xc0\
-|:\x08pFFK\xb7\x11\x01`?/\xff\x01\xba\
-\x98?\x5c\x00\xb8\x88\x0e\x02\x9cq\xb2\xddoD\x00\xf8\
-iv\x0d\xe3\x0d\xe8\xe1\xa23\x06\x00+\x04\xd4\xd2I\
-\x80\xfd\x0a\xbb\xcc\xd8\x04\xe8\xf6\xbd\x85\x8c7\x90x\xb5\
-\xa7\xd6\xfb\xa1\x02@2\x1d\x05\xd8\xaf\xd2\xd7\xeb\xf9\xe2\
-\xdf\xd2\x1bd\xac\x01=$G\x12\x00\xfe\x85\x8e\x02\xec\
-\xd7\x18\x08z>\x00\xa4\xd4w0\xd6\x80\x1e\xfe%\x92\
-\x00\xb0\x84\x8e\x02\xec\xd7\x19\x0cy>\x00\xac\xca\xade\
-\xac\x01=,\x89$\x00\xcc\xa0\xa3\x00\xfb\x05\x07\xbc\x7f\
-\x0e\xc0\xf7>*b\xac\x01=\xcc\x88$\x00\x8c\x95\x82\
-t\x16`\x9f\xcb\x93\xb3=_\xfc\xbb\x82\xfdbZ2\
-c\x0dh@\xd5\xf4\xb1#\x06\x00+\x04d\xd1a\x80\
-}f\xa6\xe5x>\x00\xecn\xecd\xac\x01=d\x0d\
-U\xeb\xcf\x14\x00\xd6\xd2a\x80}\xaeO\xcf\xf5|\x00\
-x\xb9\xa0\x9e\xb1\x06\xf4\xb06\x9a\x00\xb0\x94\x0e\x03\xec\
-se\x8a\xf7\x1f\x01,\xce(a\xac\x01=,\x8d&\
-\x00\x5cJ\x87\x01\xf6\xf2\x87\xfa=[\xfc{\xe4\xdf\xed\
-\x8a\x14N\xff\x034qi\xc4\x01\xc0\x0a\x01ut\x1a\
-`\x9f\xba\x9e>\xcf\x06\x00u\xce\x01c\x0ch\xa1\xee\
-Lu~\xb8\x00\xb0\x89\x8e\x03\xec\x93\xdf\xd9\xe3\xd9\x00\
-\xf0\xeb\xa2\x06\xc6\x18\xd0\xc3\xa6X\x02\xc0\xe3t\x1c`\
-\x9f\x03\x1e>\x0dp\xe9\xa12\xc6\x18\xd0\xc3\xe3\xb1\x04\
-\x80\xeb\xe88\xc0>j\x9b\x5c/6\xb5\xc1\xd1\xd5\xa9\
-9\x8c1\xa0\x87\xebb\x09\x00c$\x1f\x9d\x07\xd8\xe3\
-\xbf*[=\x19\x00\x8e\xb7\xf9\x18_@\x0f\xaa\x86\x8f\
-\x89:\x00X!`\x07\x1d\x08\xd8\xe3\xa7\xd95\x9e\x0c\
-\x00kK\x9b\x18_@\x0f;\x86\xab\xf1#\x05\x80\x17\
-\xe8@\xc0\x1e\xdf\xde[\xe8\xc9\x00\xf07G\xca\x19_\
-@\x0f/\x8c&\x00|\x8b\x0e\x04\xecq\x99\xd4\xda\xeb\
-\xad\x13\x01\xfb\x07\x84\x98\x95\x96\xcb\xf8\x02z\xf8\xd6h\
-\x02\xc0\x04\xa9\x9fN\x04\xec\x91\xea\xb1\x17\x01s;z\
-\x18W@\x0f\xaavO\x889\x00X!\xe0 \x1d\x09\
-\xd8\xe3\xc5\xbcZO\x05\x80\xdf\x9773\xae\x80\x1e\x0e\
-\x8eT\xdf#\x09\x00+\xe9H\xc0\x1ew}T\xcc\xf7\
-\xff\x00\xec\xb02\x1e\x01\xe0\x06:\x12\xb0\xef=\x80\x02\
-\x8f\xec\x08X\xee\xeb\x0d\xff}\x18W@\x0b7\xc4#\
-\x00$I-t&`\x8f'2+=\x11\x00^\xca\
-\xafc<\x01=\xa8\x9a\x9d4\xea\x00`\x85\x80\x0dt\
-(`\x8f\xcb\x93\xb3E\x85\xfc\xf5\xec\xe6\xd6\xdb? \
-\xaeO\xe7\xed\x7f@\x13\x1b\x22\xa9\xed\x91\x06\x80\xfb\xe8\
-P\xc0>\xcffW\xbb:\x00\xbc_\xdb\xc68\x02\xfa\
-\xb8/\x9e\x01`\x924@\xa7\x02\xf6\xb8\x22%[\xd4\
-\xbb\xf4x`\xf5\xeb\xff\xb6\xdd\x05\x8c#\xa0\x07U\xab\
-'\xc5-\x00X!\xe0\x18\x1d\x0b\xd8\xe7\xd1\xe3\xee|\
-\x17\xe0W\x1c\xfd\x0b\xe8\xe4X\xa4u=\x9a\x00\xb0\x9a\
-\x8e\x05\xec\xf5Zq\xa3\xab\x8a\x7fiw |\xf7\x82\
-\xb1\x03\xb4\xb1\xda\x8e\x00p\x13\x1d\x0b\xd8\xffY\xe0\xf6\
-\x86N\xd7\x04\x80\xffw\xb0\x94q\x03\xf4r\x93\x1d\x01\
-@\x1d\x0f\xdcA\xe7\x02\xf6\x9a\x99\x96#\x0a\xbb\x02\xda\
-\x17\xff\x97\x0b\xea\x19/@/\xaaF\x8f\x89{\x00\xb0\
-B\xc0f:\x18\xb0\xdf\xfc\xdd\x05\xa2\xda\xaf\xef\xa7\x81\
-\xbf-\xe3\xc8_@C\x9b\xa3\xa9\xe9\xd1\x06\x00>\x07\
-\x04\x1cr\xdd\xf6\x5c\xb1\xaf\xb9K\xbb\xe2\xbf\xb9\xba\x95\
-\x1d\xff\x00\x17\x7f\xfe\x17k\x00\xb8@\xea\xa5\x93\x01\xe7\
-6\x09z\xa3D\x9f\x17\x03\xff\xb3\xa29\xfcgbl\
-\x00\xed\xa8\xda|\x81m\x01\xc0\x0a\x01\xef\xd3\xd1\x80\xb3\
-\x1e9^!\xba\x83\xfd\x09+\xfcM\xbdA\xb1\xfcH\
-9c\x01\xe8\xeb\xfdh\xeby,\x01\xe0^:\x1ap\
-\x9e\xdaj\xf7\xcd\xd2&\xe1\x0f9\x1b\x04v4v\x8a\
-\x1b\xd2\xf3\x18\x03@o\xf7:\x11\x00\xce\x97z\xe8l\
- 1T1\xfe]Y\x93\xe8\xb11\x08\x04\x07\x06\xc4\
-\xb6\xdavqOF1}\x0e\xe8O\xd5\xe4\xf3m\x0f\
-\x00V\x08\xd8B\x87\x03\x89u\xe3\x8e<\xb1*\xb7V\
-\xec\x96\xbf\xd0\xe3uW@\x1d\xe9\xbb\xa6\xa4Q\xcc\xd9\
-\x99O\x1f\x03\xee\xb1%\x96Z\x1ek\x00XL\x87\x03\
-\xfa\xb82%[\xdcw\xa8L\xbcU\xda$\x0e\xb6t\
-\x8b\x92\xee\x80h\xef\x0b\x89\x813\x14z\x15\x18\xeaz\
-\xfa\xc4\x91V\x9fX+\xff\x99\x87\x8eV\x88\xafs\x9b\
-\x1fp\xab\xc5N\x06\x80\xf3$\x1f\x9d\x0e\xe8mzr\
-v\xf8\xd7\xfc\x82\x8f\x8a\xc4\x1d{\x0b\xc3w\x0d\xaed\
-\xeb^\xc0KT->\xcf\xb1\x00`\x85\x80\x8dt<\
-\x00\x00\x09\xb51\xd6:>\x9a\x00p7\x1d\x0f\x00@\
-B\xdd\x9d\x88\x00p\xae\xd4E\xe7\x03\x00\x90\x10\xaa\x06\
-\x9f\xebx\x00\xb0B\xc0{\x0c\x00\x00\x00\x09\xf1\xdeh\
-j\xf8h\x03\xc0\xed\x0c\x00\x00\x00\x09q{\x22\x03@\
-\x92T\xc1 \x00\x00\xe0(U{\x93\x12\x16\x00\xac\x10\
-\xf0<\x03\x01\x00\x80\xa3\x9e\x1fm\xfd\x8eG\x00\x98,\
-\x85\x18\x0c\x00\x00\x1c\xa1j\xee\xe4\x84\x07\x00+\x04l\
-c@\x00\x00p\xc4\xb6x\xd4\xeex\x05\x80\x05\x0c\x08\
-\x00\x00\x8eX\xa0S\x008[\xaaaP\x00\x00\xb0\x95\
-\xaa\xb5gk\x13\x00\xac\x10\xb0\x8a\x81\x01\x00\xc0V\xab\
-\xe2U\xb7\xe3\x19\x00\xa6H\x03\x0c\x0e\x00\x00\xb6P5\
-v\x8av\x01\xc0\x0a\x01\xa9\x0c\x10\x00\x00\xb6H\x8dg\
-\xcd\x8ew\x00\xb8\x87\x01\x02\x00\xc0\x16\xf7\xe8\x1c\x00\xce\
-\x91\x1a\x18$\x00\x00\xe2J\xd5\xd6s\xb4\x0d\x00\xec\x0c\
-\x08\x00\x80-\x9e\x8fw\xbd\xb6#\x00\x5c$\xf9\x19,\
-\x00\x00\xe2B\xd5\xd4\x8b\xb4\x0f\x00V\x08X\xc3\x80\x01\
-\x00\x10\x17k\xec\xa8\xd5v\x05\x80\xa9R?\x83\x06\xe8\
-cZr\x96\xb8!=O\xcc\xdbU \xaeN\xcd\xa1\
-O\x00wP\xb5t\xaak\x02\x80\x15\x02\xb62p\x80\
-\xb3Ta\xff\xd1\xd1r\xb1\xb6\xb4I\xfc\xb1\xa6M\xec\
-k\xee\x12\xf9\x9d=\xa2\xa97(B\x03\x03bp\xf3\
-\x87\xfaE\x85\xafW\x1cm\xf3\x89\x94\xfa\x0e\xf1nE\
-\x8bX\x99S+\xe6\xef.\xa0/\x01}l\xb5\xabN\
-\xdb\x19\x00\xe60p\x80\xfd\xee\xd8[(~\x91W'\
-\xf6\xcbb\xdf\xd7\xff\xd9\x22\x1fk+\xeb\x0e\x88\xb7\xcb\
-\x9a\xc5\xfd\x87\xcb\xc4\x95)\xd9\xf43\x908s\x5c\x17\
-\x00\xac\x10p\x80\xc1\x03\xe2\xef\x9a\xb4\x1c\xf1\xeb\xa2\x06\
-Q\xdb\xd3'\xecn\xeaN\xc1\x07u\xed\xe2v\x194\
-\xe8{\xc0Q\x07\xec\xac\xd1v\x07\x006\x06\x02\xe2\xe8\
-\xaa\xd4\x1c\xf1\xcb\xfc:\xd1\xd6\x17\x12N7\xf5\x08\xe1\
-\xbf\xabZ\xc57w\xe63\x16\x80\x0b7\xfeq:\x00\
-\xa8S\x02K\x19D`t\xa6'g\x8b\xe7\xb3kD\
-C (\x12\xdd\x02\xfd\x03\xe2\xad\xd2&\xf1\xb5\xed\xb9\
-\x8c\x0d`\x1fU;\xcfvm\x00\xb0B\xc0#\x0c$\
-\x10\xbb\xc5\x19%\xa2\xd2\xd7+tk\x1d}!\xf1\x93\
-\x93U\x8c\x11`\x8fG\xec\xae\xcfN\x04\x80\xf3\xa4V\
-\x06\x13\x88\xdes\xf2W\x7f\xbc^\xec\xb3\xab\xfd\xb6\xac\
-)\xfc\x89!\xe3\x05\xc4\x8d\xaa\x99\xe7\xb9>\x00\xb0=\
-0\x10\xdb-\xff\x0d\x95-\xc2-mwc\xa7\x98\x95\
-\xc6#\x01 N\x9ew\xa26;\x15\x00&H-\x0c\
-*0\xb2o\xa4\xe7\x89\xa3\xad>\xe1\xb6V\xd2\x1d\x10\
-\xb7\xb2\x87\x000Z\xaaVN\xf0L\x00\xb0B\xc03\
-\x0c,0\xbc;\xf7\x15\x89z\x07>\xed\xb3\xab\xb5\xf7\
-\x85\xc4\xf7\x0f\x940\x96@\xec\x9eq\xaa.;\x19\x00\
-\xd4\xbb\x00\x1c\x15\x0c\x9c\xc1\x8d;\xf2\x1c\xf9\xae\xdf\xee\
-\xa6>Qd7A &\x0dN<\xfbw<\x00X\
-!\xe0\x09\x06\x18\x18\xfa\xfb\xfe\x13\xed~\xe1\x95V\xd8\
-\x15\x103\xd38o\x00\x88\xd2\x13N\xd6d\xa7\x03\xc0\
-8\xa9\x86A\x06>u\x99\xa4v\xda\xf3ZKo\xe8\
-\xe4\xeb\x00 r\xaa6\x8e\xf3l\x00\xb0B\xc0\x8f\x19\
-h\xe0S\xbf)n\x10^mo\x9442\xc6@d\
-~\xect=ND\x00\x18+U0\xd8@\x96x<\
-\xb3Rx\xbd=!\xff\x8e\x8c50,U\x13\xc7z\
->\x00X!`9\x03\x0e\xd3\xa9\x03}Zz\x83\x9e\
-\x0f\x00\xcd\xf2\xef8#\x95\xf7\x01\x80a,OD-\
-NT\x00\x18#\x153\xe80\xd9k\xc5\x8d\xc2\x94\xf6\
-jQ\x03c\x0e\x0cM\xd5\xc21\xc6\x04\x00+\x04,\
-a\xe0a\xaa\xd9;\xf2\xc2\xc7\xec\x9a\xd2|\xf2\xef\xfa\
-\xf5\xf4<\xc6\x1e8\xdd\x92D\xd5\xe1D\x06\x80$)\
-\x93\xc1\x87\x896V\xb5\x0a\xd3\xda\xfa\xf2f\xc6\x1e\xf8\
-,U\x03\x93\x8c\x0b\x00V\x08\x98\xcb\x04\x80i\xee\xd8\
-[(B\x03\x03\xc6\x05\x00u\xa8\xd1\xbc]l\x10\x04\
-\x0c27\x9158\xa1\x01\xc0\x0a\x01\x9b\x99\x040\xc9\
-\x87u\x1d\xc2\xd4\xa6\xee|0\x07\x80\xb0\xcd\x89\xae\xbf\
-:\x04\x80)R\x80\xc9\x00\x13|5%\xdb\xa8g\xff\
-C}\x11p\x19\xf3\x00P5o\x8a\xf1\x01\xc0\x0a\x01\
-\xab\x99\x100\xc1\xf2#\xe5\xc2\xf4\xb6p\x7f1s\x01\
-\xa6[\xadC\xed\xd5%\x00\x8c\x97\xea\x98\x14\xf0\xbaw\
-+Z\x8c\x0f\x00\xbf\xe2\x93@\x98M\xd5\xba\xf1\x04\x80\
-\xcf\x86\x80eL\x0cx\x9d\x17N\xfb\x1bm\xcbl\xf3\
-3\x17`\xb2e\xba\xd4]\x9d\x02\xc0Y\xd2a&\x07\
-\xbc\xea;\xfb\x8a\x04M\x88\xfe\x01!\xaeO\xcfeN\
-\xc0D\xaa\xc6\x9dE\x00\x18:\x04\xccf\x82\xc0\xab^\
-.\xa8\xa7\xfa[\xed\xc9\xcc*\xe6\x04L4[\xa7\x9a\
-\xabU\x00\xb0B\xc0\x06&\x09\xbchKu\x1b\x95\x9f\
-\xad\x81a\xae\x0d\xba\xd5[\x1d\x03\xc0%\x92\x8f\xc9\x02\
-\xaf\xd9\xd3\xd4E\xe5\xb7\xda\x86\xca\x16\xe6\x04L\xa2j\
-\xda%\x04\x80\xc8B\xc0SL\x18xMnG\x0f\x95\
-\xdfji\xf5\x1d\xcc\x09\x98\xe4)\x1dk\xad\xae\x01\xe0\
-l\xe9\x08\x93\x06^\xd2\x18\x08R\xf9\xadv\xac\xcd\xc7\
-\x9c\x80)T-;\x9b\x00\x10]\x08\x98)\x05\x99<\
-\xf0\x82i\xc9YF\xee\xff\x7f\xa6V\xe5\xefe^\xc0\
-\x04\xaa\x86\xcd\xd4\xb5\xcej\x1b\x00\xac\x10\xf0\x12\x13\x08\
-^\xa0\x8e\xc2\xa5}\xda\xd4v\xc8\xcc\x0b\x18\xe0%\x9d\
-k\xac\xee\x01`\x9cT\xc8$\x82\xdb\xdd\xbe\xb7\x90\xaa\
-\x7fJ\xbb*5\x87\xb9\x01/S\xb5k\x1c\x01`\xf4\
-G\x06\x0f0\x99\xe0f\xdf\xdc\x99O\xc5\x1f\xd4\xd4\xe3\
-\x10\x0e\x05\x82\x87\xa9\x9a5W\xf7\xfa\xaa}\x00\xb0B\
-\xc0\x9bL(\xb8\xd9\x95)\xd9T\xfdA\xad\xa97\xc8\
-\xbc\x80\x97\xbd\xe9\x86\xda\xea\x96\x000Q\xaaeR\xc1\
-\xcd:\x83!*\xbf\xd5\x0a:{\x98\x13\xf0*U\xab\
-&\x12\x00\xe2\x1b\x02\x162\xb1\xe0fe\xbe^*\xbf\
-\xd52\x9a\xbb\x99\x13\xf0\xaa\x85n\xa9\xab\xae\x09\x00V\
-\x08\xd8\xc2\xe4\x82[\x1dm\xf5Q\xf9\xad\xf6Am;\
-s\x02^\xb4\xc5M5\xd5m\x01`\x92\xd4\xc4$\x83\
-\x1b\xa5\xd6wP\xf9\xad\xf6\x9f\x15\xcd\xcc\x09x\x8d\xaa\
-M\x93\x08\x00\xf6\x86\x80\x05L4\xb8\x91\xda\xff\x9e\xf6\
-q\xfb\xf7B\x0e\x03\x82\xe7,p[=u]\x00\xb0\
-B\xc0\xebL6\xb8\xcd/\xf2\xea\xa8\xfcV{\xf4x\
-%s\x02^\xf2\xba\x1bk\xa9[\x03\xc0\xe7\xa4|&\
-\x1d\xdc\xe4\x0e6\x03\xfa\xd3\x1e\x00\xd7n\xcfeN\xc0\
-+T-\xfa\x1c\x01\xc0\xd9\x100K\xeac\xf2\xc1M\
-\xaa\xfd}\xc6\x07\x80C-|\x01\x00\xcfP5h\x96\
-[\xeb\xa8k\x03\x80\x15\x02\x9ef\x02\xc2M\xde\xad\xe0\
-=\x80\x7f\xce\xafc.\xc0+\x9evs\x0du{\x00\
-H\x92v0\x09\xe1\x16\x7f{\xa4\xdc\xf8\x00p\xe7\xde\
-\x22\xe6\x02\xbc@\xd5\x9e$\x02@bC\xc0d\xa9\x95\
-\xc9\x087\xb8:5G\x04\xfa\xcd=\x16\xb8\xa6\xa7\x8f\
-y\x00/P5g\xb2\xdb\xeb\xa7\xeb\x03\x80\x15\x02\x16\
-1!\xe1\x16{\x9a\xba\x8c\x0d\x00\xea\x11\x08s\x00\x1e\
-\xb0\xc8\x0b\xb5\xd3\x13\x01\xc0\x0a\x01o3)\xe1\x06\x0f\
-\x1c.3\xb2\xf8\x07\x07\x06\xc4\xad\xbb\x0b\x98\x03p\xbb\
-\xb7\xbdR7\xbd\x14\x00\xc6K\xb9LN\xb8\xc1\xbef\
-\xf3\xee\x02\xb0\xfb\x1f<@\xd5\x98\xf1\x04\x00=C\xc0\
-4\xa9\x83I\x0a\xdd}w_\x910\xe9U\x80\xae`\
-\xbf\xf8zz\x1ec\x0f7S\xb5e\x9a\x97j\xa6\xa7\
-\x02\x80\x15\x02\xee\x92\x06\x98\xac\xd0\xdd\xa6\xeaVc\x02\
-\xc0\xbf\x16\xd43\xe6p3US\xee\xf2Z\xbd\xf4\x5c\
-\x00\xb0B\xc0j&,t7gg\xbe\xf0\x87\xfa=\
-_\xfc\xeb{\xfa\xc4U\xa99\x8c9\xdcl\xb5\x17k\
-\xa5W\x03\x80\xda\x1f \x85I\x0b\xdd\xbdZ\xd4\xe0\xf9\
-\x00\xf0\xf7'\xaa\x18k\xb8Y\x8a\xdb\xbf\xf77*\x00\
-X!\xe0B\xa9\x9c\xc9\x0b\x9d]\x9e\x9c-R<|\
-L\xf0\x9a\x92F\xc6\x19n\xa6j\xc8\x85^\xad\x93\x9e\
-\x0d\x00\x83\xce\x0b\xe8a\x12CgW\xa6d\x8b\x03-\
-\xdd\x9e+\xfe\x1b\xabZ\x19_\xb8\x99\xaa\x1d\xb3\xbc\x5c\
-#=\x1d\x00\xac\x10\xb0\x8c\x89\x0c\xdd]\x93\x96#r\
-;z<S\xfc\xd3\x1b:\xc3w7\x18[\xb8\xd82\
-\xaf\xd7G\xcf\x07\x00+\x04\xbc\xc6d\x86\xee\xbe\x91\x9e\
-'*}\xbd\xae/\xfeG[}\xbc\xf4\x07\xb7{\xcd\
-\x84\xdahJ\x00\x18+\xedgRCw\xb7\xec.\x10\
-\xb5=\xee=2\xf8d\xbb_|m{.c\x097\
-S\xb5b,\x01\xc0[!\xe0b\xa9\x8c\xc9\x0d\xdd\xa9\
-\x02\x9a\xe6\xc2\x17\x03\xd7\x977\x8b+R\xb8\xed\x0fW\
-S5\xe2bS\xea\xa21\x01\xc0\x0a\x01\xd3\xa56&\
-9\xdc\xe0g95\xae89\xb03\x18\x12\x0f\x1f\xab\
-`\xcc\xe0v\xaa6L7\xa9&\x1a\x15\x00\xac\x100\
-O\xeac\xb2\xc3\x0d\xee\xdc[$\x0a\xbb\x02\xda\x16\xff\
-\xac\x0e\xbf\x98\xcf\x01?p?U\x13\xe6\x99V\x0f\x8d\
-\x0b\x00V\x08X\xca\x84\x87[\xa8\x17\xea~_\xde,\
-z5\xba\x1b\xa0\xeeL\xac-m\xe2\x96?\xbcb\xa9\
-\x89\xb5\xd0\xc8\x00`\x85\x80\x15Lz\xb8m\xeb\xe0\xb7\
-\xcb\x9a\x13\xba}\xb0*\xfc*\x8c\xdc\xb8\x83\x83}\xe0\
-\x19+L\xad\x83\xc6\x06\x00+\x04\xacg\xf2\xc3m\xd4\
-\xa9z\xaf\x974\x8a\xee`?\x85\x1f\x18\x9d\xf5&\xd7\
-@\xd3\x03\x80\xfa<p'\x17\x01\xdc\xfa\xb5\xc0\xea\xbc\
-:\xb1\xb7\xa9K\xf4\xd8pW 80 \x0e\xb5t\
-\x87O\xf2\xa3\xf0\xc3\x83v\x9a\xf2\xb9\x1f\x01\xe0\xcc!\
-`\xa2\x94\xcb\xc5\x00\xb7o'\xbc\xf4P\x99x\xa3\xa4\
-1\xfcb^\xac\xaf\x0b\xa8\x8d\x88\xde\xadh\x11\x0f\x1d\
-\xad\x103\xd3\xd8\xcc\x07\x9e\xa5\xd6\xfc\x89\xa6\xd7?\xe3\
-\x03\x80\x15\x02\xa6H\x0d\x5c\x14\xf0\x8aYi\xb9\xe2\x8e\
-\xbd\x85b\xc9\xc1R\xf1\xd8\xf1J\xb12\xa7V\xfc\xba\
-\xa8A\xbcW\xd9\x22\xb6V\xb7\x89\xb7J\x9b\xc4K\xf9\
-u\xe2\xa9\x13Ub\x99\x0c\x0ew\xee+\x0a?Z\xa0\
-\xef`\x00\xb5\xd6O\xa1\xf6\x11\x00\x06\x87\x80k\xa5\x0e\
-.\x0e\x00\xf0,\xb5\xc6_K\xcd#\x00\x0c\x15\x02\xe6\
-H>.\x12\x00\xf0\x1c\xb5\xb6\xcf\xa1\xd6\x11\x00\x86\x0b\
-\x01\xb7I\x01.\x16\x00\xf0\x0c\xb5\xa6\xdfF\x8d#\x00\
-D\x12\x02\xbe'\x05\xb9h\x00\xc0\xf5\xd4Z\xfe=j\
-\x1b\x01 \x9a\x10\xf0\x03\xa9\x9f\x8b\x07\x00\x5cK\xad\xe1\
-?\xa0\xa6\x11\x00b\x09\x01\xcb\xa5\x01.\x22\x00p\x1d\
-\xb5v/\xa7\x96\x11\x00F\x13\x02\x1e\xe7B\x02\x00\xd7\
-y\x9c\x1aF\x00\x88G\x08x\x8e\x8b\x09\x00\x5c\xe39\
-j\x17\x01 \x9e!\xe0\x97\x5cT\x00\xa0\xbd_R\xb3\
-\x08\x00\x84\x00\x00\xa0\xf8\x83\x00\xc0\xe3\x00\x00\xe0\xb6?\
-\x08\x00\xa3\x7f1\x90\xaf\x03\x00@\x8f\xb7\xfdy\xe1\x8f\
-\x00\xe0\xf8'\x82\xec\x13\x00\x00\x89\xfd\xce\x9fO\xfd\x08\
-\x00\x09\xdb,\x88\x1d\x03\x01 1;\xfc\xb1\xc9\x0f\x01\
- \xe1\xdb\x06sv\x00\x008'\xc0\xf6\xbe\x04\x00\x9d\
-\x0e\x10\xe2\x14A\x00\xb0\x9fZk9\xd8\x87\x00\xa0\xdd\
-Q\xc2\x1d\x5c\x9c\x00`\x1b\xb5\xc6r\xa4/\x01@\xcb\
-\x10p\xad\xd4\xc0E\x0a\x00q\xa7\xd6\xd6k\xa95\x04\
-\x00\x9dC\xc0\x14)\x97\x8b\x15\x00\xe2F\xad\xa9S\xa8\
-1\x04\x007\x84\x80\x89\xd2N.Z\x00\x185\xb5\x96\
-N\xa4\xb6\x10\x00\xdc\x14\x02\xc6J\xeb\xb9x\x01 f\
-j\x0d\x1dKM!\x00\xb85\x08\xac\xe0\x22\x06\x80\xa8\
-\xad\xa0\x86\x10\x00\xbc\x10\x02\x96J}\x5c\xd0\x000\x22\
-\xb5V.\xa5v\x10\x00\xbc\x14\x02\xe6Im\x5c\xdc\x00\
-pFj\x8d\x9cG\xcd \x00x1\x04L\x97\xca\xb8\
-\xc8\x01\xe04jm\x9cN\xad \x00x9\x04\x5c,\
-\xed\xe7b\x07\x80?Qk\xe2\xc5\xd4\x08\x02\x80)_\
-\x08\xfc\x07\x17=\x00\x84\xd7B\xde\xf4'\x00\x18\xf9r\
-\xa0\x9f\x05\x00\x80\x81\xfc\xbc\xecG\x000=\x04\xcc\x94\
-JY\x0c\x00\x18D\xady3\xa9\x01\x04\x00B\xc0\x87\
-Y\x9f\x97\xfe\x8fE\x01\x80\x01\xd4Z\xf7y\xd6~\x02\
-\x00>\x0d\x01I\xd2Ji\x80\x05\x02\x80\x07\x0dXk\
-\x5c\x12k>\x01\x00C\x07\x81;\xd9/\x00\x80\x07\xbf\
-\xef\xbf\x935\x9e\x00\x80\x91C\xc0\xa5\xd2\x09\x16\x0d\x00\
-\x1e\xa0\xd6\xb2KY\xdb\x09\x00\x88<\x04\x9c+\xada\
-\xf1\x00\xe0bj\x0d;\x975\x9d\x00\x80\xd8\x82\xc0\x02\
-\xa9\x89\x85\x04\x80\x8b\xa85k\x01k8\x01\x00\xa3\x0f\
-\x01\x7f.\xa5\xb2\xa8\x00p\x01\xb5V\xfd9k7\x01\
-\x00\xf1\x0b\x01gIOJ\xbd,0\x004\xd4k\xad\
-Qg\xb1f\x13\x00`O\x10\x98!\xe5\xb2\xd8\x00\xd0\
-\x88Z\x93f\xb0F\x13\x00\xe0\xcc\x0b\x82\xaf\xb1\xe8\x00\
-\xd0\xc0k\xbc\xe8G\x00\x80\xf3A\xe0\xbbR#\x0b\x10\
-\x80\x04Pk\xcfwY\x8b\x09\x00H\x5c\x08\x98$m\
-a1\x02\xe0 \xb5\xe6Lb\x0d&\x00@\x8f \xb0\
-P\xaaea\x02`#\xb5\xc6,d\xcd%\x00@\xbf\
-\x100Qz\x93\xf3\x04\x00\xd8\xb0\x8f\xbfZ[&\xb2\
-\xd6\x12\x00\xa0w\x10\x98+\x15\xb2h\x01\x88\x03\xb5\x96\
-\xccem%\x00\xc0=!`\x9c\xf4\x92\x14d\x01\x03\
-\x10\x83\xa0\xb5\x86\x8ccM%\x00\xc0\x9dA`\xa6t\
-\x84\xc5\x0c@\x14\xd4\x9a1\x935\x94\x00\x00\xf7\x87\x80\
-\xb3\xa5\xa7$\x1f\x0b\x1b\x80a\xf8\xac\xb5\xe2l\xd6N\
-\x02\x00\xbc\x15\x04.\x916\xb0\xc8\x01\x18\x82Z\x1b.\
-a\xad$\x00\xc0\xdbA`\xb6t\x98\x05\x0f\x80\xb5\x16\
-\xccfm$\x00\xc0\xac\xc3\x85\x96Iu,\x80\x80\x91\
-\xea\xac5\x80\xc3{\x08\x0004\x08\x8c\x97VK\x01\
-\x16D\xc0\x08\x01\xeb\x9a\x1f\xcf\x1aH\x00\x00T\x10\x98\
-\x22mfq\x04<M]\xe3SX\xf3@\x00\xc0\x99\
-6\x11\xcad\xa1\x04<%\x93\xcd|@\x00@$!\
- IZ\x22\x15\xb3p\x02\xaeVl]\xcbI\xacm\
- \x00 \x9a 0FZ.U\xb0\x90\x02\xaeRa\
-]\xbbcX\xcb@\x00\xc0h\x82\xc0X\xe9\xc7R\x0d\
-\x0b+\xa0\xb5\x1a\xebZ\x1d\xcb\xda\x05\x02\x00\xe2}\xbe\
-\xc0\x13R\x03\x0b-\xa0\x95\x06\xeb\xdad\xdf~\x10\x00\
-`k\x108OzFja\xe1\x05\x12\xaa\xc5\xba\x16\
-\xcfcm\x02\x01\x00N\x06\x81\x09\xd2\xf3R+\x0b1\
-\xe0\xa8V\xeb\xda\x9b\xc0Z\x04\x02\x00\x12}G\xe0\x11\
-\xa9\x84\x85\x19\xb0U\xa9u\xad\xf1\x8b\x1f\x04\x00hw\
-\xea\xe0=\xd2\x01\x16j \xae\x0eX\xd7\x16\xa7\xf4\x81\
-\x00\x00\xed\xc3\xc0\x1ci\xab\xd4\xcf\xe2\x0d\xc4\xa4\xdf\xba\
-\x86\xe6\xb0\xa6\x80\x00\x007\x06\x81\xa9\xd2\x1a\xc9\xcf\x82\
-\x0eD\xc4o]3SYC@\x00\x80\x17\x82\xc0E\
-\xd6KK|B\x08\x9c\xf9S>u\x8d\x5c\xc4\x9a\x01\
-\x02\x00\xbc\x18\x04\xce\xb1\x9ee\xa6J\x03,\xfa0\xdc\
-\x80u-\xa8k\xe2\x1c\xd6\x08\x10\x00`\xd2\x09\x84\xab\
-\xd8a\x10\x86\xee\xd8\xb7\x8a\x93\xf9@\x00\x00_\x0f|\
-\x98\xb5@\xda&\x85(\x0e\xf0\xa8\x905\xc7\x17\xf06\
-?\x08\x00\xc0\xe9a`\xb2\xf5\x1c\x94\x03\x88\xe0\xa5\x83\
-y\xd4\x9c\x9e\xcc5\x0e\x02\x000r\x10PG\x12\xdf\
-.\xbd'uQD\xe02]\xd6\xdc\xbd\x9d\xa3xA\
-\x00\x00b\x0f\x03\xe7JwK\x1b%\x1f\xc5\x05\x9a\xf2\
-YsT\xcd\xd5s\xb9vA\x00\x00\xe2\xbf\xed\xf0b\
-i\x8b\xd4C\xd1A\x82\xf5Xsq1\xdb\xf3\x82\x00\
-\x008\x17\x06\xce\x97\xee\x95\xde\x97z)FpH\xaf\
-5\xe7\xd4\xdc;\x9fk\x11\x04\x00 \xb1a\xe0\x02\xe9\
->i\xb3\xd4A\x91B\x9cuXsK\xcd\xb1\x0b\xb8\
-\xe6@\x00\x00\xf4\x0c\x03c\xa4\x9b\xa4\xd5\xd216\x1c\
-B\x8c\x1b\xf4\x1c\xb3\xe6\x90\x9aKc\xb8\xb6@\x00\x00\
-\xdc\x17\x08&Y\xbf\xdc6H-\x147\x9cA\x8b5\
-G\xd4\x5c\x99\xc4\xb5\x03\x02\x00\xe0\xbd\xcf\x0bo\x90V\
-J\x079\xad\xd0\xf8\xd3\xf6\x0eZs\xe1\x06>\xd7\x03\
-\x01\x000+\x10L\x90\xfe\xc2*\x02\xdb\xd9s\xc0\xf3\
-\xdf\xe6o\xb7\xc6Z\x8d\xf9\x04\xae\x01\x10\x00\x00\x0c\xde\
-\x96\xf8\x1a\xe9a\xebvp%\x85\xd3\xb5*\xad1|\
-\xd8\x1aS\xb6\xdf\x05\x08\x00@T\xa1\xe0\x8b\xd6w\xde\
-\xafJ\x87\xd9\x7f@\xdb\xef\xf1\x0f[c\xa4\xc6\xea\x8b\
-\xcc]\x80\x00\x00\xd8q\x97\xe0r\xab\xd0\xbch\x1d\xf0\
-\xc2\xd9\x05\xce\xfe\xb2\xff_\xab\xef\xd5\x18L\xe7\xd7=\
-@\x00\x00\x12\x19\x0c&Z\x9f\x8c\xa9[\xcek\xad\x17\
-\xcc\xd8\xba8v~\xe9\x90\xf4\x96\xf4\x88t\xb3\xf4y\
-\xe6\x1a@\x00\x00\xdc\xf2\xd5\xc1\x97\xac\xe2\xb5LZ!\
-\xad\x93v[\xbfd\xfb\x0d\x7f\x0b\xbfJ\xda#\xad\xb7\
-^\xce\xbb_\x9a+}\x99\xb7\xf2\x01\x02\x00\xe0\xe5\x80\
-p\x8e\xf4\x15\xe9\x16\xe9\x01i\x95\xf4\x8e\xf5\xb6\xfaq\
-+$\xf8\x5c\xfa\xeb]\x15\xf7L)]z\xd7\xbae\
-\xbf\x5c\xbaU\xbaT\x1a\xcb\x1c\x00\x08\x00\x00\x86\x0f\x0a\
-\xe3\xa4/HWK\xf3\xa5E\xd2\x83\xd2\xb3\xd2+\xd6\
-]\x85M\xd6\xfb\x08)\xd2.)C:*eKE\
-\xd6{\x0a\xf5R\x9b\x15*B\x16\x9f\xf5\x7f\xab\xb7\xfe\
-7E\xd6?s\xd4\xfaw\xec\xb2\xfe\x9d\xdb\xac\xff\xc6\
-:\xeb\xbf\xf9\xac\xf5gXd\xfd\x99f\xa83\xef9\
-\x09\x0fp\x87\xff\x0fF;\x00e.\x90\xb6W\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x007\x8f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
-\x00\x007VIDATx\xda\xed]\x07\x9c\x14E\
-\xd6\x7f\xdd=y\xf3\xb2\x11vI\x12]@\x14$\x09\
-\x08\x0a\x02\x22A\x05\x03\xeay\x9c(\x9e\x01\x13\x82\xa2\
-pD\x13\xe6\x03s\x0e`\xe0\x94,b -\x08H\
-\x92\x9c\xc3f6\x87\xc9\xd3\xe1\xab\xaa\xee\x9e\xe9\x99\xed\
-\x99\xe9\xd9\x9dE\xee>\x1f\xbf\xa6{zg\xba\xab\xea\
-\xfd\xeb\xd5KUE\xc1\xff\x13\x9a\xb5c4\x15\xc9\xf7\
-\xe7\xf6^)\xfc\xd9e\xbe\x10\x14Q\xa3\x5c,4k\
-\xbb\xc8L\x91C>>Qn]\x12m\x80f\x14M\
-\xc7\x83 \xc4\xa3[q\xe8\x88A\x87\x19\xd5\xd4\x88\xbe\
-aB\xdf7\x06\xa9\xbb\xf4 \xca\x85.\x9d\xe8\x93\x13\
-}\xc0\x87\x0d\x1du\xe8\x8f\xb5\xe8\x99\xb5\x9c[\xa8\x00\
-\x03W\xa5lB\xf9As\xfb\xfc\xf7\x81\xe6\xa2\x05\xc0\
-\xac\xedc(\xcc\x13/\x93\x1dT\x12c\xd1\xb5\xa7(\
-\xaa=\xe7\xa4[3z:[\xa7\xa3\xb3\xd0\xdfZ\xa0\
-/\xa4\xa1\xfb\xcd\xd0\xd9\xa0\xf6,\xf9)\x88\x81\xbe\xeb\
-\xa0\x0d\x82^KQ\xbekur\x09\x82P\x89\xce\xa5\
-\xe8(\xe4Y\xa1\x80e\xf9|\xda\xc0\x9dAO?\xe9\
-v\xb1\xc7\x19\x83P\xadx\xe2E\x0b\x8e\x8b\x06\x00\xb3\
-~\x1bC\x89\xcc\x11\x80\xf6\xd0\x19\xb4\x89\xb9\x8a\xe2\xe8\
-\x1e\x8c\x8e\xb9\x1c\x15\xb3\x1bbp\xa6\xf8M\x01x\x81\
-'\x07\xbaB<\xe5\xf1\xff\xd2\xb5\xcc`|M\xbe\x19\
-\xa5F\xa2%L\xd0\x84\x9d\xa8,\xe4\x1e\xf9D\xd1\xe2\
-5%\x1er\x93\xa2\xb2\x14\xa1\xd3~\x96\xf7\xecE\x9f\
-\xf6\xb8=\x9e\x5c\x9a\x81\xf3^@\xf4\xbd8\x00\xf1\xa7\
-\x02@f\xba\xcb\xce7\xb3\xc4\x1a\xae\xd3\xb1\xcc`\xda\
-\xc0\x0cF\xad\xda\x16\x97Md4\x0b\x9c\xc0\x913f\
-5\x8f\xae/f\xa2)\x86@\x83\xa6t\xc0\xe0kt\
-\x16\x81\x81\xb1)\x9c\xe6\xdd\xdc\x06V\xc7n\xb0[\xdd\
-\xeb\x8d\x16\xa6\x02\xffa\xde\x9f\x08\x86\x0b\x0e\x00\xcct\
-\xf2b\x81\x8a\xa1\x19z4C\xe9'\xd04=\x14\xdd\
-2`\xe6\xa2\x1e\x83\x18\xce\x92\x03\xf7\xee\xff\x05\xc2R\
-\x82!\x80\xd0\x81\x8e\xd6\x13\x90 <\xb8\x05^X\xef\
-\xe1=K\x04\x81[\x89d\x96\x1dK\x96\xb9}V\x5c\
-P0\x5c\x10\x00\xcc\xfam\xac4\x9e\x0b\x88\xf1L7\
-\x9a\xa5\x1e\xd0\x99\x0d\x13P}c9\x1e3\xddM\x0e\
-\x1e.\xee\xde\x1d-Bp@@0\x90\x83A\xe3\x02\
-\x1a\xae\xacn\xb7g\x09Es\x8b\x91\x8c; k \
-s\xfb6=\x18\x9a\x14\x00J\xc6\xeb\x04]_\x8af\
-\xe6\xa01\xfdZ4>R\x1e\xde\x05\xf8\xb8\xd8Ez\
-S\x13\x96\x06z\xdaH\x0e$\x01\x04\x9e\xe3~\xe18\
-v&Gq;(\xc2~\x04\x84~M\x07\x84&\x01\
-\xc0\xacm>\xc6#\x83\xaa\x9d\xc1l|\x8d\xd13#\
-1\xb3\xdd\x9c\xc8x\x80\x8bB\x07\xba\x88\x88\x02\x03\x06\
-\x02c$\xa0`=\xecj\x8f\xc3\xfd82\x5cOz\
-\x15\xc7&\x00B\xd4\x01\x80\x99\x8f\x19\xcf\xda=:S\
-l\xccTd\xaa\xcdD=\xde\xec\xe2\x9c\x88\xf1\xce\x0b\
-\xd2\x94\xff\xed\xa4\xa7M`dL\x98\xedv\x96\xe3\xe6\
-9\xad\xf6Wt\x16\x1d\x8b\xd95/\xca \x88\x1a\x00\
-f\xfdv#%*m\x026\x8bZ\xe9\x18\xc3W\x0c\
-M\xf7\xc6\xbd\xdd\xc5\xd9\x89\x89\xf6\x17i'\xac\x10\x1a\
-\x19\x0b\x19\x1a8\x9e\xdf\xc1r\xae[Q\xc7\xca\x13\xa5\
-\x01\x1e\x16\x96G\xa5A\xa3\x02\x80\x99[\xbd\x22\x9f\xe2\
-\xdd\xc2PKL\xcc\x12\xf49\xd9\xc9\xd9\x88r\xf7\x17\
-5\x9c\xb0\xa2hbb0\xa3\xcak+\xec\xb7\xeb\xe3\
-\xe1WbC\x09H\x1a\xf4o\xbc4h4\x00D\xe6\
-\x13W\x0c\xc5\x08\x86;\xf5\x06\xfd\xfb\xc8\x8438X\
-k\xd4\x1c1\xff\xdf\x09\xfb\x15L\xbaXlF\xbaY\
-\xb7g\x12K\xb9\xbf\x04\x02\x81\xc6\x83\xa0Q\x00\x98\x99\
-;\x16C\x11]\xf14\xcd3\x93\x0d&\xe3\xbf\x91\x1d\
-Oc\xe6\xff\xa5\xe4E\x9b(0#\x10\xe8h=\xef\
-v\xba\x1e\xe6)\xee]\xec+k,\x08\x1a\x0c\x00\xc2\
-|\xccd\x8a\xa7\x81\xd7M0\x99\x0c\x9f q/1\
-\xff/j(\xd5U\xba .\xd9\x18\xf4\xef\x04\x04\x94\
-\x81w:<w\x0b\x8cg)\xd5H\x104\x08\x003\
-\xb7 \x85\x8f\x22\x0a\x1fm-\xe5\x064k\x11\xfb#\
-'x\x90\xd8\xaf\xfb\xb3\xdb\xef\xbf\x9a\xaaJ\xec\xe0\xb2\
-z \xa3]B\xc8\xef\x99uqh8\xd0\xbb*\x0b\
-\xac\xc3,\xe9t.\x01\x81@\xc3\xbc\x01\x91+\x86\x11\
-\x03`\xc6\xc61\xd8_\x81\xf5\x10\x1a\xfd\xdf\xdcl4\
-\xef@c}\xa6\xddS\x1b6\xd2\xf6\x17\x05'\xb7\x93\
-\x85\xe3\xdbK!\xe3\x92xH\xc9\x8e\x0d\xf9]\xdc\xe3\
--H\x1bD,(r\xba\x1d\xbd\xd0\xad\x12\xac\x7f\xa3\
-\x03\x16\x0c\x8aL\x12D\x04\x80i\xebFQ\xb4\x1e\xfd\
-\x88\x16H\x08L\xc7\x18W\x1a\x0c\xccp;[K\x02\
-6\x7fQ\x03\x09\x99\xc8\xa7w\x97\x83\xad\xda\x0d\xad\xba\
-%C|\x9a9\xecOp\xa0\xc9\xa2\x8b\x07\x8f\x8b_\
-\xeb\x11\x1cc\x81\x17cg\xe8\x0c/\x0c]\xa5\x19\x04\
-\x9a\x01\xf0\xc0\x97C)s\x82\x1e\x18\x032Q\x19\xa0\
-i\xd0\xddc\x893\xbf\xe3dm\x92g\xef/j(\
-\x95\x9e\xa9\x83\xf3\xa7j\xc9\xf5%=S\xc1\x92h\xd0\
-\xf4;\xec#0\xe9b\xc0^\xe7\x98\xc4\x03\xfb)\x0e\
-\x9a\xf2\x1c\x08\x1e;\x0fo\xdc\xbcN\x13\x084\x03\xe0\
-\xbeO\xae\xc1\x00\xa0\x18#E3::5.!\xf6\
- 2\xf7\x92\x1dl\xed\x9f\xdd~\xff\xd5TW\xe1\x82\
-\xb3{+\xbc\x9f;\xf5O\x07\xbd\x89\xd1\xfc{,\x05\
-hJW^Wc\xed\xc2s|\x05\xef\x11x\xb7\x8d\
-\x17\x16\xdf\xfeS\xf4\x000n^o*\xa9\x85\x05\x8c\
-\xf1:Zg\xa4\x18{\x85\xf0rV\xa7\xc4\x87\xed\x9e\
-\x1a\x12\xa3\xff\x8b\x1aF.\x1b\x0b'w\x95\x01\xcf\xfa\
-x\xd5\xe5\x9aL\xe2\x05\xd4J\xb44\x14\x14\x1c\xad~\
-#&\x85\x9a\xc6y\x04\x0eI\x00\xdeZ\xe6\x82\xcf\x1f\
-\xcd\x0d\x0b\x82\xb0o\xea7\xa1\x03\xd5\x22'\x09\x122\
-L\xb41VG\x9f\xdc^\xda\xea\xaa[;\x1dDb\
-\xdf\x88]\xbc\x7fQ\xc3\xc8\xed\xe4\xe0\xd4\xaer`]\
->\xddIg\xa0\xa1\xf3\x80\x8c\x88\x9f%\xb9\x8c\x9d\x9b\
-?;\x94\xd3\xe9\x9a\xe6\xf9\x1e\x07\xc7\xdb+=|\xf9\
-Y+\xfc\xf0\xda\xbe\x90 \x08\x0b\x80A\x93.\xa5\xd2\
-/\x89\xa7bS\x0ct\xd9\xb9:\xa6E\xfb\xe4W3\
-;&?`\xf3T_\x10\xad?F\x9f\x00\xd9\xb1\x9d\
- \xdd\xd2\x0aR\xcc- \xde\xd0\x8c\xdc\xa3\xc4,\x1b\
-\x92@\x82u\x10\x1b\x92F5\xae2\xa8v\x95B\xb1\
-\xed4\x14\xd9N\x82\x8bs4y\xf9\x1aB\xac\x1b1\
-\x7fw\x05\xb8\xed\xac\xdf}s\xbc\x1e\xda]\x99\x1a\xf1\
-\xf3\xb0U\x10\xa3O\x84\xfcC\x95\x8bJ\xf3*\xa7\xa6\
-\xb7M\xe0\x1c\xd5\x1e\xbe\xaa\xd0.\xac~io\xc3\x01\
-\xd0\xaeW:\xd5\xbaG\x0a$\xb7\x8c\xa5c\x92\x0d\xf4\
-\xcf\xef\x1dN\xbbw\xf1\xb5\xc7<\xbc3\xc6\xd9D\xbd\
-\x1f\x17\xa8U\xdc\xa5\xd05e tL\xea\x09\xa9\x96\
-\x96\xa1\x923\x83\x12\x0eL\x15\xdb\xce\xc0\xb1\xaa\x9dp\
-\xb8r;\xe4\xd5\x1d\xbe(\x8cT\xdc\xe3\xcf\xee\xab\x00\
-\xa7\x95\xad\xf7\xb7\xf8T\x13\xb4DV@C\xc8\x84\xa4\
-\x80\x816Z\xdf\x9d\xf4k\x87\xe1\x8f\xe7\x94;kY\
-\xbe\xa6\xc4\xc9\x97\x1c\xaf\x86\xdf\xbf;\x1d\xb4\xea![\
-6\xe7\x9a,\xaa\xc5\xa5ITb\x96\x99>\xb6\xb9\x98\
-\xe9\xd8/kJ\x97!\xd9/Yq\xef\x8fr\xba\x16\
-\x16c\xbd2F@\xdf\xccQ\xa4\xa7G\x9b\xca\xec\xf9\
-\xb0\xf3\xfc\x0f\xb0\xa3d\x0d8\xd9?g\xe8r\xa1\x1e\
-\x8f\x15>\x8fK\xdddn\x96\x1d\x03\x99\xed\x13\x22|\
-\xaaHX\x22\xc6\x22)p`}\xfe\xd4\x13\xbf\x17.\
-\xca\xb9\xb6\x05WW\xea\xe2\xcb\xce\xd4\x09\xbf-=\x11\
-9\x00\x122-T\x9b+R\xb1W\x8a\x8e\xcf41\
-\xdf<\xb5S7;w\xdcN\x81\xe6r\xecQ\xf4\xf8\
-\x19h\x13\x0c\xcc\x1a\x07\x03Z\xdcL\xdc\x9cMM\xd8\
-a\xb5\xb1\xe0\x1b\xc8-\xfa\xfe\x82F*\xed5n\xc8\
-;P\x89\xc4\x7f\xf0\x8e\x93\xd9>\x1e\x81\xa0\xe1m`\
-\xd1\xc5\x01\xc53\x07f\xf7_\xd6\xe7\x8e\xd7\xfb\xb2\xb6\
-J7W\x99g\xe3\x0b\x0eT\xc0\xe9\xdde\xaa \x08\
-\x0a\x8044\xee\xb7\xec\x9aB\xa5\xb6\x8d\xa5\xcf\xee+\
-g\x92\xd3b\xae\x18\xfeh\xf7mv\xd6\x1a\xb5\x86\xeb\
-\x9a2\x00F\xb7}\x10\x12\x8c)Qkh\xadT\xee\
-(\x84\x15\xa7\x16\x93!\xa2\xa9\xa9\xb2\xd0\x0e\xc5\xc7k\
- \x5cJD\xabnI\x10\x97bj\xf0{p\xe8\xd8\
-\x82:\xd1\x9aW\xf7\xf6\xb1V;\xf6\xb5\xef\x97\xc1U\
-\x15\xd8\xf9\xe2\xa3\xd5\xc2\xb1\xdc\xe2\xc8\x00\x90\xdd\xb5\x19\
-\x16\xfftJ\xabXz\xf5K\xfb\xf4w\xbe|\xd5\xec\
-\x0eWe>Y\xe7\xa9\x82\xc6\x12\xee\xf57\xb6{\x04\
-z\xa4\x0f\x8d\xf8\xb7.\xd6\x01E5\xa7\xa1\xd6YE\
-\x14@\xa3\xce\x0c\xcdb2 =\xae\xa5\x9c~\xad\x99\
-\xb0\x12\xbb\xadp9\xac:\xfdN\x93$\xa4\xf2\xbc@\
-\x18_U\xa4M\x19m\xd7+\x05L\xb1\xfaF\xbd3\
-N\x9f\x04G\xb7\x14\xbd\xb8d\xda\xb6\xb97\xcd\xe9\xe1\
-\xc1z\xc0\xf9\x135\xfc\xc1\x9f\x0b\xb4\x03@ob\xa8\
-\xec.\xcd\xa8\xcc\xce\x89t\xe9\xa9\x1a\xe6\xc4\xb6\xf3\xfa\
-\xd9\xb97\xef\xe2iOG\x07kkx\xe9P\x11\x9a\
-\x99\x9b\xc3\xc4\x9cy\x90\x86\xb4z\xad\x84\xf3\x08\x7f;\
-\xfd\x03:\xd6\xc1\xc9\xb2\xfddR\x88\x7f%(0\xe9\
--\x90\xd3\xbc7\xf4i3\x0c.\xcf\x1a\xe0\xb5\x12\xb4\
-\xd0\xe9\xea\xfd\xf0\xf9\x919\xc4\x92\x88V\x8e\x94\xd3\xea\
-\x81\x82\xc3\xd5\xaa\xca^0\xba\xf4\xeat\xa0\x99\xc8@\
-\x1cHx\x18\xa5y\xdd\x91\xd9\xfd\xff\xd3\xab\xd3\xd5\x99\
-\x9e\x96\xdd\x9aq\xa5\xa7\xea\xf8\xfc\x83\x15BE\x9e\xb5\
-\x1e\x08T\xabkI4\x10\x00dtL`6}x\
-Tw\xf9\xe86mo|\xba\xe7\x01$\xfe\xa9\xc6\x88\
-\xff\xac\xd8\x0e0\xa9\xeb\xf3\xc4\x8c\xd3B8\x8dl\xcb\
-\x89\xd5\xb0l\xf7\xdbPc\xaf\x90Dh09*%\
-S\xa3\xf6\xcbJ\xba\x04\xee\xec\xf3\x04t\xce\xec\xa1\xb9\
-le\xf6\x02\xf8\xe0\xc0SP\xe9*i\x14\x03p\xe9\
-*\x0bmp\xfed-\x04\xea\xc9\x97\xb5\xe9\x0dq\xe6\
-D\xbf{\xe7\xab\x0b\xe0D\xd1!\xe2\x03\xe8xUz\
-\xa3\xde\x8dI\x1a\x06\x84\xe5\x0b~\xef\x92w\xa0\xfcL\
-\x8f\x1b\xdb\xb0\x15\xe7l\x5c\xc1\xa1J\x01Y\x04\xda\x00\
-\x90\x90n\xa1\xb2\xba$\xd3z\x13\xcd\xec[\x93\xa7\xbf\
-\xfa\xde\xce\xf7\x5c\xf3\x8f.oX\xddU\x0d\xb3\xfd\xd1\
-O\xb2\xe2:\xc2}\xdd^\xd4\xac\xe89<vx\xeb\
-\x97gao^n=\x9e\xab9\xca\x84z\xdf\xa1`\
-X\x97[\xe1\xf6>\x8f\x90\xdc{-T\xe9,\x81\xb7\
-\xf7=N|\x09\x0d\x91\x04.\x9b\x07\x0a\x8f\xd6\x80\xa3\
-\xd6S\xefo\x19\x89Y\xf0\xdeCk@\xc7\xe8\xfc\xee\
-\xff\xb8\xe7?\xf0\xc6\xaaY\xc4\xff\xdf\xe6\xf2f\x91\xbf\
-4\x80\xb04\x8c5$\xc1\xaf\x1f\x1d|x\xd3\xfbG\
->\xee5\xae\x8d\x87f\x18\xae\xf0p\x15\x9f\x7f\xa0B\
-\x13\x00(\xa4\x89RY]\x93\xe9\x9a\x12;svO\
-\xb9a\xda\xda\xd1\x1f\x99\x13\x99q6O\x03\xfc\xfe\xe8\
-\x95\xa9\xe6lx\xf0\xf2\xd75\xf7|\x9b\xab\x0e\x9e_\
-\xf5\x00\x9c);\xeac6\x9e\x8fG\x89%\x16\xe7\xe6\
-\x89\xd7\xb2T\x10\xc4i\x85\xd2Y\xf0\x02\xa2{\xcb~\
-\xf0\xe8\xf0\x85\xa0g\xb4\x05XJ\xedy\xb0x\xef#\
-@,\x1d\x8d \x10\xd0X_\x9eg\x85\xb2\xb3\xd6\xfa\
-\x8a\x9e\xf4\xf9\x91\xd1\xf3`\xd8\x157\xd5\xfb-\x01\xc0\
-\xcaY\x90\x98i\x86\x16\x9d\x13\xc3\xbfL\x03\xc5\xe8\xe3\
-\xc1Q\xc5~\xf3\xd2\xc8U\x93.\xe9\x93\xe6\xceh\x97\
-\xc8\x15\x1d\xad\xe6\x0b\x0fU\x08n\x07\xe7W\xc2zU\
-\xa4i\x8a\xc2\x16\x00\x92\x00\xcc\xae\xef\xcf`\xb8\x1a\xd0\
-\xf8\xff\x87\x07\x5c\xad\x22v\xfd\x0a\xd8\xbe\x8f\x81)W\
-,Fc~\xb6\xa6\x9fx87,Xq?\x9c(\
-\xd9/2\x9d\xc6b\x9d\xc2\xe5\xf2^\x8b@\x10\xcfJ\
-\x86cF\xf0H\xec\x0a\xa8\x8e\xf8Z\x10g\x88\xc2\xe5\
-\xad\x06\xc0\xe3#^F\xcf\xd0&\x09NV\xef\x83\xf7\
-\xf7O\x13'\xad\x84\x01\x81\xb5\xd2\x0d\xc5'j\xeby\
-\xf5\xe4\xfa\xe3\xe2e$e\xc1\xfb*\xbd\x1f\x13\x06\xc0\
-\xeb+fA\xfa%q\x90\xda*&*:\x08N\x22\
-e\x04\xc3\xd99\x03\xfe\xd3\x1d}t\x0f\x9c\xd8\x91=\
-\x7f\xa2\x96\xc3\x12\x00\x99\xa3\xa1\x01\xc0\xe8i\xaay\xa7\
-D:&\xc9\xc8\x1c\xdd\x5c\xac\xef24;\xeb\x96\xb9\
-}\x8e\xa0\x1e\x11\xd9\xf8/\x88c\xf8\x84\xce3\xe0\x8a\
-\xf4!\x9a\x7f\xf6\xd1\xa6\x17\xe0\xe7C\xcb\x08\xb31\xd3\
-i\x06'\x1ePD9\xc2\xfc\xa3\x18iv.-\x15\
-]\xc9|\x89\xf1\x1c+^\xe3 \x0b\x01\x02\x02\xc5M\
-='\xc1\xb8\xde\xf7k.\xc7\xc6\xfc\xafa\xf5\xa9w\
-\xc5\xc0\x8c\x0aS\xdc\x0e\x16i\xf8u\x08\x00AB\xe1\
-\x12\xf3\xf1\x7f\x8f\x8eQ\xef\xfd\x98\xd6\xed\xc6\x00\x98\x89\
-L\xc0Db\x02\x06{_$$\xea\x01q\xc2W3\
-~\xebxxCAQ\xb7\x11\xd9\xa8_\x09\x5c\xfe\xfe\
-\x0a\xbe\xb6\xcc\x11\x12\x00\x14\x0eEf\xe5$3.;\
-\xcb\x14\x1d\xa9\xd2\xf7\xbf\xab\xe3\x0d\xd7\xfd\xb3\xdbRl\
-\xfei\xf6\xfe\x09\xa2\x89\x95\xd3\xac\x1fL\xec:_s\
-\xc1\x0f\xe4\xef\x80\xe7W>H\x18M\x18\x8e\x18\x8f\x00\
-\x09\x8cN\x02\x81\x8e\xc6\x89\x088\x04\xe6\x1b\x1a$\xb1\
-O\xa6\x86KL\xe7\xc8\xc1\x03\xefAgr\x0f\x8b\x05\
-\x0a\xe6\xdc\xf4\x11\xb4\xcb\xe8\xaa\xad\x0a\xa8\xaeX\x1f8\
-]\xb3\xdf/:\xe7qsD\xd4W\x15;B\xe7\xbd\
-J\xe5\x22\xbd\xffa\xf5\xdeO\x00\xb0k\x19\xbc\xb6|\
-&t\xe8\x9b\x06F\x0b\x13\x15\x00`\x0b\x08\x9b\x83?\
-\xbd\xbd\xff\xd6-\x9f\x1f[\xdb\xb2{3ObF\x0c\
-\x96\x00\x5cU\xa1M*]\x10\x00\x18cu\xd8\x01D\
-\x97\x9c\xac\xd6\xd5\x959\x0d#\x1f\xef\xfeD\xcf\x9b/\
-\x99e\xd5j\xffK\xcc\xd0Q\x06\x98\xd6\xfbcd\xf6\
-ej\xfa\x19\xc7\xb3\xf0\xe4\xd2[\xe0|]>\xe9\xf5\
-\x0c\xd2\x8au\x98\xf9z\x11\x04\xb2$ \x0dD\xfb\x17\
-\x5c\x90A\xc0\xfbz>\xe7\xe1\xa5C\xbc\xc6 \xc8J\
-j\x07\xcf\xdf\xf2\xa5\xe6\xa1\x00\xbb\x8f\x17\xee\x9c\x04<\
-\xb0\x04P\x15\x056\xa8,\xb0\x93w\x84m\x03\xa9`\
-\x8f\x8dY\x00\xd7]qc\xd0\xaf\xfe\xf0\xfb2x}\
-\xe5L\x12\x05\x14\xeb\x07Q\x01\x01\x06\xc0\x8eoO\xcd\
-\xf9\xe1\xf5}\xaf&d\x98\xddm\xafLg\x0b\x0eV\
-\xf2egk\xfdV\xc9\xa8\x07\x80\xd8d#\x95\xdd-\
-\x859\xb2\xb1\x10C\xd6\xf8\xe4\xeaQ\x1f\x9a\x12\x99\x9b\
-\xecZ\x13?$\x00\x0cny;\xdcp\xc9\xbd\x9a\x0b\
-\xbc\xe9\xc8*xo\xe3\x1c\xd2\xcb\xb1I\x84\x0fF>\
-p\xc3`\x00\xc8\xccW1\x03\x88\x04\xe0\xeb\x83\x00\xbb\
-^\xf1\xc1\xb9E\x10L\x1e<\x1b\x06v\xbaAs\xb9\
-V\x9dx\x0f\x96m\xfd\x00*\xf2\xed\xc4\xb1\xa3\xbd\x0d\
-\x002Q\xef\x7f/D\xef\xc7\xb4v\xe72x{\xfd\
-lh\xdb+\x05\xd5\x93\x8e\x1a\x00p\x8e\x80\xb3\x8a]\
-\xb6p\xd4\xeaI\xe8\xa3\xbb'2\x07\x91\x22\xc8aS\
-\x10\xb5Op\x00$\xa4\x9b\xe9\xc4\xe61\xcc\xb9\xbd\xe5\
-\xd8%e\x98\xb9\xf1\xa6\xcd<\xe3\xee\xa2)\xfa'1\
-\x1f\xa7*=\xd3w\x09\xc4!sDS{\xa1\xdfL\
-\xff\xfaV(\xae;\xebe\xbe\xce\x88\x99\xcf\x88\xe2\x9f\
-\x11\x15@\xaf% \x17\x16}PN9\x93\x15B\xac\
-\x08\x12\x10(\x00\xc0\xbaD\x10\xa4\xc5f\xc3\xcb\xb7\x7f\
-\xab\xd9Qdu\xd4\xc2\xdf_\xbf\x8eX&\xb2\xe5\x11\
-\xb6\x0d\xf0\x19\x81\xe5\xd1\xb1\xf3\x83\x8e\xfd2\xad\xdd\xf1\
--|\x98\xbb\x00\xb2\xba$\x8a\xc3\x1cME\x05\x008\
-:Hs\xfa\xfd\xf3\x06}?\x08}tw\x1c\x90\xe9\
-q\xd4\xb8\xb9\xc2\xa3U<j\x07U\x00\x90\xeb\xe4\xac\
-\x18\x1a\xf5B]\xf9\xd9:=0`\x9c\xbdi\xdcY\
-\x17o\x8fu\x87\x9b\xd8)\x8f\xc3\xe8|U\xf3\xb1p\
-s\xa7)\x9a\x0b{\xac\xf8\x0f\x98\xb7r\x92\xc4x\x86\
-0\x1f\x9f\xb1\xf8\x17\x99\xaf\x10\x8djLPtL\xb9\
-\x0cD\x1f\xe0\x14R\x00\x01\xc0\xe3\xe4\xc8\xe7\xa7G\xbe\
-\x059YWj.\xdf\xa7\xbf\xbc\x01_m~W\x04\
-\xa0\xda\xfb\xeb\xb5\x03@\xbf\xceC\xe0\xe9\xf1\xaf\x84\xec\
-\xfd\x980\x00\xbe\xd8\xfb\x02\xa4\xb6\x8e\x03Z\x1f=\x00\
-`w\xbb\x91\xb6\xd4\xce\xee\xbf\x0c\xaf\xb6\xe2\xca\xec\x98\
-\xe81\xc5\xea\xd9\x82C\x95<n\x07\xb9\xd5\x02\x01@\
-\xa5\xb6\x89\xc7]CWv\xa6V\x9fsmv\xf6-\
-s{\x1f\xc2\x114V\xf0\x84~\xa3\xe0\x13\xc3O\xf6\
-\xfe\x102\xe3\xdaj.\xecG\x9b\x9f\x83\x8d\xc7\x97\x13\
-\xc6c%\x94\x00\xc0 \x8e\xfb\xa2\xd6//\xde\xa4\xe1\
-a\x92\x02*\x83\x80\x93\x87\x02'O\xc2\xb0\x18\x08\xd8\
-]\xfc\xc0\xb5\xf34\x97\xaf\xa2\xae\x14\xee~u\x08\xe0\
-\xc5,d_D\xb0w\xb7I\xef\x08\xf7\x0d\x9fN\xbc\
-~Z\x08\x03\xe0\xdbc/\x93\x5c\x00Z\x06\xbc\xd6\xba\
-\x86 \x1d\xa5'\xa9\xe3K\x9f\xd9\xd6\xe9\xe8\xc6\xa2\xa2\
-\xe6\x9d\x13=\x96\x04#\x9b\x87,\x01d\xb2J^\x93\
-\x00\x00\xe0\xf5\x8e2\xda%2\xc5\xc7\xab1l\xf5}\
-nm\xd7\x7f\xc4\x94\xeek\xb0\x02\xc8\x87\xb2\x00\x14\x8d\
-\x9e\x1d\xd3\x09\x1e\xeb\xfd\xb6\xe6\x82b\xd0L\xf9\xf2z\
-\xb0\xb2\x95\x22\xf3M\xd2\xf8\x8f\x14\xbf\x88\x99\x1fX\x1e\
-^\x06\x81(\x05<N\x0c\x04\x0e\x90\x91\x04\x8b\xefZ\
-\x8fz\xa7\xf6\xc0\xcb\xfc\xaf\x1e\x81\xadG~\x0a*\x05\
-R\xe23\xe0\x8e\xab\x1f\x80\xa1\xdd\xc7jV21\xd9\
-\x9dV\xb0\xb15>\xff\x86\x06\xfa\xf7\x9e\x87\x00\xe7d\
-\x84\x22\x9a\xe4\x07$\xc1\xba7\xf7\x8d\xf8\xed\xeb\x93\xdb\
-\xd0-O\xc7\xfe\x99\x18\x00\x9c\xa3\xd6\xad\x0e\x004\x06\
-Q\xcd;%1H[$\xe3\xff\x80\xbb:\x8e\xbb\xf6\
-\xfe\xae\xef\xd7\xba+B\xbeL\xee\xfdXI\x1au\xc9\
-d\xb8\xb6\xcd\xed\x9a\x1b\xe0\x5c\xc5q\x98\xb9\xfcN\xc2\
-x\x0c\x00\xbd,\xfa\xb1BD7\x80\xf9\x01e\x22\xe5\
-B\x80g\x915\x80\xb3q\xb0\xf8\xc3\xd2`\xfa\xf0\xc5\
-\x90\xd3B\xfb0\x90{\xe8'\x98\xff\xf5#\xa2\x0fB\
-!\x05\xf4\x08Dcz\xdf\x05\xb7\x0e\x98\x0c1\xa6\xa6\
-\xcfg\xc04g\xebx <\x09\xd9.\x14\xc4\x1b\x92\
-\xe1\xe7w\x0e\xdc\x93\xfb\xf9\xb1\xff\xa0\x1b\xee\xceW7\
-g\xf3\x0fVp\xd6\x0a\x97:\x00\x90\xc6Mc\x1f\x00\
-R\x00\x89\x05p\xf5\xc4\xce\x0f\x0e\xba\xa7\xf3\xbcp!\
-`y\xdc\xc5\x0d\xfd\xccU\x9fCZ\x8c6\xaf\x1f\xa6\
-\x9f\x0e}\x0b_\xeezYd>\x96\x00X\xf4Gk\
-,\x94\x81)Y\x05X\xfc;m,T\x9c\xb3\xc1\xd8\
-\xee\xf7\xc0\xc4\xeb\x1f\xd1\xfc(\xa7\xdb\x01\xb7<\xdfO\
-\x9c\x03A\xf9\x92\xd4\x06\xe4\x0cCc\xfd\xab\x8d(d\
-\xe44{\xeb8\x02\x80p\x9d\x03\x9b\x82\x1b>8\xfc\
-\xcc\xe6O\x8eb\x91\xec\xca\xb96\x0b\xeb\x00\x5cM\x89\
-]\x5c\xc8\x01\x02\x00\x80\x14/\xda\x1c\xa7\xd7\xd5\x95;\
-\x09\x00n\x7f\xe1\xaa\xd9\xed\xfa\xa7>L\xc2\xa4\xa1\x1a\
-\x19D'L\x9c.\x05\xe6\x0eZ\x16Qe\xde\xd9\xf4\
-/\xd8\x99\xff\xa3\x17\x00\x8cA\xf4\xfa5\xaa\xf7\x07\x96\
-\x0dU\x17\xf7\xfc\xf2\xb36(\xcf\xb3\x81\xc7\xc1\xc1\xe5\
-\x97\xf4\x85\xd7\x1f\xf9,\xa2\xc7\xcd\xf8\xe4^\xd8sz\
-\xabW\x0a\xe0\x16\x1cp\xe90\x98q\xcb\x85\x05\xc0\xbf\
-\xb6\xdc\x0c\xb5\x9e\xca\xb0\xc3#\x8e\xbd\x1c\xdbP\xfc\xe6\
-73w\xccA\x1f])-\xe3X\x9e\xe7\xd9\xca\x02\
-[=\x00\x90\xb3\xde\x8c\x00\x10k\xd0\xd5\x969\xf0\x10\
-`|d\xd9\x88\xc5qi\x86[C\xfa\x00\x14\xbd\xec\
-\xf2\xb4k\xe0\xee\xee\xb3\x22\xaa\xcc\xac\x15w\x91\x0c^\
-\xf4n\xd1\xf4\xd3I\xca_\x144aLX\x01\xc4\x0e\
-\x1cl\xc7\x13S\x90\x15\xcd\xc18c\x22\xacz\xf1\xf7\
-\x88\x9e\xb5t\xe3;\xc8\x22xS4II\xe1\x04\x04\
-\x80\xe10\xe3\xd6\x0b\x0b\x80\x99\x1bn\x86:\xb6\xc2'\
-%\xe5\xe2\x04\x10\xf6\x05\xd4\x95\xb8\x96\xbeq\xcb\xba\x87\
-\x01\x03\xa0U\x9c\x07\xf1\x8a\xad\xc8\xb3\xca\x0a\x9d\xa0\x04\
-\x00e\xb0\xe8hd*\xe8jKE\x00L_{\xc3\
-\x12],54\xd4\xac_\xa5\x07\xee\x86v\x93a\xe8\
-%\x134W\x04\x03\xe7\x9fK\x06\x03\xafs\x8b\xbd\x1f\
-\x03@\xd6\xfc\x83TJ+a\xed\x1f{\xedp:\x16\
-\xe7\x8d\x09HC\x81\xe4\x18Z\xf5\xe2.H\x88\xd1\x1e\
-\x81\xdb\x83t\xa9\xa7?\xb9GT\xd8@\xecB1\xc6\
-8\xc8\x88\xcf\x22\xfa\x0f\x89Ep\xa2\x1fb\xc1\xbd\x8b\
-!=9|r\xeb\xee\xb3\x9b`\xe5\xfe\x0fE\xa9G\
-\x81\x02\x5c>\xf2FA\xd1{\xb1_\xa4\xd8~\x1a\x80\
-\xe1}&r\x90\xb6\xc2\xb3\x88=Va\xfdK\xd7\xaf\
-\xbe\x83\x00\xa0u\x9c\x07=\x8b-;S'K\x00\x7f\
-\x00\x18c\xf5\xb4)F\xaf\xab9o\xc7\xb1S\xe3\xd3\
-?\x8f\xf9\x01\xf4l\x0f\xbc\xd4\x8b:\x07\xc5\xffx\xc9\
-\xdc\x9a|\xc5\x0b\xd0%\xbd\x9f\xe6\x06\xaduT\x02\x92\
-2` \xda?\x1e\xff}\xe2_\xb3J\x1cX$T\
-\x96\xaa\x22;\x94c\xcf\x9d<\xe3\xc6\xab\xa4\x02\xf1\x06\
-\x12\xf70\x02\xc0[\x8f}\x0b9m\xbak~ve\
-]\x19\xdc\xf6\xfc@\xd2\xf0\xe4\xb1R\xfc\xc1\x17|\xe2\
-\xc5\x00\x14\xba^2\xf7\x17h\x99\xde&\xec37\x1e\
-Y\x0e\x1fl\x9e/\x82^\x1e\xf6\x02\xc8\x1b\x11\x95b\
-#\xb2\x95\x84\x95e*\x84\xae\x84\xa3\x82\xe0\xd1\xedz\
-~\xc8\x8a\xeb\xd1Gg*\x02\x00z\x06{\xfed\xad\
-:\x00L\xf1z\xc6Y\xeb!& \xfe\xfd3\x1b\xc6\
-n\xe5hW\xbb\xa0\x13,\x14\xe2\x1f\x8b\xd6g\x07|\
-\x01\x19q\xdaS\xbd\x0a\xaaN\xc2\xac\xb5w\x82\xc1,\
-\x9a\x7f\x8d\x11\xff\xb8\x1c5\xe7\x9dd\x9c\xaf\x97y\x1b\
-\x10+\x90\x87\x81y\x13\x17\xc3\x80\xcb\xae\x8b\xe8=c\
-g\xf7\x041-\x8e\x92,\x0c^r;K\xd7X\xd2\
-p\x00_\xcd\xd7\x06\x80\x0d\x87\x97\xc3\xfb\x9b\xe6\xf9\xd5\
-9\x10\xfbD\xe7@\x96%n\x1fF\xf2\x92j\x19.\
-\x8d\x8c\x19\x18\xcexb\xc15\xcb\xfb\x83\xb8\xf2\xb9'\
-\xa3C\x02[r\xbc\x86S\x05\x80%\xd1\xc0\xd8\xab\xdd\
-$\x07\x00\x03`\xe6\xc6\x1b\xf7\xb9\xc1\x91\xe1\xe6\x82x\
-\x01\xb1\xe6/\x03\x005\xe8\xc2\xe1?\x80E\xaf\xdd\x14\
-:\x5c\xfc;\xbc\xbaa\x0a\xe8\xcc41\xff\xfc\xb4\xff\
-\x08\xc8V\xe3\x86\xb2\xd3\xd6\xe0\xf9w\x92{\x96\x0c\x03\
-^\x00\x08\xf0\xd8\xcds`t\x7f\xed&+\xa6{_\
-\x1f\x05ye'\xc5d\x14\xe2r\xe6}\xccg\xe5\x90\
-t\x84\x00\xd88\xcf\x1b\xe4\x0a\x0a\x00Z\x01\x00\x85\xaf\
-$\x94\xe3\xc8\xc0\x98PO6\x17\xcd\x1f\xf4\xfd\x15\x12\
-\x00\xdc\x99\x9d\x12\xd9\xe2\xa3\xd5\xea\x00\x88I62\xb6\
-J\x17\xb1\x00\xf01s\xd3M'\x5c\xbc-.\xd8\xf4\
-o\xd9\xf3G\xc2\xad,\x03o\x8c\xfa5\xa2Y<{\
-\xf3\xb7\xc0\xe2\xad\xd3\xc8\x10\xc0H\x88\x8eD\xfb\xc7\xf3\
-\xeb\xca\xceX\xa1\xae<\xfc\xf4t\x12'\xe0E_\x05\
-\xe9\xb1\x08\xb0\xf7\x8cx\x02\xee\x18:9\x22\x00L}\
-\xefn\xd8\x7fv')\xa7\x0c\x00\xc2xV\xa9\x03\x08\
-\xb0T\xe3\x10\xb0A\x1a\x02\xbc\x09/j\xe0W\x8c\xff\
-\xca! \x9c\xb9\x8cc2F&\xa6f\xde\xc0\xef:\
-\xa2\x8f\xb8\x91\x5c\xcd;'\xb1\xc5\xc7\xaa8\xb2\xd8z\
- \x00\xe2RL\xb2\x09h\xc0\x0bS\xcd\xdatS\x81\
-\x83\xb52\xaa\x89 \x0a\xf3\x0f\x8f\x81z\xde\x02\xaf\xde\
-\xb0.\xa2\xc6\xfc\xfd\xdc\xaf\xf0\xde\xf6g\xd1\x10 \x22\
-\xdbk\xfe\x85\x91\x00\xb8'c\xe5\xae<\xcfN\xae5\
-Q\xa0\x1e\x80\x00\xf0\xb7\xa1\x0f\xc3\xdf\x87?\x1cQ\x99\
-g\x7f\xf6\x10l;\xfa\x8b\xa8\xa7(C\xd02\xf3%\
-\x00,\x99\xf53dk\xd1\x01\x8e\xae\x80\x8f\xb7-\x10\
-C\xc1\x8al'?\xfeK[\x18`=\x81\x88}\x02\
-\x84\xf0\xe6\xb2\x9e,1\x17\xeb\x99;\xf0\xbb\x96 I\
-\x80\x16\x97b\x00T\xb3RD\xd0\x0f\x00t|\x9a\x99\
-A\x16\x00\x91\x00\x89\xcdc\xe2\x1e\xf9z\xf89l\x02\
-\xe2\xfc\xfb\xe0\x0d*\x90\xc4\x0b3$\xc0K#WE\
-\xd4\x98\xdb\xcf\xfc\x08\x1f\xed\x9a#z\xff\x0cb\xc5\xe8\
-0\xe3\xbf\xa3\xce\x03%'\xea\xc8\xd4\xea\x88H\xa9\x07\
-H\x8a\xe0m\x83\xee\x83{ox\x22\xa2\xc7,\xf8\xf2\
-q\xd8xp\xad\xa4\x08\x8a\xb6\x80 \x8d\xfb<\xef\xeb\
-\x10_<\xbb\x1e\xb2\xd3\xc2\x03`\xf3\xf1\x15\xf0\xc9\xce\
-\xe7%q\xee\x0b\x05\xfbc@r\x89KRB\x8e\x91\
-\x843\x03\xa5\xcc x\xed\xa65\xd9\xb5eN\xac\xb8\
-\xb8\xb2\xba$\xa3!\xa0\x8aCe\xe4\xeb\x01 !\xd3\
-\xc2\xd4\x14\xdb\x89\x1b\xb8U\x8f\x94\x94\xbb_\x1fx<\
-\x1c\x00p\x85Ydk\x9b\x848xe\xd4\x0f\x115\
-\xe6\xef\xe7~\x81\xf7w\xceD&\xa0,\x01\x82\x8b3\
-\xd2\xeb\x91YW\x81{}Cfy\x06*\x82\xa8\xcc\
-\x13\x06\xdf\x0f\xf7\x5c\xffXD\x8f\x99\x8f\x00\xb0I\x02\
-\x00IK\x93$!^&\xc1\x0b\x00\x04\xae\xcf\x9e\xfe\
-Q\x1b\x00N\xae\x84\xcfw=/\xe6=\xe8\x15\xa9n\
-J\xf6+\xb8$k\xfd~\x922H\x87\xc1K\xd3c\
-_\xc0\xc7\x0fnl\x9f\xbf\xbf\x12\xfb\xf3\xdd\xd9\xdd\x9a\
-y\x8a0\x00\xdc|}\x00\xe0<@[\x95\x8b\xf8\x00\
-:]\xdd\xbc\xf9-\xf3\xfb\x1c\xc0\x99\xc0\x1c\xaf\x1e\x09\
-\x94\xfd\xec\xb81)V\x0f\x8bn\xdc\x10Qc\xee+\
-\xd8\x02om\x9f\x8e$\x804\xa6\xe9\xd4\x15@\xb7\x83\
-\x83\xe2\xe3\xb5\xe0\xac\x8b\xb0\xd7\xfb\x15\xd6\x97:F\xc4\
-4\x19\x02\xa6\xc0\xdf\xae{0\xa2\xc7\xcc\xfc\xf8\x9f\xb0\
-\xfd\xd8\x06o\xec^v\x08\x10y\xaa\x08A\x7f:]\
-\x1b\x00\xb6`\x00\xec}A\xd2\xea%\x00\xa8\x81@q\
-AI\x86\x7f8_\x09\x83\x00\x803\x84\xbf~\xfa\xb7\
-.\xc7r\x8b\x8b\xd1-Wj\x9b8\x0f2\x939\xd6\
-\xc5\xd5\x07\x80\xde\xcc\xe8<\x0e\x8e\x0c\x01]\x87f\xb5\
-\xbdqV\xaf\xdfm\xee\x1a\xb2y\x83z\x83J9w\
-8\xd2\xe6\x12\xe0\x9dq[\x22\x9a\x9eu\xa4d\x17\xbc\
-\x9e;E\xac\xbc^]\x02`\x05\x0f\x8b\xfc\xb0iX\
-\xe1Ha\x09\xc8\xc9\x22\x93F<\x09\xb7\x0d\x9e\x14\xd1\
-c\xa6\xbd;\x11\xf6\x9e\xf9\xcd\x07\x00Er*\xcfI\
-J!z\xf6'\xd34\x02\xe0\xd4J\x92\x0f\x80\xfd \
-r\xe6\x93\xc8Xu\xceRA?\xd4'\xbcAE\x8c\
-!\x01\xbe\x9b\xbd\xb3\xe7\xc1_\x0a\xce\xa0[.\xa4\xe7\
-\xb1N\xab\x87\xf58U\x00`0\xebtn\x07K$\
-@\xb7\x11-\xdb\x8d\x9d\xd1s{(\x00\xf0\x82O\xa3\
-\xc6\xb1\xf6\x97nX\x09I\x16\xed\x0b\x1c\x14V\x9f\x86\
-\xb9?\xdf\xe9\xad\xbc\x12\x00\xb8\xb7V\xe4\x89.\xdc\xa8\
-\x90\x0a\x00\x9e\x18\xf7\x1c\x8c\xe8usD\x8f\x99\xf4\xf2\
-h8W~\xdc\x0f\x00D\x08x\x87\x17\xd1\xc4\xfcd\
-\xda:\xed\x00\xd8\xf7B}38\x0anp\x19\x00\xdf\
-/\xd8\xd5\xeb\xc0\xba\xbc\xd3\xe8\x963.\xd5\xc4\xba\xac\
-,\x8b\xf8\xac\x02\x00\x0b\x02\x80]\x04\xc0e#Zu\
-\x183\xa3\xc7\xb6H\x00\xf0\xf45\xefC\xdb\x94.\x9a\
-\x0bX\xe7\xac\x82\xa9kF\xd6\xab<~n\xc9\xf1:\
-M\xe6\x9dfR\x01\xc0\xbc\xbb\xdf\x81\xbe9\x83#z\
-\xcc\xe8gz\x82\x83\xb3F\x19\x00/\x92a\x90\xf6\xda\
-\xf5\x10U\x00,_\xb0\xbb\xef\xfeu\xe7N\x00\x96\x00\
-\xa9&\x0fR\xa0Y\xc4g/\x00\xe4W\xf9\x03\xe0\xfa\
-V\x9d\xc7<\xddcK$\x00\x98\xd4k\x0e\xf4n\xad\
-\xdd\xb3\x86\x87\x90GW\x0e\x05\x8eqy\x01\x80u\xd3\
-\x82\xc3\xea\xd3\xab\x1aE*\x00x{\xca\xf7\xd0>\xeb\
-R\xcd\x8f\xa8\xb3\xd7\xc2\x98g{\xfa\xd9\xe0\xff\x0d\x00\
-X\xf9\xfc\xee\xfe\xfb\xd6\x9e;\x0aa\x00\xc0 \x000\
-\x12\x00L\xddG\xb5\xbet\xd4\x93\x97o\xc2\xa1`\x9c\
-\xb2\xad\xda\xa0\x02x\xbd\x808\xdc:\xb4\xdd\x04\x18\xdf\
-\xe3\xa1\x88\x0a\xf9\xfc/\xf7@\x81\xfd8I\x01\xc7T\
-p\x18+{Qf\xbe\x5c^\xf0\xcf\x1a^9w7\
-\x98\x8d\x16\xcd\x8f\xd8{|;L}\xe7n\x9f\xc9\x1a\
-\x06\x00Yi\xad\xc3>3\xf7\xd4*2\x04xs \
-\xe9\xe8\x88\x7fL\x0c\xad#!\xe1U\x0b\xf7\x0e\xdc\xb7\
-\xea\xeca\xf0\x01\x80C|&\x89\x81\xc1\x010\xb2U\
-\xe7Q\xd3\xaf\xd8\xacE\x02\xe0\xde\x84\xd3\xad:$\xf7\
-\x80\xa9C\xde\x8c\xa8\x90\x1f\xff>\x0fv\x95\xac'\xc8\
-/:Z'j\xfaQj\x80\xc0\xf2*\x01\x90lI\
-\x83\xa53\x22\xb3Z\xbe\xfe\xf5#xo\xcdK\x9a\x00\
-\xf0\xf1\xb4\x1f ;\xb5u\xd8gnA\x00\xf8\x12I\
-\x00]SJ\x80\x17\xf6\x0c\xf8C\x94\x00\xce\xd0\x000\
-#\x00\x88J\xa0\xa9\xdb\xf0\x96\x1d\x91\x0e\x90\x1b\xce\x0a\
-\xf0J\x00\x17\x0f\x0ck\x847oY\x17Q\xae\xdd\xe6\
-\xd3\xcb\xe1\xeb\x83\xafB\xe9)+\xd8k\xd8\xd0I\x97\
-\x8d\xa1\x003\xb0O\x87\xc10\xfbo\xff\x8e\xe8\x113\
-\xde\xbd\x1fv\x1e\xdf\xe4\x03\x00\xe33[\xeb\x01\xe0\xc9\
-\xb5\x9a%\xc0\x97\xfb^jR\x00\xacxnw\xbf\xfd\
-\xeb\xf2\xb0\x0e\xe0DV\x80\x08\x00\x87?\x00\x02\xcd@\
-S\xd7a\xd9\xed\xc7>\xd3s\x9b&\x00x\xc4\xb4k\
-l\xaf?9d\x11t\xca\xbcBs!\x0b\xaaO\xc2\
-\xf4%\xb7Cu\x89\xcb\xe7\xdchJ\x00H\x12\xe0\xee\
-!S\x90\x09\xa8}\xe2\x8a\xdb\xe3\x86\xb13z\x83G\
-pI\x00\x10\xa7\xa9\x05\x03\xc0GO\xae\xd1\x08\x80\xd5\
-\xb0\xa4\x89\x01\xb0|\xfe\xae>\x07\xd6\xe7\x9fB\xb7\x9c\
-\xb1\xcd\x90\x15`\xf37\x03}\x000!\x0089\xa2\
-\x04b?\xc0\xd8\x99W\xee\x08\x0b\x00\xc9\x15\x8c\x95@\
-\x9cju]\xc7;`|\xcf\x07\x22\xe0\x8b\x00\x7f{\
-q\x08T\xda\xcb}\x0d\xda\xe4\x00\xe0\xe1\x95\xfb\xbe\x80\
-\xce-/\xd3\xfc\xf3\x1d\x877\xc3\x8c\xf7&\xfb\x021\
-:\xff\xb8E \x00>|r5di\x18\x02rO\
-\xaf\x86\xa5\xfb\x166)\x00\xbe\x9f\xb3\xb3\xd7\xc1_\x0a\
-\x89\x1f 6\xd9\xe8q\x22%P\xe9\x08\xf2\x02\x00U\
-N\xc7\xbay\xd1\x13803{\xfc\xbc>{B\x02\
-\x00\xc0\x9b\x08!O\xbc\x88\xa5\x9b\xc1\xcb\xb7~\x17\x91\
-Ch\xd1\x8a\xf9\xf0\xc3\xeeo}cj\x93\x01@\x0c\
-\x06%\x98\x92\xe0\x8b\xa7~\x89\xa8\x8c\xb3?|\x0cr\
-\x0f\xae\xf7\xbal\xc5@\x8c\xaf\xac\xf5\x01\xb0J\x1b\x00\
-N\xadi:\x00H\x9e\xc0ofl\xef~lkq\
-!\xba\xe5\x8aI\xc2\x00\xf0\xb0JW\xb0\x17\x00\x08\xd9\
-:$\xce\x09\x00Z\xf7HI\xbb\xf3\xd5\x01\xe2\xa4\x90\
-\xa0\xae`_pE\x06\x00V\x06\x1f\x1b\xf2\x0at\xcd\
-\xd661\x02\xd3\xa1\xb3{a\xfaG\x13\xa5`G\xf4\
-\x1a \xb0\xac \x0dY\xc3{\x8c\x83\x87\xc6<\xab\xf9\
-\xb75\xb6j\xb8\xf5\xd9A\xc0Q\xac\x94\xb5\xec\xf3Z\
-\x06\x03\xc0\x07O\xae\x8c\x00\x00/7\x09\x00H,\x00\
-\x01\xe0\xb3G7w\xce\xdb[Q\x8en\xb9,\x89\x06\
-b\x06\x22>\xd7\x07\x00RltH\xab'\x00Hi\
-\x1d\x9bp\xff\xa7CN\x86\x02\x00\xb1\x04x\xc1\xcf\x14\
-\xc4\xc3@\xa7\xb4+a\xea\x88\xd7\xb43\x07\xfd{h\
-\xd1x\xc8\xaf8]/\xef>*\xa4\x98\xaf\x87\xcb\x8b\
-\xc5\x7f\x87\x169\x9a\x7f\xfe\xf1\x9aE\xf0\xe5\xfaw\xa4\
-\xde\xafH\xc5\xa2}\xd9\x0f\x81\x00x\x7f\xea\x0aM\x00\
-\xd8z\xba\xe9\x01\xb0h\xc2\xcfm\xab\x0b\xad8\xb1\xd3\
-eN@\x00\xb0zp8\xb8>\x00P\x85t\xa8\x12\
-D\x09D\x22\xce\xfc\xf4\xaf\xa3\xcf:<ut\xd0\x85\
-!\x02\x14A\xdc\xfb\xe5\x89\x17\xb3\xc6|\x00\xadS;\
-i.\xec\xcf{V\xc0\xbfW\xcem\x1aEPa\x01\
-\xb4\xcb\xc8\x81W&kO\x07w8m0a\xd6u\
-`s\xd7z\x01 [\x00\xde\xc9\xaa\x82:\x00Z\xa4\
-\x86O\x8f\xc3\xab\x9f-i\xa2!\x80\xe4\x03\xe8b\xf9\
-\x05\xd7\xach\x05<\xc9\x07p\x9a\xe2\xf4,\x96\x00\x02\
-/\xd4w\x04\xa1+\x06U\x86\x98\x81@r\x02\xc7\x1c\
-ur\xb6\x98\xa0\x1bB\x04(\x82d\xfa\x95C\x9c}\
-\xd39\xbd'L\x1d\xa9]\x0ap\x1c\x0b\x0f,\x1a\x07\
-\xe7k\x0a\xb4M\xc2\x8c\x84\x14\xf3\x16\x9f\xb9\xedU\xe8\
-\xd5i\xa0\xe6\x9f\xbe\xff\xfdk\xc4\xfe'=\xdfo\xfc\
-W\x00U\x05\x00\xefM]\x8e$@x\x00\xe0\x90\xf8\
-g\xbb\x9fk\x22\x00\x18qb\xa8u\xc1\xe0\x15\x9d\x01\
-$\x00\xc4\xea\xb1\x0e\xc0\xa12\xd7\xf7\x03H\x87\x17\x00\
-3~\x1e\xbd\xc7\x0d\x8e\xd4P9\x81^\xe7\x8a4\xff\
-\x0e\xf7~\x9c\xaa\x85u\x82\x07\x87\xcc\x87\x9em\xaf\xd6\
-\x5c\xe0]'ra\xfe\xd2\xc7\xa2;\x0c(\x16k\xc8\
-i\xd9\x03\xe6\xdd\xfd\xb6\xe6\xb4\xb5\xbc\x923p\xdfs\
-7\x03Os\x12\x00\xc4\x8c\x1cJ9\xfe\x07\x01\xc0\xbb\
-O|\xaf\x09\x00\x87\x8aw\xc2\xbb\xdbg\xf8\xeb\x162\
-g\x1aI8'\xd0\x00\xe6\xd2\xe7\x86\xac\xc4\xeb\xe5\x11\
-\x00\x18ct\xc4\x0f\x80\xaeC\x02\x00\xe7\x04\x9a\x9f\xfa\
-iT.G\xe1\xc5\xa1B\xact)y\x04\x05iY\
-\x16y\x02&v\x0c%\x18R`\xce\xf8\x8f!\xd6\x14\
-\xaf\xb9\xd0\xaf}7\x13\xb6\x1c\xfa1z\xc3\x80\xc4\x1c\
-<\x87\xef\xe5{?\x83\xecTm\xb3\x96Y$\x91\x1e\
-}\xe5n8\x96wPd\xbc^!\xfe\x15\x1e\xc0\xe0\
-\x00\xf8N\xd3\x10p\xbe6\x1f\x9e\xfby\x22q\x05G\
-\x1b\x008+\x98\xe6\x8dg^\xbcn\x15\x16y\x98\x89\
-.\x83E\xe7\x91\xbc\x80\xf5\x00@\xa6\x85\x83\x0f\x00\xa6\
-'\x7f\xb8a\x9d`\xf0tq\x85Z][9\x0cH\
-\xf3\xef\xc8$L\x87(\x11.o9\x00\x1e\x1e1O\
-s\x8d\x1c.\x1bL\xfbp\x22\x14U\xe6E\xa5!d\
-\xed\xff\xbe\x11\xd3aX\xcf\x9b4\xff\xee\xa3\x15\xff\x86\
-\xa5?~@\x82>^\xf1\xaf\x0b0\xff\xbc\x1a`}\
-\x00\xbc\xf5\xd87\x90\x9d\x1e\x1elx(~v\xedx\
-p\x81-\xea\xe1`\xa3\xce\x02\x94[\xbf\x7f\xe1\x88\xd5\
-d^\x00:\x5cz3\xe3A\xc34\xb6\xeb\xeb\x87\x83\
-!\x00\x00\x8f\xaf\x1c\xb1T\x17#\x0c\x08\xb9\x19d\x80\
-\x8f\x9dS,\xc6@\xc0\x80>\x8f\xef=\x19F\xf6\xb8\
-Cs\xc1\xcfW\x15\xc2\xbf\xbex\x08\xcakJ|\xa5\
-k\x08I\x8c\xb9\xa1\xf7m\xf0\xf7\xa1S4\xa7\x9b\xff\
-\xb2s-\xbc\xf0\xc93b*\xb6\x9e\xf2S\xfeTM\
-U\x15\x00\xbc9e\x09\xb4i\xde^\xd3\xfb\xbe\xd9\xf7\
-&\xec(\x5c\x1bu\x00\xe0E9=V\xd8\xf4\xda\x98\
-u\xb8\xf1\x09\x00\x90\xa4\xf1\xa0\x0e\xaa\x0d\x00\x0f.\x1d\
-\xba86M7\xc6\xee\x09\xb3<\xbc\x94\x17\xe7\x9d\x85\
-\xeb\x96\x86\x01\xa7\x08\x00\xecG\x9a<t\x16\xf4n\x7f\
-\x8d\xe6\xc2\x9f\xaf.\x82\xe7\xbe\x9a\x0aE\x15g\x1b>\
-=\x1c\x9d\xae\xbf\xf2\x16\x988\xf4\x11\xcd\xcc\xdf{l\
-'<\xb3\xe8!\xb2 \x06\xf6\xf6\xc9\x8bT)\x95\xbf\
-\xc0\xa5j\xd4\x00\xf0\xca\x03\x9f@\xfblm\xa1f\x9c\
-\x17\xf1\xda\xd6\x87\xc1\xcaU\xfa\xc5\x17\x1aK\x16}\x1c\
-\xd4\x95x\x96\xbfu\xc7\xcf8DKt\x00\x04f\xec\
-\x04\x0a\x09\x00y^\x80\xe9\xce\xd7\xfb\xcd\xcf\xea\x9a4\
-1\xe4\xec`Ec\xfbI\x01\xb7oU\x0e\xfc\x99\x12\
-\x18\xb8w\xc8\xb3\xd0\xbb\x83\xf6\x04\x0c\x9b\xb3\x0e>\x5c\
-\xf7*\xe4\x1eZ\x1f\xf1\x02\x11&\x83\x85\xf8\xfb\xaf\xbd\
-|\x94\xe6\x9f\xed8\xb0\x05\xe6\xbd\xf7$\xb89\xb7(\
-\xee\x95\xab\x94y\xd3\xb6U\x14T\x15\x00\xcc\xfe\xc7\x1b\
-py\xfb>\x9a\xdf]\xe5(\x85\xd5\xc7\xde\x87\xa3\x15\
-;\xc5M\xb7\x83\xd4\x17o\x13\x87\x95r^\xc3>\x8d\
-8\x14\x9c\xbf\xaf\xea\xc3/\x9f\xd8\x86g\xec\x12\x09\x80\
-\xea\x85\xd4\x1bA\x1d\x00\xa8b\x8c \xf8$@\xff\xbb\
-;N\x19pw\x87\xe9x\x8d`-\x8d\xee\xa7\x0b\xe0\
-\x09\x98.1J\x88u\x02\x9c)\xeb\xac\xe5\xe0\xb6\xbe\
-\x0f\xc3\xa8\xab\xc7G\xc0M\xec)\xdc\x03\xdfn\xf9\x08\
-\x8e\xe4\xef\x0b\xfb]\xbc&\xcf\xc0.#\xe0\xe6\xfe\x7f\
-\x87\x94\x04\xed\x8b/\xaf\xdd\xf2\x1d,\xfa\xea\x05\xe2\xf6\
-\x16\x97\xa4\xf39}hy\x0a\x96\xdc\xfb\xe5\x16\xf3\xab\
-\xbb\x0f\x0087p\xca\x84i0\xf8\xd2\x1b5\xbf_\
-&\xbc\x0fcq\xdd\x19\xb0\xba\xab\x81\xcc\xc9\xc4\xab\xad\
-\xea\xcc\x10gH\x86$s\x1a$\x18S\xe1\xc5\xad\x13\
-\xa1\xce]\x19\xf6Yx\x91\xae\xcd\x1f\x1f{>\xf7\xf3\
-\xe3\x8bd\x00\x18\x90\x0e\xe0vp\x9c:\x00P}\x91\
-NB\xd2\xc21\x00\xfaMh\x7f\xfb\xa0{;\xbfR\
-\xeb\x0a\xff2y\xa1&A\xf2\xb6\xc9\x130\x89B(\
-\xad\xd0U{\xde\x05U\x85\x0e\xb8\xae\xcfhx\xf8\xf6\
-\xa7\xc0`0\x86\x7f\xae\x82\x0a\xcb\xcf\xc2\x8ec\x9b\xe1\
-t\xc9Q(\xa9\xcc\x07\xbb\xcbNz#\xb62\xb2R\
-\xda@\xe7\xec\xcb\xa0w\xa7\xab!\xce\xa2}\xc6\xaf\xcb\
-\xed\x84\xb7\xbfY\x08?\xe4.\x17m{y\xf2\x85\xde\
-\xb7H%%\xcfW\x08\xe6\xa6\x0e\x00@\x5c3#\xf4\
-\xed6\x10\xee\xbbzN\xc4\x00\xd0B/\xe4\xfe\x1d\x01\
-\xa0*\xacT\x8c7&\xc3\xc6\xf7\x8f<\xb6m\xc9\x89\
-\xaf%\x00\xb8\x8d\xb1z\xec\x09T\x07\x00\x88f\xa0w\
-\x08\xe85\xae\xed\xe0!\x0fv\xfd\xb2\xceU%\x8a\xa5\
-p\xa4p\xb8\xc8s\xe6\xe4\x15\xba\xf0\xb92\xcf\x8e@\
-\xe0$\x7f\xc7\xd3\xa6\x1e\xbd\xf3\x19\xc8i\xa7}vn\
-\xb4\xe9\x8f\xe3\xbb\xe1\xb5\xcf\xe7AqY\x81\x97\xf9d\
-\xd6\x8d\x0c\x00\x9dr\xa1*\xca/?\xbf~\xbdE\x00\
-\xe0\xefdt\x8a\x05\xf0\xd00\xe3\xfaw!=!+\
-\xea\xe5~>w\x22\x01\x802U<\x90P\xc9!\xd6\
-\x98\x04?-:p\xfb\xef\xff9\xbd\x09d+\xc0\xc4\
-\xe0P\xb0*\x00\xf0!\xeb\x00D\x02t\x19\x92\xd5q\
-\xf4\x8c+6\x86\x9a\x1bP\x8f\x94QB\xc9E\xccI\
-\x00(=m\x83\xbaR\x97w\xfd^\xfc\xcaa\xfdF\
-\xc3\x1d#'AZr\xe4\xfb\xe55\x94\xce\x16\x9d\x82\
-\xcfV\xbd\x0b\xdb\xf6n\xf0\xe6\xd9\x13\xe63\xbe\xf1^\
-\x9e\x82%/T\x15\xd2;\xa9\x00@r\x96\x09\xf0\x16\
-\xbb\xd8#\x9a\x15\xd7\x01\x1e\xbb~!\x18t\x91I\xba\
-P\x84\xd3\xf3^\xd8\xf2\x0f\xb2\xb9\x05\x15\xa2Lr$\
-p\xf9\xfc\xdd\x03\x0f\xffZH\x92A\xd0\xe1F\xf5\xc3\
-\x81 \x16\xd4&\x87\x82\xbf\x040\x9a\xe2\xf4\xb1\x8f-\
-\x1f~\x04\x8dKz\xcd\xfb\x03\xcb\x0a\xa1\xe0\x9b+\x87\
-\x95\x22\x0c\x80\xf3'\xc4\x89\x9c\xcaE\x9ce'\xcd\xd0\
-\xbe7\xc0\xe8A\xe3\xa1u\x8bvM\xc2t\xbc\xf6\xef\
-\xee\xc3;`\xf5\xa6e\xb0\xf3`\xae\xb8\xc0$\x150\
-\xf7^b\xba<\xe6\x87\x1c\xf7U\x00\x80\xe78ft\
-\x8c\x15\xcd`\x07G,\xa1\xec\xc4\xf6D\xf9M\x89\xd7\
-\xb6d\xae\x1a!\xb5\x1d\x8e\x97\xed\x83\x03%\xdb\xe0h\
-\xd9N\xa4\x1bX\xa5\xf5\x04\xa8\xa0 \xc0n`d\x06\
-\xba^\x1e\xb5\xf6R\xb7\x9d\xccg'\x00\xc0\xeb\x03\xa0\
-\xf6W\x9f\x1d\xac\x00\x00\x91\x00\xf8\x98\xb6n\xe4F\x8e\
-v\xb5\x8eh\x13F\xe5tly6\xaeGJ\xf5.\
-sK3iEe\x890B1\xbatn\xdb\x15\x06\
-\xf6\x1c\x02=s\xfaA\x8b\xb4\x96\x8db\xba\xddi\x83\
-\xc3\xa7\xf7\xc3N\xa4\xddo\xdf\xbf\x05\xca\xabJ\xc5\x82\
-I\xb5\xc5\x8d\xa7\x5c\x98\xba\x1e\xf3E\xcdH\xdb\xe2\x90\
-\xe8\x94\x89D\xbf\xc1D\x8b\xc3\x9eC2\x83q\xaa\x1c\
-j\xceA9\xa3`P\xd7Q\x90\x9a\xd0<l\xb9\xf1\
-\x0e\xd0x\xce\xc4\xc9\xf3\xfb\xe1D\xe9\x1fp\xba\xe20\
-\xd2\xfc\x1d\x0a\xa0*\x15S\xf5\xf2\x19\xc9J\xa1\x863\
-\x0bG\xac\x19,1\x9f\x00\x00}\x1f\x07\x82\xc2\x02\xc0\
-\x1b\x0fxd\xd9\xb0O\x0d\x09\xd4 G\xa4[\xc5\xa9\
-\x80\xa0\x04I\x80\xdaR\xb7\xff\x5czN\xf0\xea\x0dJ\
-\xc2=/\xbdY&th\x9d\x03\x1dZu\x86\xb1\x83\
-n\x07\x9a\xd6\x96\xc0\x81W\xf4\x9a\xf6\xc6d8[x\
-\x1a84\xdc\x91\x19\xc4\xf2\xc4\x22\xca7\xdf\x9e8]\
-\x18\x1f\xe3\xe5\xe5ih\xa5\xd8\xd7\x12\x93@\xcf\x8eK\
-3@J+\x8b4\xf3X\x10C\xe3\x0a\x0b\x88\xccl\
-\xc2\xab\x87'fC\x0b\xa4\xb0\xa6\xc6g\x10S\x15\xef\
-f\x82\xbd\x81vw\x1dT\xd9J\xa1\xa46\x1f\xca\xad\
-E\xde\xbd\x0a\xbc\xd3\xff\x14C\x94\x9fu\x12$z\x8a\
-}\x00\xcej\xfe\xd77\xc7\xad\x9f\xa8\x00\x80\x07}\x8f\
-\x95\x02A\xaa\x00\x90}\x01d\x89\x18\x0c\x80QOw\
-\x7f:gH\x8b\x7f\xd6\xb9\xab!b\x0a\x88\xc3\x97\x9d\
-\xb6CM\xb1\xd3\xeb0\x92\xb3\x89\xe4E\x9e\xc9!\xfd\
-N\x9c\xf1Ly\xc5\xf4\xb2\x85\xbf\x82\xd1\xa0mK5\
-\x9e\xe7\xe1\xa6'\x06\x01\xcb\xb2\xbe\xc9\x9b\x00^E\x8e\
-\xa2}\x8c\xf6\xedG\xe0\xbf,-\x84R\xfa\x02\x083\
-#\xbb[\x02)\xa7R\xef\x91%\x00+\xadV.\x0f\
-y\xde\xd9\xad\xd2\x0b\xbc\xd3\xbf\x95\xef\xa6\xc1\xaf\x1cr\
-9\xc9\xfa\x00F\xc5\x22\xdaA<\x87\xd8\x04<\xb0\xae\
-`\xf1\x9a\x85\xfb^\x94\x01\x80\xbe\xefQ\xfa\x00B\x01\
-\xc0\xeb\x0b\xe8s[\xbb\xf1\xd7\xdc{\xe9\xab\xd8\x14\x8c\
-x\xbf \xdf\x12=\xe2\xec\xde|\x07T\x158\xfc\xe6\
-\xd4+\xe7\xd5{\x81 \xf8~+\x97\xee\xcb\xe7\xd7@\
-|\xacv\xf3n\xf2\xdc\xdb\xa0\xa8,\xdf\xfb{\xbf\xe9\
-\xd5\x81\x00\x905}:@\xe1\xd3\xc0|L\x19\x1db\
-\xc1\x82\x14?\xa5\x1fD\xd6{d\x09\x80A!/\x1e\
-\x01\x0a\x0cx_A\x81\xc2\xc9\xe4\x0f\x00\xdc\xcbe)\
-\xe5]E=\x84\x04\xc0\xa5\xc7&\xe0\xaf\xef\x1d~t\
-\xfb\xd7'\xff#\x01\xc0\x85\xea\xe8\x11\xb8\xe0\x00\x005\
-\x00t\x1d\x9a\xd5e\xd4SW\xac\xb3Fb\x09\xa8\x00\
-\x01\xbf\x0d\x9b\x80eg\xec>\x05P\xb9\xb8\x02\xef[\
-a\xcb\xbb\xdd\x0b\xefk\xa87\x9f\xfa$\x22\x05\xf1\xf5\
-\xcf\xe7\xc3\x86]\xeb|S\xa9e\x1f\xbe<\xbf\x9eV\
-\xf4x&\xa0\xf1#`~\x5c\xaa\x01R\xdb\xc4\xd4S\
-~9i\xc6\x14\xf1\x85x\xc4\xcd+\xbcu\x15\xe4/\
-\xfbT\x12\xaf^\x02\xb2\xe2)\x01U\x01Vy\x85\x10\
-\xb2\x96b\x08\x1d@'Y\x00+\x9e\xdb}\xdd\xa1_\
-\x0a\x0f{\x01@\x81\x07\xbdZ\x06\x00(\x01 ?\xa2\
-\x9e;\x18\xbd\xdc2\xed\x87\x91\xbb<\x82#\xa1Q\xbb\
-q\xa3\x9a\xda\xab=P|\xcc\x06\xdem^\x84\x80\xc5\
-\x15d}A9$H\xd7OM\x9c\x0f}/\xd3\x9e\
-\xc8\xb1\xe3@\xae\x18\xd0\x91\x17R\x90\x19]o\xff!\
-\xc5\xaa\x1c\x14\x84W\xf8\x14\xa4GZ\x7f\x8bK\xe3\xbc\
-\xab\x86)WL\xf7\xeeY \xef\x5c\x12\xb0\x86\x90r\
-\x99{/\x03\x94R\x80\x16{\xbe\x17\xa8\x8a\xa1\xca\xbb\
-\x7fB\x90\x05\x22p\x18\xd8@\x99\xab^\x1c\xb6\xfaJ\
-\xf4\x1a\x87\x0c\x00t\xb0\xd2\xa1\xbeR(\xa88\x83\xf0\
-1\xe5\xdb\xa1\x9f\x18\x13\xe9\x81a\x83Ba\x08+E\
-\xf9\xfbj\xbd\x09\x1a\xde\x9d\xbex\x9f\x22(\x0f\x01~\
-R\x01\x1dc\x07O\x80\xbf\xddp\x9f\xe6wa=\xe0\
-\xd1W\xff\x0e%U\x85\x92\xc8\x97\x95?\xca/\x9b\xa7\
-!\xbd\x9e|\x0d=\xa3EN\x1cY\xe1\xccK\xf2\x90\
-\xa7\x00\x01\x91\x06\xf2\xfeEJi'(~\xa3\x90\xc3\
-^\x10\x04n\x96%3\x9c\x09\x00\xafJ\x99\x89\x02X\
-\xc5o\xfc\xf7-?\xfd\x03\xa4<\x00|\xa0\xdf\xe1u\
-A\xbcN 5\x00\xd4\xf3\x05\xa0\xc3<\xec\xe1.\x0f\
-]1\xa6\xf5\x13\xb5\x1a\xfc\xcf\xa1\x08W\xfa\xec\xee\x1a\
-Q\xf3\xf76\x98r\xcb7\xdf\x06P\xf2\x8a\x1brO\
-j\x99\xda\x06^\x99\xfaAD\xef;rf?<\xf7\
-\xf9t\xb2-\xac\xdf\x9e\x03^\xedZ\xd1\xeb#`>\
-\xa6\xb4v1\x10\x9b\xac2\x03*\x00\x04~RMi\
-\xf1(\xb6\xb6#\xaf\x96\xcbC\xd7\x07\x81\x088\xaa\xbe\
-\xa2\x18\xa4\xccx\x91\xe8\xdd\xdf\x9f]\xb8~\xf1\xc1\xb7\
-$\x00\x10\x130\xd0\x02\x08\x07\x00\xaf)\xd8mx\xcb\
-\x1e#\xa7^\xf6\x9d-T\x86\xb0F*>j\x15\xe7\
-\xff)\x14D/:\xbc\xe9[\x8a\x86\x93\x96\x5c\xc1J\
-\xd4+\x8f\x7f\x00-3\xdaD\xf4\xbe\xdc\xfd\xbf\xc0\x87\
-k_\x13A\xa0\xc6\xf4\x08\x19\x8f)\xb1\xb9\x09\x92Z\
-\x84\xb0H\x14\x8c\x0dd\xb8\xa0T\x02\x03\x14]\xe5\x10\
-\xe4\x1fu\xf4\xdf31T\xb9\xe5\xf1\x7f\xcd\xcb\x7f\xdc\
-\xb8\x7f]\xde\x1eP\x9a\x80\xa2\xf8\x0f\x0b\x80@E\xd0\
-\xac\xd33\xe6'V\x0f\xff\xcd\x03\xaed'\xdb\xb8\x05\
-\x1b*\x91\x15PS\x1c\xe0UT\x82A!\x15\xbcN\
-$iU\xaf\xfe\xdd\xae\x85)\x13\x9e\x8e\xf8\x9dgK\
-N\xc2\xe7?\xbd\x05\xa7\x8a\x8f5\xa8\xb7+)\xb6\x99\
-\x1eR\xdbZ\xb4=\xc0\xaf^\xfeb_\xf0\xa2\xddW\
-\x1e\xef@$\x9f\xbcC\x03\xa5\x19\xb08\x5c\xac\x03C\
-\xc5\xc2\xeb\xd7\xf6C\x12\x07\xf7~q\x08@\x0a \x08\
-~\xe3\xbf*\x000\xd5\xb3\x04\xf0\xf1\xb77\xfb\xbf\x98\
-\xd99\xe1\xe6:-\xa1\xe1\x10d\xaf\xf1\xc0\xf9\xe3\xa1\
-\x96\x9eU4\x98\x22\xa8Dv\xfeB\xa6\xd5\xbf\xee\x7f\
-\x05r\xdauk\xd0\xbbO\x17\x1d\x83\xdd\xc7\xb7\xc1\x09\
-\xa4\x18\x97T\x16\x80\xd5\xe9\xaf\xd3\xe0\xde\x15oI\x80\
-\xd4\xc4Lh\xde\xac%\xb4Lk\x0bm2;\xc0+\
-\xdf<\x0bv\x97\x0d\x99z:\x22\xfa\xd5\x16r\x0aI\
-\x81\xd2N\xaa_=R\xf4\xeezo\xd0\xf8Jl\xff\
-\x17\x1e\xacZ\xf6\xc5c\xdb\x9e\x02_\xef\xc7=N\x96\
-\x00^\x0b@\xed\xb1JE\xd0\x1b\x16F\x87\xb9\xe7M\
-m\x86\x0c} \xe7]k\xb0\xa9b\x1a\x09\xbb\x7f\xcf\
-\xed\xad\x81\x90.\x85 +{b\xbb:\xde\x9c\x08/\
-<\xba\x08R\x92\xd2\x1a\x5c\x06\x99\xf0\x160.\xb7\xcf\
-\xb21\x1a\xcc\xaa\xfb\x0cOY4\x018\xbd\x03\xd2;\
-\xc4\x80Fgd\xc8\xba\x85\xa5\x06J'<\x170\xd6\
-\x90\x00h\xec\xbf\x17\xe9\x00\xbf\x82r\xfc\x17\x01\xe0\xa7\
-\x00\xaa\xbd*\x98\x22h\xb2$\x1a\xe2\x1f\xfaj\xc8&\
-\x8er'5j\x0byD%\xc8\x14t\xd4\x86\x06Q\
-\xbd\x95=\xa5\xcd\x9f\xf0\xb9Y\x5c*\xcc~\xf0e\xc8\
-H\x0d\xefW\x8f\x06M\xff\xf4n\x88\xcd\xe6\xa2\xbax\
-CS\x10\xce\x01d\x04}\xc5\xbfo\xfdy\x90\xa3\xc6\
-\x8d\xc5\x9b7\x06\x00*\xe3?\xa6`\x00\xa8\xe7\x12\xc6\
-\xcf\x1f;\xab\xc7S\x9d\xfagL\xac%\xc3@\xc3W\
-\xed\xaa-uAE\x9e\xc6]\xc8\xe4\x95=\xa5,#\
-^\xda\x0c\x12\x87X\xef\x1as\x1f\x5cw\xd5H\xd4k\
-\x1b\xdb-C\xd3\xc2\x8d\xf7\x83\x8b\xb7E\x7f\xc2JT\
-\x09o\x11\x93\x04G\xb6\x14\x7f\xb4b\xde\x1e\xec\xfeU\
-\xda\xff2\x00\xfc\xc6\x7f\xb5\xaa\x04\x9b#@\xf4\x80\x8e\
-\xfd3:\xdf\xf8\xaf\x9e+\x91\x04\xa0\x82N\x16\xd1@\
-\x98\x91\x05\xfb5$\x9a*\x16\xa3\x94\x87\x01\xa2\x0b\xe0\
-Cr\xa8\xb4Ho\x09#\x07\xdd\x08\xfd{\x0c\x06\x8b\
-I\xfbr/\xe1\xa8\xb2\xae\x1cJ\xac\xe7\xe0\xbc\xed\x1c\
-l;\xb7\x1ax\x8a\x8d\xda\xa6\x8eMAx\x12\x08R\
-\x00\xf9\xeff\xed\x1cu\xe2\xb7\xd2cP\x7f\xfc\xf7\xce\
-\x05\x80\x10\x00\x90\xef\x05\xea\x01\xc4\x1a@\x87\xe9\xbeO\
-\x07\xbf\x9d\x98i\xbe\xba\xb1\xca`\xc91l\x0e\x86H\
-l\x0c\x08$\x89\x0b;\xf9\xb6\x84\x95\xdd\xaa\xb2\xbbX\
-\xaf\xd3C\x97\x0e\xdd\xa1s\xdb.\xd0\xb6e;\xc8L\
-\xcdBzB*0L\x90\x1d\xbc\xd0\x8f\xac\x0e+T\
-\xd7U@U]%\x94\x94\x17BqE\x01\x14\x95\xe3\
-#\x0f\x98$'\xc4\xa6\x18\xd4\xe3\x05\xc1Z\xeeO$\
-\xac\xfcU\x16\xd8\x7f\xfd\xe0\x1f\x1b\xe5\x0c`\xd9\x01\x14\
-t\xfc\x0fV\x0d\xb5\xdc\x00\xaf\x14\xe8:,\xbb\xcf\xc8\
-\xa9\x97}\x8a\xe7\x0a\xb8\xb9\x86/\xe3\x86\xf3\x02*\xce\
-\x85q-\x07H\x01\xafI(/\xcf\xee\x0d'C=\
-\xcf\x1a\xa9\x18\x82q\x5cL\x1c\xc4Xb\xbd\x9e3\xec\
-\xc7\xc0\x09\x16.\x8f\x0b\x9d=\xfe\xad\x80~\x8b#m\
-\xcdZ\x99\x89\x9b\x97\xec^.\xa5\x86\x93\x14\xb1\xc09\
-\x81\x17\x09\xe1\xdeo\xd6\xc5\x08\xab_\xfa\xe3\xae\x83?\
-\xe5\xe3}p\x94\xbd?\xe8\xf8\xaf\xacz\xe0=\xa5\x14\
-0\x80\x22A\x04\x1f\x93?\xbd\xe6\xfd\x84LS_\x9c\
-\xb9\xaa\xe6\xd3\xd6B\x98y\xf9\xfbk!\xe4\x86\xe4B\
-\xa0I(%\x92x\xe4]:\xa4\x08\x9b\x9cX\xa2\xe6\
-\x5c\x91\xceJ\xc7\x8a\xdf\x1e}\x0aGKl3\x03\x89\
-\xeb+}\xf0\xde\x89!\x06\xc5r\xf6M\xb2\x82E\xc3\
-\x08\x97%\xd6\x90\x88wI\xc9}\xff\xefHY\xf11\
-_V\xfe\xf0\xa1\xec\xfda\x01 \xdfW\x1b\x06\x08\x00\
-\xda\xf7M\xefr\xd3\xec\x9e_\xb9y\x07\xd3\x18\xc7P\
-\xf9Y\x07X+4\xecH\x8a\xcfx\x18P\xa4\x99\xf9\
-\xad\xd1\xcf\xfb\x12.\xe4x\xbb?\x0e(\x7f\xe7\x8a\xd2\
-\xbb\x86+g\xa1!!\xc3\x88\xce\xe2p!\xbb`\x95\
-\xd171C\xf8\xe2\x93\x00\xd8\xf1c\xa0M\xdc\x7f\xfe\
-\xf5\xfb-'\xb7\x97\xca\x91?e\xef\x0f*\xfe\x01B\
-\x03 \xd0-\xec\x05\x00>\xc6?w\xe5\xb3m{\xa6\
-\xddbk\x84_\xc0e\xe3\xa0\xf8h\x18\x93\xd2\xeb[\
-\x97\xfd\xebb\xf4P\xf6\x12z7kRD\x0fe\x0b\
-\x22(I\xda<\xde\xa3\x08\xf7xK\xa2\xde;lP\
-\x8aH\xa1\x9c\x80\xc1\x04f\x08\x87j\xb9\x0bH\xf2\x1a\
-@\xa7\xb6\x9f\xffj\xd9\xac]\xcf\x81\x7f\xefW:\x7f\
-T\xc5\x7f\xa8j\x04\x0e\x03J\xa7\x109\x123,\x09\
-\x13\xdf\x1b\xb8\x8c1R\xcdmx(h\xa0Y\x88\x01\
-\xe0\xb6\x85\x99\xe5\xa2\x00\x01\xd4\x0b\xb2(r\x0bxY\
-)T$\x95\x08\x8a\x07H\xd5\xc5[\xae\xc44\xd3\x13\
-\xc6\x8bk\xf4+\x83D\x8a\xe8\x9b\x9c\x85#3\x9e\x09\
-\x1e\x81\xbb\xd0\x84K\x11\x83D?\xe7\x14\x0a?\xbao\
-\xd3\xf8\x9a\xf3\x0e\x9c\xb2\x85\x99\xae\x14\xff\x81\xbd_3\
-\x00\xe4\xbf\xd1\xa0\xee\x13\xc0\x87\xb1\xf3\xb5\xcd{\x8d\x9a\
-v\xf9\xdb\xac\xe0\xd674Tl\xab\xf4@\xf9\x19\x0d\
-y\x06*~uo\xd2\x08\xaf\x00\x85\xe0\xaf\x0f\x08\x12\
-\x000\xe3\x8cq\x0c\xc4$\xe9\xc1\x14\xaf\xf3\xe9\x03r\
-\x04\x0e\x7f- \xe2&\x86`\x95\xc9$\x17\x07\xf31\
-\xe1\x90\xaf\x8e2xV\xbe\xb0g\xf2\xd1\x0d\xc5\xbb\xc0\
-\x9f\xf9\x81\xb6\xbf\xaa\xf8\x0fW\x155)\xe0\xf5\x0c\xca\
-\xd7#\x9e\xb8\xec\xaen\xc3\xb2\x1f\xc7\xba\x80\xab\x01\xfa\
-\x00f\x96\xad\x92%1\x02g-\x1bZ)\x04\xf0\x8b\
-\x18\xaa\x85\x92\x95y\x06\x98\x81\xa6\x18\x061\x9c\x01s\
-\x82\xce\x97\xb8Aj\xe7c\xa62\x02\xe7\x0d\x15\xab\x84\
-\x8f\xa3\xb1\xabw4\x08O\xfb6\xa1c\xdf\x0fy\x0b\
-\x7f|m\xff\x12\x90\xe2\xfd\x10a\xef\x97\xaa\x1d\x94\x94\
-\xc1!5]\x80\x00\x00w\xac\xf1\x0bz?\xd3\xa6g\
-\xea\x8d\x0e\x8f\x15\x1a\xe3 \xc2Lt\xdby2$\xb8\
-\xec\x9cw\xb1\x09>\x10\x14\xf5\xa2\x878g\x0eH\xbe\
-\x1c\xde}\x04\xefB\x8as\xf4\xf1\x01\xf2\x0a\x0e\xc1\xaa\
-\xa7\xc8\xbc\x85@&{\xc1\x11y\xc2HS\x111\xf9\
-\xf4\xb1pjg\xe9w\xcbf\xee\x5c\x80\xaa\x86\x99\xad\
-\x04\x80<\xf6\xe3C\xee\xfd\x8a\x96Rm\x85\xa0\x14L\
-\x17P\x82\xc0\xa072\xa6;^\xef\xfbR\xfa%\x09\
-W;=6hT\xea\x98\x0aa3\x8fc}\xde?\
-\x99h\xda\x97&%o\xe2\xe4\xad\xa9V\xf3T\xce\xcc\
-Ui\x91\xc6\xe4\x0c4\x05\xe1\x5c\x7f\x93\xde\x02%'\
-k6.y\xec\xb7\xe9\x1e\x17'\xf7v%\xf35\xf7\
-~-\xd5RJ\x81\xc00\xb1\xf20\x98bu\xe6\x9b\
-\xe6\xf4\xfcWV\xd7f\xc3\xf0P\xd0\xd8\xbc\x81\x88\xa9\
-\xe1\xa1\x89\xc8[\xe5O 36\xf7tf(\xd8_\
-\xb1\xee\xbb\xd9\xbb\xe6:\xad,\xeee\xca\xde/\x1f\xca\
-\xb0o\xc8\xde\xaf\xb5\xaa\x81R \x18\x08\xf4H\x12\x18\
-G>\xd5}J\x87~\x19\xb7\xb1\xbc\x9b\xc2\x8aaC\
-\xad\x83\xbfH$$\xdf\xc8f\x9c\x0cm\x10\x8em)\
-\xfeb\xedK\x7f\xbc\xc5\x8a.X\xcc\xe8`\xcc\xd7\xd4\
-\xfb\xc5\xe7k)\x83H\xb2\x14\x90\x87\x82@\x10\x18\xe4\
-\xfb\x03\xff\xd1qD\xaf\xf1\x97L\xa7(\xc1\x84\xf5\x02\
-O\xb0u\x06\xff\xa2\x90D\xe6\xf7\xe9c\xd0hF9\
-\xb7\x7f}rA\xee'\xc7\x7f\x02\xdf\xf8\x1e\xd8\xfb\xe5\
-\xfb2\xf3\x83j\xfeJ\xd2*\xec\x02\x15B\xa5> \
-\xeb\x04F\xf0\x01C\x9f\xd9)\xb1\xc5\xa8\xa7\xba?\x9b\
-\x98\x19s9\xf6\xbfc hY\xd5\xe2/\xc2\x06\x08\
-C\x14=\x9c\xdfWUd\xdb\xb3\xfa\xc5}\x0b\x8a\x8f\
-V\xe3\xb5~=\x8aCf\xbc\xec\xeeUF\xfc\xc2\x8a\
-~\x99\x22\x19\xed\x94C\x81R\x1fP\x82\xc0+\x05\xf0\
-\xdfu&Z\xdf\xff\xae\x0ec\xaf\x18\xdd\xfa\x1eFO\
-'y\x90\xe4\xc2\x0a\xe2_@P'\xccx\x9c\xd3\xaf\
-g\x8c8\xe2Y\xb5g\xc5\xd9\x0fr?;\xbe\x82u\
-\xf3\xb2h\x0f\xec\xfdJ\xe6\x07\xda\xfc\x9a\xc6\xdeH\x01\
- \x9f\x03\xf5\x01C\xc0\xa1\x07\xdf\x04\x13&\xb9el\
-r\xdf\xdb\xda\xdd\xd6\xe9\xea\xe6ch\x06\xe2\xf1\xd2\xb3\
-\xd8\x5cll\x86\xf1\xff\x0a\xe1\x9e\x8e\xcd;\xbc\xd3'\
-\xb2tj\x8fl,Z\xb1\xfd\xabSK+\xf3\xad8\
-\xe6\x8e{\x8b<\xa1Cf\xbe\xf2P\x1b\xf7\x01\x9a\x00\
-\x00\xca\xef\xd3\xa0.\x09\x94`\xf0\x03\x01\xfenrv\
-lb\x8f1\xad\xc6\xe4\x0ci1Zo\xd6e\xf2<\
-\x0b\x1e\xce\x0dx\xed\x01\xee\xff\x99T`Po\xc7c\
-\xbc\x9e\xc1\xd1G\x1d\xb8\xedl\xe1\xc1\xf5\x85+\xf7\xac\
-:\xbb\xb2\xaa\xc0\x86W\xe5\xc2\xcc\x0c\xc5|Y\x1a(\
-{\xbef\xd1/SC\x0c\x1e5\xa5P\xa9\x18*\xc1\
-\x10\x08\x02\x02\x04\xbc1E\x97\xeb\xb2\xae\xea2$\xeb\
-\x9a\xb4K\xe2\xfb\x22;>\x06\xaf|\x81%\x83\x07I\
-\x85\x06\xcfA\xbc\xc8\x09\xaf\xda\xa1G\x07\xee\xe9xC\
-'\xd4\xdbm\xa5\xa7j\xb7\x1d\xfc)\xff\xd7\x03?\x15\
-le\x9d\xbc\xdc\x8b\xe5\xb1\x5c\xc9|\x19\x00J=@\
-9\xe6G\xcc|L\x0d\xb5x\x83I\x02Y\x1a\x04\x1e\
-\xf5@ =\x03oXmi\x7fUz\xbfv\xbd\xd3\
-z6\xbf4\xa9\x8f\xce\xc0\xa4\x90\x1dI\x05\x96,\x87\
-\x82\xf5\x05|nL&\xf2\x9fA8R\x87\x99\x8c\xc7\
-u|\xc6\x9fIB\x8a\x8b+/:R\xf5\xdb\xc9\x1d\
-\xa5\xbb\x8eo-\xf9\xad\xae\xd4\x89\x1d&\xb2\xe8\x0e\xc5\
-|\xe5\xa1\x9c\xe3\xd7`\xe6\x034\xce\xe5\xa1\x06\x02Y\
-/P\x02A\x07\xc1A \x1fD\xc1d\x0c4\x83\xc0\
-\xd0>)#\xa6K\x87\x01\x19\xdd\x12\x9b[:\xe9\x8d\
-L\x06j8\x9aL\xbdF`\xf0\x1d<9\x04\xf9\xac\
-e\x11\xab(\x12\xb6\xcf\xf1\xb2j\xa8h\xe4,\x1e\x8c\
-\xf7\xc0\xccFe\xe6\x11\xc3\x8b\xab\x8a\xecG\x8fm.\
->Ps\xde~\xf0\xf8\xd6\xf3'87\xaf\x0c\xcf*\
-\x99\x18\x8c\xf9,\xf83\x9e\x83(0_\xc9\xc4\x86\xb7\
-\x83H\xde\x1e\xad`\xb0\x12\x08\xca3\x13p\xd0\x01\xbf\
-\xa7\x14\xcf\xa5\x123-\x96\xecn\xc9\xed-\x09\x86\xd6\
-H\x87h\x81\xa4D6\xbann01)\xb4\x8e\x8e\
-S\xd6\x81\x04\x84\x80\x97\xce\xd24l\xaf+J\xd0\x9c\
-\xbdDI\xa1B\xd9I,\x86\x80\xe53\x1d\x98\x11$\
-p,_\xe7qr\xe5\xf6\x1aWQ\xd1\xe1\xea\xbc\x8a\
-|k\xa1\xa3\xc6}.\x7f\x7f\xc5\x89\xeab\x87\x1d\xfc\
-\x153\x99\xe9J\xe6s\x01\x87\x92\xe1\x81\x8c\xe7\x02~\
-\xdf`\xe6G\x03\x00\xcag(MD5 (%@\
- \x10\xeaI\x0350\x04\x969.\xc5hJo\x9f\
-\x90fN0$\x19L\xbaD\x9d\x81N\xc4\xa0\xb0$\
-\x18-I-,\xb1\xa6\x04C\x8c\xd1\xcc\x98\x90\x09j\
-d\xd0\xc0\x8b\xfef\xa4\x18\xa2\x9f\x04%$\x5c\xdc<\
-\xcb\xbb\x90\x19\xe6B\x8cu\xbb\x1d\x9c\x031\xd3\x8e\x14\
-3\xab\xbd\xd6m\xc7\xcc\xe6\xdc\x5c\xb5\xdb\xc9U\xdbk\
-\xdc\x95\xe7\x8f\xd7\x94Z+\x5c\xca\xe4HA\xe5\xacd\
-z \xe3\x03{\xbeR\x02\xa81>\xd0\xc9\xd3(W\
-k\xb4\xbc\xdeJ\xe6\x04\x03\x82\x92\xf1\xa1$\x81\x1a\x18\
-\x94\x07\x04\x5c\x07\xabG\xb4=\xfaB\x88{\xc1\x98\xae\
-<x\x95C\xad\xe7+\xcf\xc1\x18\x1f\x15\xe6G\xbb\x91\
-\x94\xcf\x0a\xec\xc9\x81@\x08d|(\x10h\x05B0\
-@4\xb6\x8eB\x98k\x01\x22g\xbc\x92\xf9j@\x08\
-d\xbcR\x82\xa8\x95%*L\x8b\x16\x052G\x0d\x08\
-\x81\xd7\x8c\xca\xdf\x02\x01\x10\x0c\x08A\x87\x08h\x1c\x10\
-\xb40^>\x07c|\xa8\x9e\xafv\x0e\xbc\x0e|f\
-`Y\xa2\xc6\xac\xa6\xa0P@\x08\x04\x84\xda\xb0\x11\xf8\
-=5\xdd\xa0!\x12!\xd8\xbdP\x22^y\xad\xa5\xc7\
-\xab\xf5~\xfc9P\x9c\xf3*\xdf\xb9 \x8c\x0f\xd50\
-M\xf5\xfc@\xe6\xd0\xa0\x0e\x88`\xf7\xc2I\x81\x86\x80\
- \x145\x84\xf9\xa1@\xa0&\x15\x04P\x17\xf1\x024\
-\x81\xb8\x0f\xc7\xa0\xa6&50\x04;\xe8\x08\xef\x03\xa8\
-3\xbe)\x00 \x9f\xb5J\x01-\xf7\x03{{\xe0\xfb\
-/\x08S.\x14\xa91%\xd8p\xa1\xf5\xbe\xdau\xb0\
-wi\xa5H\x01\xa0\xbc\x16\x22\xb8\x1f\xec]\x17\x84\xfe\
-\xec\xe4'*\xc8\xe7pL\x0d\x05\xa2P\xd7\xe1\xea\xad\
-U\x0fP^\x07\xde\x0b\x07\x16\xb5\xf7\xfciiS\x7f\
-6\x00\xc2\x95E\x0bS\xa9 \xbf\xd7\x92\xf1\x1cH\xa1\
-\x18\x11\x8ci\xe1\x00\x12\xec\xb9\x17E\xae\xdc\xc5\x04\x80\
-H\xcaFE\xf17\xc1(\x1204\xe67\x7f*]\
-\xcc\x00h\xeark1\x03#\xa5\x8b\x92\xc9\x914\xc2\
-\xff2ES\x02\xfc\xcf\xd0\xff\x01\xa7\x96\x0e^=\x14\
-\xa6\xe9\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00U\xff\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x91\x00\x00\x00\xa7\x08\x06\x00\x00\x00\x11\xfb\xbe\x93\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\
-\x0e\x1b\x00\x00U\x94IDATx^\xed}\x07\x80\
-$Gy\xee7\xd3==yf\xe3%\xdd\x9d\x84\x12\
-B\x02\xa1\x80\x00I$\x0ba\x8c\x03\x06\x83\x89\xb6\xb1\
-\x0d&\x1a\x83\x8dm\x8c\x1f\xe6\xc98\xc1#\xda$=\
-d\x84\xc1\x11\x83\x8d\x1fQ\x18\xd9\x02\x09\x09\x84\x04(\
-!\xebP>]\xbe\xdb0;\xa9gz\xc2\xfb\xbe\xbf\
-\xa7w\xe7\xf6v\xeffW\x17V\xba\xfd\xef\xfe\xad\xee\
-\xea\xea\xea\x0a_\xfd\xa1\xaa\xba'\xd6%a\x95V\xe9\
-aP\xbc\x17\xae\xd2*-\x9bVA\xb4J\x0f\x9b\x8e\
-\x98:\xeb\xa2ca,\xc2\xe9BO\x89\xf5\xc2\xe8\x9a\
-\xce\xfb\x8f\x8f)\x85\xe5?\x90\xc2\xfa,\xd6h\x87\xab\
-\xd8\xf3\xf3?d\xbeK\xbe\xe1\xf0\xd1\x11\x01\x91\x00\xd4\
-A\xdb\x8e\xe3H\xf0!\x16\xd9G\xec\xa0X\x1cA\xb3\
-\xc5\xd0\xb5\xfa\xba.cyK\xab\xd9\x80\x97I\xa2\xdb\
-\xe9\xa0{\xcc\x80\xa4\xf2\x09D]\x96\xad7\x18X\xfe\
-.k\xd3\x85\xc3r\xc5\x19\xab\xe3\xfdI\xc5\x8d\xa3e\
-i\x1fN\xd1\xf5\x9c\x16\x9f!\x8a1#\xe5\xe7\xcc\xcb\
-\xb0\xcd\xb6r\x1c\xa0\x5c\xae\xa3\x90O3\x82\x91*c\
-\xa3\x8dX\x9a\x17\x94\xfe\xe1\x14b\x09t\xc4\xd4\x99\x80\
-\xa4F\xdeo<[\xab\x0b8m\xd4+\xd3\x04N\xdc\
-\x1a\x89x1\x8e\xb3\xee^&\x81Fm\x86'L\x1c\
-\x8f\xf1:\x13\x1c\x83\x90\x07\xd6{:\x9f\xbd\xc62\x19\
-[\x5c\x98D@\x17\x87\xe7\xec~\xe3\x8e\x1d\xab\x0e\xcb\
-\x0dg\x8b\xc0\x16S'\xd9P'+\x147\xdb\x01\xca\
-\xb5*r9\x02\x88\xb4g\xef^t\x19\x17K\xb2\x11\
-\x95\xf6(\xd2\x11\x93Dm\x1b\x1a1\x8e[J\x1a=\
-!zJ\xacA&\x90\x8c\x5c\xb4\xbb\x0e\x1b\xccE3\
-h\xa2\xd9\xa8 \x9fK0>\xc6\xbb\x13\xcc\x85\xd7x\
-_\x87-y\xb4C\x06$\x96@\x07\xac\x80\xd5\xc1H\
-\x17)\x85z\xd2($\x1d\x118\x0a\xbb\xa1\x04\xee\xf0\
-\xba\x81\x8b\xf7-'\x8c\xf7\xf2V\xf7(.\x22]\xeb\
-(\x8e#.h7\x19\x13C\xd2\x914\xe7\x05\x96\xba\
-2UB\xaeP\xa0\x98\xa2h\x9f-\xdf\x91\xa5#\x08\
-\x22\xc9\xa0\xb8`\x106\x82X\xe0\x11\x88xu\xa6:\
-\x83t&\xcf\xd1\x96\xe1\xb9\x8bj\xad\x8c\x1c\xd5X\x0c\
-\x0d\xd4j5$3#\xbc\xc5;\xa0q\x8fV\xa8\xd2\
-\xf3\x90\xe5\x0f\xc9\xe9\xf6\xc9T\x82h>\x09@\xc6L\
-\xd7e&\x1d\x8a\x11\x81q9$ \xc7y?;\xa7\
-\x17C\xea\x15\xae\xcbx\xfe\xc5\xde\xc9\x09\x8c\x8d\x8c\xa1\
-\xd9j\xa2R\xa9\xa0\x98\xcf\xc3\xa3~\xab\xd7kH\xa7\
-\xb2L\xfb(\x00\x91\xfe\xa9\x12\xfa\xa7\x8e1\x8a\x05\xfc\
-#\x10I\xd5\xc5\xe1\xb7\xbbp\x1d\x02\x891~\xa3\x8b\
-d2\x86ju\x12\xf9l\x9e)$\x89\xc2f8\x16\
-a\xc4s \x0aC\x95U\x9d\x1c\x91\xd5\xad\x0f,:\
-TT\x8b\x19\xe9\xfe\xe5\x90\xca\xe02\x93Y\x10I\xaf\
-Y\x18\x06\x8aU\xde\xedn@3\x80-E\xf0\x08Z\
-\xcd\xa0\x81T\x22\x89]\xbbwc\xdd\xda\x0dL\xa1\x9c\
-\x8e<\x1da\x10\xa9\x1a\xa1\xe1l57\x10I\x04S\
-\x87O\x97\x90\xcf\xaf\xe5\x91\x83\x165\xc0\x83\x0fN\xa2\
-\xc6\x1159\xf1\x10\xc6\xc7\xc7\xe17\xd5,l\x1cS\
-\x1d\x1a\xe1G1d\xa9\xda\xf10T\xd9\x05\x1aI\x98\
-P])NWT\xb7\xb0\x8eQM%,D:\xd7\
-qt\xbeT\xd2\xb3\x1cz\x19\xf1\x9e\xf4\xeb\xf6l5\
-\x13F\x06\xa8.\xce8\xe3t\xb3!\x93\x898\xda\x9d\
-\x16\x1d\x12\x9f\xaa\xafMs\x80\x03P\xf7\x9b$::\
-t\x04A\x14\xda\x06\xe6\x9dY\xa4\x1a\x84L\xa3Z\xe0\
-h\xb4]k\x84\xcf\xfe\xfd\xb7\xf0\xa5\xff\xf8&n\xbb\
-\xed\x0eJ\xa0\x0c<\x8fR\xc9\xaf\xb1A\xe8\xa1\xd1\xae\
-\x18\xa8\xd3\x0f{\xd8\xa2*\x0a\xd5\x92HAd\xf3D\
-\xc7\xfd\xd4\x96\xfd\xc3X\x85\xb2\xe3\xac\xb3\xe7\xa5Y\x0a\
-\x99:\x93\xa7\xc1<\xcc>\x9b\x05\x8f\x9e\x1f\xfa\x85k\
-\xd7\x8c\xe0\xe5/{1^\xfd\x1b\xcf\xb7\xa6\xa5M\x8d\
-d\x8a)x\x1c\x04\x01RI\xd9\x96G\x87\x8e\x08\x88\
-T\xd9n\x0fD2\xad\xcd\x86`\xa7\x84$x\xb9\xbc\
-\x0e\xdcr\xdb\x1e\xbc\xf6u\xef@\xa5\xdcF\xcaM\xa3\
-N\xf0$\xbd.\x82V\x83\x86\xa3F\x92\xc1\xef\x18\x10\
-\x87A\x5c\x12Se\x9eS\x09\x92\x0c*\xd1\xac\x9a!\
-\xc9\xf6is\xd4\xb7X\xde\xb6\xa4j,\xec<\x97\xb7\
-Jb\x09\x10\x0b\x19\xee\x87\x0c%\x09\x19\xaa\x04\x02\xb7\
-\xba\xc9$\xa1Z\xaf\xdb\x22\xc8\x9aH9\x1d|\xe4\xc3\
-\xef\xc3E\x17\x9e\x16\x96\x92\xe9\xab\xb4'\x0b\x85\xccQ\
-m\xb9#\x06\x22y\x0e\xe6\x0akd\x9b\xa3\xc6\x0e\xe0\
-y\xdcUc\xb3)\xf8\xd4\x0f}\xf8\xf3\xf8\xe4'\xbf\
-@[h\x08]\x1a\x11\x9ac\xa9\xd7'\x91\xcb{h\
-u8\xb4f\x8d\xa9\xa3M\xea\xba\x08\xf4\x92.!\x90\
-\x228I\x1a\xc8\x16iu\xd8\xb1n\x12\xf1L\x01\x0f\
-\xed\x99\xc2\xd8\xc6\x13Qi\xd0\xa5hu\x91\xee\xd0\xa9\
-\x10\xe8X\x05\x93$K\x08\xe5\xd9\x05\xaeCp\xf2a\
-\xf2\xf5Y\x02\x8f\x22\xbaV\xa5\x09\x90\xe2\x00\xacW\xe0\
-\xb4|\x8c\xe6<\x5c\xfc\x94'\xe2}\xefy\x9b\x95-\
-\x99\xa4-\xd6\xee\xd8\xd4I\xb3\xd9\x84C[\xc9\xc0(\
-\x00\xaa/\xc8:\x96\xa4R~\x87\x8b\x8e\xa0$\xeau\
-\x02]xs?{\x92(h\xb7\xd0 `\xdc\xa4\x8b\
-\xdfz\xdd\xbb\xf1\x83\xef\xdf\xcdJ98\xfd\xb4\xd3\xf0\
-'\xff\xeb\x0f\xd9\x00\x94\x00\xf4\xe0\x1a\xcd\xf2\xec=\xc7\
-\x82\xd4\x99\x82\x8d\xd4\x14\xcd\x7f\x8b\x8bH\x12\xc1\xd5\xec\
-(%\xd0T\xd5G\xad\xeb\xe2\xe6\x1f\xdf\x83\xed\xd35\
-\xd4;.\x5c/\x89d\xcc\xa1]\xd3\xbba\x89$\x99\
-\xd3\xa2T\x0bX\x866\xa5N\xbbMI\x9df\xa7\x07\
-u\x02\xa8\x86\x87\xee\xb9\x13?\xf9\xd1MHv\xeax\
-\xc6\x05g\xe3\xca\xbf\xfdS\xb8jb\x22\xc9o\xd4\xe0\
-\xd2Nr\xe24#X\x06\x91\x00\x1fus\xa8\x16C\
-Iw\xb8\xe8\x08\x81H0\xe2\x88d#J\x0a\xe9\x11\
-.\xdd\x9b\xb0N\x9a\x03\xa2\xf8\xe7\xd1K^\xfefl\
-\xdb:E\x8f,\xc09O|<\xae\xfc\xd4\x9f\xd0(\
-\x94\xb1\xa8\xfb\x8f\x1dI\xa5D\x92A\xe5\x98\xdf@!\
-\xc0H\xec\x87\x92\xcf\xd1\xcf\xf2\xdezo\x13\xdf\xb9u\
-\x0b\xaa\x04\x9174\x8cR\xb3\x11J\x92e\x90C)\
-\x96A\x9a\x0f\xe7\xf0s\xe2h4\xeaT\xf3.\xd5\x17\
-\x8d\x84j\x19\xb7\xdep-\xfe\xe7\xfb\xdfA\xac<\x89\
-\x8b\xce{\x1c>\xf3\xa9\xbfB\xe07\x91\xcd\xc6\xe0\x07\
-\x15\x03\x88\xe7f\xd9\xee\x1c\xc0=\xd0\x08Hb\x9dK\
-B\x1dN:|p\x9cG\x02\x90*\xe3\xca\xfdd\xc1\
-%^\xeb\xf5:\xed\x1dyh\xbc\xce\x8e(\xd0\x90\xde\
-\xbd{;j\xb5I\x0c\x0fkd\xf3B\xac\xce?u\
-\xc2, \x0bnG\x9f\xe34\xfe\x9d8\x9f\xaf\x90e\
-\x92F\x89X#\x9e\xfd:\xbb\x0c!\xc0k\x95\xe1\xa4\
-\x93=l\xdc<\xce\x04\x01\xfcv\x1d\xcdD\x17\x8dD\
-ly\xec\xc5Pj\xd5\x08H\x1f\xbe\xd3F=\xde\xc2\
-d\xa3\x8c\xe9f\x1d\x0d\x22\xbc\xcd\x877(\xd1c\x04\
-V:\x93\xb1\xe5\x8f\xae\xack\x96)E5\xe5\xf0z\
-\x8b\xd7[\xadP\x8a\x89\xd4\x17\x91\xf49\xdcr\xe3\x88\
-\x81Hz7\xaa@\x22\xe1 \xe1\xa5(f\xe9qi\
-\xa6\x95u\xa8U\xbb(\x16\x87\xe9\xe6\x17\x91Jy\xac\
-X`kg)\xb7\x8d&G\x13-[\x0eq\xb6\xce\
-1\xe0\x18\xb9\xcb\xc2t;\x0d\x96\xab\xc1V\x978\x0d\
-Y\xe5\x8c\xb3s\xe3\x9d*\x82\xda\x14\x92\xecd\x9a!\
-\xc8q\x0cl\xda0L\xdb\xae\x8eze\x0an#@\
-b\x99\x1co\x06\xf4\xb4h\xfb\xd0:\x17\xc7\x93,\x0f\
-U\x94O\xd5\x16\xa8\x91h/9.\xed\xc6\xa0C)\
-\x150\x04\x1al\xef\x06\x07\xaa\xcf0h\xd1G\xec\x0d\
-\xdeH\x02\x89\x04\x22\xc5=b@\x94JjD\xd08\
-d\x05Z\xac\x94\xf4sBFh\x8c\x80a\x9dR\xc9\
-\x18&\xf6U\x18\x97A\x22\x9eFe\xa6n#Js\
-\xdc\xb9D\x1a.\xc1\xc6\xb6bhmvTC\x95\xc3\
-\xe1\xf3\xc5\x09\x96\xdb\x95\x0a\xe8\x85\x14\x12\x8c\x97\xcf\xd9\
-A\x8a\x92*ea\x17\xb4i\xb1y}\x12\xa3CY\
-\x8c\xe4rH'<rj\x99\xec\xb1\x1d(M\x08\xda\
-F\x10\xaa\xc5t6k\x03\xb1\xc9\xb6l1\xa2A\x03\
-\xbeZk\xb2-][\xe1\x18\x19\xce\xd3X\xcer\xa0\
-2]\x22\xc7\xd2\xb0\xbc\xb4\xdb\x04\x1c\x0dfI%Q\
-$\x8d\x0e'\x1d\xfe\x1c\x8d:\x94&>G@\xcb<\
-\x05\xb1\x0c\x0b\xd5\x83R6<6\x0f:K\x91E\xd7\
-\xbe\xc2Q\xd3\xceA\xceq\xa7\x95\xb4\xc6AW\x09d\
-d\x1f\xa3\x90e\xec\xd2`6V3\xf1\x5c\x9e\xa6I\
-H\xe9bZ\xb1\x09J\xd6\x18+$?G>@\x92\
-\xd1Y\x1a\xb4\xedF\x13\x0d\xbf\x8dZ\xa3\xb3,\xf6\x1b\
-\x948\x94(l\x15\x0a?\xba(\x948\xae\xe3q\xc0\
-\xa5\x08\x02\x0e\xce8\x81F\x8fv\xed\x9a\xcd\x18\x1e\xd9\
-\x80\xe9I`\x86~\xc8\xd44\xa5x;A\xaf\xd1\xb5\
-\xd5}\x01'\x92H\xfd\xd2\xe7pK\xa2E\x0d\xeb(\
-\xb2\xa7\xfa\xc3\x88Yoi\x0e{]3\x91\xa3\xd4\x1c\
-\xc2\xbdk\x1c(6\xb2\x03\xf6\xc7\xbd\xf7<\x84\x1bo\
-\xb8\x097|\xef\xfb\xd8\xf2\x93{1I/&\x9b[\
-k\x92(\x9b\x1e\xa1\x18\xf6\xf1\xf4\x8b\xcf\xc1G>\xfa\
-V\x1a\x90\x1a-A\xef\xb9\xd1\xf3\x22\x9a\x7f>\x9f\xa2\
-r\x1d*\xdd\xa1H\xf9\x88)I\x19Z\xd5\x15\xc3\x83\
-\xd0\xa8V\x9d\xa9C$)\xcaU$\x8b\xe3\xa8\x13T\
-\xd3|\xec\xd7\xbe{?\xee\xdc]B\xdd\x1b\xa5\xfd\x22\
-\xf9\xb40\xcd\x1a\xe7=\x92\x11\x1f\x91]\xe3 L\xa5\
-(yxX\xa9Vi4g\x11\x0b\xa8:Ke<\
-t\xfb\x8fq\xeb5\xdfB\xb74\x89$]\xfd\x93N\
-\x18\xc7\xae\x9d\xf7cl<\x8f\xf3\x9fz\x1e\xd6\xac\x1d\
-\xc5\xcb\x7f\xf9\xc5X3>\x0c\x0aE\xcbO*W\x0e\
-\xa5\xca\xdel5\x90\xa4V`\x8c\x22z}\x1b\x1e\x86\
-uS\xc4\x5c_\x1e\x8a\x16\x04\x91\x22\xa2nP6a\
-\x85\x15\x13\xc5\xba&N\xbd\x94\x1a\xb9F=]c\xc7\
-\x0b0\x14\x9f\x9d\xa1p\xd6\x99I\xbf\xf8\xa5k\xf1\xef\
-\xff\xfae\xdc}\xd7\x03\x940\xcc\x8b.\xb1FE\x8c\
-\xf2W\xb3\xd6u\xe6!W4\x97\xf1p\xd6\x99\x9bp\
-\xf9\xe5\x7f\xcc\x877\x90\xa1\xa5\xda\xb5V\x95P\xd7t\
-AX\xc7pFY\xa1\xca\xb0\x00IR\x88\x0c\xeca\
--\xec>E-!\xb4\x033Ti\xde\xc7\xb4\x86\x17\
-\x9b\x05\x90\xad\xa1\xf11\xb1\xde:\xa0?YB*;\
-J[(\x81\x12G\xfd\x97o\xfe1n\xdbSA)\
-1F\xa38K\x07+j3\xde\xa6{I\xca\xc7\xf2\
-\xd3\x89\xe6\xd1x\xa0\x09F\x0b\x99\xb9\xe6\x97\x5cJ\x1f\
-\x81\xd4M%\xe1\xd3\xd3S7e\x88\x82d\xb3\x8d[\
-\xaf\xbb\x01w~\xe7z\x14\x99\xb6S)#\xef%\x08\
-\xb4i\xaa\xb9\x06\x8a\xa3y\xb4\x996\xce|\xc7\xc7F\
-\xf0\x867\xbe\x06\xcf{\xdeY6\x87\xa4\x85\xdbv\xa7\
-D\xf3!NI\xd7\xa1SP@\xd0\xd0t\x80\x0a\xa5\
-\xe9\x81*2Y\x8e~\xab1\xb5\x84\xe9\x86CS\xaf\
-\xd5\x0f$\xd5\xb7W\xe7\x05I`\x08(\xd6K\xd5\x19\
-\x02\x88\xf6\x03\x85z\xca\xcb\x99$\xb9\xf9\x07\xfb\xf0\xf2\
-W\xfe1>\xf0\xc1\xbf\xc3\xcd7\xdfK\xef\x8b\xb6\x84\
-W@*\x9d\xe7\x13\xb5\xc8Zf\xa3\xc8N\x22\x04\xeb\
-3\x98.\xed\xa5\x18/\xb3\xc1\xa8\x12\xd2IL\x97\xa7\
-{OQ\x19T\xc4P\x1aD\x0dn\x87\x07pxM\
-K%\xa1\xfa\xd1H\x22\x18mD-5\x14\xa9\xf3%\
-\x07Z\x8c\x9b#{\x06C\x8dWuxjx\xc4\x86\
-x\x8c\x03J\x93\xd53T!Ao\x1b\x86C{0\
-\xc1>\xd1|Q\xc4\x9a\xc9\xde\x8f\x05\x18\xa6\xd3\xb1\xa5\
-\xe1\xb9\x00V(\x14h\xeb\xb8TM2\xe69\xd8X\
-\xac\xb8\x10\x1c\xa3W\x16o#\x9d\xf6P\xf7\xcb(W\
-\xa6\xd9\xf1)J\xaa4\xa5N\x8e\xe6B\x17335\
-\xec\x9b\xacb\xe7\x9e2\xde\xff\xfe\x8f\xe3\x05/\xf8\x1d\
-|\xe7\xfa-(\xd3L\x88Q\x1d\xfa\x1d\x1a\xeeT\xc5\
-\x93S\x93\xa1\xfd\xd7cI\xbb\xc8\x19Z\x0a9\x97\x91\
-z\xc7\x0bR\x0f\xa4\xe1_\xb5\x1e\xc1\xa3c\xb9\x91>\
-\xc5\xab\x8e\x13\x89<*>Q\xdeL\xe2\xdf>w-\
-\xfe\xf0\x0f\xdf\x0d\xdfO`\xc7Nz/\x14\x9bRk\
-\xb5\xfa\x04\xce;\xeft\xfc\xca\xaf\xbe\x10\x97\x5cz\x11\
-^\xfc\x92\xe7c\xdf\xd4\x1e\xec\xdc\xb1\x13##\x05\x9c\
-|\xf2F<\xfb\xd2\xa7\xb1\xe1Z\xc4\x19=\x14\x896\
-6\xde\x1c\xb3\x85\xc9ZN1w\xd6\xbaQ\xcf\xd75\
-\x16\xcc8Lcl\xb6\x0b\xcb\xba\x0c\x0e\xd7\xbd$i\
-\xa8>X_\x9d\xc9\x1e\x8a\xeb\xba\x9e\xcfk\xe5`\x06\
-\xe5:U\x19\x9d\x80\x99z\x17u\x02g\x1bo\xb9\xee\
-\xbe\x12\xa6in\xbb\x1d\xda0,\x9a\xcb\x81\x96\xe8q\
-t\xec\xf5\x9d\x8b\x1d\x96\xdd\x00\xc6P\xaca\xd0h\xd2\
-\xc5\xa7d\x88\xb1\x9d9FM\x15\xb9\x14a\xf1v\x13\
-{\xb6=\x80\x07\xb7\xfc\x18yJ\x97\xa7\x9ew\x16\xde\
-\xfe\x87\xbf\x8dg<\xfd|\x9cv\xfa\x09\x1cgUT\
-*\x13(\x16r\xd6w\x0fm\xbd\xdf\x96\x91\xbe\xf7\xdd\
-\xef\x19@\xce}\xe29\xec\x93\x0c\x9a\xf4\xea2\x99\x5c\
-X/%T\xcd\x08X\xc7\x06\x80\xac1I!\xd5\xf7\
-\xd0tHu\xc6\xf2\x87\x11\x162\xd6\xf2e5\x19\xd7\
-T\x22\x16@X\x92\xc1\xfc\x9e\xbf\xbc\x1cW_u\x1d\
-%K\xc0\x06`\xa5)f\xcf:\xe3d\xbc\xf8\xc5?\
-\x8b\x9f\xfd\xd9\x0b12\xc6{\xd8\xd0.\xcb'\xc0\xff\
-\xfe\x1f|\x10\xdf\xfc\xcf\xef\x18`.|\xea\xd9\xf8\xe4\
-\x15\xef\xa2\xa2\x148|\x86\xaaD\xafvFQ\x85\xa2\
-\xc2D%\x8cHi\xa34<f\xe3,\x9bL\x05i\
-\xbeJ\x90M\xf0\xaf\xb6\xd6\xa9q\x19om@o\x87\
-\xff|^\xf5P@\x9dQM>\xee\x96\xbd\xc0\xe7\x7f\
-\xb8\x1dU\x82\xad\xc8\xe7{Z\xdba\x99:f\x0f\xa8\
-l\x04\x81\x89\xd2.\x1b\x9ea\xa4\x9b\x19\x0a\xacQ\xcd\
-\x14\x15\xf0Y\xba/\x99I\xdbdc\x8b^Z\x92\x83\
-)A\xa3\xfd\x8e\x1b\xae\xc7\x9d\xdf\xbd\x1e9J\x94g\
-\x9d\xf7D\xfc\xf5\x07\xdeN\xa3;l\xd7\x9a\x0fTj\
-\x0d|\xfd\xeb\xd7\xe1\x83\x1f\xfc\xb8-\xccj~.\x9d\
-\x22\xa8\xa9%.\xbd\xe4\x22\xbc\xf7}o\xb79\xaf\x8e\
-\xa6\x02X\xee6\x13\xb5Y\xd6DB\xb3\xdc\xe1\xf2\x88\
-xPZ\xb0\xa5u{\xb8b\xa4\xc6\xec\xb1\xd5P\xc9\
-\xc3[\x9a\x14\xdb\x9a\x81f\x9d\x0c@W\xfe\xed\xd7\xf0\
-\xa5/~\x8b\x22\xb2\x8e|>\x8b\x136\x0c\xe1\xa5\xbf\
-\xfc\x5c\xfc\xe9eo\xc3\xcb_z!\x8aE\xdeC\xcf\
-C\x0b\x88\xf5Z\xdb\xda\xafR\xaa\xc1\x93;J\x0fH\
-bX\xde[\xb96C\xd5V\xedM\x96)NLw\
-\xb7\x15gC\x12b-\xa7\x8f\x15\xdf\xcf\xbd4\x01C\
-Z\x92\xcbfs\xa3\xb5s\x906Q\x87v_\x9b\xa5\
-\xa6\x0d\xd1\x95\x9d\xd2\x0ah\xff\xb4\xe8}\xb1\xb7\x82\x18\
-\xed:\x9e\xb3I&\x89\xb9;\xef\xa9b\xba\xd2F\xa5\
-A)M\x15U\xa3:\xacu\x03\xf8\xf44\xa5B\x14\
-V\x09\x8f*\xe3\xfb\xc3\x0a\xc3:\xd3\xd1\xba4\xd6\xb1\
-\xcd.\xebq>\xe3\xca54*\x9a\x9b\xa2GH\x91\
-\xe4p\xd0\xb5\x9a\xcc\x9b\xa6D\x83f\x80\x00\xa4\xb4\x9a\
-\x00MyM\x0c\x0f;x\xc9K/\xc5\xd7\xaf\xfaW\
-\xbc\xf5\xf7^\x87\xd116>\xd5{e\xa6\x83[~\
-x?\xde\xfa\xe6\xffc6\xea\xde\x89i\xaa7>\xc7\
-\xd5\x5c\x97O)\xc46e\xdbu\x968\xd5\xbe \x88\
-B\x92Q+\x12\x88\x0e$\x89\xd8\x06A!\x83\xed\x9a\
-\xff\xda\x82\x8f\x7f\xf4\xb3\x94(9\xda>)[\xf7z\
-\xd3o\xff\x0a\xde\xf9\xae_\xa3\x0a\x1b2\x1d\xdde\x03\
-fh\xf38N\x0b\x85\xac\xe604B\x1a\xa8\xd0\x15\
-\xed\xb0\xc3\xb2\x99!k\x8c4\xc3\x0c\xdd\xd7\x18\x8dR\
-M\xa89tm%b\xd5p\xa6\xbb\x15\xda1\xe3\xec\
-Z_\x1a\x0e\xab9\x1d\xaf\xe3\xe5qL\x85sRl\
-w\xb9\xd4\x94A\xf6<\xc6kg\x81\x93f\xd9\xd2\xc8\
-\xa6\x8aHS\x8d'd\x08q\xb4o\x7f\xa0\x8b\xdd\x0f\
-\xed@\x9a\xe7\xe3T\x13)\x0e\x12\xb1\xc7\xde\xd5\x14\x80\
-\xb1\xa4\x93\x1d\xc7\xc3y)6\xb0\xc2\x04\xc3\x04\xd3%\
-\xd9\xd66\xef\xc4\xfb\x5c\x0e\x9e\x18\xbd\x13\x87\x86t\x86\
-\xd2p4U\xc0p*\xcfc\xde\x1dtiL\xa7\x90\
-\xa2\xe8Q/\xa9\x13%e\xd4W\x0e\xed%7\xae\x01\
-\xde\xc6\x9a5.^\xf8\xc2\xe7\xe2m\xbf\xf7fl\xda\
-\xb4\x89\xd7\x92\xb8\xff\xde]\xb8\xe9\xc6\x1f\xe3\xd3W~\
-\x8d\xde\x1b\xed9\xde\xdd\xa4w\x9c\xa5\xc4\xd3\x16\x1c\x03\
-\xa4\xb22\xa11\x18-\x0a\xa2\x10@\xf3.+c\xb1\
-.\xb2\xa3\x04\xafm\xdb\xda\xf8\xd0\x87>ACo\x18\
-e\x8e\x98\xb1\xb1!\xfc\xd9_\xbc\x03/{\xc53\x98\
-\xb6\x8aj\xad\x82\xf1q\x17\xd9$\x0dq\x8e\x9a\xc0\xaf\
-\x9b\xe4\xaaV\xc0J\xae1\xbd,I\xc4hLP\x1d\
-4\xfd8\xa6f\xb4K\x8fJ\x8dR.\xe2\x06\xd5\xe3\
-\x82\xack\xf3\xafG\xf7)\x8f\xe50\xef\xad3\x14s\
-\xc0S\x82\x86\xac\xe9\x8a\x90\xe9\xdd4\xe8a*\xddd\
-\x0bS\xdb;\xd8\xf1\x93{\x90\x0d\x02\xac\xa1]1N\
-]\x9dcF\xb9:\x07L-\xe4\x9c\xdfc\xc6e\x19\
-f\xe6\xb1\xe2\xf3b\x1a\xbf\xf9z\x93\x9eW\x02\x19J\
-\x84l7\x81!z\x1c)I\xda)\xca\xa9\xe9:\x12\
-|\xbeC\xa9\x9b\xe05\xb94\xf5ZX\xce\x16\x01\xa7\
-\xf9%\xa9\x5c\x01\xa9\xcdpd\x08\xf8\xd9\x9f\xbf\x18\x7f\
-\xfa\xeew\xb2\x1fF\x19\x17Gi\xa6\x89+\xae\xf8G\
-\xdcs\xef$\xebK\xa9\xcbt\x1dI\xc0&m0v\
-\xf9\x124\x99\xd1\xe2\x0b\xb0\xb3\xb1=I\x14\xd9\x18|\
-\x80tv\xbdEq\xce\x91\xfa\x8e\xb7\xff\x0d\xae\xb9\xfa\
-G(\x97\xda\x18\x1b\x1f\xc6\x8b^\xf4L\xbc\xe5\xf7~\
-\x89*\xa1J\x1dK\x1d\xae\xd5d\xe6\xa5\xb7 B\xd2\
-\xb4@\x92\x0c\x5cv\xd9'\xf1\xd5/\xdf`j\xa3R\
-\x9af%\x8b\x94N\xbb\xe1q(6\xd5\x18\x021\x1b\
-\x0a]\x8f\xe2:\xb2\x91X\x1e\xc9ns\xb1\x15*'\
-\x92\xd9\x1a\x1cF\xb3\xe5l2j\xe1\xaa\x1d\x8a\xb4\x8f\
-Y{\x84\x94\x97c\x866\xb3\xe3q\x97\xcf\xea\xda>\
-q\x86\x9d&\x9f\x16CZ\x13\x80\x94\x9a\xf7\xee\x98@\
-~\xe3c0\xc1t\x01\xefI\xb37\xc2}\xd9ay\
-\xa2\x92\xd8\xc65k\xc3^\xbb\x92d\xba\x87\x9e\x99\x8c\
-l\xd6\x8a\xd7[\xf4\xa2f\xa823\x99\x8c\xd9'\x01\
-\xa5\x85Cp\x8e\xd3.\x98\xda\xb9\x0d\x19\x96c(\x1d\
-\xc3\xa5\xcfz2\xde\xff\xde\xdfc[\x13\xdc\xbc\xde\xe9\
-\x12d\x9eV\x00c\x98*\x950R\x5cc\xcf\xe0X\
-\xa6\x9dt+>\xf2\xd7\x9f\xc2\xc4\xc4\x14\x0bP\xc73\
-\x9eu\x0e\xfe\xea\xbd\xbfOS\xc3\xc1\xbe};\xb0f\
-l\x1dU$%\xa2\x976\xfbjP\xea\xb5\xf8\x02\xa4\
-Z[\xcd\x17N\xe2Q\xd5l\xdd\xba\x03W]u\x15\
-2\xf9\x0c%\xce4\x9eB\xe3\xf8\xad\x04P\xc3oP\
-%%\x91\xa4\xf8t8\xa2\xe2\xb6QK\xac\xee\xa0\xe7\
-EK@k\xf9\xcfz\xf69H\xa4\xea\xb6%v\xcd\
-\xf88u6\xafuG\x08(6\x02A\xe3S\xa4w\
-\x08\xa28\xc1Z\xa7\x15\x9f\xca\x0c\xc3\xa1\x0d5\xab \
-\x94\xaf:\xdbX\xc7\x14\x8fv\xec\xb1\x93\xf4\x02\x80\xe6\
-:\x96\xce]*\x8dp\x8a\x80\xaa\x22F\x05\xd3I\xd2\
-N\xa1\x17\xd6\xc9`_;\x8dZj\x1c~\x82\xec\x8e\
-\xa0\xda\xce\xa0L\x1bhx|-m\xa6&\xd24~\
-\xf3\xacf\x86\x86j\x8a\x92$\xcdP\x9c\xa1$I\xdb\
-y\xcc$L\x82\x12 M\xc0i\xadL\xd72\xac_\
-\x9e\xe3\xa1\xd8\xec\xa2\xd0\xa0\xf4\xea\xd4\xb11\xe7 \xe5\
-Oa\x88F~Qs@\x94.\x9d\xf2\x04\xc6\xb2T\
-\xdf\xb4aF\x87s\xb8\xe4\xa7\x9ei\x13\xe8\xb2\xe1\x1d\
-\xb9\xc1\xac\xbf\x16e\x5c\xb6\xb2\x9d\x82&\x03\xed\xcc4\
-\xab\xf6s?\xf7D\x02\xe7)\x94\xd6u\xc4\xd9\x7f\xd7\
-]\x7f3n\xb9\xe5.\xb6'\xd5\xe5\xd8Z4:\xec\
-\xb7\xac\x00H\xd1\xa6\x01: -\x8c\x10\x03O?)\
-C\xb20\xd0#:\xe2\xf8\xf2W\xaeb\x03w)\x1e\
-'\xb0n\xfd0~\xe1\x17\x9em)sY\xe9j%\
-g-\xa8\xaa\x8c%I$U,\x13y=5<\xeb\
-\xe9O\xc6\xeb\xdf\xf0\x0a<\xfe\xf1'1\x8f=6\xba\
-\xf3\x99<u7E9\x8ds'A\xf7\x93\x9c\xc9\x09\
-8q\x1a\xdc>v\xec\xde\xc3\x06\xa0\xc7\xc4ll\xc7\
-\x9fI\x07\x19\xb7-\x86\xa1\x94\x08_I\x92w\xb3<\
-f\x97\x10\xb8\xf4\xbc\xf4|\xe6\xa7\xa9\xb7\x1a\x0d\xeeN\
-\xae\x88vq-fh\xb3M\xb9E\x94\x9c\xbcq\x99\
-6R\x9d\x92\xa3!)\xc3\xbai\x1bL\x93\x06k@\
-Ih\xcc\xfb\xc3\xe30\xd4J|\x5c{Y)1\x14\
-\xe7\xd0\x8b\xcd\xe4\xb2\x1c<3&q\x124\xac\x83\xe9\
-\x1dH6\xf7!\xdb\x9e!\xc8J\xc8t\xcb\x04]\x19\
-\xa9N\x19ng\x06kF\xd2x\xfe\xcf?\x07?\xf3\
-\xbc\xf3mrwb\x92F2\xdb\xc4\xa3Q3U\x9a\
-\xa2T\x0a0\x94+\xa0R\x9d\xb4\xeb\xba\x96\xe2\xd8\xf8\
-\x99\xe7=\x13\x9b6\xaf3OL\x06\xf45\xffM\xd7\
-_\xcd&[\x8b\xb6\x1f\xdd\x1e\x93jK\x01\xd1\xc2\xea\
-L1Q\xac\xfa\xdc:E\x11:\x11R\x81R\xb5\x8b\
-\x97\xbf\xf27\xf1\xc0\xbd\xfb\xd0\xa2\xd7p\xe1S.\xa0\
-\x9e}'\x9a\x1c1Y\x8f\xa2\x9cicR/=\xfc\
-\xd9\xedB\x96\xe46\x9buoi\x1f\x86\x8a\xe3L\xef\
-\x81\xf6\x1c\xf6\xee\xaec\xc7C;\xa9\xcb\xd5\xa0)L\
-6v\xdb\xc2c\xbc\x93\xc6=w?\x84\xcb?\xfei\
-\xdaQ\x0d\xe4\x09\xa8\xff}\xd9;l\x8a\x1f\xf1\x06\xb3\
-\xa4Zc\xf9b\x1d>K\xe5\xa3\xea\x13\xf5\xab\x8b\xa5\
-\x13=\xabz\x09\x09\x1a\xec\xf5J\x17\xbb&\xea\xf8\xc1\
-\xfd\xdbQO\xe5PN$Qi\xd1\xd8M\xa4\xe9\xc2\
-s\x0c\xf31\x0e\xa5O\xf8\xbc\x10\x84!\xc0\xc3\x9c\xa4\
-\x06\xa5U5\x83l\xfe.\xdb@\xf5\xd2\xe6{\xad)\
-\x96\xd9\xe1\x05/\x09\xb7\xd9\xc2\xd5_\xfa2\x1c\x1at\
-\x1eU\xcde\x7f\xfc:l\xda8\xc2v\xa4,g\xaf\
-\xeama\xebxzm\xda\x98\x7f\xd2\xe6M\x04z\x07\
-\xe3k\xd2T\xfd,/\xa5M.\x9f2oK\x96\x92\
-f\xad\x1d\x22gjf/\x0a\x85!\xda>\x94\x8ct\
-\x04d/\xbe\xeb]\x97\xe3k_\xb9\xc6\xca7:\x9a\
-\xc6\x17\xbf\xf8w\x18\x91\x8dM\xa9\xd5\xee\xce\xd0\xc8\xd7\
-\xab[z)\xd2\xd0tH:8\x88z\x0d1k\x7f\
-\xb0\x11\xba\xccX\xe2\xf3\xf6;w\xe3U\xbf\xf1F6\
-\xb6\xa6\xcf\x1d\xbc\xe5-\xaf\xc3\xab^\xf5\x1c\xdaBr\
-\x15\x03z%\xac\x90\x0a!\xc4\xe9\xd6(?i\x09V\
-T\xb2H{b\xe2qz;\x8c\xd2v\x06\xcd)\xca\
-[a\xdf\xd9,\x8dF\x8f\xae\xddx\xe36\xbc\xe5\xcd\
-oGi\xbaJC\xb1\x80o^\xfdYp\x90\x19\xcd\
-\x16\xb1\x17Ft`\xa5\x96F\x9a\x8d\xf7\xd8\xd1]\x8e\
-\x9fm\xfb\x80\xff\xb8\xfevlktQ\xcd\x17\xd1\xa4\
-z\x8dQ\x05i\xf3X\x82@\x92-#I(\x15\xad\
-}\xd8\x02R[ud\xa14flBO \xe2\xb9\
-\x00$ iK\x87f\x98\xabSS(&\x13H\xd2\
-\xb8\xfe\xe4\x87\xff\x1a.\xadz\xb71\x85/}\xee\xc3\
-x\xfcc7\x12\xc8T\xa9J\xcf\xf6\x09%D\xa8\xba\
-\x14\xa7\x9e\x0b\xc1\x1a\x02X\xb5\xae\xfat\xf9\xe9:\xa7\
-\xbd,|\xaa-\xd96\xf2f\xa7\xab\xf4\xbc\xe8Q&\
-(1\xaf\xb9\xe6N\xbc\xe9\x0doG&] 8k\
-\xf8\xf4g>\x86s\xcf\xdd@\xcfL\xb3\xf3\xa5\x9e\x00\
-\xe0 \x1d\x10D,\xca\x02\xc4\x82\xcd\x8e\xa6\xde\x08\x93\
-\x02\x0bYE\x05~\xb2e\x17=\x14\xcf\xdcs\x8d\x90\
-\x8b.>\xdf\xc0\x95 \x0a\x5c\x8a\xf5p\x9eWL\xb2\
-|\xc2C\xbb\x99\x0dZ)\xeb\x8dW\x16\x80\xf1\xf2\xc4\
-ZDQ\x9a\xe0O$\x03V~\x0a\xedv%\xba\x9b\
-\x85d\xe5\xda\xb47\x92\x1ca-\xad\xad1R\xe0d\
-^z\x0e\xfd\x16\x9e\x84eSq\x8d-\xbe\xb9,\xa6\
-\xc2\xe1\xf3\xcb|\x84\x06\x0f\x90g{\x16\x87\x93h\xd0\
-\xdb\x0c8\xa0:I\xba\xc5\x1c\x0c\x0d\xba\xfd\xbe\xeb\xa2\
-\xc6ATcoU\xc9ur\xc3q\xedZCi\xd8\
-\x1e\x01\x8f\x95^a\x8b\x1d\x1a\x90\xf5\xae}\x87\xd7\xb4\
-\xc1L\xfb\xabTZI\x19\x19\xd2\xd9L\x8a\xeev\x85\
-1\x94\xb4t\xd9;\x1d\xaakJ'U\xacKT\xc7\
-\xe84h\xb9\xa8\xd3mP\x0b\xd4\xa9\xbe\xf6\xa1R)\
-1]\x8b\xd2\x86\x9e\x1c\x0dc\xd9\xf4\x9a\x0br9H\
-e?z\x8c\xd7<\x90\x9a\xff\x82'\x9f\x89Q:1\
-\xdaz\xabi\x8b\xdbn\xddb\xfd\xd0\x91\xd9a\x90X\
-\x18\x16\x8b\xd1\xe2\xa9\xa3N\xb7\xae\x14k\xba\x9f\xa3L\
-Q,\xc9\xc4\xbe\x1a\x0b))\xe2!Ee{\xca\xc9\
-\x14\xbd*H\xa0\x11)\x04\xf7\xb2V>Q^}\xc7\
-\x9a\x90L\xb3\xb2:MQ\xf2$Md\xfb\x94H\x15\
-dR.\xbd\x1e\xad\xc6\x99\xbfEi@\xf7\xb3RF\
-\xa3F\xbd\xc7cjK\x13h\xf2d\x1c6\x84\xc3\xce\
-\x96\xcf\xe7\xd0\xe7\xb6x\xbb\xa6x\xc6-\x8bi\xc4\xb3\
-<\x9aC\x96*\xd2\xfc\xd6\x09\x1b\xd7\xd0\xb6\x90$n\
-\x11\xf4u\xdak\x9a\xeb\xe2`Qah\xdb\x18'\xc3\
-P;\x0e\xc3cz\x95\x09\x1a\xf92J\xec\x98y\x92\
-\xe3\xe4.;\xb4\xc3Q\xaa\xb90\x0d\xc2V\x8b.\xb9\
-\xdc\xed:\x07Q\x8d\xa3\x8b\xa4\xad\xb1\x12\xc7z?\xdf\
-\xde\xd1g\x9d\x04(y\xba\x19\x8e8\xed7\x92K?\
-T\x1cB\x81\xf6\x9a\xf6<\xb5\x1a\xb4\xc5\x1am\x86-\
-\x022\x8f\xa6\x96\xa3(\xfaR\x9e$\x8bl<\xb67\
-qu\xf2)\x9b\x10Pkh\xa1[;+\x14/\x80\
-\xd9J\xd6a\x03\x11I\x80\xd1\xca\xaf\xc0\xd3\xbf\xe5C\
-\xf1~-\xc6\x8e/rp$06:n\xe2\xb5#\
-\xdb@\xe2\x8b\x85\x96\xda\xb3\xec\x85\x121\xc5;\x15>\
-C\xfa\x9a\xb1\x0a\xca\xd5=\x0c\x9b\x1c\xf1,8\xf5\xb4\
-*\xa1\xd1\x92p2t3}\xde\xa9\x99\xe7\x00M\x0e\
-@\x81m$?\x8a|*\x8f\x94C\x89P%\xb8X\
-\x14v\x13\xef\xd3d\x1b;C\x1d\xc2P\x15\x12;\x1d\
-y0\x1c}\xcba\xc2WPjJ5\xf5\xd4\xf1\xda\
-QM\x82\xb23\x12z\xb9\x9b\xa62\x0b\xd1\xa5*\xe8\
-\xd2\xd8\x17\xb7\xb4\x7f\x8a\x85\xedp \xb4)b\x83&\
-\xd55m'MU\x88\x03\x0e\xae\x06{\xa8\xc98]\
-\xa3\xd0A\x95*FM\x93K\xe7l*$\xad\xc9U\
-\xd6\xcb\xa3\xca\xd1S:\xf42m+\x0a\xaf\xc5Yo\
--\xbf\xc8\xd6Q\x0d\xf5j\x90l\xb6t2g;\x19\
-k\xf5&\xcb\xea\x12\xf09\xb6c\x9a\xed\xa2\xd6a\x8f\
-Iwv(\x81x\x9b\x0ch\x91$\xbf\xec\xa78\xfb\
-D\xebi\xa5\xe9\xb2\x99\x13\xea\x83v+\x1a\x86*\xd9\
-`\xa4\xf6^\x94\xfa/\x9a\x91\x1ce\xcc\xa0^\xafR\
-\x02%m!o\xed\x9ap.\xa2I\xd7^s\x0c\x9a\
-\xe5\xdd\xaf\x08\xd2/q\x96\xd2\x0ct1\xdd[\x8e$\
-\xdb\xf9H\x97V\xfb\x94e\x0b\xd5\xab\x01Gc\x17\xd9\
-,]y\xfdcC\xd0q\xe1\x88\xd7\x07\x1fZ\x98\xa9\
-T\xcd\xaeH\xe9%=\xe6b\x90V\x84M\xbc\xf0L\
-2\x5c3\x80\x1c\xb1vq\xd6\x08YZ\x18\xa3\x8a\x96\
--\x93\xa6\x81I\x5c\xdb\xcc\x81\x9e)D%\xf8\x0c\x93\
-\x90\x04\xaff\x9a5\x9bm\x0b\xa4<\x8e\xb3\x174\x98\
-\xc2s\xdaKl3\xb5\x85\xbc\x9e.\xa5\x8a$KL\
-\x09\x18\xca\x1b\x0bh\xdc4\xb5G\x88\x03\xa0\xeak\x13\
-\x19\x07!A\x9bJ&M\xb5\x19^H\xb2P,\x0f\
-\xa6\xd3\xf2\x90b\xb2\x942\x94O\xb6L\xa3\x0dk\x1a\
-\x80\xb2\xbdD\xed&\xed4\xb6YE{\x9dh\x02\xc8\
-\xd5W\x93\xa8\xcc\xc4\x9bI\xd6j\xb5J\xe1\x98b\xdb\
-RB\xb2\x82\x15\x19\xa1F2\x04\x94O\x98\xd7 \xb4\
-hJIO\xb6\x0bY\xff\xd4lR=\xe1&+\xdd\
-\x94-\xb4Q\xad\xef\xa1h\xa4\x0d\xa0ib\x92'\x11\
-\xce\x9a\xb7\xb4\x08\x16\x912\xd1\x1d6W\xa4\xfb5\x17\
-\xa3\xed\xaf\x04\x1b\x81\x92N+\x7f\x12\xff\xa4s\xf4+\
-X1V\x97\xd9h\x9e\x83\xd7\xd8\x005\x8e\xf0\x80\x07\
-\xa9\xfc\x10\xea\xf4\xfedk\xd8\xcc\x816\xaf\xb1qc\
-\x1c\xa9a\xef\xb1\x85\x1c\x82H\x12\xcfa\x19TP\xa6\
-]j\xa8\xf2$\xf9\xfc\x96\x5cnb\xbf\xa1\x086\x81\
-\xa9\x1d?@\x92\x92B\x83\xaa\xcb:um^\x8a\x83\
-\x86\x1d$\x8f+HP\xca\xd0\x85\xf78\xfaS\xed\xd0\
-K\xd5\x10\xe7)\xed\x1f\x19\xe0lX\x9e\xab\xcd\x04\xaa\
-$=\x84}T\xd5\xa9B\x81\xf8%\xf0\xf8\x8cf\xbd\
-\x86$\xaf\xf5\xf6TZy\x04*\x01I\x1d\xaf\x82J\
-\xe6j\xa0y\xb4\xbf\x0c\xb0\x1c\x85\x8e\x9a\x98\x89\x1dJ\
-L\xd5#G\x93\xc12 1[\xe6I\xe6\xb9\xf2K\
-\xc43\x04\xa4Nh\xbf5\xab\xe6\xa8(>\x93\xcc\xf0\
-a\xbd\x9b\x06\xa4\x01R+\x89\xb2W+k\x0a\xabw\
-\xaam\xa4t\xb1\xf9D\xc5\xf4(<\x16\x00\xf7#\xa5\
-\xb7;%\xcdTS\xb1\x8e{d\xf9\x85\x87Q\xa8<\
-t\x87\xb2\x92'g\xee1/v4\xccyAO\x0a\
-\xaf\xf1D#\xd0\xe6\xa0\x94\xa72\xe0y\x94\xe7\xb2\x98\
-\xb9S\xf6\xeb{?\x02+\x1d1\xeb Z$\x04?\
-\xed\x0eJ\x5cy[\x96\x98a\xe4}IzE\x9b\xcd\
-\xcc^SgH\xbd\x93,`\xa5\x14\x86\xed\xa3\xfbC\
-\xb6z\xf1B/i\xaf\x18\x16k\xc7\x07\x92\xee\x8b\xd2\
-\x85<K\xfd\x91\xc6\x1cL\xe2^\xb9\xa2\xa7Z\x7f\x86\
-#\xd1\xce\xec\x22kh\xc2\xc3\xe2z\xf1\x03\xd0\x00)\
-\xfbAr\xf4\x88\x83+l\x03\xab\x94\xb6P\xb0\xb0\xea\
-(\x16YpV\xc1e\xc0\xab\xbf\xad\x88\xc6\xec\xe9\xae\
-f\x9c\xd3\x84\x9dk\x1aj9\xac6l1\xe3\xc0\xa3\
-\xf8\xe79\x87\x8b\xf9i>\x0d\x878\xf5\xab\xed``\
-y\x04\x14\xcd\x13yTA\xe2\xa4\x98\xa3\xdb\xa3\x04\x12\
-\x22\x04\x0aq?\x14t\x8f\xea\x22\xc0E\xa0\x13\xd8\x22\
-\xd6\x9e\xa5\x10\x94\xbd\x1b\x1e\x014\x00\x88\x8e\x15\xb1\xe9\
-\x05\x1e\x1e\xd9X\xa5=\xa2\xae0\xee5\xf0l\xe1\xa3\
-\x06\x9f\xd7\xf0:]\x0e\x0b\x8fRO\xc94E>\x8f\
-E\x93e\x02\x8b\x06E\x8c\xe8\x96\x1d1GJ\xdd#\
-\x22f\x0e.\xbc\xd2wb\xa0\x13h\x08\x94pW\xa3\
-\xc2Pz\x09XQ\xbd\xfa\xef\x7f\xa4\xd0\xca\x04\x91\xf5\
-f8\x9aCI\xd4\x03\x12\xbbT\xac\xcb!IT3\
-\x08\x91\x16r\xcc\x16\x19(\xad\xa8zx\xba\x1cv$\
-\xf1h\xc0\xa6\xe24\xac{q\xbb\xb6\xed1C\xb9K\
-\xa3U\x9e\x94H\xe50[\x5c^\x0eC96M\xda\
--\x9a\x03\x920\x8aH\x87\x91\xd4\x91\xe42\x10\x11\x9d\
-\xc6\x02Q\x8fC\xb2\x5c\xc3\xc3G\x08\xf5Uu\x85\x91\
-f.I\x11F$\x19\xf4\x999\x19\x98\xe1%\xcdY\
-\xf1@\x09fYJG\xcaG\x86=;B\xe9\x96\xc3\
-\xa4@\xa8\xe85\x0f\xbdg\xec\xde=AC\x98\xce=\
-\xb3\x16\x8cMM\x11\xdd!\x80\xe8L\x10\x05-\xa2D\
-\xb6\xaaX;\x08\xc2\xa5\x90^\xa6<\x16\x884\xa3m\
-\xf6\x12C\xd9<F\xbcf\xf9\x90\x95\x8f\x80\xd9/\xc5\
-V:\xad\x5c\x10\x99A\xc1P\x81\x00\xc4\xa2\x0a4\xf6\
-2$G\xb0\xce\xe5\xe2J\xddDI\xc3\xa9\xc2\xc8\xa7\
-!\xa9\x13\x97\xc5\xcc\x9f.\xb3\xbc2\xb9\x0e\xdb&\xda\
-\xd8=U\xa5\x87\x95\xa2aO)c\x92\x86\x9dm\x1c\
-0\xbe\xc9s\xba\xea=\x10\x04\x06\x041\xe1\x16\xef\x19\
-\xb6\x02\x8c\x85*\xb1<\xb8p\xc1\xb8E/\xb2IT\
-5\xdd\x16\x1a\x14M\x0d\x8a&\xf1\xc3[\xfb;\xba\xb4\
-2A\xc4\xceSg\x1a8z\xac\xcf\xadp\x0c#\xe8\
-\x12(\xec\x07\x81F\x0aKs)m\xb6\xb7\xd6\x934\
--\xa0\xbdJt\xc2\x0dL\xda\x80\xb5<\xa6\xa4HP\
-)\xb2\xcf\xf5\x9c\xc9\xdd\xd3\xf0Ku\xb8A\x0c9\xe6\
-[\xa4\x94\xca\x06m\xe4\xe8\xff\x17\x9a\x01r\xe4B\xb3\
-\xc9\xb0\x85B\xa3c\x9c\x0bzL\xf5\x97eF\x11g\
-hWeh\x98g\xb4 \xca\x07\xa59\x22\x92\xf4\x04\
-=V\xca\xeb\xb4\xa8\xde4\xbd(\xb0=r\xe8\xe0\x9b\
-\xd2\xd4\x99\xb3\x15\x12\xde4\xfa\xc3\xb1\xf4\xb1\x8f\x7f\x05\
-W\x5c\xf1\xcf\xf6\xde\xd2\x93\x9fr&>\xf5\xe9w\xa0\
-\xdb\xf1\xe1\xc5\x92\xe8\xb0a\x1c\xed\xb3\x5c6\x853\xa9\
-z\xdf*\x99\xce\xe1\x96\xdb\xb7\xe3\xe5/\xff\x03\xb8N\
-\x91W\xea\x88;\x0d\x02g\x9a8\xa3\xcc\xe9\xe4\xe1\xc4\
-R\x04P(\xa5l!\xd4\xa5\xe4\xd2q/\xb7\xa5\x92\
-TMB\xef\xe0\x93\xf4\x02b\x10\xa7T\xa2\x1d\xa4w\
-\xd0\xa2\x99x\xfd\xd5\x9b\xae\x99\xb4\x9eM)\xc4\xf2\xda\
-\x863>T;\x05\xb5\x08*\x95\x14\xaa55\xa5\x1c\
-\x05\xd9>\xe1\x17q\x9b\xbc\xe8$=4%\x9d\x08\x9c\
-4\xd3\xe4\xe3\xb4\x01Kex\xdd\x19\xfc\xcb\xbf\xfd5\
-6\x9d8b\xaf\xf1\xf4\x7fO(\xea\xae\xc17\xd2\xf7\
-\xfaO\xee\xbc\xca\xc3C\xf5\xdfo\xbe\xfa\xcfp\xf3M\
-w\xb1\xcf\x5c<\xe9\x823p\xc5\x95\xef@\x82e\xd1\
-\x8b\x04\xfa\x86x\xdc&\x9d\x06\xa3\x15\xab\xce\xe2Z\x88\
-\xa3\xa1*\xa1~\xf2\xa9'`\xc3\x09\x1b\xe1s$\xeb\
-\x93\xc5\xda\xd2\x99\xcd\x0d\xdb&5}8\xb4\x15h\xe6\
-\x9c\x1d\xdcN\xf3\x96\x22\x9c\xb8\xc0\x96c'f\x96\xc9\
-i6\xb8\xb6C$\xe1j\x0b*\xa5S\x8a\x9d\xae\x8d\
-f9J\x91B\xcb\xc7H\x97aPC\xaaRB1\
-h\x22\xe5\xfb\x18\xe2\x1d\x05\x96 EI\x94agd\
-yO\x9a\xbdf\xcc\x8a\x84\xc7\x9a\xba\x8d\xd1h\x8f#\
-I \xe8\x9d\xb3.\xa5\x98 \xd2%(+SS8\
-\xe9\xc4\x13\xb1v\x5c[\x87\xe9\x1dJ\xec\xf6\xa8\xc5g\
-\x0bP\x1a +\x89V,\x88\xea\xbe\xbe\xc9\x93A\x9d\
-\xc0\xd1\x82\xe1\xe3\x1e\x7f\x16\x86G\x87(\x9d\xea\x1c\x95\
-.\xf6\xee\xdb\x85Je\x9a\xd2\xc7G\x8c\xd2\xc7Mt\
-\xe1z\xb4Ab>\x1a\x8d\x12\xbb\xa9\xc2\xca-\x8f\x81\
-\x1a\xc7o\x9b\x92'dZ::c<\x9f\x15\xab2\
-\xac\x22\xeeV\xe1\xa6\xe9\x05f(%\x0a1L6\xa7\
-P\xa6\x05\xe5k\x85?\xed\xa2F\xfb\xa8NVX%\
-Wh'U\xc9\x0a\xed\xd8\xedb\x82e\xaf{1\xf8\
-\xe4\xc9\xb6\x8ff\xcaA\xe1\x8458\xf5\xf1\x8fC\xda\
-\xd6\xb6\xa8Z\x09\xa2H\xea\x98\xb4\xed;_)\xb4B\
-\xd5\x99\xbc\xa3&\x1a4v\x02J\x81V\xc7\xc3\xcb_\
-\xf6N\xdcw\xdfN\x8e\xc2*6l,\xe2\xadoy\
-\x15\x8a\xb9<\xf2\xe95p)9\xd4\xe0\xda\xa4\xd5\x08\
-\xea\x04`\x15)/\x5c\xa2Y.I\xe5Dv\x98B\
-\xa9*\x8b7\xb5Dc\x98\xcf\xb0N&\xfb\x94\x8eW\
-}\xfb{\xa8v(\xb5r#Ti\xf2\xf5}\xb5\xae\
-\xb9\xfe2\xb8\xed^\xe6)\xa9&\xbf,\xc5\xb2\xcfT\
-+4\xcac\x98\x9a\xd8\x87;\xbe\xc7\xfbw\xef\xc6\x10\
-\x93\xae/:\xf8\x97\x7f\xfa\x00\x1es\xe2\xa8-\x8fh\
-\xed\xd0\xd6\x19\xa52\xc9K\xfbT\xde\x91Wg+\x16\
-D3\x952UV\x1eu\x1a\xa2\xb7\xdf\xf1 ^\xf3\
-\x9a\xcb01Y\xa1\x8d\xd0\xc1\xfb>\xf8'\xf8\xa9g\
-\x9e\x8d\x0c%\x92f\xaf\xb5oF\xe4\xf0\x91V>\x16\
-\x90\x82\xc9l\x90\xe5\x92\xddK\xee\xb0\xda:4\x18\xb0\
-=\x22\xd1-{G\xeba\x9aP\x90\xec\xfa\x87\xaf\xdc\
-\x86\xadS\xb4\xd7rk\x98\xc8C\x86\x09\xf5m\xc7\xd0\
-\xdd\x0fA\xa4\xe6\xb4\xa5\x10\xe6\xe2\xb3\x8d\xe2\xf6n\x13\
-\xd5\x1a\x83;n\xbc\x117\x7f\xf3j\x1a\xe2\x94|\xe5\
-\x1d\xf8\xc8\x87\xdf\x8e\x9f\xbe\xf4)&u\xc2\xc5\xd7\xb0\
-2\x0au>8\x1d\xc76Q\x81\x00\x9a\x9c\x9aF\xd2\
-\x8d#\x9dL\xc1\xaf\x97\x91K{\xd8\xb0~\x0c?s\
-\xe9yH&\xe4\xe4S\xbd\xb0\x7f\xba\xec\x90\x8e\xf6\xc6\
-\xb4\xebl\xa72\x0d\xed2;\x90\x066\xaf-\x97\xad\
-\xb5I\xf4\xdcm]7\x9a t\xc4D\xad>f\xa5\
-\xf5\xb5\x06\xed3Qa4\x8fx\x8a^\xa1\x16P)\
-9&\xe9\xb1M\xd0~\x99h5\xc8\xbd0\x10\x07\xbc\
-\xd6\xc04\xed\x9fv\xc2\xc3dM\xaf0\xc6q\xea\xe9\
-\x8fc^]T\xaa>\x92\xc9,\xb6n\xdd:\xbb\xe8\
-*\x92=$@\x89\xfb\xed\xa4\x95@+\x16D\x1a\xfb\
-\xc5|\x9a\xfd\xd4F\xb52\x83|&m\xdb-\xb6=\
-\xb8\xd54\x85\x0d'yg\xeclm\xcf\xd5\x8e>\xbd\
-z\x1d\xe7\x88\xb3\x0f\x81\xb3\xb7\xbb\x89\x06\xb9\xb9\xbc\xd0\
-\xab\xf7B\xca\x1a\xc6\xc5\x5c\xb1v\x07\xd0&\x8a\xd3.\
-K\xb48r}\x1a\xde\x81yjkFF\xd9\x981\
-\xb4\xe8\xd2\xfb\xfa$\x0a\x8d\xe2nV\x9cE\xbb\xc7:\
-V\x9c\xaey\xc5!4%:\x1d\xcf^{N\xa6\xf5\
-\x11sv\x07\xc5\x9b\xe7&\xa9\xc6\x02\x03L$\x81\x22\
-c\xba?n\xa5\xd0\x8a\x05Q@\x8f\xc5\xa1\x1d\xa2\xdd\
-\x83j\xb4F\xbdikV\x85|\xde\xf6\xc7$y\xec\
-\xea\x8d\xd4\x88\xd8\xae\xd4\x1e\x88\xb5\xd9\x95f\xcb\xc8 \
-\x0e\x8d\xe2\xe5\x85r\xd9\x03\xb2\xce\xd5\x81R\x0b4\xae\
-\xb5\xe1\x87\xe7z=H\x12Ao\xae\xcaB\x19\xce$\
-\x19v\xcdv\xf1\xe8\xf6k\x9f\x90T\x96O\x09\xd2\xa0\
-s\xa0\x0dj:\xb7\xcf\xe2Irr@\xcc\x94\xa9\xb2\
-\x09&\xa9\x8e\x80\xe9e\xeb\xa4\x92i\xcc\x94*\xac\xa3\
-\xde\xbep\xe7ycs@ZI4\x00\x88\x8e\x0d\xce\
-\x5c\xaa\x05\xcd\xf4hI\xd3\x1a\xb1KUA\x03#\x9c\
-3\x09\xd3\xd8^F\x15\xaf\xc7\xf6\xfa\xb3\x10\xc6\x13\x87\
-v\x89\xbe(\xb6<\xe6\xbd1J6\xbdl@\x97?\
-\xce8{{\xc0\xa1\xb1\xee\xd2Ut)a\x12Et\
-\x1d}yC\xefx\x01'\x8c$\x91h\x97y.\x00\
-\x12LTC\x09\x16N\xafN'\x19\x9b\xd24\x01Y\
-\xafP\x8b\xdb\x04\x96\x00\xa7\x0f\xa2j\xaf\xb3D\xaa^\
-c\xd6\xd4\x86\x0cim@\x93\xbc\xd1\xf6Y\xbd\xc9\x9a\
-L&\xd0\xb2_\x15\xa2\xa9\xaf\xe9\x8f\x88\x94\xa8\x9f\x0d\
-h\x11\xe8\x8e\x0e\x1d\x1b\x84,\x99z(\xb1\x17\x0a\xe7\
-\xc8\x967\xcc\x80\xe9'\x19\xffj\xe4\xde=\xcbb\xc1\
-\x22\x0a\xa3.\xe19;V\xd0e\xd7\xd2\xe0\xe6\xb5\x98\
->6\x1e\x1a\xf7)^N\xeb\x83\x8e&\xb1\xac7\xcd\
-8\x0f\xd7\xc9\xc8\xcc$\xf4\xce\x94\x83\xfc\xb3\x1e\xf5\xca\
-O?\xceB{\x9a\xc5Im\x851\xfb\x93\xae\x85\xf7\
-\x1c@\x07\xb4\xc5\xd1!\xb5\xd4!\xe8\xd8\x14\xec\x91B\
-\xb2{\x05\x08\x9ae(d)\x99\x8e\xb6\xaa\xd1\xe3\x8e\
-\xf2#\xe7\xd3\x00 Z\xa5\x83\x91\x19\xba\x0c\xf5~W\
-\xa1\x90\xa3\xf4\xa0D!G\xbf\x10t<\xd0*\x88\x0e\
-J\x8b\x03A\xaaFl\x0d\xc8d2S4-a?\
-ie\xaf\x88\x1c?\xb4\x0a\xa2\x05i0)\x12\x02I\
-\x0b\xbf-k\xc8\x826\xc6\x13@+\xcd\x05?\xd2\xb4\
-\x0a\xa2AIs8}\xcd\x15\x99>2\xe3\xbbz\x95\
-\x9a\xc7Y\xba\xf6\xb6\xf3\xe9\xe1L\x95/B\xcaq\xa5\
-Bs\x15D\xcb$\xb3g{@\x8a\xc9\x06b\x98L\
-\xe8m\x18\x02\x8a\xf1\x02\xd3\xf1B\xab \x1a\x94\x0c5\
-:`\x93Q*i\xdfP\x5c\xe7T]\xe9\x94\xdeN\
-\xd5\xac5\x90Ky\xd0o\xfb/\x95\x16\x9a@<\xda\
-\x8e\xderi\x15D\x0f\x93\xec=y\x85=v\xb5\xb1\
-l\x19Rh!;\xea\x91bZ\xad\x82h\xa9\xd4C\
-\xcb\xfeR\x22\xdc\xb5\xa8(\xfd.\x99\xdc\xfbp\xbf\xc3\
-\xe1\xa3\xdecW$\xad\x82h1\x1a\x14\x03L\xa7\x9f\
-\xb5\x12\xa8\xd4\x98\x19\xaa\xb6#aX\xafdZ\x05\xd1\
-\xc3%\x02F\xaa(jH\x81\xe8x\xa3U\x10-J\
-\x87\xb6k\xb4\x16&\xd2\xba\x97\xe6\xad\xa5n2\xa9\x94\
-yg\xc7\x13\xad\x82\xe8\xe1\x90-xj\x86:\x04\x90\
-H\xfb\xbf\x8f7Z\x05\xd1b4\xbb\xa7z\xa1F\x0a\
-\xa5T\xf87\x0e}_(\xfa}\x22}\x0e\xc7\xf6\x11\
-\xac\xae\x9d\xf5\xd3\xf1\x88\xb3\x08:\xda\xab\xa8m\x1b\xd1\
-;l\x8c3p\xf4\xb6r\x10h\xcd\xaec\xdfTj\
-\x07\xbem\xf7(\xd0&\xd2\xaf1.\x95\x96=O\xa4\
-\x82\x1dc;\xfexD\xc8@4\xd7/!hDs\
-qs\x86\xb4~_MW\xf5\xc54}\xbe1A\xd6\
-\xbe\xe8\xa5:h\x8f\xf2y\xa2\xb0\x01Wi\x7f\xa2O\
-f\xa1$\x88\xfeIl\xa81\xed\x05\x0e\xfd9Z$\
-i5\x88\xc4:\x824\x00\x88Vi!\xea\x97\x1c\xb3\
-\x80\x22\xdb&\xb5\x81\xf4\xd0\xa3\x87VA\xf40h?\
-!\xd0\x03\x95\x82\x95\xf6\x9a\xf3\x91\xa6U\x10=L\x12\
-\x88$\x89\x22\xc9\xb4\x0a\xa2U\x1a\x98\xf6Sg<\x8e\
-\xce\x8f\x94&S\xeesO\x5cY\xb4\x0a\xa2\xc3@f\
-\x5c\xf7\xd0\xb3j\x13\xad\xd2\xc0$\xa0H2\xccW\x5c\
-\xd2dK{W>\xa4\x85\x80\xf7H\xc1\xe2*\x88\x96\
-I&}z\xc7\xf3\xa9_\xd5\x0dJ\x0b\xdd\xb3\x8cl\
-\x8e\x09\xad\x82h\x99\x14AH\x7fm\xa6\xe8\x08\x8b\x8d\
-\xf09+\x93VA\xb4L\x8a\xe6\x86\xe6\x93\xb0\xb4j\
-\x13\xad\xd2@d\x1e\x99B\xe3\xfd\x01\xb5\x0a\xa2U\x1a\
-\x88\x22\x1b\xe6\xc0p\xee\xf8x\xa1U\x10-\x93l\x91\
-\x95\xa1\xa4\x8eI%\xb2<5yg+\xed#TG\
-\x9aVA\xb4\x08\xcd)$5Q\xd8Lsq\xd1>\
-F\x1eiS>Y?f\xa7O\x83\xea\xe7\xc84c\
-m\x1f\x109Nh\x00\x10\x1d\x8f83\x99b\xacM\
-\x1f\xe2\x10\x13\x8c\x9b\xfd \x92\xd4V\x07\x09\xfd\x84z\
-'\x80\xeb%\xed\xa32\xd3\xb5&\xba\xfa\x02\xda\x12i\
-!;j \xd3J\x9a\xf3\x18k\xcf\xe3\x11!\x83Q\
-o\xf3Y\x04\xa7\xfd)l\xb6\xf0\xaf$\x91\xfd\xb5/\
-\x0c\x05-\xfd\xdc\x02o_\xa2$Z\xc8\x8ez\xa4\x98\
-V\x03\x80\xe8\xc0&\x5c\xa5\xfdI\xbf\xb8\x18\xed}l\
-6\x09\xa2\xa3\xd9\xfb\x02\xeb\x12\x01{\xb8iU\x12-\
-\x93\x04\x13\x1b^\x04L\xa8\x8a\xc2\x1d\x8e5\xbfiR\
-\xe9xj\xdaU\x10-\x99\xe6+8\xd9K\xfau\xa3\
-P\x1c\xd4\xfc\xc6#F\x0d\x1d.Z\x05\xd1bt\x08\
-\x15!\xa0D\xae\xbd\xbe\xec\xa0\x09G\xd9D5\xdf'\
-\xc4\x8e/\x14\xad\x82h`\xeaI\xa0\x05\xf0\xa1\xdd\xd5\
-\xf6C\xc0<\xd6'\x86\xf5\x0aQ\xbf\xac:\x1c\xa4\xbc\
-W*4WA\xf4\xb0H\xcd\x17\x82\xc7<2\x86A\
-KsDa\xfc\xf1B\xab :(\xcdk\x9e>Q\
-\xa0o\x13\xb5\xf4S\x09\xf18\x9a\x01C\xc6MW(\
-\xab\xe2\x09\xfb\xf6\xf4Ri\xd9\xf3D+\x80VA\xb4\
-(\x1d\xbci\xe6\xf0\x14\xa7\xe4\xd1\xfb\xafTe\xcd.\
-Z\x1d\xdaFRmK\x04\xc0\xa3|\x9eh\x95\x16\xa3\
-\x98\x13~\x85H\xa1\x8c\xear\xb5N\x00\xb1\xf3%B\
-\xec\x1b\x8f\x87\x8f\x84\xc9\x95*\x98VA\xf40(|\
-\x03_\xf3D\xa1$*\x95\xcbh\x19\x8a\x8e\xaff]\
-\x05\xd1R\xa9\xf7~\xb4y\xf6l=S]<\x977\
-6]\x22\x88\xe4\xc0\xd9\xc7\x1c\x8f\x1fZ\x05\xd1\xb2(\
-t\xe0\xa5\xb5\xa2m\x1f\xfa\x10\xe8\xccL\x05\x1d}f\
-&\xee\xda\xaf\x08\x1d/\xb4\x0a\xa2\xa5\xd0\x02_i\xb0\
-m\x1f\x0c\xf5\xb3\xea\xe5Z\xd5\x0c\xea\xa3\xfa.\xfe\x0a\
-\xa0\x15\x0a\xa2ySu]\xda\x1c\xb1\x0e\xddg\xfdP\
-pxM\x05\xb7)\xbd\xa8_5\xf2%\x19\x18\xf7\xb0\
-g\x8c#\x9b\x86\xa1\x8e\xe6\x1aiN\xbch\xa5L\xf1\
-\xfa\xc8\x8c\xb6\x80\xe8G\xa4\xea<h\xe9+Eq\xd9\
-H\xf2\xda\x98\xc5\xec-R{\xe2pk\x89X\xb9\xe8\
-\xe7<\xed\xd7\x87X\x15\xfd\x02Q\xb8\x02':X\x1d\
-\xc2'\x1f@\xc7\xc8\x16\x1b\xe0\xa9\xc7\xa6`\xedVC\
-Mlj\x22\x91,\xc2I\xc5\xd0l\xcf\xa0\xde\xac\x85\
-\x09\xd4\xc62b\x8d\xa9Rh\xa4t\x10\xb0\x13\x9b\xe4\
-\x80\xc7\x8c\xd3\xcd\xcba\x19<\xf6#\xaf|\x86pj\
-Q\xecx\xfdT\x96\xe2\xba\x84i\xa3\x1ev\xb8~/\
-\x9fQw\xedh\xa1\xee\x14\x017\x8b\x80\xf7\xaa\x04A\
-\xb7e\x92J\xac\xdf,\x93\xb4\x12\xd8\xf4s\x9d\xc9T\
-\x16\x1d\x1aPn\x9b\xc7\xad8\xf2\x8e\x874\x0d\xf4j\
-\xa9\x84lF\xbf\x88\x16\x82\x94\x8e\x9f\xfdN\x9fv\x07\
-\xb4\xb5\xe3\x8d\xb1s;'{\x05\x14\x09\xac\x06X\xdd\
-ut\xfb\xec\xd8 d\x00r\x13\x8e\xa9\x85\x80\xad\xee\
-kQ\x93\xdd\xa2\xdf\xacKx\x8cS\xafY\xfb\xa9\xa3\
-{\xcc\x9e\x0e\x7fh\xae\xf7O\xe7\x04\xd2\xb2B2\xff\
-\x90{\x019\xc4W\x98\xbf\x22\xe2\x12\x1bL/pH\
-\x12U\x1b,\x94\x9b\xb02w\xed\x97\x8d\x05\x02\xca\x1e\
-\xa6\x0d\xb9_\x8e\x01\xb5Z\x05\x89D\x02\xf6\xd3Vm\
-\xc2\xbe\xe1\xf3\xde\x18b\x89\xb8\xa9E\xe6\x8c\x16A\xd6\
-\xe6 \xd1\x8f\xe8\xe9W\x19\xf5\xdbj\xa2\x03\xdf\xf5\x9f\
-\x7f~ti\x00\x10\x1d\x9b\x02v\x88\x14\xfd\xec\x93~\
-L1\x99T\x03R\x12\xd5}kP\xb6}o\x83!\
-\xff\xe8\xa0\xb7\xdbP\xbf\x81\x98D\x1a\x09\xfe\xd5O\x7f\
-\xda%\x0a\x8f%\x87di%\xb1\x1d3>b\xcdP\
-+T'\x8bd\xfe\x08NS\xfb\xb6\xa3]/QB\
-\x95\x10\x0f*H\x11\x10\x9e\xfd\xd2t\x9c\xc7\xe2\x18\x8f\
-\x15\xc7\x81\xc0:\xa5S\x09\xa4\xd2\x94bm\x1fA,\
-@\xb9YE#Ne\x98K\xc3\xc9zpX\xcfh\
-\x16;\x9a\xb9\x8e\xf6s\xaf4R\xd3\xacH\x8a\x13)\
-\xfa\x1d\xd8ZU#\xbf\x0d\x8f\x92I\x9b\xe3\x13n\x1a\
-S\xd3\x1a\x8dL\xa4\xf6\x8cX}*\xa6\x8d\x11\xeb\xd2\
-;\x9ae-\x8e.5\x94\xeab\xa8,\x99\xb7\xe4\xca\
-\x1c3\x0d9h\xc9\x22\xa3\xb4\xa4\xfd#)539\
-\x81n\xd3G\xa2\xdd$\x84[\x88\xd5kd\xbf\xc7:\
-\x16W\x80F\x95\xa2\x95\x80\xa9L\xa3U\x9b\xe1`\xa9\
-ad\xa8\x88LF?\x0b\xea\xa0\x16\xd4QaZ\xe9\
-1\xd7\xd5\xcf\x99\xf39|@$}\x04\xa4\x85\x96H\
-\x8e%\xadX\x105\xebux\xc9$\xf2y\x1a\xae\xad\
-&\xf6\xee\xddk\xbf\x97\xbaf\xed\x06\x93\x10u\x02\xc6\
-'7\xd9\xb6\x01Ccj\x14\xa9?&C\x83=\xae\
-4\xcbe_\xf7\x93\x15\xd2\x1c\x99\xe50\x9e\xe0I\x16\
-\x88\xdd8ZL\xdb\xf2)]:\x09\x0c\xd1\xce\xc9\xb1\
-\xd33D^\x81 \x1c\x22\xa0\x8b\x04X\x81j\xb08\
-\xcb]\xe4\x09\xbf\x02\xad\xe9\x0cQ\x1f#\xf0Z\xb5\xb2\
-\x81PR\xcb\xde\x22!H|_?\xb9\x1dJ!\xb3\
-\xa9h\x07E\xe0Yi\xd2\x88\xeaz\x91\x12)\xd6\xca\
-\xccV3\x12\xde\xa4\xe5\xc3\x01\xff\xb1\x8f\x7f\x05W\x5c\
-\xf1\xcf\xd4\xe5q<\xf9)g\xe2S\x9f~\x07m\x01\
-\x1f^,I\x83\xb1\x0dG2{\xd9D\xa3\x94\xa35\
-\xee&i\xa4z\xb8\xe9\x87\xf7\xe1Mo\xf9c4\xd8\
-9\x0fm\xdb\x86\xd3N?\x15u\x8eby51v\
-V\xe4E\x85\xa4\x11K\x8e\x85\xbf\xf8l\xfb\x9f\x97\x18\
-\x8ad\xc3\xb0\xcfM\xda\x84\xab\xf2!\xe9\xf7\xf6\xb5\xc8\
-\xd1\xd1\xafQw\x88\xda\xb8\x87D~\x08\xdb\xf6\x96\xe1\
-\x16F\xd0N\xe4\xd1\xe2\x8dqy]\x96\xbeg\x1b1\
-'y\x96m\xe6\xd5f\xbe\x0a\xbdT\x8a\xed\xd7D\x8a\
-\xd2,\xc9n\xa8\xee\xdb\x8bQJ\xa4\x8c\xeb\xe3\xd5\xbf\
-\xfa\x5c\xbc\xe9\xf5\xbfF\x1bP\x864\xf3`f\xa1\x14\
-\xea\xa2\xd1hP\xc5\xcf\xff\xe8\xfa\x5c\x19\xf7\xa7^\xff\
-Q\xca\xaa?U=\xf5\xdfo\xbe\xfa\xcfp\xf3Mw\
-\xb1\xcf\x5c<\xe9\x823p\xc5\x95\xef@\x22\xc6\xba\xb1\
-\xec]\x82V\xbf\x90=(-\xf6\xe4cN\x89d\x9a\
-u\xa6\x0a\xe3\xb1Fb\xab\xd5B&\x9b\xc7\xe8\xbaM\
-\x98\xacuP\xe9f0\x1d\xcb\xa0\x14K\x1bO\xf7\x98\
-\xbe\x0d\xca\xdd<j\xed!4\x82!\xf8\xe4\xa5\x86v\
-\xdc\x1aB\x93a3(\x86\xdc\xe41\xb9\xd5\x1c\xa6\xb4\
-\x1bB2\xb1\x91\x05\x1b\xa7\xe8\x1bF\xa7\x9a\xc1pj\
-\x1d\x0a\xb1\x11\xa4\x83$r\xcd$\x86ZI\x0c\x07\x09\
-\x0cSj\x19\x07\x0eF\x8cc\x16z\x935xS5\
-\x0c\xf9]\xe4*-\xa4g\x9a\xd8\x9c*\xa2\xd8 \xa0\
-X\xbf\xb1\xe2\xb0I\xa5@;\x04\x08\x1e\x1dG*M\
-\xc7+\x89V(\x88X,\x8eTy'2\xa2\xf3\xf9\
-\xbc\x89\xf3\xd2L\xcdl\x92\x96\x9bA\xcd\xc9\xa0\xe2\xe6\
-0\xc3\x91?\xedeQJ\xe4fy:Q\xc0Tb\
-\x08S\xde\x10&\x93K\x0f\xa7\x19\xea\xfeir\x89<\
-\xe3\x16\x18\x16\xf9,\xb2\xabs\xc6;\x05>\x7f\x18\x8d\
-\xcc\x18*,K\xe0\x15Q\xed8\xa8\xcb\x96\xa2\x94\xa8\
-Q\x02\x89}\xf6{\xbd\xd3f\xa8\xe3\x0e\xa5i\x87*\
-\xb8\x85\xc2(A\xe2\xd0x\x96\xe7@5\xd6\x16@x\
-\xaf<Q\x81f\xed\xda\xf5\xe6Th\xf0D\xa4c\xb5\
-\x83\xbc\xba\x95D+T\x9d\x85\xd2'N \xb1MM\
-\x12\x9f{\xc1/\xa1\x19\xcf\xa1\xcc\x8e\x1a\x7f\xcci\xc8\
-\xd16r\x0byTh;hN\xc6\x89\xd3]\xe6}\
-NLF/%W\xd2\xa1\xca\xb0\x0a,\x99\xe4\x92'\
-\xd8\xa7\x0d\x1a\xc5\xc5\xe1a\xba\xe35\xb8\xcc\xff1\x8f\
-y\x0c<\xda<q\xfd\x5c\xa7\xd4\x14\xd9\x9c~=\x86\
-\x7f\xda\x94\x10\xe1$\xa2\x9aN\xd7\xd8\x0e\xac\x87#C\
-\xbb\xa7\xd6\xa42\xa5\xdc\x9a4\x96\xf5%\xfeL2E\
-\xbb\xa8\x85\xbb~\xf8Cl\xbf\xfb\x1e4\xa7\xa70\x92\
-\xef\xe2\xfb\xd7\xfd\x03\x9f\xa9\xa9\x04I\x1e\xa91\xcb\xd6\
-<VQd\x1f\xcd\xd1b\xf2\xe08Vg\x9a\x1fQ\
-\xe7h4\xea\xe7\xc2\xcf>\xebLk8yg\xd33\
->\xb2c\x1c\xa9#k\xe0\x8e\xaf\x85\xb7\xe1\x04$O\
-\xa0zY\xc3\xb8\xb5<\xde\xbc\x19\xb1\xb5\xeb\x80uk\
-\x97\xc7\xeb\xd7\xc1\xdd\xb4\x01\xde\x89\xccs\xed\x18\x12\x1b\
-6 \xb1~-bcC\xc8m\xde\x84\xdcI\x9b\x90\
-\xdet\x022\xe4,\xd3\xe56\x927\xadG~\xe3Z\
-\xf2\xb8qf\xd3Z\xa6\xd9\x80\xf4\xe6\xf5\x966K\xd6\
-y\x96iu\xdf\xfa\xc7>\x16\xc3'\x9d\x88<\xf3\x1d\
->a\x1d|\xa7\x8b\xa6\xa6\xad\xe9\xf6\x0f\x8f\x8fY\xcf\
-\x846\xd0|\xb0\xac<Z\xb1 \xd2\x88\x91\x8c\xd4<\
-\x8c\x9a\xf1\xe9O\xbb\x10\x9df\x83\xa0\xf2P\xae\xfa\x1c\
-X)6z\x12~\xd2\x83\x9fJ\xa2\xe2\xb9\x98fm\
-&\x99\xb6J\xf5\xd0\xe2\xb1\x0c\xd9\xe5r\x83\x92\xa4C\
-\x09P\xa5\xbb\xad\x99\xf0v\xa7\x81\x1a\xddr7.\xa9\
-G0;\xb4\xd8\xe8\x82k\x82P/\xbc\x8a\x05v\xcd\
-\x03\xe98Fw\xbd\xcb\x88.%r\xdbK\x18w\x13\
-I2m=:\x0cu\xcd@s\x94x\xb4\xfdd$\
-O\xee\xd9\x87\xa0Z\xa5\x91\x1d\xc7S\xce?O\x1a\xae\
-gL\x87\xbc\x92iE\x82H\x00r\xd8\x01-\xa2\x88\
-Z\x80\xe0\x01.8\xe7,4j\xd3T%\xfa\xcd\xf9\
-8U\x0c\xd5\x18\x136\xd9\xd2u6r\x95b\xdb\xa7\
-\xf8o\xb8<\xa78\x16\x88\xdad\xa9\x8f%\x87\xe4\x80\
-\xcf\xe9$\x98W\xa0\xb77\xda,K\x80Z\xbd\xcc\x1e\
-e|\xb7\xc92\x86\x93\xa1Z\xab\xd3_\x1dw\x99&\
-d\xc5\xe8J\x97\xa5\xd2<8\xf3\x93\x0acsG\xcb\
-\x1em\xb3\x85h`{)\xd4\x08\x9e\xdaL\x09\x0e\xef\
-kVgp\xde\x13\xce\x02\xf19\x0b\xa2\x95N,\xe6\
-\xca$\x01I\x9d\xa5\xe6\x97\xedq\xca\xe6\x0dHQB\
-t\xeaUh\x07\xf3\xcc\xe4\x14\xdd\xec\x96I\x836\xd3\
-\xb5\x99.\x91J \x99\xf6h\x9f\xca\x1aQ\xe7E]\
-\xbc\xb4P\x1d\x1f0\xdfn\x92\xd2\x83\xa2\xc5a\xbe.\
-\xc3\x0em\x06[)e\x1a\xfd\x1eU\xcc\x98\x1d\xad\xde\
-\x96\xe8\x98e6,\xaf)Za\x98\x96\x91\x04x\x87\
-\x92\xb4\xa3\xd9h7av\x91O\x90n\xdb\xb6\xd5$\
-]\x86\xaa,\xde\xf5\xf1\xd8SN\xb4\xd9\xf3G\x0a\xad\
-\xd8\xa2\xb6(~4\xa2\xe3\x0e\x8dS\xf2\xd8\xb0\x87S\
-hK\x80*-\xde\x0eP/S*\xb4\x02\xfbm1\
-\xfb\xa5CJ\x88x\xaf\x83\x83@/\x10J\x8ai\x99\
-@\x86\xe2\xd2B\x99\xc4\x0d\xe2D\x0b\xa9\x9a\xcf\x09$\
-\xd9(\x99\xb4;_\xbf\x81\xafIO\x9bv \xb8\xb5\
-&*\x96T\x14k\x91\xd5\x5c\xf16\x8di\x96S?\
-\x16\x13\xa3\xa1\xaf\x9f=W\x16\xba\xa6Ps=*\xa3\
-\xce\xf7\xee\xd9MiK\x89\xe7W\xb0\x9ev\xd7\xe9\xa7\
-\x8c\xd1\x10\x0f\xdba>\xadD;i\x85\x82\x88\xf2\x80\
-\xa0\x90\x94\xb1Q\x1fgGP\xfa\x9f\xf7\xf83\x91a\
-\x5cL\xefv\xc9Vi\xf8\xa6\xdeR\x1c\xe1)\xc6\xdb\
-\x82D\xb7E\x0fJkU)$\xdd\x0cm\x94\xcc\x92\
-C\x8f\xf7\xc6\xe2\xf42)R\x1c\xda0]\xe6\xac\x95\
-\xb9\xb4\x97\xe3\x11\xa5\x05]&'\xee\x19\xc7\xe3\xa99\
-\xd6}\x0e\xe3i\xab\xa5(\xa22\x04\xa38\xcdNO\
-\x12\x8cI\xc6yb\xde\x9f\xcfd\x91\xa6tjp0\
-\xd4\xa7ik\xb1\xdc\xadz\x05g\x9fv*r}\xf3\
-\x88\xb2\x0bC\xe6\xa0\xd0\xc1\x0a\xa4EA\xc4\x01\xd9#\
-\x15\x9c\x1di\xcc1\xaaScu\x19\xc5\xb3\xed\xf1\xd1\
-\xb50n\x96f\xd3\xf5\xb1\xe8Pa\x8f\xe4\xb0\x87N\
-;\xd9>\xfa\x03\x9cr\xea\x89t\x89\xd9\x09\xdd:J\
-\xdb\xefC\xe5\xa1\xfb\xd1\xd9\xb9\x1b\xe9\xe9\x0ar\xd5\x00\
-\x99J\x03\xe9Z\x13Ej\x1d\xcfo\xc0\xab7\x90\xf0\
-\x03\x86d\x9e'\xb5\x94\xe2W\x19R%Z\xc8s^\
-K\xd6\x08\xbcz\x87\xdc\xb2\xf4\x09\xbf\x85L\xd0A\x8a\
-\xa2%\xdd\x89\xc3m0\x0d\x0d\xe1\x22\xc1\x90\xa6\xe4\xc8\
-PB\xc5\xb5\xc6BI\x18\xeb\xb1\xc3s\xa7Ii\x18\
-\x10\xfc\x0c=?\xe4\x84\xdf\xb50)f>)\xe6\x9f\
-a\xb9\xdcR\x15\x13\xf7>\x88\xff\xb9\xf1F\xec\xba\xef\
-\x1ex\xed6\xb2T\x9f\x8f;\xebT4\xa4\xc5Y\xe5\
-\x851\x13uY\x7f\x18\x1dG$\x89,\xd7\x9e\xa1\xfa\
-\xa4\xcf\xbd\xd7\x15q\xb8\xf7\xc8a\x7f2$G3\xf5\
-\x92\xe8}\xa9\x06\xa2\xf9O7\x8a\x1e\x16BC\x85a\
-\x83\xc9>\x91\x98\xe6\x7f\x9a&\x94\x12iT\xaau$\
-2,@2\x86\xc9\x19\x8e[M\x9e\xf1\x9f\xe6j\xf6\
-\x03\xc7\x12Y\x15\xf3\x08\xa1\xb6\x16\xaa\xba\x09\x22*#\
-\xed\x80\xb3\xcf}\x22Z\xcdi$\x82)\x8c\xb6fP\
-\xbe\xfd\x87\xd8\xfa\x9f\xff\x85{\xfe\xdf\xd5\x98\xfc\xf6-\
-p\xef\xde\x8d\xd4\xb6I8\xdbw!1\xb1\x17\x85f\
-\x05\xf9*U\x04{c\xc4\xaf#3\xb9\x07\x9b]\x1f\
-\xf9\xd2v\x8c\xf9SX\x17\xd4\x19\xfaX\x1f\xb8X\xdb\
-r0\xea\x03C\xec\xe0Q\xaa\x96M\x94\x18\xd9\xd2\x0c\
-\x819\x83\x22m\xaf\xf5N\x02\x9b=\x0f\xa3Zr(\
-\x97\x10\xab\xcd O\xc3;\xcd\xc6\xc8R\x1a\x16\xa9\xe6\
-2\x8d:rTq)\xaa\xaf\x5c'\x81\x91n\x16\xc5\
-v\x02\xc1\xcei\xcc\xdc\xbb\x0d\xa5\xbb\x1e\xc0\x96\xab\xaf\
-\xc5\xb5\xff\xf4\x05|\xe5c\x9f\xc4\x0d\x9f\xfb\x02\xee\xfa\
-\xf6u\xe8LMPMW\x91\xc9&\xf0\x84'\x9f\x8b\
-\x06\xcd'm]\xb2\xde\xd1`6\xe6\x1fr\xd8D\xe1\
-|\xdd\x5c\xb8?\xab\x93\xda\x9d\x0a\xc3\x00\xd4\xec\x16\xa9\
-\xf8\x06\xcb\xa8\x1dW\x1c\x1f\x94\xa2\x19J\xd5\x1c|\x0d\
-\xa0\x98v=H\xc5\xd6\xf8(:\x06\xd0\xba\x9d\x100\
-\x18-8\xd9\xa8\x08\x01HewP\xe7_\x81\x885\
-\xea\xa4\x18\xbav\xfd#W\x5c\x83\xbf\xbe\xfc\x93L\xd0\
-\xc4\xc5\x17\x9f\x8b\xcb?\xf2N\x8adJ\x00I\x0dz\
-(6\xc1\xa3\x0c\xe6\xe3T7+~\xb1\xb0G\xdd\x96\
-o\xb3\xb9-\x8e^:\xd4p\xe8\xc2\xd3\x1c\xc2_\xfe\
-\xd5G\xf1\xd5\xab\xbe\x85\x8e\x93F\x8d.X\x97\xea'\
-\xe6ePb\xe7O\x96\xd8\x08\x09\x0f\xb9\x91!T)\
-\xad\xfc\xa0)%\x04/\x91@\x86\xc6q\xc3\x9fA\x9a\
-Uh\xb5\xe8\xc0\xb3\x9c\xdd\x8eG\xfb\x89 \x8d\xa5\x11\
-P\x12\xc4\xe9\x11z\xc9.\xca\xd3\x13\xe6\x86\xcb\x06r\
-3)8\xb4m\x1c\x82\xb1\xe8\xc5QLg\xe0\x134\
-\xd3,UY{\x88h\xeb\xc8-\x1f\xa6\xab\xde$\xc0\
-4\xe1\xa8w\xcf\xe4\xe6i\xebJ.\x9bF\xcaK\xa2\
-R\xa2g\xc9\xfa\xe5y\x7f\x93\x80\xce&\xf9lJ\xc3\
-nP\xa5*l`l4\x83SO=\x01\x7f\xf0\xfb\
-o\xc1cO\xdb\xc82/2\xc2\x17\xa5\xb9N\x97[\
-\x01\xeb7\x0e\xc4FZ\x9d\xc8\xfe\x08\x9b\x98V\x1cC\
-\x17\xafz\xe5_\xe2\xb6\x1f=@3 \x81'_x\
-\x06>q\xf9\x9b\xd1hUXFJm\xd5\xdd\xdc\x17\
-\xde4\x00-Z\xce\xb9\xfeTF\x1a\x1a\x8cQd\xef\
-\x82\xdf\xa8\x22\x95\xd6\x8as\x17\x95\x0a\x1f\xce8-S\
-t\xe2r\x7f)6\xa8\xe6L4\xb2P!3NL\
-\xfb&\x0c{\x22m~h\xac\x11\x13\xde\xdff>4\
-5P\xa6\x1bL\xf3\x04oz\xf3\xab\xf1\xe1\x0f\xff9\
-\xcex\xeczd=\x1f\x93{\x7f\x82\xca\xd4=\xc8{\
-\x15l\x18\x05F\xf3\xec\xb8\x18\xc1B\xc0\x8c\xb2\xc9\xd6\
-\xc83\xa2'\xd7\xde;\x01g\xba\x8a\xea\xb6=p\xca\
->UY\x13)\x8e\xbca:\xdc\xe3\x09\x1fC\xed\x19\
-d\x1b\x13L\x1f`4\xd6\xa0\xc4\xaa\xe1\xc4\xb8Oi\
-U\xc3Z\x82q-\xbd\xa6\xcc\xcc\x14Z;\xb7\xa2\xb3\
-k\x17Uh\x03\xc3\x1c\xec\x9b\x9d\x1c\x86\xcaTQ\xfb\
-&1<]\xc6\xdaJ\x87\xf1-\x14(\xb9\xc7\x8aT\
-\x17\xcd)\x04\xd5\x9d\x18\xca\xb6\x91cy\xdb\x8d\xbd\xc8\
-xT\xc7\x93\xf7S\xaa\xee\xc1\x89\x9b\x8a\xf8\xc5_x\
-\x16\xde\xfb\x9ew\xe2C\xef\x7f7\x9ep\xe6FT\xab\
-Sl\xcfp\xe3\xed\xe0\xac\xf4!\x87\x80R\x8fh\x1e\
-K\xfd\xc2C\xa3\xd0\x07U\x17\xa63\x14\x061\x9f\x80\
-/S}\xce\xd8\x0e\x88dBBB\x00b8 \x80\
-D\x8bJ\x22\x15C\xa4){\xdb\x9f)\xa2\x88V\xe1\
-t\xfd}\x7f\xf3o\xf8\xbb\x7f\xfa\x17\x1a\x9e\x09\xa4\xb3\
-q|\xe3+\xff@c\x966\x04;\xc1&v(\xfe\
-\x95N\x05\x96\xd8\x0d\xc3\xe8\x5ca(\x9a\xe7\xcemQ\
-`6Tu\xf5\xb7Z\xab\xd2\x08-\xa2^\xf3)\x82\
-i\xb0\xa6\xe8\xc2\xb3p\xc2\xf4D\xa9\x83\xbb\xb6\xdc\x87\
-\xef\xdet\xb3\xf1\xdd\xf7\xdc\x87R\xb9B\xe1\xe0r$\
-\xe7\x91\xa4!\x5c\xaf\xb1\xf3\xd2y\x9e\xa7\xcc\xab\x9a\xa2\
-\x94\x19\x1f\x1fa\xc3U\xcd\x8bSfr\xc5[\xed\xa6\
-\x0d\x86\xd1\xd1a\xf3\x94r\x1c\x88m\x0e\x8az C\
-\x99\x92,\xc1ZP\xc2j[J\xdb\xc9\xa2\xe9\xad\xc1\
-\xe4t\x13\x85|\x1a\x9dZ\x19#)\x8e\xefv\x97\x06\
-y\x81\x12\xd2\x87\x9f\xa8\xc1\xefV\xed7a[\xcd\xba\
-\xa9\x0b9\x0a9J\xac3\x1e{\xba\xcd\xc0?\xf6\xf4\
-\x93mb\xb1P\xf0P\xc8I\xa8I:6\xd1\xa4\x9a\
-\xcd\xd2\xf0\x0e\xe9\xc0\x96\x1b(\xb4|(O\xdc\xacm\
-\x8b\xa10\xe4p!\x88)q]\x96\xff7^\xf5n\
-\xdc\xfa\xc3\xbb\xd9\x06u\x5cz\xe9\x93\xf1\xbe\x0f\xfc!\
-\xd2Iz\x91\xb4\x01\x05\x09M\xa2\x0eJ\x87\x06\x91N\
-\xac\xd7\x18\xf6&/t\xf8\x8f_\xf8\x16\xdey\xd9_\
- 7\xc4\x0e\xa1W\xf1\x9f_\xffwlZG\xdd\xaa\
-\xe94\xa93\xdaE2\xbcuG\x08\x8d0\xcf\xb9P\
-cm\xfeyx\x87\xc2F\xdbge)\x8e;Tg\
-|\xaep\x9crS\x94\x80l\x08*\xf5\x04E\xae\xe6\
-^\xd8\xcf\xb6V\x16\xa3\x87\xa6\xe5\x9er%\xc0\xf4D\
-\x05\x13{\xea\xb8\xe3\xb6\xbb\xf1\xf1\x8f\xff_\x82'\x86\
-*\xa5Cqh\x94*\xe3t<\xefy\xcf\xa1\x01{\
-\xb2\xa9\xaeD\x22 \xd0J\xc8\xa6\x13\xf0eh\x13l\
-\x09\x95#(\xb1\x0e\x0ej\x9d<kD[\x8f\x12\xb6\
-\xd9\xf1\x11\x10q\xdd\xcc\x08\xae\xbe\xe1^LP\x02\xa5\
-h\xe8\x07\xb5i\x94w\xdf\x83;n\xb9\x0d\xfb\xf65\
-(@iT\xc7)\xa9\x13-\xbc\xee\xb5\xaf\xc6y\xe7\
-\x9f\xcd\x0er\xf1\xb8\xc7m\xa4\x07\xc8\xf2\x0a\xbb\xac\x8f\
-\xcdp\x13\xac\xcdF\x07\xc9$[\x82R\xb8KU\xab\
-\xba\x98\xf47:\xb0\xe5\x0e\x1d\x92\xa8f\xfd\x06=\xd7\
-T\x12\xb4\xf3\xe1R\xda\xfa\x1d\xda\xb0q\xaa\xddV\x0a\
-\x97<\xe3WQ\x9a\xa2#\xe1u\xf1\xda\xdfz\x19^\
-\xfb\xfa\x17\xb0\x1di7\x12\xe4\x01\x1d\x8a\xa478\x88\
-\x9c\xcbH\xbd\xe3\xfd(BVX$f\xd8?7\xa1\
-S\xda\x22_\xf8\xc2\x17\x89Zv:\xcb\xfe\xb4\x8b.\
-\xc4\xe6\xcd#V\x8f\xd0\x06\xd4\x1b\x0fb\xe5 \xa9\xa3\
-\xfb\xfb\xc30>\x94H\xfa\xabg\xce\x85u\xca\xd7\x84\
-K\x17\x9a`\xd4\xe8\xb1\xcd\xaft\x8d\xdb\xda\x12\x92N\
-3\x9e\xb93\x0b\x8f\xa3;\xc5\x0a\xabs\x12\xbc9\xcd\
-\x0e(d\x938yc\x81\xb6\x8c\x83\xeb\xaf\xbd\x86\xb6\
-P\xcd\x80'\x80\xec\xda\xb9\x07\xb7\xdfv\x1b\xb2Y\xda\
-N\x94\xa0O}\xf2\x09X\xbb\xb6\x88\xcd\x1b\xf2X\xbf\
-v\x98*1\x8f\xb5\xeb\x0aX\xb3&G.b\x0du\
-\xe4\x9aM9\x8co,bl\xd3(\xc6N\x18An\
-M\x1a\xbb\xfd\x1c\xd2\xc3c\xd8\xbac+\xb6\xdc\xf3c\
-\xdc}\xef\x9d\xd87MUIpk\xa3\xbdC\xc3\xdf\
-C\x03\x97<\xf3b<\xfb\x19\x17`\xb3\xca\xc3F\xad\
-\x94h\xec\xf3\xd9\xfa\xe5s\xab\xab\xfa\x9d6\x97\xea\xd3\
-!\x80\xb4\x9bS\xbb%cqI}\x01I\xa9\xc2\xb6\
-\x1a84\xd7\x9a`\xef8&\xfd4\xe7\x16w\x1a\x8c\
-\xd6\xa4E\x0a\xffs\xd7C\xf8\xc7\xcf~\x99mI\x07\
-\x86\x83\xe0E/y>\x1es\xf2Z\xa6\xa7\x91M\xcd\
-\xc2\xe66\x09:(-\x02\x22M\xd8\x87\xb6\xbfMl\
-\x994\x22+\xdf\x1eg\xf2Y|\xfd\xaa\xffFeF\
-\xfa\xd8\xa5>M\xe2\xdcs\xceE\x9av\x92* \x10\
-\x85\x10Y\xec_/+\xe6k\xa0S\x18\xc5\xf1O\x82\
-\x06\x9fo\xde\x19+\xca\x8a%\xd8\xb0\xac#\xea\xd5\x1a\
-\x05\x1dG:\xe5s\x87a\xa0\x9d\x81lxm\xee\x92\
-\xbarxsR=\xc4\xce\x19\x1d/\x22_\xa4\xe1\xcd\
-\x06\xd9M\x9be\x8a\x1dH\x19\x86\xc2\xc80\xbe}\xdd\
-\xd5\xd8\xbe\xf3~<\xe9\xa9O\xc4\xd0\xb0T\xaf\x8cm\
-\x1f\x1d\xaa$\x81\x13\x1e\xad2\xa7E\x0dN\xe9\xc7s\
-jN\xd4\x19\xca\x5c\x9ddY\xbf\xf3\xfd{\xb1s\xcf\
-$\xbe\xf6\xe5/a\xfb\xfd\xf7\xa1Q\x9a\x84G\xf1B\
-\xe1\x037\xf0q\xda\xa6ux\xfb[\xdf\x8c\x17\xfe\xe2\
-%\xf6\xe3\xc2\xaa\x9f$\x8f\xcaW\xa7\x8aNRB\xc8\
-\xd0\xd6\xa3\xb4\xc4\xa3Yo\xad\x9ckmP\xeb.z\
-\x01\xf2\xa0\xa4\xfeX\x8c\x15\xb0\xbc6\xcf\xc6\x07\x04\xed\
-\x1aA![\xc8\x85OE\xf1\xd9\xcf\xfc;\xee\xbek\
-\x0f\xebK\x0fr\xa4\x88_\xfd\xb5\x97RJ\x13^\x94\
-\x86\x1a\xc0\x8ev\x0f\xa8\x13\x06\xa4E\xb6\x82\x08D\xb2\
-\x83\xd4\xd9a\x87\xcc\x12\xf3\x16\xd0u\xf5\x0do\xd2v\
-\x82-T\x15\x01F\x86\xf3\xf8\xdb\xbf\xfd\x1b\x9cqF\
-\xc6\xe67L\x22\xf7\x91\x1a\xd1ls=M\xe5\x8b\x9e\
-\xba\xc0\xd3u]\x8f\xd4vT\x0d\x08\xd9,\x01\x15\xbb\
-\xb6(\xa4\xd3l\xe4\xa8<\xcaG\x1c\x91\x8e\x894I\
-+%\xa2\x83\x04\x97\x9e\xdbL\x15\xf8\xe1\x8f\xb6\xe2\x9f\
-?\xf7\x0d\xfc\xd75\xdfg\xf9\xd4Itcc\xd3\xb8\
-\xe2\x93\x7f\x8e\x8b\x9ez&\xa1E\x0fLy4\xd5\xd3\
-\x94\xa048\xb5\xfe\xd6\xa4\xc4\xbd{\xfb>|\xef\xce\
--\xd8U\xa1=\x94(\xa2BT%\x92\xe3\xd8I#\
-\xfd\x1f?u%\xc6\xb5\x5c\xe1\x97\xe8\x99\xfax\xce\xd3\
-\x9f\x8e_\xf9\xe5_\xc2\x93\xce\xde\x88\x1c\xed\x1c\xe2\x85\
-FlX\xb6\xe9\xd2>\x0c\x17\xf2\x96\xbfm\xde\x96\xdd\
-\xc8\xb2\xda\x1b\xb3A\x8b\xf5\xe4\x03\xd9p-\x9f\xaa\x5c\
-n\xe4\xc1h\xa1v\xeb#\xcd5\xd9\xe6G>\xb7\xde\
-d\xd9\xbcP3\xec\xdcU\xc7+_\xf1\x16L\xed\x95\
-\xa4J\xe0\xdc'\x9d\x8aO\xfd\xdd\x1f\xd1&\xa4\x14r\
-\xdb\xb4A\xeb\xc8e(5\x0d\xde\x83\xd1AR\xaa\xa7\
-z%U\xe7\xf43I*\xec\x95/\x7f\x05\xa5\x00\xed\
-}\xaa\x8av\xcb\xc1_\xfc\xc5\x87\xac\xf0\x12\x87\xba\xb5\
-\xd5\x94\x88\xe69m\x16\x9f.\xb8@ \x92\xd40/\
-\xcc\xa0\xa8g\x90{\x811/i\xf2+\xc5\xb6\xd6(\
-V\xe7\xa6(]\xd24\xaa\xed\xba\x89\xad(q\x1f\x0b\
-\xbd\x94\x80\x0e\x1b,N]\x1fs\xe5\xe3\x05\x04\xd14\
-\x9ez\xf1f\x1b\x912\xd8SR\x87\x94tzgL\
- k\xb0\xfcr{\x8di\x7fI\xc2\xc9Kq\xe9\xfa\
-\xbb|z\x91V\xef\xb3\x9e\xf9S\x94\xb6#\x1c0\x8c\
-\x89\x15\xd0\xa1w\x97\xa1t\x1c\xa2D\xec\x12\x5cI\x1a\
-\xe0E7\x87\xc6\xe4\x1e\x5ct.\x01$\xe0\xb08\xb2\
-\x8feJ\xc6\xe8e\x0e\x0f\x17\x08\x12\x95Q\xa3Ce\
-\xa6\xbd'@\xb1.q\xed\xbf2\x11\xc8RPJ\xa9\
-m\xec\x15\xa6E\xfe\xa9\xf5\x9a\xda\xa4\xa6:\xf3\xb6\x9e\
-\x06c^\xc2'\xf3\xa0\x91\xec\xd3hV\xca\xb8\xabY\
-\xf7,\xcd\xa44\xfe\xe3\xdf\xfe\x1b\xfbv\x95m\xabM\
-\x8b\xed\xf1\xcaW\xd0\x16bw$X\xaer}\x8a`\
-\x93\x1a]\x1a\xe9\xb1\x07\xa1\xb0\xd3#\xe0\xf4\x93\x0c\xc3\
-\xb3\x1f\x7f\x0a\x9ev\xf1\x85(\x16\x8b\xd8\xb1c'v\
-\xee\xdc\x8b/~\xf1\x07\x04\x8d\xde\xabbeh\x14\xab\
-]\x5c\xfeIe8Z\xad\xe3\xd9pr\xf3\xbb\x92\x16\
-\xccdv\x0a\xa0\xc7\x8a\x13\x9bG\xc8s\x85v\xdc\xcf\
-,W4\x1d\xd0w\x1cn\xe3`r\xb2\xa4q\xbb\x15\
-\xa0<3\x89\xf5k\x86\xa0\xa5\xb6k\xbeu5U\x9d\
-\x83\x89\xc9p\xd3\xff\xd9O8\x07\xe7\x9fw*\xd5\xa5\
-\xc7F\x95\xf4\xa1\x83\xcc\xec\xe3<\xd7(\xad\x12\x1cM\
-\x1a\xf2\xc5|\x014c\x88\xd14\x0d\xf1!\x0a\x12z\
-~Ts\xc5l\x1a\x1b\xd7\xad\xb3y\x15\xd7Ib\xcf\
-\x9e}x\xf0\xfe\x9f\xc0K\xb3X*G\xafSmF\
-\x9fu\xeb\xc6\xd8[\xf4vm\x0a\xc4\xcaJ8D\xe5\
-\xe6\xa81\xb6c\xa6\xb1{\xc2\xfb\x0edI\xad\x16\x8d\
-e\xa6\xa5\x13#/\xd3\xf7\xabh4\xea\xe8\xb0]\xed\
-9\xb1\x86ycuz\x93\xf18\xeb\xd7\x8a\xe1\xdak\
-\xee\xc4\x87\xde\xff)dR\xc3v\xcfYO8\x19\x17\
-<\xe5\x0c\x93X\xe5\xda$\x0a\xf4b]-\x0c\xdb\x94\
-\xf9\xe0\xb4(\x88\xe4O\xcd\xf9T\x16\x11\xb2\x02bA\
-f\x87\xcbA\xf4\xbboy#\x1b\xb5\x85|.\x8b\xc9\
-\xc9I\xbc\xff}\x1f\xc2\xb6\x1d\x1c\xa5\x1c\x89r\xc7[\
-\x14E\x0d\xba\xb8\x01\x8d\xc6\x16\xbd\x9b6\xd9\xa5\xbb\x8c\
-.\xd5\xc9~,\x97e\x00\x16\xb0\xc8\x1d6\x9e\xa4\x8c\
-\xd6\xdc[Zw\x22\xdbl,\xb9M\xd0ior\xd2\
-\xcb\xd2u.bz\xbal\xe5]G\x1b)\xd6i`\
-\xac\x98\xc5\x93\xcf9\x0f\xaf|\xd1+\xf0\xc3\xef\xed@\
-m\x8a\x80\xa3\xc1\x13\xa7\xdc1\xc9Zc'\xb9\xb4\xf3\
-\xbc<\xed\x18\xcd\x9d\x87\x0d\xa5\xf5\xb1Lv\x0c3\x95\
-\x06J\xa5\x12\xb6>\xf4\x00\x1e\x7f\xf6Y\x18ZK\x09\
-\xa5\xa9\x82\x5c\x1a\xa5V\x85\x1e\x1d\xa1\x22\x10\xdb\xbfF\
-\xc8,{X\xde\x1ek\xe7Ao\xf7A\x9be\xdf\xff\
-\x5ci\xd8V\x8b1\xf3\xaa7\xcb\x94\xa0UJ[\xba\
-\xec,`2\xad\x89R\xf6\x99\x96\xa1\x080\xbfS\xa1\
-Ta\xa5Yf\x09\xab\x9bo\x9a\xc0\xc7>\xfay\xb6\
-\xc7\x09\x98)\xd51<\xe4\xe1\xb7~\xeb\xa5\xe0\xf8`\
-~\x9aF\x91\xb4b^t\x074\x95\xb2\x14Z\xc4&\
-\x12\xf5\xc03K\xd1\xb95\xa7I\x9a\xc8\xf3\xff\xfb\xbf\
-\xff\x06\xfe\xe6\xa3\x97\x13(\x14\xcbD\xd6\xf88\xed\xa3\
-\xff\xfb\x1el<a\x98v\x01\x0d`\xa6S\xe5\xda\xf4\
-B\xba\x94N\x9em\x9d\x95D\xe9#\x0d[3\xe6z\
-\xb8\x9e_\xaa\xde\xf4\xc2\x1c\x85\xf3L\x11ir@\xa4\
-8M\xb8\xc9\x02`\xebPEP\xaa0\xa8\x11\x7f?\
-\xfd\xdcW`\xeb\xd6\x09zwC\xf4\xa0\x0a\x98\x9a\xe2\
-\xe8\xcb:\x04|\x1c\xbf\xf8\x0b\x97\xe0\x8f\xfe\xe8\xb5!\
-F\x85\x1a\xd5\x8dY\xd6\x08\xba\x09\xba\xca[\xcbI|\
-\xfd\xdbw\xa0\xed\x8e\xe3\xdak\xbf\x83\xbb~t\x03U\
-Z\x05\xc3\xd9<Z\xd5\xbaI\xab};~\x82\x0d#\
-\x01\xfe\xfb\x9b_@\x91\x80\x0a\xdbL\xf5\x94\xd4\xd5q\
-Tb\xd5Sm\xa0\xe9\x8c\xbe:\xcf\xa6Qmt,\
-\x9eOQ\xda\xb9\xf6\xd0@\xd5k\xd6\xb2\xa9\xb4\xffZ\
-\x03\xaaII\xe4Q\xed\xd6\xfd\x04\xee\xbcm\x17\xfe\xec\
-]\x7f\x83\x07\xee\xdf\x89\xc0o`x4\x8d\x97\xbe\xe2\
-\xb9x\xeb\xdb^\x02\xbf1c *R\x0a\xd5iw\
-\xc6\xba9\x0e~-_\x0dNs%\x99OjA\x93\
-\xc7\xaa\x16\xc5\xe6\xec?\x1d\xeb\x0dN\xb65E|\x96\
-\x12\xe7\xd7^\xf5\x5c\xbc\xf0\x85\x97r4\xb4\x91\xcdy\
-\xd8\xbdg\x0f^\xf6\xca\xdf\xc4\xbf~\xe1*\x94\xa8F\
-\x94M\x9b\xee\xa6V\xb9[\xdd\x14v\xee\xd5(r\xc9\
-\xfa\xdea\xcc\xb8\xc5\xa1K\xed3\xcb]\x9e\x8b\xdb\xf4\
-T\x8c\xa34\xe4\x80\xe7\x01\xad\xdef{\x8e\xed\xfd/\
-\xb2\xec\xb1\x16\xcf\x1b\x04ME\x22\x81\x85\xdd\xbe}\xda\
-D\xf6o\xfc\xe6\xaf\xd2\x03\xa1\x9dB\x0f\xb2\xd3\xa6'\
-\xc7k\xf5Z\x97\xc6o\x1b\x1f\xff\xe8\xa7@\xcdEc\
-\x9c`\xa7D\xa8\x13y\xb2\xb1;\xb4\xec\xeb\xbcP\xa9\
-\xccp\x00PA\x94\xa7p\xf7\xad\xb7\x22\xd3\xec\xa0\xa0\
-\xb2\xd3\xe8vJU\xec\xdd\xb2\x05\x9b\x08\xa4?\xff\xdd\
-?\xc0P2M\xbb\x8a\xe5 v\xb4g\xa8\xa9%\x90\
-\x0e\xcb\xc96\x98e\xaaOq\xabM\xe9g\xe5\x8fX\
-.\xb9\xd2G\xf7D\x1c\xdd\x1b^\xab\xd3\x8e\xf39h\
-\xe9\xa7\x12<Y\xf6E\x81\x92'\xcfq\xa8\x1d\x059\
-\x02h\x143\xac\xcf\x97\xbf\xf4m\xbc\xedm\xff\x0b\x0f\
-m\xdb\x85\x9a_\x87C[\xe9\xcc\xc7\x9f\x88\xd7\xbc\xf6\
-%l\xab.rl\x90\x8c^t`\x1d2\xc9\x02|\
-\x1a\xd6fu,\x81\x16\x96D\x8a\x11\x0b\x8e\xe4\xde\xef\
-\xe7\x90\x05*\x99\xb9.\xa6\xa7J\x14\x89E\xec\xdd;\
-e.\xf3\xe4T\x1do\xfa\x9d\xdf\xc7O~\xb2\x95\xe0\
-`\x0aJ\x8e\xa4\xe7\xe1l\x8a\xfb\x17\xff\xf2\x0b\xf0\xcc\
-g\x9cC\x836\xecd[V\xeb\xe5\xafP\x02hv\
-\x15\xb9GQE\xcc`\xec#\xb6\xdf@d\xb6\x0d\x8b\
-k\x1b\xfd\x99\x97G\xd0\xeb\xd9\x0fm\xab\xe1\x1f\xff\xe1\
-\xf3\xf8\xc6\xd7\xae%hx\x81\xa0\xacTK\x18\x1b\xf7\
-p\xfd\xf5\xffd3\xd9Z:\x8a\xb1c\xb4\x14\xa9\x89\
-\x8a2;kg=\x86kn\xbc\x07\x0f\xed\xa8\xe2\xca\
-O|\x1ai\x1a\xd6\xf1j\x15C\x1cEk\xc6Gp\
-\xe1\xc5\x17\xe0g\x7f\xfab<\xe1\x94\x11\x93l\xb1,\
-\x07\x01\xcb\xbahy\xe7\xd5\xd7h\xc0\xba\x89$\xddU\
-/\xdd\xa2zE\xed\xaa:WY\xe7\xdb\xee\xba\x0fW\
-^\xf9\x0f\xb8\xf1\xbbw\xb0\x0eiT\xa6\xeb\x18\x1b\x1d\
-\xc2\x09\x1b\x8b\xf8\xd8'\xde\x83\xf5k\x1d\x0eFJ+\
-\xda\xab\xda\xd3T\xa3\x8a.\x14\x0a\x1c,5di\xeb\
--e\xcf\xd2\xe2 \x92$U>,\x94\xcd\xa1\xf4@\
-\xa4\x0d\x1a\x0ae/\xc9\x90K&\xc3\x05\xd9\x86\x8d\xae\
-8\xdeu\xd9\x07\xf0\xd5\xaf~\x1b\xed\x86\x8cM\x8eH\
-\xea\xf7\x18G\xf7\xc9'm\xc43\x9ey1\xcey\xe2\
-Y\xb4+\x92\xb8\xe0\xfc\xc7X\xfe\x82\xa4\xc2\xa8\xc8\x9a\
-;Q\x86\xd2D\x07\xa5\xde\x0d\x11\xd8\x04\xef\x88Tt\
--\xfe\x0b@t\xc4(\xeaM\xab\xd92\x80\x1aZ\x92\
-NK{\x0f\xdc\x07\xbc\xe8\x97~\x8d\x89\x03\x8a\xf8\x04\
-\xae\xfe\xef\xcf\x12\xe8\xb2MhO \x85:{#O\
-\x9b\xaaAI\xa0\xfd\xdb\xdf\xfa\xc1N\xdc\xf6\xe3\xad\xf8\
-\xdbO\xfc\x1d\x12\x15\x1a\xb6\x1c-o\xf9\x9d7\xe1\x05\
-/\xba\x00\x99!I8>\x83\x927/\x93B\xe5\x12\
-G\x15\x8b(\xaa\xd7\xfc\xfaE\xe9\x18FJl\xbf\x01\
-4/\xbd@C\xcde\xb3\x05zY\xf6\xc1\x07f\xb0\
-\x85\xd2\xf0VJ\xc9;\xef\xba\x17?\xb8}\x0b5C\
-\x11\xf5J\xd5\x16\x81\x13\x14\xbb\x17]t\x0e\xde\xf5\xbf\
-\x7f\x97^b\x0c\xd3\x93\x13\x18\x1d\x19Ee\xa6\x8e4\
-=\x01Y\x18M\xda\x83\x89\xa4\xa6\x1c\xa8dc\xaaD\
-\x7f\xab.N\x03\x82H\x92(\xaa\x9a\xc6&\xc5+{\
-&\xe1\x12Ht#\x9b\xec\x95lv\xc8\xcc2\x9a\x07\
-\xb8\xfa\xea\xef\xe3=\x7f\xf5IT\xca\x02\x10G3\xd3\
-5\x9b4\xa8\x99\x97\xdb;\xd6\xb6Q\xbdF#\x8aP\
-\xafPG\xf6\xf8\xe8q\xb3\xd4\x17A\x0f\xc6\x02+y\
-x\xaci2\x91\xe2\x88e8\xa9\x14\xa6J3\xb4\xc9\
-rl\xa8\x12F\xc7\x86l\x9e\xc6K\xc9K\xf4\xd0\xa4\
-\xad\xe0\xd0\xed\x8d#cK\x03\xe5\xf2V\xfc\xcf\x96/\
-\xb3\x0e\x12]U$9(\x1a4\xa429\x1a\xcdT\
-\xbb\x0d/\x8e\x9b\xef\x9a\xc1\xf7~\xb0\x05\x97\x7f\xe4\xd3\
-p\xaa\x1d\x0c\xd3{(M\xedA~8\x85Rm/\
-Uv\x0d\xebFr(\xd3\xd6\xf2\xe8\xc1\xc5\x99GT\
-\xd6\xb0V\xac\x9d\x99\x08=\xeeG\x89<1\xd5\xa5\x97\
-^\x7f5\xdd\xa0\xfa\x98\xb7\xa9\x90\xf7D\xed\xa3\xc9@\
-\xbd\xab\xa6\x99|]\xd7\xf0\xf6X\x0f\xed\xa0\x9c)\xd3\
-Scv\xeb\xd7\xaf\xc7\x8em[\xb1~\xc3\x18^\xf3\
-\xea_\xc1\xaf\xff\xfaO\x9b\xa4\xaa\xd1\x96\xd3V\x5c\xbf\
-\xea\xd3&,Z\x86\xd5r\x97\x03(\x06'\xd1\xb4\xe5\
-\x8fDBkw\xb2\xdb\x0eM\x8b\x1b\xd6Q\xac\xd53\
-j\x88\x88\xd4\x08\xa2\xb9\xf80yh\x0e\xeax\xd7.\
-\xe0\x0b_\xf8:]\xfe\xffG\xd7\x7f\xa7\xb9\x8e\xe1\xd6\
-Q\xcdI\x84\xc6v?\xcd\x89}]\x08\x1bx\xbf\x91\
-\xb8\x1f\x85O[\xf42\xf3\x88\xee\xd5\xde$S\x95\x9a\
-\x9b\xa14\xed\xb07\xf4uW\x97v\x83\xbc\x94\x93N\
-<\x0d?\xbe\xe3V\x9cz\xf2\x1a|\xf3\xea+\xd9\x90\
-lL\x97\xd2\xa8Y\xa1\xd7C#\x95\x0dYjr\xd8\
-\xd0\xce\xd96\x09|\xe5\xab\xb7\xd1~\xba\x92\xc3\xbf\x8b\
-\x8c\xec\xa5\xf2^[\x83Kg\x1c\x1a\xb1\x15\xebD\xb5\
-\xa8\xebh\xa2(j\xa7y\xb4X\xc5\xc2QA\x0a\x1b\
-G\xee\xfe~ \xea\x03\x95\xe0\xa4\xd0c\xbb\xca\x99\xd1\
-;r\x95Z\x95\x12\xc7\xa5\x07\x96\xa2\x9b>\x89\x91B\
-\x1a\x97<\xfbYx\xc5+^\x8a\xc7\x9e\xb1V\xab+\
-T\xd7>\x07\x96&2\xb5\xd2 \x9a\x0f\x14\xb5\x93H\
-e_\xa4\xfc\xf3\xe8 \xde\xd9\xf2I\x19jK\x8d\xc2\
-];\xdb\xf8\xee\x8d7\xe1[\xdf\xfa\x0en\xbf\xedN\
-LL\xce\xd0^Q+p\x94\xf6\x0c\xf7\xfd\x01\x14R\
-\xd8\xce\x83U\xe2@R>\xea\x00\x01(\x1c\xbd\xd68\
-\x9a\x83a/\xc8#\x92a\xee\xa5\xb2\xf0\xa9\x96\xb4L\
-\xe29>~\xf4\xc3\x7f\xa6\x0al!\xe55l\xbb\xaa\
-\xd2\xd6X\x86\x8eC\x83\x939\xdc\xfd`\x077\xdcp\
-\x17>\xf0\x7f>\x81D\x97\x8e\x82\xbe\xe4\xd0\xa2\x94\x1b\
-J\xd2 n\x98z\x8f\xc7\x12\xb4\xa9\xb4P,\xe9\xfd\
-\xf0\xca\x7f02/L\x93\x8d\xd4k\x92\xe0\xfa.R\
-\x86\x92q\xcd\x9a5X7^\xc0\xcf<\xfb)\xb8\xe0\
-\xbc\xb3p\xca)\xebXW:\x9dA`\x9b\xdeDz\
-\x193\x93\x11\x90\x16zFT\xe6\xc1\xcb~D@$\
-jj\x9bh\xc21\x89\xa3\x19Q\xe9n=h\xf7.\
-\x9fn\xf6\x0e\x8e\x1e\x1a)\xa4\x10,!i\xe4\x85t\
-\xf0\x06\x1c\x8c\x94\x87Fn8z\x8d\x0cD\xf2.i\
-\xc7\xc5\x93\x04\xf8\x14\xde\xf8\x86\xb7b|t\x8c^\xda\
-\x1eJ\xa4\xff$\x80@\xa7a\x1b\x811\xc2\x02ui\
-T\xb7\x11\xa7\xe7\xa35\xb3;\xef\xf5q\xcb-[\xf1\
-W\xef\xfe \x1c\x1am#\xc54\x9e\xf5\xb4s\xf0\xfc\
-\x9f\xbb\x84\x9eQXf\xed\xa9\x8a\xb3\xb2\xe1\xfe\xf0\xc3\
-Q\x8f\xc5I]\x17u\x9f>\x82%\xc3xd\xa4\x00\
-\xad\xactY`y\xd0jw\x8d\xa2z]\xf3u5\
-K\xb7?\x80\xa2p>h\x8e9\x88h\xed\xd7\xcb6\
-Z\xa4\xc6$q\xda4NU\x1b\x19\xce\x02N\xf4\xd4\
-\x08D\x83z]\x83\xd2,n\xc8\xfd\x9e\x9f\x9e\xa3\xd3\
-\x0a\x1b\xf9\xa6\x9b\xee\xc3e\xefz/\xfcz\x95\xe9|\
-\x5c\xf5\xf5\x7f\xc5\xc8\x90<\xb2\x06\x9c\x98\xec\x998j\
-\x04\x91^\x94\x94$\xbamK\x05\xd7}\xfb6\x5cq\
-\xf9g\xd0\xa2\xd5^\xc8\xc4\xf0\x9a_\x7f1\xde\xf8\xba\
-\x9f3[\xc3\x06\x0a3\x97\x89\xd7\xf7\xc8#Br\x16\
-dX[{\xf6\xe2\xa2&TKk\xfaB\x0e\x84\x06\
-\xb1\xca%\x87B\x09\x22\xe0\xa9\xbc\x8b\xd3\xe0\x00\x12-\
--\xf5\xc0\xd4\xa1\xe1\xe6\xd1\xf6a\x07t4\x86}\xa2\
-\xd5G\xa7U\xa5\xf8U\x07\x85\x0fV\xa5\xd5\xc1!s\
-\x04\x8b\xa9v\xc4nW\xbbx\xa8V\x96\xc14\x83\xfb\
-XjLz^#N\x8a,\x1cy\x9a\xcc-\x16\xb2\
-(\xcfLcbb\xc2\x1c\x85w\xfd\xc9e\x1c\xad,\
-Co\x1bF\xab\xb7oIw\xcbP\xbd\xef\xbe\xfb\xf0\
-\xdd\xef]OI\xd3E6\xa3\x8fpU\x91\xd5f4\
-V&hh\x17@\x9bv\x07\xebL\xbb\xc8\xea\xd0+\
-\xcf\x92Yu\xa7:=\x18\xa7\xdd\x00IJUW\x93\
-\x99\x81\x8fn\x93\xaa\xd4&\xa7\xa8V\xeb5:5<\
-g\xb94?&\x95\xa7\x1d\x11\x02\x94\x8e\xab\xd5\xaa\xb5\
-\xc1\x1c\xa97\xfayi\xb4\xf4;\x06\xa4z\xa5\xc2F\
-\x0dgQm\x06\x99:\xc5K\x12X\xda\x0fa\xdd\x22\
-\xc3\xae\xc7\xb1&\x0b\xc2\xb4\xb1\x80\xa1\xf6\x0e\xc9\xab#\
-\xf7\xa7Y\x02k7f\x0cM;V^z\xb3Tq\
-z\x86\xcab\xa0%\x82\x1b5MQ$\x19G\xe3\xb4\
-\x9b\xc0w\xae\xbb\x11\x0f=\xb4\x83e\x13\x88\xb4\xa7\x9b\
-\x0d\xcf\xab\x02\xbbf\xe8\xb7l\xf9\x1f\xba\xd0\xb7p8\
-\xb7\xe9\xddU\xc8e\x021c\xcb?\x99T\x1cI\xb7\
-Cw\x99\xa0r\xf4\xcc\xe5\x97?\xac\xbbX\xdb7\x16\
-g\xb5\xa1V\x00t\xac\xed\x1b\x02\xb3\xc7?\xe9\x94\x8b\
-<\x8djY\x7f\x9a\x0aH\xa6\x1c:\x0cT\xe1&\x81\
-\xe2\xf6\x95\x959z\xf8\x108B bErC\xb4\
-{2\xe8\xd0=\x0e|u\x03\x87\xbe>%L\xff[\
-s\x13rM\xc5\xe1\xbe#v\xa2\x9dG\xff\x5c\xeb\xd4\
-\xe5\xb2m\xec\xef\xb1\xe5eL;\xa5\xf7O\x95\x96\xc9\
-\xb2y\xf3I\xb6\xfb\xa0X\x1c\xa5M\xd4! \xc6\xe8\
-\xdd\x14`\x8b\xf8\x12XD\x9a>\xec\xa9\xf4R\x09\xa9\
-T\x0a\xc3\xc3\xc3<\xeb\xa0P\xcc#\x9f\xcda\xcd\xd8\
-\xa8\x09\xb9\x86_\xa5\x0a/\xd1\x80\xad\xdbF|\xab\xcf\
-\x02e\x1b\x98\xad\xcc\x8b\xff\xeb\xd2&\x13K\xedz\xb4\
-/\xb5\x81/\xd4W*\x1e=7\x02F\xd3)\x1d\x02\
-^\x92G_^\x8b\xb6\xbcj\x1bp\xd8\xf5\x87\xa7\xfb\
-\x8f\x18\x88\xf4\xb9\x5c\xad\x1c\xc7\xe2)$\x92YVF\
-\xe2\xbfC\x91\x1aG\x8e#!z\xd3t\xf6\xedS\x9d\
-\x0bd\x9d\xdej:\xed\xa8\xf0\xb3\xbf\xcb`\xd9_\x1d\
-\x82V\xa1\xad\xce\x13\x01\x0c\x8d\xedy!\x88\xf6\xee\x9e\
-\xc0\xd4\xbe)J\xcd\x1a\xcbT\xc4e\x7f\xfa\x17X\x7f\
-\xc2\xb0\x01Fb_F\xa8fs\xd5/ZP>\xed\
-\xb4\xd3p\xce9\xe7\xb0s\x5c\xd4*U\xbb\xa6Q\xad\
-\xbe\xc9fr\xf6V\x87v\x04h\x85\x7f\xc1r-\x85\
-\xad\x1d\x16g\xd7\xd5\xeeN\x01GRSv'%\x0d\
-\x07\xa8\xaeE\xbbA\xe5\x91i\x9eN^\x9b\x06\x80H\
-\x9e\x9c\xce\x0f'\x1d!\x10q\xe4rd8\x8eG\x10\
-\xf1\x11,\xb8&\x17\x134D\xf4\xc5\x0c\x19\xd3ZO\
-5f\x87\x85\xc7a\x84Bm\xd2\xd2\xe7vcl\x8c\
-\xe5\xb0\xee\x8d\xd8\xf2\xd3\x00\x14\xf3\x11Rc\x02\x90<\
-F69\xd6\xad[c`\x10`bT\x092VE\
-z\x85[#Y\xaf;79 D\xea\x88\xa1B\x91\
-\x1d$\xb5\xc0\x8e4)\xca\x0e\x93vf'\xc6\xd4\xc1\
-\x01\xaf\xa9\xde\x0b\x94kI\xec\xb0\xdc\x07\xe1\xb0>\xfc\
-\xa3\xb0\xc7\xb3\xd7\x18\xaf\xb2\xcbtP( \x99\xb8\xd4\
-\xb0U_\xa8\xad\x0f#\x1d\xde\xdc\xfaH\xc5\x16X\x16\
-b\xbb\xde\x0b#\x0a\xcd\xdd\xa8\xaa\xbc.\x9e\x97v\xd0\
-0\xbc\xb9\x8fE\xd15\x92\x0e\xf5\xf6\x83\x0c\xe4\xa9\xc9\
-=t\xcb\x09\x94@\x22\x9e\xb6\x06[\xa4Z\xd7\x97=\
-(I9\x9a\xa5\x02\x92D\x9d\xb0\x95\xcdR\xeap\x14\
-\xf8\xf5\xa6\xad\xcd\xc9P\x95:6\xe2s\x04\xa8\x98>\
-\xb6m\x9e(\xa3\x16)\xdf\xc0a\x18,9\x9c\xa3\xa8\
-U\x8f,\x1d1\x10\x89\x22@,\xces\xff\x0e\xbc\x12\
-\x1e\xa9A\x97\x1aF\x1c\x8d\xd0\x90xU^\x9am\xea\
-\x0aUT\xdd\x9fFq8\x85\xc2\x10\x8dk\xc6\x8f\x8c\
-\xe6lbNK\x023\xe5i\x02\xc6A&\x99A\x8d\
-\x06\xf6\xc4L\x98\xcb\xd0\x88\xb6\xb7\xe4L\xca\xe9\xfbB\
-1\xda>z\x84l\xa8n\x8cP\xe3H\x17\xb8\xfa\xcb\
-\xb3\xac\x90\x7f\xf5o9\xa18\xccE\x14\x85\xa2#\xd3\
-\xddG\x10DQE\xfaYr?\x0a\xa3\xe3\xfd9\x5c\
-8\x99c\xfd]j\xa8\xbf\x0amd\xb2S\xe6^\x8c\
-\x0c=\x1aI\x1c\xad/i\x8f\xd3\xd4\xd4>\xf6\xbb\xec\
-\x07\x1f\xa5\x99)\x1a\xa8\xbc\x8f\x88\x18\x1d\x1d5\xb7_\
-\xdf)\xca$]\xaa1\xc5SrMM\x99\xa1\xaa\xa5\
-\x06\x81E\xd2J\xad\x18\x09$\xd1\x9cDX\xb8|\x83\
-\x85:Z~x \x0d\xd2\xd5\xd1\xbd\x0b\xdd\xbf8\x1d\
-QI$@\xec\xcfZB\x8c\xc2\xf9\x1c\x16\xc6\xfa|\
-\xc1{\x07g5B\xff\xc8\xb4F\xe9\xb3\x0b\xc4\xc3\x85\
-,<\xaa\xa6b\x81\xe8\xa0\xb1\x9dNg\xe8&'P\
-\xa5\x97V\x16\xc0(a\x88\x1a\xb3\x97\x04=a$\xfa\
-\xec\xafl\x0a\x01JW\xb4\x01L\xd7E6\xe3\xce\x0a\
-\xc4\xb4\x8f\x9aW\x17*\xdb\xe0\x1c\xb5\xc3\xd2y\x7f:\
-0fa\x9ak\x9b9\x1e\x8c\x06}\xc2\x92I`P\
-\xf6Z\xf1\x0fCQ8\xe7\x12\x86\xf3\xff\xf5\xa7\x9d;\
-\x0eiya(\x11t\x1c\xc5\x8b\xc2s-\x03\xa4R\
-9&rP*Ulo\xd1\xfd\xf7m\xa7\x97\x15'\
-\xb0\xf2,b\x8c\xc6v\x9a\xf6P\xcf\xd2&\xc9\x0e\xaa\
-\xd7\xeb\xbc=f;\x11\xb4\xef&\x95I\xda\xb6\x15\xa9\
-!\xed/\x11\xb0\xe8\xff\x857\xcc>w9\xe1\xe1\xe0\
-A)\x02\x8d\xca\x1d\x95}pZ\xca\x93\x96H= \
-\xd0]\x0dC\x1a\x9d4<\xfb\xc3\xfd9LkF\xa9\
-\xc2\xde\xfd\xcba\xfd\x9b\x1b\xd3\xcc\x8ea\x08k>\xc7\
-8A\x1b\xc6\xc5\x99\x8f[\x87\x91\xe1\xf5\xc8g\xd7\xd0\
-M\xcf\xe1\xeao~\x07\x15\xda>\x13\xfb\x024\xea\xdd\
-\xd0\xceaj\x9f\xb8\x99\xae\x02\xf7\xdf\x7f?\xb6o\xdf\
-Np)\x8f\x0e6\x9c\xb0\x16\xeb\xd6\x8f\x9b1\x1et\
-\xf5r\xa0\xa4\x926\xb9\x87\xb2i\xa1\xb2-\x89\xd5v\
-\xcba\xde\xbbt \xf5\xd3\xd2\x80t\xc4\x16`\x97\x0c\
-h\xa5W?Ga(\xb2\x96E\xca\x22R1& \
-za8\xdaDq\xda2\xc0\xbe\x89.>\xf7\xf9o\
-\xe03\x9f\xf9\x1c\xf6\xee\x9d@A/\xc4\xd3\xc0v\xdd\
-\x166\xaf\x1b\xc2\x1b~\xfb\x0d\xc8\xd36\xfa\xd0G/\
-\xc7M\xb7\xdc\x89x\x22G\xb7>c_\xfb\xf0\xa8\xb2\
-\x9ey\xd1\x13\xf1\x89\x8f\xbf\xc3T]\xb3U\xa5=\xc5\
-\xa7\xf0\xe1\x9a\xf3\xd2\xeb\xca\x0f\x8b\x96\xda~\xfd4\xdb\
-vs\xf5=8)]\x946\xea\x80\xc1A\xb8\x5c\xa8\
-\x1e\x9aT\x8e\x87\xc3\x0f\x83t{\xf83.\xda\xb0\xdf\
-\xcbNm\xc3Q\x1aUY/\xeb\x0d\x8f\xc6p\xc9%\
-g#\x9d\xf1Q\xabO\xd8\xeav+pP\xa9\xb8\xb8\
-\xfd\xde)\xfc\xcb\x7f\x5cO\x80}\x13w\xddA\xe3\xbb\
-\x96C\xaa\x99F\xa7TE\xba\xd3D\xa6[\xc3\xef\xbc\
-\xfeUD\x0fsd\xde\xfa2\x9b&\xfb\xdcX\x8a\x00\
-\x0am\xa7\x87E\xfdm\xb1T\x9e\xa5A\x81\x10\xa5\x13\
-\xab\xc5\x06\xbd/\xa4\xc1S\x1ei\x8a*\xbf_#,\
-\x97\xa2\x91E6\xf0(n\x7f\xaa\xfbe\x9b\x99>\xf5\
-\xd4\x0dx\xd9K\x7f\x01\xe7\x9f\x7f\x16*\xd5\x194\x1b\
-m\x82k\x03}\xb84\xfc\xc0\xc3\x9e\x89\x1a\xba-\x0f\
-\x9b\xd6\x9f\x04\x8f\xb0L;q\x8c\x0f\xe5\xf0\xb6\xdfy\
-=N;y\x83-\xe4\xaa\xc8-\xad\x13Z\x07h\x9d\
-Mk\xfe\x8f4\x8a\x80\xb34\x00\x89\x8e\x9c:;\xa6\
-\xd4'\x9eeo\xf5S\x0f\xa4A[\x1f9\xf0(\x91\
-\xc2m\x15\x0f<0\x8d\xef\x7f\xff\x0e\xfc\xe77\xae\xc3\
-\x0fn\xf91\xf4\x0d\xeag?\xfb\xd9\xa8\x96k\xb8\xfe\
-\xdb\xd7\x9a'\xb7f\xac\x887\xbe\xfe\xd7\x09\xb83\xb1\
-yc\x1a\xe9,\xd5&\xc1\xe3P\xb5\xf9\xcd\x86\xcdz\
-k\xc9!\xdc\xf4E\xd5x\x9c\xd0\xca\x91D\x87\x9d\x0e\
-6\xa2:HP\xa2\xe8\xb5!\xfd\x02\xa26\xf3?\xf6\
-\x8c!\xbc\xf0\x05O\xc3\xd3\x9f~!\xf4cvM\xbf\
-\x81\x07\x1f|\x90\xdeX\x15\xc5b\xde^\x8f:\xf9\x94\
-\x8d\xf8\xf9\xe7\x9f\x8fSO'\x802z\x11\xa0\x09\xfb\
-LrLK$ZLf\xcet\xf9\xa3u\xaa\xe3\x85\
-\x1e\xc5 Z\x84zrwrj\x12\x9dN\x0b\x85|\
-(1j\xf4\xc0r\xf4\xecs\xf94\xaa\xd52\xf2\x85\
-,\xa5\xd3\x03\xb8\xfd\xf6\xdb11\xb9\x87\xd7\xa7\x91$\
-6\xb4\xabW\xb3\xda\x92`q\xa7\x057\x11\xa3*k\
-B\xaf\x8ak\xa2B\xab\xe5\x87{mj\xa5\xd3\xf1\x07\
-\x22\xa3\x0e]\xfba{\x13W{qff\xaa\xa8\xeb\
-5\x15J\x925\xe3\xc3\xc8e<\xec\xde\xb5\x97\xe9h\
-(\xbb.%\x8b\x87B1\x8b3\xcf:\xcd0(\xa9\
-\xa4\xd9n\xfd\x1a\xa4\xf2\x92\xfa\x12u\xf9\xcf&)\x8f\
-\xb3f}\xf4\xd7V6P\xcf\x0e\xea'-qH\x95\
-i2@;\x1c\xc7\xc6B\x97\x5co\xf0j\xc3\xfd\xc8\
-\xc8\x18A\x92\xb6\x99i{\xfd\xbb\xdb\xc6\xf9Oz\x22\
-U\x9d\xf6\x8fk&\x5c\x1b\xf1\x192^+\xe3j\xca\
-\x16\xc5S*\xa5O\xeb<\x0a\xcd\xcc\x83\xd0q*\x89\
-\xb45V\xbf\xbb\x9a\xa2\x97V\xa5\x08i\xd9l\xb4O\
-\x812T\xc8\xd8{riZ\xcd;w\xec\xa5zj\
-bhh\x84a\xf8\x86\x84\xf0\xa2\xad\x15\x1d\xde\xa0e\
-\x15m\xa5\xd5\xea\xbe\x90\xaa\xed\xb4\x02\x94\xb6\x8a\x1cO\
-t\xdc\x82HRD6\x8c\xd6\xc3$i\xb4\x91]3\
-\xcf\x02K\xa7\x15\x10\x10m\x02)\x87\x84\x9b\xa2\xba\x9b\
-\xb1\x8d\x5c-\xc6\xcf\xcc\xe83\x80\x0e\xa5T\x92\x8d\xa7\
-Ma\xda\xb7\xa40\x04\x9e\xf4\x9d\xec\xa3\xe3\x89\x8e\x9f\
-\xda\xce\x13\x0e\x01\x81\xa3\xafi\xb4\x02\xbd/\xd6\x10\xa6\
-\x90L\x00\xe3c\xa3\xb62\xaf\xb9\x9el&o\x0b\xb0\
-\xda\x12\xa2O\xc9(>\xa9DFj:\xa9\xb1\xc8\x06\
-\x22\x1f_\x02h\x96\x8e\xaf!\xd3G\x09\x87\x92\x84^\
-\x94\xe6v\x924\x9c\xe5P\xc9\xf3Z\xbf>\x1f~\x91\
-\x8d$\xf0\xc8\xbeQ\xa8\xb4RU\xf6\xf6\x84MAE\
-\xc0\x89Xq\xc7'\xa9%\x1e\xa5\xd4\x9bl<\x08i\
-.H\x92F\xaf\x1e\x8b\xea\x15z\x5c\x04\x89\xc0\xa2w\
-\xe6\xca\xe5\xb2\x81H{\x95Si\xcf\x00'\x9b\xb9\xa9\
-/C\x18-\xd2|\x0b\x18\xf2\x8ffz\xd4\x82H\x82\
-!\xdcK\xb4\x10i?PxM3\xccQ\xaf\x87\xaf\
-3i\xbbG\xd5\x8e\x13\x9e\x83\xb4>'\xec\xea\x85?\
-\xad\xda\xaf\xb3\xeb\xe9\x14UZ\xf8\x80\xfdI\xd9\x1cg\
-\x00\x12=\x8a%\xd1!\x88*(E\x7f]?Vl\
-oE0J\xaa*\xd0\xeb\xf5\xad\x16\xbd\xb6\x1a\x81\xa4\
-\xe6\x11\xd8:fp\x0f\x0f\xbb\xb4\x9ft\xf3\x024\x0b\
-\x1e\xa5\xd7\xee\xc9\xe3\x87\x8e[\x10\xd9\xb6V\xf6\xbc\x04\
-\x92@$W^kh\xe2\xb3\xce:\xcbf\xa1+\xd5\
-i\x94+\xd3\xb4\x81\x9a\xd8\xb4y=\xef\xd1\x1cQ\x03\
-\xb5:\x13-H\x02\x90\xf2\x95\x88\x0a%\xdd\xf1@\x87\
-\x00Q\xd4\x10\x0b\x85\x07\xf2\xecV\xd4\x03x\x10Z\xe8\
-\xbe\xf9|(\x9aK\x13j\x96\xbe\xea\xf5\xab\x19J\xa1\
-\xf0\x1b\x01\x0e\xddz\x07\xd9t\x11\xa9\xa4go\x90\xea\
-\xe5\xd0_z\xe1\xcf\xd9\x17\xf0\xddx\x99\xd7\xda\x18\x1b\
-\xc9\xe29\x97>\xd3>\xf6P\xcc'm\xb7\xa3\xedd\
-\xecg{\xb6\x00\xd4_\xde\xf9|\xa4(\xca\xfb0<\
-c\xbe\x8a\x1e\x80\x0e\xb2\x8a\x1fU<\x12\xe9\xfb\x87\x0b\
-\xdd\x14]\x15\xf5\xf7Y\x18\xdb\xbb\xb2\xd0\x8d\xda\x9b,\
-\x910\xbb\x0fZ\xa4\x9d\xd7\xfb\xe7\xa2\xb8\xf91\xfbS\
-_\x09\xe41\x1d<\xf1\x1c\xf5\x95)*\xc1\x9e}u\
-\xec\xdb\xb7\xcf&\x15\xf5n\x9a~JJ\x9f\xcb\x11N\
-\xec\xe3\x08\xb3\xa4\xf9&\xdd\x11\xdd\x19\x95_4W\xef\
-\xb0.s\xe7\x07\xa3\xd9b\xf7\x95\xcb\xdah\x01\x0a\x93\
-\xe8\x9a\xf2\x8dB\xd1\xfe\xcf\xb1\xa6U\xc6\xfd\xe1B\x14\
-]\x9f-\xc4\xa1i\x00\x10\xcd\xa7\xb0\xb0\x0b\xdd\x14\xa5\
-\x8e\x8a\x1f\x96c^\xa5\x16\xba\xf1H\x81H4Hc\
-\xf4\x95\xc9$\x8cB\xfe\xd3~j\xd9G\xa9d\xa6\xb7\
-%Vj0L<\xf7+<z\xa6\xbd\xcb\x1b\x9e\xf6\
-\xceCR\x19\xc2r,\x05D\x96_T\xfe\x88\x0e\x0a\
-\xa2\xf9t\xe03\x16m\x86\x853\x18\xac\xddzt\x08\
-\x10-D\x07\x16p\xb1r\x84y,P\xa1\xfe\x1b\xa2\
-\xc2*\xae\xaf\xa1\x16\xces\x01\x10\xed\x97\x17\xef\x9f\xdf\
-\xf8\xfd\xb4_G\xf4\x1f\x1f\xbcN\x06\x00\xa2\xcb\x96<\
-xA\xaf\x0a\xd9B\xfd~\x85\x89\xf2\xeb\xcfW\x14\xe5\
-\xdd\xf7\x8c\xbe\xcc#\xd0\x864\x97\xc7~\xaax?Z\
-,~\x8e\xc2\xec\xc3\xb7]\xb4\xdf\xfc\xc02\xcd\xd1\xdc\
-\xe3\xe7\xe7{\xe8\xe7\x84\x04\xfc\x7f\x83+\xc1 \xce\xfe\
-[=\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x03[\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x03\x22IDATx\xda\xedTILSQ\
-\x14\xbd\xbf\xe5C[(\xe0P\x07\x12\x11\xcad\x19\xca\
-\x90\x18!\x91\x9d\x88\x03\x1aQ6\x1a%!D#\x06\
-cdCt\x01q!\x0b5\xeaJ\xe3\x10\x07T\x84\
-R!\x01e\xab.\x8d\xaed\xa7\x22S\x00-\x94\x16\
-\x8c\xb4\x85\xc0\xf3\xdc\xf6\xc54\x8d\xa4\x14\xb6\xde\xf4\xe4\
-\xf5\xbfw\xef9\xf7\xde\x7f\xdf\xa7\xff\x16\x91\xb5\x11Y\
-\x9f\x11\xbd{N\xf4\x09\xeb\xf1\x95\xc4\xc0w?\xf0\x19\
-x\x8b\xf8\xdd\xe1\x9cm\xfdYYb\xb4\xb8Xt\x1b\
-\x0c\x02\xcf\xe7\xc3\xf8W\xdaTua\xa4\xb4T\x0c\x14\
-\x16\x0a\x16\x0a'\xf0\xfe\xab\xd5*\x5c99\xc2QQ\
-!\xba\x8dF\xf1\x82\xa8n\x99j\x0f\xd9bb\xe6'\
-\xaa\xaa\x84+?_\x0cY,\xec\xfb1\x5c\x8bJ\xda\
-5\x1a\xcf`J\x8a_d\xaa\xbaZt'$,!\
-\xf0L\xb0\x1f\x9e\x0ft\xea\xf5>G]\x9dp#\xf3\
-\xb1\xf4taW\xd5%$XE\xe1\x0c\xbd/\xeb\xd0\
-j\xbdC\xa9\xa9\xc2\x95\x9b+\x9c\xf5\xf5\xa2\xcbhd\
-\x91ZI^\xde\x19\x1b\xeb\x9djj\x12\xee\xa2\x221\
-\x0e\xf2W\x01\xf2\xd3\xb4R\x83\xc8>\x16\x19f\x91\xbc\
-<\xe1lh\x10]qq\x8b \xb9f\x8f\x8f\xf7L\
-\xb7\xb4\x84\x92\x9f\xa5H\x0d\x22\x07mZ\xad\xef\xaf\x08\
-\xda\xd1c2\x89\xc9\xc6F\x7f[&@\xde\xa5\xaa\x02\
-~\xf5\xb4ZC\xf0a\x88\xcc\x8f\x98\xcd~\x91\xd9\x9a\
-\x1a\xe1\xb2Z\x03\xe4\xd1\xd1L~\x81\xd6j(\xff\x92\
-\x1d\x99Na|\xdd\xd9\xd9\xc2\x85iy\x83\x11n%\
-\xc2o\x8d\x06\x86]\x98\xaa\xd9\xefh\xd3/\xbc\xf0\x19\
-\x08\xf0\xcaS\x83\xca\x16P\xc1\xb1\xb5d\xbe\xf3\xa5\xa2\
-\xb8\x07A\xfe\x1bmq\x82\xbc\x0f\x99\xffD%\xfc<\
-\x9e\x99)\xb8}\x109\xb2\x9a\xde\x17\xb5+\x8a\x8b\xc9\
-\xe7p\x89\xdc\xb8\x13=:\x1d_$;\xda\xb5\xe8@\
-\x9b<\x05\x05\xe2\x07D: \xc2\x97.\x12\xf2|d\
-\xee\xe4\xb6x@>\x8b\x9609*\xba\x82c\x05\xe7\
-5|\xa9\xb8\x22\x1fOS@\xc4\xf78 \xa2\xf8\xb1\
-\x8c)p\xda\xd1\xa6(\x93\xdfp\x93\xe7$y\xaf^\
-\xcf\xd3r\x15\xe7\x1a \x0a\x88\xbeOt\x0eS\xb4\xc4\
-\xb7\xdd\x8bJ\xc622X\xc4{\x9b\xa8\x82\xcf\xff%\
-\xa2\xe1\x03\x08\xb4\xf6'%\xf9{<\x83\xe0\xd7 \x7f\
-Ht\x13g\x06@\x0f\xc4\x01\xeb\x80-7\x88.\xb3\
-\xc84\xfc\xb8\xd2a\x8c\xf2\x13\xa2A\x9cm\x0c\x15\xe1\
-?:`\xeb\x03\xa2\x0f_\x92\x93\x05g\xc6\x99\xdf\x22\
-z\x8a\xfd\xedL\x08l\x00L\xec\x07\xa4\x00\x96f\xa2\
-\xeb\x10\xf1\xbf\xf8\xd1\xb44\x81\xf8\x01\xec\xa7\x01\xb1\xc1\
-\x02\x1a \x1e\xb0\xee%j\xbeK\xe4hU\x94\xf9\x8b\
-D}\xd8;\xc5\xfbA\x22\x9b\x80\xcd\xc06 \x0b(\
-\xafE\xd5\xf7\x88&\x1fa(N\x12\xdd\xc1^\x0e`\
-\x08\xad\x80\x15\xd3\x812&U\x03\x1f\xae\x13\xc0\x1e \
-\x13H\x92\x15$\xc8d\x12\xa5\xa0\x85E\x80\xa3\xe8_\
-%\xd6\x12`=\x10\x15*\xc0\x1bF\x19d\x96bf\
-\x99\xa9I\x92\xeaeo\xa3\xe4\xaa\x93\x89%2\x82|\
-4\xc1\xe4\xc1\x22\x9a\x90`\xbd\x5c%\xa9\x0c\x5c\x0e+\
-4%\x0c\x22\xb6?\xd5\x91U (\xba\x10S\x00\x00\
-\x00\x00IEND\xaeB`\x82\
 \x00\x00e)\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -4872,22 +1638,6 @@ qt_resource_name = b"\
 \x0alxC\
 \x00r\
 \x00e\x00s\x00o\x00u\x00r\x00c\x00e\x00s\
-\x00\x0c\
-\x03v\xc2\x07\
-\x00q\
-\x00u\x00e\x00s\x00t\x00i\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x07\
-\x0aFW\x87\
-\x00c\
-\x00n\x00c\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x0f\x07Z\xc7\
-\x00e\
-\x00x\x00i\x00t\x00.\x00p\x00n\x00g\
 \x00\x08\
 \x0b\x85Z\xe7\
 \x00g\
@@ -4899,18 +1649,10 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x05\x00\x00\x00\x03\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x80f\xe1\xe8\xa3\
-\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00pB\
-\x00\x00\x01|\xe0\x9a\xb9\xe8\
-\x00\x00\x00F\x00\x00\x00\x00\x00\x01\x00\x008\xaf\
-\x00\x00\x01w\x91R\xaa\xd0\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\xc9\xa4\
-\x00\x00\x01\x80f\xf71\x90\
-\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00\xc6E\
-\x00\x00\x01w\xb5\x0f\x1e\xb8\
+\x00\x00\x01\x80\x95z\x83\xe0\
 "
 
 def qInitResources():